@@ -43,6 +43,12 @@ def __init__(self, root_uri, endpoint, config=None):
         # Cache jedi environments
         self._environments = {}
 
+        # Cache jedi scripts/projects and sys paths per document version
+        self._jedi_cache = {}
+        self._sys_path_cache = {}
+        self._jedi_cache_hits = 0
+        self._jedi_cache_misses = 0
+
         # Whilst incubating, keep rope private
         self.__rope = None
         self.__rope_config = None
@@ -86,20 +92,58 @@ def get_maybe_document(self, doc_uri):
         return self._docs.get(doc_uri)
 
     def put_document(self, doc_uri, source, version=None):
+        self.evict_jedi_cache(doc_uri)
         self._docs[doc_uri] = self._create_document(doc_uri, source=source, version=version)
 
     def rm_document(self, doc_uri):
+        self.evict_jedi_cache(doc_uri)
         self._docs.pop(doc_uri)
 
     def update_document(self, doc_uri, change, version=None):
+        self.evict_jedi_cache(doc_uri)
         self._docs[doc_uri].apply_change(change)
         self._docs[doc_uri].version = version
 
     def update_config(self, settings):
+        self.evict_jedi_cache()
         self._config.update((settings or {}).get('pyls', {}))
         for doc_uri in self.documents:
             self.get_document(doc_uri).update_config(settings)
 
+    def get_cached_jedi_script(self, key):
+        """Return the jedi script cached for key or None."""
+        script = self._jedi_cache.get(key)
+        if script is None:
+            self._jedi_cache_misses += 1
+        else:
+            self._jedi_cache_hits += 1
+        log.debug('Jedi script cache %s for %s (hits: %s, misses: %s)',
+                  'hit' if script is not None else 'miss', key[0],
+                  self._jedi_cache_hits, self._jedi_cache_misses)
+        return script
+
+    def cache_jedi_script(self, key, script):
+        self._jedi_cache[key] = script
+
+    def evict_jedi_cache(self, doc_uri=None):
+        """
+        Drop cached jedi scripts for doc_uri or for all documents.
+
+        Evicting all documents also drops the cached sys paths, since
+        they depend on the configuration.
+        """
+        if doc_uri is None:
+            self._jedi_cache.clear()
+            self._sys_path_cache.clear()
+            return
+        for key in [k for k in self._jedi_cache if k[0] == doc_uri]:
+            del self._jedi_cache[key]
+
+    @property
+    def jedi_cache_hit_rate(self):
+        total = self._jedi_cache_hits + self._jedi_cache_misses
+        return self._jedi_cache_hits / total if total else 0.0
+
     def apply_edit(self, edit):
         return self._endpoint.request(self.M_APPLY_EDIT, {'edit': edit})
 
@@ -257,6 +301,17 @@ def jedi_script(self, position=None, use_document_path=False):
             env_vars = os.environ.copy()
         env_vars.pop('PYTHONPATH', None)
 
+        # Scripts are only reused for versioned documents (i.e. the ones
+        # managed by the client), because the source of the others can
+        # change on disk without notice.
+        cache_key = None
+        if position is None and self.version is not None:
+            cache_key = (self.uri, self.version, environment_path,
+                         tuple(extra_paths), use_document_path)
+            script = self._workspace.get_cached_jedi_script(cache_key)
+            if script is not None:
+                return script
+
         environment = self.get_enviroment(environment_path, env_vars=env_vars) if environment_path else None
         sys_path = self.sys_path(environment_path, env_vars=env_vars) + extra_paths
         project_path = self._workspace.root_path
@@ -276,7 +331,10 @@ def jedi_script(self, position=None, use_document_path=False):
             # Deprecated by Jedi to use in Script() constructor
             kwargs += _utils.position_to_jedi_linecolumn(self, position)
 
-        return jedi.Script(**kwargs)
+        script = jedi.Script(**kwargs)
+        if cache_key is not None:
+            self._workspace.cache_jedi_script(cache_key, script)
+        return script
 
     def get_enviroment(self, environment_path=None, env_vars=None):
         # TODO(gatesn): #339 - make better use of jedi environments, they seem pretty powerful
@@ -296,7 +354,11 @@ def get_enviroment(self, environment_path=None, env_vars=None):
     def sys_path(self, environment_path=None, env_vars=None):
         # Copy our extra sys path
         # TODO: when safe to break API, use env_vars explicitly to pass to create_environment
-        path = list(self._extra_sys_path)
-        environment = self.get_enviroment(environment_path=environment_path, env_vars=env_vars)
-        path.extend(environment.get_sys_path())
-        return path
+        cache_key = (environment_path, tuple(self._extra_sys_path))
+        sys_path_cache = self._workspace._sys_path_cache
+        if cache_key not in sys_path_cache:
+            path = list(self._extra_sys_path)
+            environment = self.get_enviroment(environment_path=environment_path, env_vars=env_vars)
+            path.extend(environment.get_sys_path())
+            sys_path_cache[cache_key] = path
+        return list(sys_path_cache[cache_key])
@@ -97,3 +97,21 @@ def test_document_end_of_file_edit(workspace):
         "print 'b'\n",
         "o",
     ]
+
+
+def test_jedi_script_cache(workspace):
+    workspace.put_document(DOC_URI, DOC, version=1)
+    doc = workspace.get_document(DOC_URI)
+    script = doc.jedi_script()
+    assert doc.jedi_script() is script
+    assert workspace.jedi_cache_hit_rate == 0.5
+
+    workspace.update_document(DOC_URI, {'text': u'import os\n'}, version=2)
+    new_script = doc.jedi_script()
+    assert new_script is not script
+    assert new_script._code == u'import os\n'
+
+
+def test_jedi_script_cache_unversioned(workspace):
+    doc = Document(DOC_URI, workspace, DOC)
+    assert doc.jedi_script() is not doc.jedi_script()
@@ -11,10 +11,13 @@
 """
 
 # Standard library imports
+import bisect
 from distutils.version import LooseVersion
+import itertools
 import os
 import sys
 import threading
+import uuid
 
 # Third-party imports
 import ipykernel
@@ -34,6 +37,35 @@
 EXCLUDED_NAMES = ['In', 'Out', 'exit', 'get_ipython', 'quit']
 
 
+def _complete_import(shell, event):
+    """
+    Complete the module names of import statements with the module index of
+    the kernel, to not import packages to find their submodules.
+    """
+    from IPython.core.error import TryNext
+    modules = shell.kernel._module_index
+    words = event.line.split()
+    if (not modules or len(words) > 2 or
+            (len(words) == 2 and event.line.endswith(' '))):
+        raise TryNext()
+
+    prefix = words[1] if len(words) == 2 else ''
+    depth = prefix.count('.')
+    completions = []
+    start = bisect.bisect_left(modules, prefix)
+    for module in itertools.islice(modules, start, None):
+        if not module.startswith(prefix):
+            break
+        if module.count('.') == depth:
+            completions.append(module)
+
+    # Modules that are not in the index (e.g. in the working directory)
+    # are found by IPython
+    if not completions:
+        raise TryNext()
+    return completions
+
+
 class SpyderShell(ZMQInteractiveShell):
     """Spyder shell."""
 
@@ -68,11 +100,13 @@ def __init__(self, *args, **kwargs):
         # All functions that can be called through the comm
         handlers = {
             'set_breakpoints': self.set_spyder_breakpoints,
+            'update_breakpoints': self.update_spyder_breakpoints,
             'set_pdb_ignore_lib': self.set_pdb_ignore_lib,
             'set_pdb_execute_events': self.set_pdb_execute_events,
             'set_pdb_use_exclamation_mark': self.set_pdb_use_exclamation_mark,
             'get_value': self.get_value,
             'load_data': self.load_data,
+            'load_text_data': self.load_text_data,
             'save_namespace': self.save_namespace,
             'is_defined': self.is_defined,
             'get_doc': self.get_doc,
@@ -89,7 +123,10 @@ def __init__(self, *args, **kwargs):
             'get_namespace_view': self.get_namespace_view,
             'set_namespace_view_settings': self.set_namespace_view_settings,
             'get_var_properties': self.get_var_properties,
+            'get_namespace_view_and_properties':
+                self.get_namespace_view_and_properties,
             'set_sympy_forecolor': self.set_sympy_forecolor,
+            'set_module_index': self.set_module_index,
             'update_syspath': self.update_syspath,
             'is_special_kernel_valid': self.is_special_kernel_valid,
             'get_matplotlib_backend': self.get_matplotlib_backend,
@@ -107,6 +144,14 @@ def __init__(self, *args, **kwargs):
         self._mpl_backend_error = None
         self._running_namespace = None
         self._pdb_input_line = None
+        self._namespace_state = None
+        self._sent_namespace_state = None
+        self._module_index = None
+
+        # The namespace can only change after executions (or through the
+        # setters below), so its view is computed only once after them.
+        self.shell.events.register('post_execute',
+                                   self._invalidate_namespace_state)
 
     # -- Public API -----------------------------------------------------------
     def frontend_call(self, blocking=False, broadcast=True,
@@ -128,8 +173,9 @@ def frontend_call(self, blocking=False, broadcast=True,
     def set_namespace_view_settings(self, settings):
         """Set namespace_view_settings."""
         self.namespace_view_settings = settings
+        self._invalidate_namespace_state()
 
-    def get_namespace_view(self):
+    def get_namespace_view(self, ns=None):
         """
         Return the namespace view
 
@@ -147,13 +193,14 @@ def get_namespace_view(self):
 
         settings = self.namespace_view_settings
         if settings:
-            ns = self._get_current_namespace()
+            if ns is None:
+                ns = self._get_current_namespace()
             view = make_remote_view(ns, settings, EXCLUDED_NAMES)
             return view
         else:
             return None
 
-    def get_var_properties(self):
+    def get_var_properties(self, ns=None):
         """
         Get some properties of the variables in the current
         namespace
@@ -162,7 +209,8 @@ def get_var_properties(self):
 
         settings = self.namespace_view_settings
         if settings:
-            ns = self._get_current_namespace()
+            if ns is None:
+                ns = self._get_current_namespace()
             data = get_remote_data(ns, settings, mode='editable',
                                    more_excluded_names=EXCLUDED_NAMES)
 
@@ -185,6 +233,35 @@ def get_var_properties(self):
         else:
             return None
 
+    def get_namespace_view_and_properties(self, force=False, since=None):
+        """
+        Return the namespace view and the variable properties together,
+        so the Variable Explorer can be refreshed with a single call.
+
+        The result is reused until the next execution, unless `force` is
+        True or we are debugging (Pdb commands don't trigger
+        post_execute).
+
+        Each result has a `state_id`. If `since` is the id of the last
+        result sent, only the variables that changed after it are
+        returned, together with the names of the removed ones.
+        """
+        if (force or self._namespace_state is None
+                or self.is_debugging()):
+            ns = self._get_current_namespace()
+            self._namespace_state = dict(
+                namespace_view=self.get_namespace_view(ns),
+                var_properties=self.get_var_properties(ns),
+                state_id=uuid.uuid4().hex)
+
+        state = self._namespace_state
+        sent_state = self._sent_namespace_state
+        self._sent_namespace_state = state
+        if (since is not None and sent_state is not None
+                and since == sent_state['state_id']):
+            return self._get_namespace_delta(sent_state, state)
+        return state
+
     def get_value(self, name):
         """Get the value of a variable"""
         ns = self._get_current_namespace()
@@ -196,24 +273,30 @@ def set_value(self, name, value):
         ns = self._get_reference_namespace(name)
         ns[name] = value
         self.log.debug(ns)
+        self._invalidate_namespace_state()
 
     def remove_value(self, name):
         """Remove a variable"""
         ns = self._get_reference_namespace(name)
         ns.pop(name)
+        self._invalidate_namespace_state()
 
     def copy_value(self, orig_name, new_name):
         """Copy a variable"""
         ns = self._get_reference_namespace(orig_name)
         ns[new_name] = ns[orig_name]
+        self._invalidate_namespace_state()
 
-    def load_data(self, filename, ext, overwrite=False):
+    def load_data(self, filename, ext, overwrite=False, mmap=False):
         """
         Load data from filename.
 
         Use 'overwrite' to determine if conflicts between variable names need
         to be handle or not.
 
+        Use 'mmap' to memory-map arrays instead of reading them, for the
+        formats that support it (e.g. .npy, .npz and .h5).
+
         For example, if a loaded variable is call 'var'
         and there is already a variable 'var' in the namespace, having
         'overwrite=True' will cause 'var' to be updated.
@@ -226,7 +309,10 @@ def load_data(self, filename, ext, overwrite=False):
         glbs = self._mglobals()
 
         load_func = iofunctions.load_funcs[ext]
-        data, error_message = load_func(filename)
+        if mmap and iofunctions.supports_mmap(ext):
+            data, error_message = load_func(filename, mmap=True)
+        else:
+            data, error_message = load_func(filename)
 
         if error_message:
             return error_message
@@ -242,7 +328,27 @@ def load_data(self, filename, ext, overwrite=False):
             glbs.update(data)
         except Exception as error:
             return str(error)
+        finally:
+            self._invalidate_namespace_state()
+
+        return None
+
+    def load_text_data(self, name, filename, settings):
+        """
+        Load a delimited text file in variable `name`, with the settings
+        chosen in the Import Wizard (see iofuncs.load_text).
+
+        Return an error message or None.
+        """
+        from spyder_kernels.utils.iofuncs import load_text
+
+        data, error_message = load_text(filename, **settings)
+        if error_message:
+            return error_message
 
+        ns = self._get_reference_namespace(name)
+        ns[name] = data
+        self._invalidate_namespace_state()
         return None
 
     def save_namespace(self, filename):
@@ -279,13 +385,13 @@ def do_complete(self, code, cursor_pos):
 
     def publish_pdb_state(self):
         """
-        Publish Variable Explorer state and Pdb step through
-        send_spyder_msg.
+        Publish the Pdb step through send_spyder_msg.
+
+        The Variable Explorer state is not included, so it's only
+        computed if the frontend asks for it.
         """
         if self._pdb_obj and self._do_publish_pdb_state:
-            state = dict(namespace_view = self.get_namespace_view(),
-                         var_properties = self.get_var_properties(),
-                         step = self._pdb_step)
+            state = dict(step=self._pdb_step)
             self.frontend_call(blocking=False).pdb_state(state)
         self._do_publish_pdb_state = True
 
@@ -296,6 +402,13 @@ def set_spyder_breakpoints(self, breakpoints):
         if self._pdb_obj:
             self._pdb_obj.set_spyder_breakpoints(breakpoints)
 
+    def update_spyder_breakpoints(self, changes):
+        """
+        Update the breakpoints of the files that changed in the frontend.
+        """
+        if self._pdb_obj:
+            self._pdb_obj.update_spyder_breakpoints(changes)
+
     def set_pdb_ignore_lib(self, state):
         """
         Change the "Ignore libraries while stepping" debugger setting.
@@ -472,6 +585,17 @@ def set_autocall(self, autocall):
         """Enable/Disable autocall funtionality."""
         self._set_config_option('ZMQInteractiveShell.autocall', autocall)
 
+    def set_module_index(self, modules):
+        """
+        Complete import statements with the sorted module names of `modules`,
+        which are found by the frontend without importing them.
+        """
+        if self._module_index is None:
+            for keyword in ('import', 'from'):
+                self.shell.set_hook('complete_command', _complete_import,
+                                    str_key=keyword, priority=40)
+        self._module_index = sorted(modules)
+
     # --- Additional methods
     def set_cwd(self, dirname):
         """Set current working directory."""
@@ -576,6 +700,32 @@ def _get_current_namespace(self, with_magics=False):
 
         return ns
 
+    def _invalidate_namespace_state(self):
+        """Discard the namespace view computed after the last execution."""
+        self._namespace_state = None
+
+    def _get_namespace_delta(self, old_state, new_state):
+        """Return the changes of the namespace state from old_state."""
+        old_view = old_state['namespace_view']
+        old_properties = old_state['var_properties']
+        view = new_state['namespace_view']
+        properties = new_state['var_properties']
+        if None in (old_view, old_properties, view, properties):
+            return new_state
+
+        changed_view = {}
+        changed_properties = {}
+        for name in view:
+            if (view[name] != old_view.get(name)
+                    or properties.get(name) != old_properties.get(name)):
+                changed_view[name] = view[name]
+                changed_properties[name] = properties.get(name)
+        return dict(namespace_view=changed_view,
+                    var_properties=changed_properties,
+                    removed=[name for name in old_view if name not in view],
+                    state_id=new_state['state_id'],
+                    delta=True)
+
     def _get_reference_namespace(self, name):
         """
         Return namespace where reference name is defined
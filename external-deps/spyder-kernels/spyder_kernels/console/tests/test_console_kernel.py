@@ -212,6 +212,59 @@ def test_get_var_properties(kernel):
     assert "'array_ndim': None" in var_properties
 
 
+def test_get_namespace_view_and_properties(kernel):
+    """
+    Test that the namespace view and var properties are computed together
+    and only once per execution.
+    """
+    kernel.do_execute('a = 1', True)
+
+    state = kernel.get_namespace_view_and_properties()
+    assert "'a':" in repr(state['namespace_view'])
+    assert "'is_list': False" in repr(state['var_properties'])
+
+    # Reused until the namespace changes
+    assert kernel.get_namespace_view_and_properties() is state
+
+    kernel.set_value('b', 2)
+    state = kernel.get_namespace_view_and_properties()
+    assert "'b':" in repr(state['namespace_view'])
+
+    kernel.do_execute('c = 3', True)
+    state = kernel.get_namespace_view_and_properties()
+    assert "'c':" in repr(state['namespace_view'])
+
+
+def test_get_namespace_view_and_properties_delta(kernel):
+    """
+    Test that only the variables that changed are sent if the frontend
+    has the last state.
+    """
+    kernel.do_execute('a = 1; b = 2', True)
+    state = kernel.get_namespace_view_and_properties()
+    assert not state.get('delta')
+
+    kernel.do_execute('a = 3; del b; c = 4', True)
+    delta = kernel.get_namespace_view_and_properties(
+        since=state['state_id'])
+    assert delta['delta']
+    assert sorted(delta['namespace_view']) == ['a', 'c']
+    assert sorted(delta['var_properties']) == ['a', 'c']
+    assert delta['removed'] == ['b']
+    assert delta['state_id'] != state['state_id']
+
+    # Nothing changed
+    empty = kernel.get_namespace_view_and_properties(
+        since=delta['state_id'])
+    assert empty['namespace_view'] == {}
+    assert empty['removed'] == []
+
+    # The whole state is sent for unknown ids
+    state = kernel.get_namespace_view_and_properties(since=state['state_id'])
+    assert not state.get('delta')
+    assert sorted(state['namespace_view']) == ['a', 'c']
+
+
 def test_get_value(kernel):
     """Test getting the value of a variable."""
     name = 'a'
@@ -320,6 +373,19 @@ def test_load_data(kernel):
     assert "'array_ndim': None" in var_properties
 
 
+def test_load_text_data(kernel, tmpdir):
+    """Test loading a text file with the settings of the Import Wizard."""
+    path = tmpdir.join('data.txt')
+    path.write('1 2\n3 4\n')
+    settings = dict(kind='list', sep=None, skiprows=0, comment='#',
+                    transpose=False, encoding='utf-8')
+    assert kernel.load_text_data('data', str(path), settings) is None
+    assert kernel.get_value('data') == [[1, 2], [3, 4]]
+
+    assert kernel.load_text_data('data', str(tmpdir.join('missing.txt')),
+                                 settings)
+
+
 def test_save_namespace(kernel):
     """Test saving the namespace into filename."""
     namespace_file = osp.join(FILES_PATH, 'save_data.spydata')
@@ -546,6 +612,28 @@ def test_runfile(tmpdir):
         assert not content['found']
 
 
+@flaky(max_runs=3)
+def test_profilecode():
+    """
+    Test that profilecode runs code in the current namespace, even if the
+    results can't be sent to a frontend.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        client.execute("n = 10")
+        client.get_shell_msg(block=True, timeout=TIMEOUT)
+
+        client.execute("profilecode('total = sum(range(n))')")
+        msg = client.get_shell_msg(block=True, timeout=TIMEOUT)
+        assert msg['content']['status'] == 'ok'
+
+        client.inspect('total')
+        msg = client.get_shell_msg(block=True, timeout=TIMEOUT)
+        assert msg['content']['found']
+
+
 @flaky(max_runs=3)
 def test_np_threshold(kernel):
     """Test that setting Numpy threshold doesn't make the Variable Explorer slow."""
@@ -705,6 +793,20 @@ def test_do_complete(kernel):
     assert 'baba' in match['matches']
 
 
+def test_complete_import(kernel):
+    """Test that imports are completed with the module index."""
+    kernel.set_module_index(['os', 'os.path', 'os.path.sep_mod', 'zz_mod',
+                             'zz_mod.sub'])
+    match = kernel.do_complete('import zz', 9)
+    assert match['matches'] == ['zz_mod']
+    match = kernel.do_complete('import zz_mod.', 14)
+    assert match['matches'] == ['zz_mod.sub']
+
+    # Module names that are not in the index are completed by IPython
+    match = kernel.do_complete('from zz_mod import ', 19)
+    assert 'sub' not in match['matches']
+
+
 @pytest.mark.parametrize("exclude_callables_and_modules", [True, False])
 @pytest.mark.parametrize("exclude_unsupported", [True, False])
 def test_callables_and_modules(kernel, exclude_callables_and_modules,
@@ -13,6 +13,7 @@
 
 import bdb
 import cmd
+import cProfile
 import io
 import logging
 import os
@@ -422,8 +423,13 @@ def transform_cell(code, indent_only=False):
     return '\n' * number_empty_lines + code
 
 
-def exec_code(code, filename, ns_globals, ns_locals=None, post_mortem=False):
-    """Execute code and display any exception."""
+def exec_code(code, filename, ns_globals, ns_locals=None, post_mortem=False,
+              profiler=None):
+    """
+    Execute code and display any exception.
+
+    If a cProfile profiler is given, it's enabled while the code runs.
+    """
     # Tell IPython to hide this frame (>7.16)
     __tracebackhide__ = True
     global SHOW_INVALID_SYNTAX_MSG
@@ -462,7 +468,13 @@ def exec_code(code, filename, ns_globals, ns_locals=None, post_mortem=False):
                         SHOW_INVALID_SYNTAX_MSG = False
         else:
             compiled = compile(transform_cell(code), filename, 'exec')
-        exec(compiled, ns_globals, ns_locals)
+        if profiler is not None:
+            profiler.enable()
+        try:
+            exec(compiled, ns_globals, ns_locals)
+        finally:
+            if profiler is not None:
+                profiler.disable()
     except SystemExit as status:
         # ignore exit(0)
         if status.code:
@@ -606,7 +618,7 @@ def debugfile(filename=None, args=None, wdir=None, post_mortem=False,
 builtins.debugfile = debugfile
 
 
-def runcell(cellname, filename=None, post_mortem=False):
+def runcell(cellname, filename=None, post_mortem=False, profile=False):
     """
     Run a code cell from an editor as a file.
 
@@ -620,6 +632,8 @@ def runcell(cellname, filename=None, post_mortem=False):
         Cell name or index.
     filename : str
         Needed to allow for proper traceback links.
+    profile : bool
+        Profile the cell with cProfile and send the results to Spyder.
     """
     # Tell IPython to hide this frame (>7.16)
     __tracebackhide__ = True
@@ -660,10 +674,13 @@ def runcell(cellname, filename=None, post_mortem=False):
         file_code = get_file_code(filename, save_all=False)
     except Exception:
         file_code = None
+    profiler = cProfile.Profile() if profile else None
     with NamespaceManager(filename, current_namespace=True,
                           file_code=file_code) as (ns_globals, ns_locals):
         exec_code(cell_code, filename, ns_globals, ns_locals,
-                  post_mortem=post_mortem)
+                  post_mortem=post_mortem, profiler=profiler)
+    if profiler is not None:
+        send_profile_data(profiler, '{} ({})'.format(filename, cellname))
 
 
 builtins.runcell = runcell
@@ -688,6 +705,48 @@ def debugcell(cellname, filename=None, post_mortem=False):
 builtins.debugcell = debugcell
 
 
+def profilecell(cellname, filename=None):
+    """Profile a cell."""
+    # Tell IPython to hide this frame (>7.16)
+    __tracebackhide__ = True
+    runcell(cellname, filename, profile=True)
+
+
+builtins.profilecell = profilecell
+
+
+def profilecode(code, name='<selection>'):
+    """
+    Profile code in the current namespace.
+
+    Parameters
+    ----------
+    code : str
+        Code to profile, e.g. the selection of an editor.
+    name : str
+        Name used to show the results and compare them with previous ones.
+    """
+    # Tell IPython to hide this frame (>7.16)
+    __tracebackhide__ = True
+    ns = get_ipython().user_ns
+    profiler = cProfile.Profile()
+    exec_code(code, name, ns, profiler=profiler)
+    send_profile_data(profiler, name)
+
+
+builtins.profilecode = profilecode
+
+
+def send_profile_data(profiler, name):
+    """Send the statistics of a cProfile profiler to Spyder."""
+    profiler.create_stats()
+    try:
+        frontend_request(blocking=False).show_profile_data(
+            name, profiler.stats)
+    except (CommError, TimeoutError):
+        _print("Could not send the profiling results to Spyder.\n")
+
+
 def cell_count(filename=None):
     """
     Get the number of cells in a file.
@@ -8,6 +8,7 @@
 
 import ast
 import bdb
+import dis
 import sys
 import logging
 import traceback
@@ -87,6 +88,9 @@ def __init__(self, completekey='tab', stdin=None, stdout=None,
         self._exclamation_warning_printed = False
         self.pdb_stop_first_line = True
         self._disable_next_stack_entry = False
+        # Canonic filename and lines of code objects
+        self._canonic_filenames = {}
+        self._code_lines = {}
         super(SpyderPdb, self).__init__()
         self._pdb_breaking = False
         self._frontend_notified = False
@@ -228,6 +232,7 @@ def interaction(self, frame, traceback):
             if frame and frame.f_back:
                 return self.interaction(frame.f_back, traceback)
 
+        self._trace_stack(frame)
         self.setup(frame, traceback)
         self.print_stack_entry(self.stack[self.curindex])
         if self._frontend_notified:
@@ -247,14 +252,43 @@ def print_stack_entry(self, frame_lineno, prompt_prefix='\n-> ',
             frame_lineno, prompt_prefix, context)
 
     # --- Methods overriden for skipping libraries
+    def trace_dispatch(self, frame, event, arg):
+        """
+        Dispatch a trace function for debugged frames based on the event.
+
+        Reimplemented to stop tracing the frames of code without
+        breakpoints after `continue`, since the debugger can't stop in
+        them. Otherwise, all the code run after it goes through the
+        debugger.
+        """
+        if self.stoplineno == -1 and event in ('call', 'line'):
+            code = frame.f_code
+            if not self._has_breakpoints(code):
+                if event == 'line':
+                    # Frames traced before continuing have to be untraced
+                    # explicitly
+                    frame.f_trace = None
+                return None
+            breaks = self._get_breaks(code)
+            if (event == 'line' and frame.f_lineno not in breaks
+                    and code.co_firstlineno not in breaks):
+                # No breakpoint in this line
+                return self.trace_dispatch
+        return super(SpyderPdb, self).trace_dispatch(frame, event, arg)
+
     def stop_here(self, frame):
         """Check if pdb should stop here."""
+        # Check the code before getting f_locals, because that's slow
         if (frame is not None
+                and "__tracebackhide__" in frame.f_code.co_varnames
                 and frame.f_locals.get(
                     "__tracebackhide__", False) == "__pdb_exit__"):
             self.onecmd('exit')
             return False
 
+        if self.stoplineno == -1:
+            # After `continue`, only breakpoints can stop the debugger
+            return False
         if not super(SpyderPdb, self).stop_here(frame):
             return False
         filename = frame.f_code.co_filename
@@ -499,6 +533,7 @@ def reset(self):
         Register Pdb session after reset.
         """
         super(SpyderPdb, self).reset()
+        self._code_lines = {}
         kernel = get_ipython().kernel
         kernel._register_pdb_session(self)
 
@@ -598,23 +633,73 @@ def break_here(self, frame):
                 return False
 
     # --- Methods defined by us for Spyder integration
+    def _get_breaks(self, code):
+        """Return the lines with breakpoints of the file of code."""
+        filename = code.co_filename
+        canonic = self._canonic_filenames.get(filename)
+        if canonic is None:
+            canonic = self.canonic(filename)
+            if PY2:
+                try:
+                    canonic = unicode(canonic, "utf-8")
+                except TypeError:
+                    pass
+            self._canonic_filenames[filename] = canonic
+        return self.breaks.get(canonic, ())
+
+    def _has_breakpoints(self, code):
+        """Return True if there are breakpoints in the lines of code."""
+        breaks = self._get_breaks(code)
+        if not breaks:
+            return False
+
+        lines = self._code_lines.get(code)
+        if lines is None:
+            last = max([lineno for __, lineno in dis.findlinestarts(code)
+                        if lineno is not None] or [code.co_firstlineno])
+            lines = self._code_lines[code] = (code.co_firstlineno, last)
+        first, last = lines
+        for lineno in breaks:
+            if first <= lineno <= last:
+                return True
+        return False
+
+    def _trace_stack(self, frame):
+        """
+        Trace frame and its callers again, since they are not traced if
+        they were entered after `continue`, but stepping can reach them.
+        """
+        while frame is not None:
+            if frame.f_trace is None:
+                frame.f_trace = self.trace_dispatch
+            if frame is self.botframe:
+                break
+            frame = frame.f_back
+
     def set_spyder_breakpoints(self, breakpoints):
         """Set Spyder breakpoints."""
-        self.clear_all_breaks()
-        # -----Really deleting all breakpoints:
-        for bp in bdb.Breakpoint.bpbynumber:
-            if bp:
-                bp.deleteMe()
-        bdb.Breakpoint.next = 1
-        bdb.Breakpoint.bplist = {}
-        bdb.Breakpoint.bpbynumber = [None]
-        # -----
-        i = 0
-        for fname, data in list(breakpoints.items()):
-            for linenumber, condition in data:
-                i += 1
-                self.set_break(self.canonic(fname), linenumber,
-                               cond=condition)
+        if self.starting:
+            self.clear_all_breaks()
+            # -----Really deleting all breakpoints:
+            for bp in bdb.Breakpoint.bpbynumber:
+                if bp:
+                    bp.deleteMe()
+            bdb.Breakpoint.next = 1
+            bdb.Breakpoint.bplist = {}
+            bdb.Breakpoint.bpbynumber = [None]
+            # -----
+            for fname, data in list(breakpoints.items()):
+                for linenumber, condition in data:
+                    self.set_break(self.canonic(fname), linenumber,
+                                   cond=condition)
+        else:
+            # Keep the breakpoints that didn't change, with their numbers
+            # and hit counts
+            filenames = set(self.canonic(fname) for fname in breakpoints)
+            for filename in list(self.breaks):
+                if filename not in filenames:
+                    self.clear_all_file_breaks(filename)
+            self.update_spyder_breakpoints(breakpoints)
 
         # Jump to first breakpoint.
         # Fixes issue 2034
@@ -655,6 +740,27 @@ def set_spyder_breakpoints(self, breakpoints):
                     logger.debug(
                         "Could not send a Pdb continue call to the frontend.")
 
+    def update_spyder_breakpoints(self, changes):
+        """
+        Update the breakpoints of some files.
+
+        changes is a dict of lists of (lineno, condition) by filename, with
+        all the breakpoints of each file. Only the breakpoints that are new
+        or whose condition changed are set.
+        """
+        for fname, data in list(changes.items()):
+            filename = self.canonic(fname)
+            conditions = dict((lineno, cond) for lineno, cond in data)
+            for lineno in list(self.breaks.get(filename, [])):
+                current = [bp.cond for bp in self.get_breaks(filename, lineno)]
+                if (lineno not in conditions
+                        or current != [conditions[lineno]]):
+                    self.clear_break(filename, lineno)
+            breaks = self.breaks.get(filename, [])
+            for lineno, cond in sorted(conditions.items()):
+                if lineno not in breaks:
+                    self.set_break(filename, lineno, cond=cond)
+
     def notify_spyder(self, frame=None):
         """Send kernel state to the frontend."""
         if frame is None:
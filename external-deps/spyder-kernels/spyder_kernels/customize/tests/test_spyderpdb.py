@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for spyderpdb.py"""
+
+# Standard library imports
+import bdb
+import pdb
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder_kernels.customize import spyderpdb
+from spyder_kernels.customize.spyderpdb import SpyderPdb
+
+
+SCRIPT = """\
+def inner(x):
+    y = x + 1
+    return y
+
+
+def outer(n):
+    total = 0
+    for i in range(n):
+        total += inner(i)
+    return total
+
+
+def later():
+    return outer(1)
+
+
+def unused():
+    return 0
+
+
+a = outer(2)
+b = later()
+"""
+
+# Lines of SCRIPT with breakpoints, the last one is never run
+BREAKPOINTS = [2, 14, 18]
+
+
+class ScriptedMixin(object):
+    """Debugger that runs a list of commands instead of prompting."""
+
+    def __init__(self, commands):
+        super(ScriptedMixin, self).__init__()
+        self.commands = list(commands)
+        self.stops = []
+
+    def interaction(self, frame, traceback):
+        self.stops.append((frame.f_code.co_name, frame.f_lineno))
+        command = self.commands.pop(0) if self.commands else 'continue'
+        if command in ('continue', 'step'):
+            getattr(self, 'set_' + command)()
+        else:
+            getattr(self, 'set_' + command)(frame)
+
+
+class ScriptedPdb(ScriptedMixin, pdb.Pdb):
+    pass
+
+
+class ScriptedSpyderPdb(ScriptedMixin, SpyderPdb):
+
+    def interaction(self, frame, traceback):
+        # Done by SpyderPdb.interaction before prompting
+        self._trace_stack(frame)
+        super(ScriptedSpyderPdb, self).interaction(frame, traceback)
+
+
+class KernelStub(object):
+    def _register_pdb_session(self, pdb_obj):
+        pass
+
+
+class ShellStub(object):
+    kernel = KernelStub()
+
+
+def run_script(debugger, path):
+    """Run SCRIPT from path in debugger and return where it stopped."""
+    filename = str(path)
+    for lineno in BREAKPOINTS:
+        debugger.set_break(debugger.canonic(filename), lineno)
+    # Other files can have breakpoints too
+    debugger.set_break(debugger.canonic(__file__), 1)
+    try:
+        bdb.Bdb.run(debugger, compile(SCRIPT, filename, 'exec'),
+                    {'__name__': '__main__'})
+    finally:
+        debugger.clear_all_breaks()
+        bdb.Breakpoint.clearBreakpoints()
+    return debugger.stops
+
+
+@pytest.fixture
+def script(tmpdir, monkeypatch):
+    """Path of SCRIPT, to be debugged without a kernel."""
+    monkeypatch.setattr(spyderpdb, 'get_ipython', ShellStub)
+    path = tmpdir.join('script.py')
+    path.write(SCRIPT)
+    return path
+
+
+@pytest.fixture
+def debugger(tmpdir):
+    """Debugger with breakpoints in a file."""
+    path = tmpdir.join('script.py')
+    path.write('\n'.join('a = {}'.format(i) for i in range(10)) + '\n')
+    debugger = SpyderPdb()
+    debugger.starting = False
+    debugger.filename = str(path)
+    debugger.set_spyder_breakpoints(
+        {str(path): [(1, None), (3, 'a > 1'), (5, None)]})
+    yield debugger
+    debugger.clear_all_breaks()
+    bdb.Breakpoint.clearBreakpoints()
+
+
+def test_update_spyder_breakpoints(debugger):
+    """Test that only the breakpoints that changed are set again."""
+    filename = debugger.canonic(debugger.filename)
+    first, second = [debugger.get_breaks(filename, lineno)[0]
+                     for lineno in (1, 3)]
+    first.hits = 2
+
+    debugger.update_spyder_breakpoints(
+        {debugger.filename: [(1, None), (3, 'a > 2'), (7, None)]})
+    assert debugger.get_file_breaks(filename) == [1, 3, 7]
+    assert debugger.get_breaks(filename, 1) == [first]
+    assert first.hits == 2
+    assert debugger.get_breaks(filename, 3)[0] is not second
+    assert debugger.get_breaks(filename, 3)[0].cond == 'a > 2'
+    assert (filename, 5) not in bdb.Breakpoint.bplist
+
+    # Removed files lose their breakpoints
+    debugger.set_spyder_breakpoints({})
+    assert debugger.get_all_breaks() == {}
+
+
+def test_continue_stops_at_breakpoints(script):
+    """
+    Test that continue stops at all the breakpoints, including the ones in
+    functions that are called later.
+    """
+    stops = run_script(ScriptedSpyderPdb([]), script)
+    assert stops[1:] == [('inner', 2), ('inner', 2), ('later', 14),
+                         ('inner', 2)]
+    assert stops == run_script(ScriptedPdb([]), script)
+
+
+@pytest.mark.parametrize('commands', [
+    ['continue', 'next', 'next', 'next', 'next', 'next'],
+    ['continue', 'step', 'step', 'step', 'step'],
+    ['continue', 'return', 'next', 'return', 'step', 'continue', 'next'],
+    ['continue', 'continue', 'continue', 'step', 'step', 'step', 'next'],
+    ['next', 'next', 'step', 'continue', 'return', 'return', 'return'],
+])
+def test_stepping_after_continue(script, commands):
+    """Test that next, step and return work as in Pdb after continue."""
+    stops = run_script(ScriptedSpyderPdb(commands), script)
+    assert len(stops) > len(commands)
+    assert stops == run_script(ScriptedPdb(commands), script)
+
+
+def test_has_breakpoints(script):
+    """Test that only the code with breakpoints in its lines is traced."""
+    debugger = SpyderPdb()
+    filename = str(script)
+    namespace = {}
+    exec(compile(SCRIPT, filename, 'exec'), namespace)
+    debugger.set_break(debugger.canonic(filename), 2)
+    try:
+        assert debugger._has_breakpoints(namespace['inner'].__code__)
+        assert not debugger._has_breakpoints(namespace['outer'].__code__)
+        assert not debugger._has_breakpoints(namespace['later'].__code__)
+    finally:
+        debugger.clear_all_breaks()
+        bdb.Breakpoint.clearBreakpoints()
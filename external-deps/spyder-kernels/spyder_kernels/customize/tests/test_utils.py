@@ -8,8 +8,9 @@
 
 import os
 import sys
+import sysconfig
 
-from spyder_kernels.customize.utils import create_pathlist
+from spyder_kernels.customize.utils import create_pathlist, path_is_library
 
 
 def test_user_sitepackages_in_pathlist():
@@ -22,3 +23,14 @@ def test_user_sitepackages_in_pathlist():
         user_path = 'Roaming'
 
     assert any([user_path in path for path in create_pathlist()])
+
+
+def test_path_is_library(tmpdir):
+    """Test that the results of path_is_library depend on the pathlist."""
+    script = str(tmpdir.join('script.py'))
+    library = os.path.join(sysconfig.get_paths()['stdlib'], 'os.py')
+
+    assert path_is_library(library)
+    assert not path_is_library(script)
+    assert path_is_library(script, initial_pathlist=[str(tmpdir)])
+    assert not path_is_library(script)
@@ -45,7 +45,25 @@ def create_pathlist():
     return standard_paths + user_path
 
 
+# Results of path_is_library by path and initial pathlist
+_LIBRARY_PATHS = {}
+
+
 def path_is_library(path, initial_pathlist=None):
+    """Decide if a path is in user code or a library according to its path."""
+    # This is called for every frame entered while debugging, so results
+    # are cached
+    key = (path, tuple(initial_pathlist or ()))
+    try:
+        return _LIBRARY_PATHS[key]
+    except KeyError:
+        pass
+    is_library = _path_is_library(path, initial_pathlist)
+    _LIBRARY_PATHS[key] = is_library
+    return is_library
+
+
+def _path_is_library(path, initial_pathlist=None):
     """Decide if a path is in user code or a library according to its path."""
     # Compute DEFAULT_PATHLIST only once and make it global to reuse it
     # in any future call of this function.
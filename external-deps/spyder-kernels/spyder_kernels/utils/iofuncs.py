@@ -16,9 +16,11 @@
 from __future__ import print_function
 
 # Standard library imports
+import io
 import sys
 import os
 import os.path as osp
+import struct
 import tarfile
 import tempfile
 import shutil
@@ -29,21 +31,44 @@
 import dis
 import copy
 import glob
-
-# Third party imports
-# - If pandas fails to import here (for any reason), Spyder
-#   will crash at startup (e.g. see Issue 2300)
-# - This also prevents Spyder to start IPython kernels
-#   (see Issue 2456)
-try:
-    import pandas as pd
-except:
-    pd = None            #analysis:ignore
+import zipfile
 
 # Local imports
 from spyder_kernels.py3compat import getcwd, pickle, PY2, to_text_string
 
 
+def _is_installed(module_name):
+    """Check if module_name can be imported, without importing it."""
+    if PY2:
+        import imp
+        try:
+            imp.find_module(module_name)
+        except ImportError:
+            return False
+        return True
+    else:
+        from importlib.util import find_spec
+        return find_spec(module_name) is not None
+
+
+def _get_pandas():
+    """
+    Return the pandas module or None if it can't be imported.
+
+    Pandas is imported when it's first needed because it's slow to import
+    and Spyder imports this module at startup.
+    """
+    # - If pandas fails to import here (for any reason), Spyder
+    #   will crash at startup (e.g. see Issue 2300)
+    # - This also prevents Spyder to start IPython kernels
+    #   (see Issue 2456)
+    try:
+        import pandas as pd
+    except:
+        pd = None            #analysis:ignore
+    return pd
+
+
 class MatlabStruct(dict):
     """
     Matlab style struct, enhanced.
@@ -156,51 +181,116 @@ def get_matlab_value(val):
     return val
 
 
-try:
-    import numpy as np
-    try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            import scipy.io as spio
-    except AttributeError:
-        # Python 2.5: warnings.catch_warnings was introduced in Python 2.6
-        import scipy.io as spio  # analysis:ignore
-    except:
-        spio = None
+# Numpy, Scipy and PIL are slow to import, so the functions that use them
+# import them when they are called
+def _import_scipy_io():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        import scipy.io as spio
+    return spio
 
-    if spio is None:
-        load_matlab = None
-        save_matlab = None
-    else:
-        def load_matlab(filename):
-            try:
-                out = spio.loadmat(filename, struct_as_record=True)
-                data = dict()
-                for (key, value) in out.items():
-                    data[key] = get_matlab_value(value)
-                return data, None
-            except Exception as error:
-                return None, str(error)
 
-        def save_matlab(data, filename):
-            try:
-                spio.savemat(filename, data, oned_as='row')
-            except Exception as error:
-                return str(error)
-except:
+if _is_installed('numpy') and _is_installed('scipy'):
+    def load_matlab(filename):
+        try:
+            spio = _import_scipy_io()
+            out = spio.loadmat(filename, struct_as_record=True)
+            data = dict()
+            for (key, value) in out.items():
+                data[key] = get_matlab_value(value)
+            return data, None
+        except Exception as error:
+            return None, str(error)
+
+    def save_matlab(data, filename):
+        try:
+            spio = _import_scipy_io()
+            spio.savemat(filename, data, oned_as='row')
+        except Exception as error:
+            return str(error)
+else:
     load_matlab = None
     save_matlab = None
 
 
-try:
-    import numpy as np  # analysis:ignore
+if _is_installed('numpy'):
+    def memmap_npz_member(filename, info):
+        """
+        Memory-map the array saved in member `info` of the .npz `filename`.
+
+        This is only possible for members that are not compressed (i.e.
+        saved with np.savez) and don't contain Python objects. Return None
+        otherwise.
+        """
+        import numpy as np
+
+        if info.compress_type != zipfile.ZIP_STORED:
+            return None
+
+        with open(filename, 'rb') as fid:
+            # Member data starts after its local file header, whose size
+            # depends on the length of its name and extra fields.
+            fid.seek(info.header_offset)
+            header = fid.read(30)
+            if header[:4] != b'PK\x03\x04':
+                return None
+            name_len, extra_len = struct.unpack('<HH', header[26:30])
+            fid.seek(info.header_offset + 30 + name_len + extra_len)
+
+            version = np.lib.format.read_magic(fid)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(fid)
+            elif version == (2, 0):
+                header = np.lib.format.read_array_header_2_0(fid)
+            else:
+                return None
+            shape, fortran_order, dtype = header
+            offset = fid.tell()
+
+        if dtype.hasobject or not shape or 0 in shape:
+            return None
+
+        # Copy-on-write, so users can modify the array without touching
+        # the file.
+        return np.memmap(filename, dtype=dtype, mode='c', offset=offset,
+                         shape=shape, order='F' if fortran_order else 'C')
+
+    def load_array(filename, mmap=False):
+        """
+        Load a .npy or .npz file.
 
-    def load_array(filename):
+        If `mmap` is True, arrays are memory-mapped instead of read, so
+        only the parts that are accessed are loaded from disk.
+        """
         try:
+            import numpy as np
             name = osp.splitext(osp.basename(filename))[0]
-            data = np.load(filename)
+            data = None
+            if mmap:
+                try:
+                    data = np.load(filename, mmap_mode='c')
+                except ValueError:
+                    # Arrays of objects can't be memory-mapped
+                    pass
+            if data is None:
+                data = np.load(filename)
+
             if isinstance(data, np.lib.npyio.NpzFile):
-                return dict(data), None
+                if not mmap:
+                    return dict(data), None
+
+                arrays = {}
+                with zipfile.ZipFile(filename) as zip_file:
+                    for info in zip_file.infolist():
+                        key = info.filename
+                        if key.endswith('.npy'):
+                            key = key[:-4]
+                        array = memmap_npz_member(filename, info)
+                        if array is None:
+                            array = data[key]
+                        arrays[key] = array
+                data.close()
+                return arrays, None
             elif hasattr(data, 'keys'):
                 return data, None
             else:
@@ -210,16 +300,15 @@ def load_array(filename):
 
     def __save_array(data, basename, index):
         """Save numpy array"""
+        import numpy as np
         fname = basename + '_%04d.npy' % index
         np.save(fname, data)
         return fname
-except:
+else:
     load_array = None
 
 
-try:
-    from spyder.pil_patch import Image
-
+if _is_installed('numpy') and _is_installed('PIL'):
     if sys.byteorder == 'little':
         _ENDIAN = '<'
     else:
@@ -239,6 +328,8 @@ def __save_array(data, basename, index):
               "YCbCr": ('|u1', 4),
               }
     def __image_to_array(filename):
+        import numpy as np
+        from spyder.pil_patch import Image
         img = Image.open(filename)
         try:
             dtype, extra = DTYPES[img.mode]
@@ -255,13 +346,14 @@ def load_image(filename):
             return {name: __image_to_array(filename)}, None
         except Exception as error:
             return None, str(error)
-except:
+else:
     load_image = None
 
 
 def load_pickle(filename):
     """Load a pickle file as a dictionary"""
     try:
+        pd = _get_pandas()
         if pd:
             return pd.read_pickle(filename), None
         else:
@@ -286,6 +378,154 @@ def load_json(filename):
         return None, str(err)
 
 
+# Rows of text files that are read at once
+TEXT_CHUNKSIZE = 100000
+
+# Rows of text files used to infer the types of their columns
+TEXT_SAMPLE_ROWS = 1000
+
+
+def _parse_text_value(value):
+    """Return value as an int or a float if possible."""
+    for _type in (int, float):
+        try:
+            return _type(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _iter_text_lines(fid, lineterminator, size=2**16):
+    """Yield the lines of fid split by lineterminator, reading by blocks."""
+    rest = u''
+    for block in iter(lambda: fid.read(size), u''):
+        lines = (rest + block).split(lineterminator)
+        rest = lines.pop()
+        for line in lines:
+            yield line
+    yield rest
+
+
+def _read_text_rows(filename, sep, lineterminator, skiprows, comment,
+                    encoding):
+    """Read the rows of a text file as lists of values, without pandas."""
+    rows = []
+    with io.open(filename, encoding=encoding, newline=u'') as fid:
+        if lineterminator in (None, u'\n', u'\r\n'):
+            lines = fid
+        else:
+            lines = _iter_text_lines(fid, lineterminator)
+        for number, line in enumerate(lines):
+            stripped = line.strip()
+            if (number < skiprows or not stripped or
+                    (comment and stripped.startswith(comment))):
+                continue
+            if lineterminator in (None, u'\n', u'\r\n'):
+                line = line.rstrip(u'\r\n')
+            rows.append([_parse_text_value(value)
+                         for value in line.split(sep)])
+
+    # Replace missing values with NaN's or None's
+    try:
+        import numpy as np
+        missing = np.nan
+    except ImportError:
+        missing = None
+    columns = max([len(row) for row in rows] or [0])
+    for row in rows:
+        row.extend([missing] * (columns - len(row)))
+    return rows
+
+
+def _read_text_frame(filename, header, sep, lineterminator, skiprows,
+                     comment, encoding, chunksize):
+    """
+    Read a text file with pandas, by chunks.
+
+    The types of the float and text columns are inferred from its first
+    rows, so they are not inferred again for each chunk.
+    """
+    options = dict(header=header, skiprows=skiprows, encoding=encoding,
+                   comment=comment or None)
+    if sep is None:
+        options['sep'] = r'\s+'
+    else:
+        options['sep'] = sep
+    if lineterminator not in (None, u'\n', u'\r\n'):
+        options['lineterminator'] = lineterminator
+
+    pd = _get_pandas()
+    sample = pd.read_csv(filename, nrows=TEXT_SAMPLE_ROWS, **options)
+    if len(sample) < TEXT_SAMPLE_ROWS:
+        return sample
+    dtype = dict((column, column_dtype) for column, column_dtype
+                 in sample.dtypes.items() if column_dtype.kind in 'fOU')
+    del sample
+
+    try:
+        chunks = pd.read_csv(filename, chunksize=chunksize,
+                             dtype=dtype or None, **options)
+        return pd.concat(list(chunks), ignore_index=True)
+    except (TypeError, ValueError):
+        # A column has other types of values after the sampled rows
+        chunks = pd.read_csv(filename, chunksize=chunksize, **options)
+        return pd.concat(list(chunks), ignore_index=True)
+
+
+def _simplify_rows(rows):
+    """Reduce the dimension of a list of rows with a single row or column."""
+    if len(rows) == 1:
+        row = rows[0]
+        return row[0] if len(row) == 1 else row
+    return [row[0] if len(row) == 1 else row for row in rows]
+
+
+def load_text(filename, kind='array', sep=u',', lineterminator=None,
+              skiprows=0, comment=u'#', transpose=False, encoding=None,
+              chunksize=TEXT_CHUNKSIZE):
+    """
+    Load a delimited text file as an array, a list or a DataFrame.
+
+    This is used by the Import Wizard, so big files don't need to be
+    sent from Spyder. `kind` is 'array', 'list' or 'dataframe' and `sep`
+    None means any whitespace. With pandas, the file is read by chunks
+    of `chunksize` rows. The first row is the header of DataFrames and
+    `transpose` only applies to arrays and lists.
+    """
+    try:
+        pd = _get_pandas()
+        if kind == 'dataframe':
+            if pd is None:
+                return None, "pandas is not installed"
+            return _read_text_frame(filename, 'infer', sep, lineterminator,
+                                    skiprows, comment, encoding,
+                                    chunksize), None
+
+        if pd is not None:
+            values = _read_text_frame(filename, None, sep, lineterminator,
+                                      skiprows, comment, encoding,
+                                      chunksize).values
+            if transpose:
+                values = values.T
+            if kind == 'array':
+                # Same shape as the array of the simplified rows
+                return values.squeeze(), None
+            rows = values.tolist()
+        else:
+            rows = _read_text_rows(filename, sep, lineterminator, skiprows,
+                                   comment, encoding)
+            if transpose:
+                rows = [list(column) for column in zip(*rows)]
+
+        data = _simplify_rows(rows)
+        if kind == 'array':
+            import numpy as np
+            data = np.array(data)
+        return data, None
+    except Exception as error:
+        return None, str(error)
+
+
 def save_dictionary(data, filename):
     """Save dictionary in a single file .spydata file"""
     filename = osp.abspath(filename)
@@ -317,6 +557,7 @@ def save_dictionary(data, filename):
         saved_arrays = {}
         if load_array is not None:
             # Saving numpy arrays with np.save
+            import numpy as np
             arr_fname = osp.splitext(filename)[0]
             for name in list(data.keys()):
                 try:
@@ -409,6 +650,7 @@ def load_dictionary(filename):
         saved_arrays = {}
         if load_array is not None:
             # Loading numpy arrays saved with np.save
+            import numpy as np
             try:
                 saved_arrays = data.pop('__saved_arrays__')
                 for (name, index), fname in list(saved_arrays.items()):
@@ -434,9 +676,14 @@ def load_dictionary(filename):
     return data, error_message
 
 
+# Extensions whose load function accepts an `mmap` argument
+MMAP_EXTENSIONS = ('.npy', '.npz')
+
+
 class IOFunctions(object):
     def __init__(self):
         self.load_extensions = None
+        self.mmap_extensions = None
         self.save_extensions = None
         self.load_filters = None
         self.save_filters = None
@@ -444,6 +691,7 @@ def __init__(self):
         self.save_funcs = None
 
     def setup(self):
+        self.mmap_extensions = set(MMAP_EXTENSIONS)
         iofuncs = self.get_internal_funcs()+self.get_3rd_party_funcs()
         load_extensions = {}
         save_extensions = {}
@@ -499,6 +747,8 @@ def get_3rd_party_funcs(self):
                 try:
                     other_funcs.append((mod.FORMAT_EXT, mod.FORMAT_NAME,
                                         mod.FORMAT_LOAD, mod.FORMAT_SAVE))
+                    if getattr(mod, 'FORMAT_MMAP', False):
+                        self.mmap_extensions.add(mod.FORMAT_EXT)
                 except AttributeError as error:
                     print("%s: %s" % (mod, str(error)), file=sys.stderr)
         except ImportError:
@@ -512,6 +762,15 @@ def save(self, data, filename):
         else:
             return "<b>Unsupported file type '%s'</b>" % ext
 
+    def supports_mmap(self, ext):
+        """
+        Check if the load function for `ext` can memory-map data.
+
+        I/O plugins declare this by setting `FORMAT_MMAP = True`, in which
+        case their load function must accept an `mmap` argument.
+        """
+        return ext in self.mmap_extensions and ext in self.load_funcs
+
     def load(self, filename):
         ext = osp.splitext(filename)[1].lower()
         if ext in self.load_funcs:
@@ -530,6 +789,7 @@ def save_auto(data, filename):
 
 if __name__ == "__main__":
     import datetime
+    import numpy as np
     testdict = {'d': 1, 'a': np.random.rand(10, 10), 'b': [1, 2]}
     testdate = datetime.date(1945, 5, 8)
     example = {'str': 'kjkj kj k j j kj k jkj',
@@ -208,6 +208,81 @@ def test_npz_import():
     assert variables['val1'] == np.array(1) and not error
 
 
+@pytest.mark.parametrize('compressed', [True, False])
+def test_npz_import_mmap(tmpdir, compressed):
+    """
+    Test that arrays in uncompressed .npz files are memory-mapped and the
+    rest are read as usual.
+    """
+    filename = str(tmpdir.join('data.npz'))
+    arrays = {'a': np.arange(10.), 'b': np.ones((3, 4), order='F'),
+              'c': np.array([])}
+    if compressed:
+        np.savez_compressed(filename, **arrays)
+    else:
+        np.savez(filename, **arrays)
+
+    variables, error = iofuncs.load_array(filename, mmap=True)
+    assert not error
+    for name in arrays:
+        assert np.array_equal(variables[name], arrays[name])
+    assert isinstance(variables['a'], np.memmap) is not compressed
+    assert isinstance(variables['b'], np.memmap) is not compressed
+    # Empty arrays can't be memory-mapped
+    assert not isinstance(variables['c'], np.memmap)
+
+    # Arrays are copy-on-write
+    variables['a'][0] = 100
+    assert iofuncs.load_array(filename)[0]['a'][0] == 0
+
+
+def test_npy_import_mmap(tmpdir):
+    """Test that .npy files are memory-mapped."""
+    filename = str(tmpdir.join('data.npy'))
+    np.save(filename, np.arange(10))
+    variables, error = iofuncs.load_array(filename, mmap=True)
+    assert not error
+    assert isinstance(variables['data'], np.memmap)
+    assert iofuncs.iofunctions.supports_mmap('.npy')
+    assert iofuncs.iofunctions.supports_mmap('.npz')
+    assert not iofuncs.iofunctions.supports_mmap('.spydata')
+    assert not iofuncs.iofunctions.supports_mmap('.unknown')
+
+
+@pytest.mark.parametrize('use_pandas', [True, False])
+def test_load_text(tmpdir, monkeypatch, use_pandas):
+    """Test loading delimited text files by chunks."""
+    if not use_pandas:
+        monkeypatch.setattr(iofuncs, '_get_pandas', lambda: None)
+    elif iofuncs._get_pandas() is None:
+        pytest.skip("Pandas required")
+    filename = str(tmpdir.join('data.csv'))
+    rows = [[i, i / 2.] for i in range(3000)]
+    with io.open(filename, 'w') as f:
+        f.write(u'# Comment\nx;y\n')
+        f.write(u''.join(u'{};{}\n'.format(*row) for row in rows))
+
+    data, error = iofuncs.load_text(filename, kind='array', sep=u';',
+                                    skiprows=2, chunksize=1000)
+    assert not error
+    assert np.array_equal(data, np.array(rows))
+
+    data, error = iofuncs.load_text(filename, kind='list', sep=u';',
+                                    skiprows=2, transpose=True)
+    assert not error
+    assert data == [list(column) for column in zip(*rows)]
+
+    if use_pandas:
+        data, error = iofuncs.load_text(filename, kind='dataframe',
+                                        sep=u';', chunksize=1000)
+        assert not error
+        assert list(data.columns) == ['x', 'y']
+        assert data['y'].tolist() == [row[1] for row in rows]
+    else:
+        __, error = iofuncs.load_text(filename, kind='dataframe')
+        assert error
+
+
 @pytest.mark.skipif(iofuncs.load_matlab is None, reason="SciPy required")
 def test_matlab_import(real_values):
     """
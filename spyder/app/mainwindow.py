@@ -95,6 +95,7 @@
                               PY3, qbytearray_to_str, to_text_string)
 from spyder.utils import encoding, programs
 from spyder.utils import icon_manager as ima
+from spyder.utils.executor import get_executor
 from spyder.utils.misc import (select_port, getcwd_or_home,
                                get_python_executable)
 from spyder.utils.programs import is_module_installed
@@ -1409,6 +1410,11 @@ def create_edit_action(text, tr_text, icon):
                 except TypeError:
                     pass
 
+        icon_stats = ima.get_icon_stats()
+        logger.info("Created {} icons in {:.3f} s, {} more taken from the "
+                    "icon cache".format(icon_stats['created'],
+                                        icon_stats['time'],
+                                        icon_stats['hits']))
         logger.info("*** End of MainWindow setup ***")
         self.is_starting_up = False
 
@@ -1644,9 +1650,17 @@ def set_window_title(self):
 
     @Slot()
     def report_missing_dependencies(self):
-        """Show a QMessageBox with a list of missing hard dependencies"""
+        """
+        Check dependencies in the background and show a QMessageBox with a
+        list of the missing hard ones (if any).
+        """
         # Declare dependencies before trying to detect the missing ones
         dependencies.declare_dependencies()
+        dependencies.update_installed_versions(
+            self._report_missing_dependencies)
+
+    def _report_missing_dependencies(self):
+        """Show the missing dependencies found in the background."""
         missing_deps = dependencies.missing_dependencies()
 
         if missing_deps:
@@ -2644,6 +2658,9 @@ def closing(self, cancelable=False):
 
         self.completions.shutdown()
 
+        # Queue and latency metrics of the tasks run in the background
+        logger.debug("Background tasks: %s", get_executor().get_stats())
+
         self.already_closed = True
         return True
 
@@ -3621,6 +3638,7 @@ def main(options, args):
                 "theme used in Spyder 2.<br><br>"
                 "For that, please close this window and start Spyder again.")
         CONF.set('appearance', 'icon_theme', 'spyder 2')
+        ima.clear_icon_cache()
     if mainwindow is None:
         # An exception occurred
         if splash is not None:
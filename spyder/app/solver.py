@@ -13,8 +13,6 @@
 import os
 import traceback
 
-import pkg_resources
-
 from spyder.api.exceptions import SpyderAPIError
 from spyder.config.base import DEV, STDERR, running_under_pytest
 from spyder.utils.external.toposort import (CircularDependencyError,
@@ -109,6 +107,45 @@ def find_internal_plugins():
     return internal_plugins
 
 
+def _get_entry_points(group):
+    """
+    Return the entry points of group as (name, module name, attribute,
+    distribution name, distribution version) tuples.
+    """
+    # When support for Python 3.7 and below is dropped, the fallback to
+    # pkg_resources can be removed
+    try:
+        from importlib import metadata
+    except ImportError:
+        # Importing pkg_resources is slow, so it's only done if needed
+        import pkg_resources
+        return [(entry_point.name, entry_point.module_name,
+                 entry_point.attrs[0], entry_point.dist.project_name,
+                 entry_point.dist.version)
+                for entry_point in pkg_resources.iter_entry_points(group)]
+
+    entry_points = []
+    dist_keys = set()
+    for dist in metadata.distributions():
+        # Only the first distribution with a name in sys.path is used, as
+        # the import system does
+        dist_name = dist.metadata['Name']
+        dist_key = dist_name.lower().replace('_', '-')
+        if dist_key in dist_keys:
+            continue
+        dist_keys.add(dist_key)
+
+        for entry_point in dist.entry_points:
+            if entry_point.group != group:
+                continue
+            module_name, __, attrs = entry_point.value.partition(':')
+            attrs = attrs.split('[')[0].strip()
+            entry_points.append((entry_point.name, module_name.strip(),
+                                 attrs.split('.')[0], dist_name,
+                                 dist.version))
+    return entry_points
+
+
 def find_external_plugins():
     """
     Find available internal plugins based on setuptools entry points.
@@ -124,25 +161,19 @@ def find_external_plugins():
         "lsp_completion",
         "python",
     ]
-    plugins = [
-        entry_point for entry_point
-        in pkg_resources.iter_entry_points("spyder.plugins")
-    ]
+    plugins = _get_entry_points("spyder.plugins")
 
     external_plugins = {}
-    for entry_point in plugins:
-        name = entry_point.name
+    for name, module_name, class_name, package_name, version in plugins:
         if name not in internal_plugins and name not in new_plugins:
             try:
-                class_name = entry_point.attrs[0]
-                mod = importlib.import_module(entry_point.module_name)
+                mod = importlib.import_module(module_name)
                 plugin_class = getattr(mod, class_name, None)
 
                 # To display in dependencies dialog
-                plugin_class._spyder_module_name = entry_point.module_name
-                plugin_class._spyder_package_name = (
-                    entry_point.dist.project_name)
-                plugin_class._spyder_version = entry_point.dist.version
+                plugin_class._spyder_module_name = module_name
+                plugin_class._spyder_package_name = package_name
+                plugin_class._spyder_version = version
 
                 external_plugins[name] = plugin_class
                 if name != plugin_class.NAME:
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the time it takes to import the main window.
+
+Run tools/audit_imports.py to find what makes it slower.
+"""
+
+# Standard library imports
+import os
+import subprocess
+import sys
+
+# Third party imports
+import pytest
+
+
+# Maximum time to import spyder.app.mainwindow, in seconds. It takes less
+# than 1 s in a development machine, so this only catches big regressions
+IMPORT_TIME_BUDGET = 4
+
+# Modules that are slow to import and are not needed until later
+DEFERRED_MODULES = ['astroid', 'docutils', 'jinja2', 'matplotlib', 'numpy',
+                    'pandas', 'pylint', 'requests', 'scipy', 'sphinx',
+                    'sympy']
+
+IMPORT_CODE = """\
+import sys, time
+start = time.perf_counter()
+import spyder.app.mainwindow
+print(time.perf_counter() - start)
+print(' '.join(sys.modules))
+"""
+
+
+def import_mainwindow():
+    """
+    Import the main window in a new interpreter and return the time it
+    took and the modules that were imported.
+    """
+    env = os.environ.copy()
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_CODE],
+                                     env=env, universal_newlines=True)
+    seconds, modules = output.strip().splitlines()[-2:]
+    return float(seconds), set(modules.split())
+
+
+def test_mainwindow_import_time():
+    """
+    Test that the main window is imported within its budget and without
+    the modules that are imported when they are first needed.
+    """
+    times = []
+    for __ in range(3):
+        seconds, modules = import_mainwindow()
+        times.append(seconds)
+
+    imported = [name for name in DEFERRED_MODULES if name in modules]
+    assert imported == []
+    assert min(times) < IMPORT_TIME_BUDGET
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -162,6 +162,7 @@
               'pdb_execute_events': True,
               'pdb_use_exclamation_mark': True,
               'pdb_stop_first_line': True,
+              'kernel_pool_size': 0,
               }),
             ('variable_explorer',
              {
@@ -177,7 +178,8 @@
               'truncate': True,
               'minmax': False,
               'show_callable_attributes': True,
-              'show_special_attributes': False
+              'show_special_attributes': False,
+              'import_mmap': False
              }),
             ('plots',
              {
@@ -242,6 +244,7 @@
               'autosave_interval': 60,
               'docstring_type': 'Numpydoc',
               'strip_trailing_spaces_on_modify': False,
+              'large_file_threshold': 50,
               }),
             ('historylog',
              {
@@ -283,7 +286,9 @@
               'show_all': True,
               'show_hscrollbar': True,
               'max_recent_projects': 10,
-              'visible_if_project_open': True
+              'visible_if_project_open': True,
+              'watcher_excludes': ['.git', '.hg', '.svn', '__pycache__',
+                                   '*.pyc', '.ipynb_checkpoints']
               }),
             ('explorer',
              {
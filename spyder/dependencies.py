@@ -7,15 +7,26 @@
 """Module checking Spyder runtime dependencies"""
 
 
+from functools import partial
+import hashlib
+import logging
 import os
+import site
 import sys
+import sysconfig
+
+# Third party imports
+from pickleshare import PickleShareDB
 
 # Local imports
 from spyder.utils import programs
-from spyder.config.base import _, is_pynsist
+from spyder.config.base import _, get_conf_path, is_pynsist
 from spyder.config.utils import is_anaconda
 
 
+logger = logging.getLogger(__name__)
+
+
 # =============================================================================
 # Kind of dependency
 # =============================================================================
@@ -296,22 +307,37 @@ def __init__(self, modname, package_name, features, required_version,
         self.required_version = required_version
         self.kind = kind
 
-        if installed_version is None:
-            try:
-                self.installed_version = programs.get_module_version(modname)
-            except Exception:
-                # NOTE: Don't add any exception type here!
-                # Modules can fail to import in several ways besides
-                # ImportError
-                self.installed_version = None
-        else:
-            self.installed_version = installed_version
+        # The installed version is only found when it's needed, which is
+        # usually done for all dependencies by update_installed_versions
+        self._installed_version = installed_version
+        self._checked = installed_version is not None
+
+    @property
+    def installed_version(self):
+        """Installed version, or None if it's not installed."""
+        if not self._checked:
+            self.installed_version = find_installed_version(
+                self.modname, self.package_name)
+        return self._installed_version
+
+    @installed_version.setter
+    def installed_version(self, version):
+        self._installed_version = version
+        self._checked = True
 
     def check(self):
-        """Check if dependency is installed"""
+        """
+        Check if dependency is installed.
+
+        This compares the installed version with the required one, so the
+        module is not imported. Whether it can be imported is only checked
+        by update_installed_versions, which sets installed_version to None
+        if it can't.
+        """
         if self.required_version:
-            return programs.is_module_installed(self.modname,
-                                                self.required_version)
+            return (self.installed_version is not None and
+                    programs.check_version_requirements(
+                        self.installed_version, self.required_version))
         else:
             return True
 
@@ -411,3 +437,127 @@ def declare_dependencies():
             add(dep['modname'], dep['package_name'],
                 dep['features'], dep['required_version'],
                 kind=dep.get('kind', MANDATORY))
+
+
+def find_installed_version(modname, package_name):
+    """
+    Return the installed version of a dependency, or None if it's not
+    installed.
+
+    It's read from the metadata of its distribution, so the module is only
+    imported if that's not possible.
+    """
+    version = programs.get_package_version(package_name)
+    if version is None:
+        try:
+            version = programs.get_module_version(modname)
+        except Exception:
+            # NOTE: Don't add any exception type here!
+            # Modules can fail to import in several ways besides
+            # ImportError
+            version = None
+    if version is not None and not isinstance(version, str):
+        version = '.'.join([str(i) for i in version])
+    return version
+
+
+def get_installed_versions_key():
+    """Return the key of the versions of this environment in the db."""
+    digest = hashlib.md5(sys.executable.encode('utf-8')).hexdigest()
+    return 'dependencies/' + digest
+
+
+def get_site_packages():
+    """Return the folders where packages are installed in this env."""
+    paths = sysconfig.get_paths()
+    site_packages = set([paths['purelib'], paths['platlib']])
+    if site.ENABLE_USER_SITE:
+        site_packages.add(site.getusersitepackages())
+    return sorted(site_packages)
+
+
+def save_installed_versions(modules, db_path):
+    """
+    Return the installed versions of modules, a list of (modname,
+    package_name) pairs, and save them in the modules database at db_path,
+    with the mtimes of site-packages.
+
+    Modules that can't be imported are saved as not installed, even if
+    their metadata is found. This is slow, so it's run in a background
+    process.
+    """
+    from spyder.utils.interpreters import get_mtimes
+
+    versions = {}
+    for modname, package_name in modules:
+        version = find_installed_version(modname, package_name)
+        if version is not None:
+            try:
+                __import__(modname)
+            except Exception:
+                # NOTE: Don't add any exception type here!
+                # Modules can fail to import in several ways besides
+                # ImportError
+                version = None
+        versions[modname] = version
+
+    modules_db = PickleShareDB(db_path)
+    modules_db[get_installed_versions_key()] = {
+        'mtimes': get_mtimes(get_site_packages()),
+        'versions': versions,
+    }
+    return versions
+
+
+def load_installed_versions(modules):
+    """
+    Return the saved installed versions of modules, or None if some are
+    missing or packages were installed or removed since they were saved.
+    """
+    from spyder.utils.interpreters import get_mtimes
+
+    modules_db = PickleShareDB(get_conf_path('db'))
+    entry = modules_db.get(get_installed_versions_key())
+    if (entry is None or
+            get_mtimes(entry['mtimes']) != entry['mtimes'] or
+            any(modname not in entry['versions']
+                for modname, __ in modules)):
+        return None
+    return entry['versions']
+
+
+def update_installed_versions(callback=None, deps=DEPENDENCIES):
+    """
+    Find the installed versions of deps and call callback when they are
+    known.
+
+    They are looked for in a background process (unless they didn't change
+    since the last time), to not import modules in Spyder's one.
+    """
+    from spyder.utils.executor import PRIORITY_BACKGROUND, get_executor
+
+    modules = [(dep.modname, dep.package_name) for dep in deps]
+    versions = load_installed_versions(modules)
+    if versions is not None:
+        _installed_versions_updated(deps, callback, None, versions, None)
+        return
+
+    executor = get_executor()
+    task = executor.create_task(
+        save_installed_versions, modules, get_conf_path('db'),
+        priority=PRIORITY_BACKGROUND, key='dependencies', process=True)
+    task.sig_finished.connect(
+        partial(_installed_versions_updated, deps, callback))
+    executor.start(task)
+
+
+def _installed_versions_updated(deps, callback, task, versions, error):
+    """Set the installed versions found by update_installed_versions."""
+    if error is not None:
+        logger.debug("Installed versions not found: %s", error)
+        versions = {}
+    for dep in deps:
+        if dep.modname in versions:
+            dep.installed_version = versions[dep.modname]
+    if callback is not None:
+        callback()
@@ -27,7 +27,7 @@
 from spyder.plugins.completion.manager.api import CompletionItemKind
 from spyder.plugins.completion.manager.api import LSPRequestTypes
 from spyder.plugins.completion.fallback.utils import (
-    get_keywords, get_words, is_prefix_valid)
+    get_import_prefix, get_keywords, get_words, is_prefix_valid)
 
 
 FALLBACK_COMPLETION = "Fallback"
@@ -47,6 +47,7 @@ def __init__(self, parent):
         self.daemon = True
         self.mutex = QMutex()
         self.file_tokens = {}
+        self.module_index = None
         self.diff_patch = diff_match_patch()
         self.thread = QThread()
         self.moveToThread(self.thread)
@@ -58,7 +59,15 @@ def tokenize(self, text, offset, language, current_word):
         """
         Return all tokens in `text` and all keywords associated by
         Pygments to `language`.
+
+        In Python import statements, the names of the modules found in the
+        module index are returned instead.
         """
+        if language.lower() == 'python' and self.module_index is not None:
+            module_prefix = get_import_prefix(text, offset)
+            if module_prefix is not None:
+                return self.get_module_completions(module_prefix)
+
         valid = is_prefix_valid(text, offset, language)
         if not valid:
             return []
@@ -101,6 +110,20 @@ def tokenize(self, text, offset, language, current_word):
 
         return keywords
 
+    def get_module_completions(self, prefix):
+        """Return the modules of the module index that start by prefix."""
+        completions = []
+        for module in self.module_index.get_completions(prefix):
+            name = module.rsplit('.', 1)[-1]
+            completions.append({'kind': CompletionItemKind.MODULE,
+                                'insertText': name,
+                                'label': name,
+                                'sortText': name,
+                                'filterText': name,
+                                'documentation': module,
+                                'provider': FALLBACK_COMPLETION})
+        return completions
+
     def stop(self):
         """Stop actor."""
         with QMutexLocker(self.mutex):
@@ -16,6 +16,7 @@
 # Local imports
 from spyder.plugins.completion.manager.api import SpyderCompletionPlugin
 from spyder.plugins.completion.fallback.actor import FallbackActor
+from spyder.utils.introspection.module_completion import get_module_index
 
 
 logger = logging.getLogger(__name__)
@@ -37,12 +38,17 @@ def __init__(self, parent):
         self.started = False
         self.requests = {}
         self.update_configuration()
+        interpreter_changed = getattr(self.main,
+                                      'sig_main_interpreter_changed', None)
+        if interpreter_changed is not None:
+            interpreter_changed.connect(self.update_module_index)
 
     def start_client(self, language):
         return self.started
 
     def start(self):
         if not self.started and self.enabled:
+            self.update_module_index()
             self.fallback_actor.start()
             self.started = True
 
@@ -63,6 +69,10 @@ def send_request(self, language, req_type, req, req_id=None):
         req['language'] = language
         self.fallback_actor.sig_mailbox.emit(request)
 
+    def update_module_index(self):
+        """Complete imports with the modules of the main interpreter."""
+        self.fallback_actor.module_index = get_module_index()
+
     def update_configuration(self):
         self.enabled = self.get_option('enable')
         self.start()
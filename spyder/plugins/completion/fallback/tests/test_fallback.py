@@ -10,7 +10,8 @@
 import pytest
 from diff_match_patch import diff_match_patch
 from spyder.plugins.completion.manager.api import LSPRequestTypes
-from spyder.plugins.completion.fallback.utils import get_words
+from spyder.plugins.completion.fallback.utils import (
+    get_import_prefix, get_words)
 
 
 DATA_PATH = osp.join(osp.dirname(osp.abspath(__file__)), "data")
@@ -91,6 +92,22 @@ def test_get_words():
     assert set(tokens) == {'foo', 'baz', 'car456'}
 
 
+@pytest.mark.parametrize('text,prefix', [
+    ('import ', ''),
+    ('import os.pa', 'os.pa'),
+    ('x = 1\n  import os, sy', 'sy'),
+    ('from numpy.li', 'numpy.li'),
+    ('from os import pa', None),
+    ('import os as o', None),
+    ('important', None),
+    ('😀; import o', None),
+    ('# 😀\nimport o', 'o'),
+])
+def test_get_import_prefix(text, prefix):
+    offset = len(text) + text.count('😀')
+    assert get_import_prefix(text, offset) == prefix
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize('file_fixture', language_list, indirect=True)
 def test_tokenize(qtbot_module, fallback_fixture, file_fixture):
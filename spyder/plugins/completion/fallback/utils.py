@@ -39,6 +39,10 @@
 # Same as above, but it also considers words separated by "-"
 kebab_regex = re.compile(r'[^\W\d_]\w+[-\w]*')
 
+# Module names being written in import statements
+import_regex = re.compile(
+    r'^\s*(?:from\s+|import\s+(?:[\w.]+\s*,\s*)*)([\w.]*)$')
+
 LANGUAGE_REGEX = {
     'css': kebab_regex,
     'scss': kebab_regex,
@@ -146,6 +150,23 @@ def is_prefix_valid(text, offset, language):
     return valid
 
 
+def get_import_prefix(text, offset):
+    """
+    Return the (possibly dotted) name of the module written before offset
+    in an import statement, or None if offset is not in one.
+    """
+    # Account for length differences in text when using characters
+    # such as emojis in the editor.
+    offset = offset - (qstring_length(text) - len(text))
+    if offset < 0 or offset > len(text):
+        return None
+    line_start = text.rfind('\n', 0, offset) + 1
+    match = import_regex.match(text[line_start:offset])
+    if match is None:
+        return None
+    return match.group(1)
+
+
 @memoize
 def get_parent_until(path):
     """
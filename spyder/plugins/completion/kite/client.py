@@ -16,7 +16,6 @@
 # Third party imports
 from qtpy.QtCore import QObject, QThread, Signal, QMutex
 from qtpy.QtWidgets import QMessageBox
-import requests
 
 # Local imports
 from spyder.config.base import _, running_under_pytest
@@ -63,6 +62,9 @@ def __init__(self, parent, enable_code_snippets=True):
         self.sig_perform_onboarding_request.connect(self.get_onboarding_file)
 
     def start(self):
+        # Importing requests is slow, so it's done when Kite is used
+        import requests
+
         if not self.thread_started:
             self.thread.start()
         logger.debug('Starting Kite HTTP session...')
@@ -136,6 +136,7 @@ def update_font(self):
 
     def on_close(self, cancelable=False):
         self.get_widget().dialog_manager.close_all()
+        self.get_widget().shell.scrollback.close()
         return True
 
     def on_mainwindow_visible(self):
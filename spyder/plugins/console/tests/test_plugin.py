@@ -152,5 +152,23 @@ def test_handle_exception(console_plugin, mocker):
     console_plugin.set_conf_option('previous_crash', '', section='main')
 
 
+def test_collapsed_output(console_plugin):
+    """Test that long outputs are collapsed but kept in the scrollback."""
+    shell = console_plugin.get_widget().shell
+    shell.setMaximumBlockCount(100)
+    text = ''.join('line {}\n'.format(i) for i in range(1000))
+    shell.write(text, flush=True)
+
+    assert shell.collapsed_lines > 800
+    assert 'line 999' in shell.toPlainText()
+    assert 'line 1\n' not in shell.toPlainText()
+    assert shell.scrollback.find('line 1') >= 0
+    assert shell.scrollback.find('line 999') >= 0
+
+    # The scrollback file is removed when closing
+    console_plugin.on_close()
+    assert shell.scrollback._file is None
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -35,14 +35,19 @@
 from spyder.utils import icon_manager as ima
 from spyder.utils.qthelpers import (add_actions, create_action, keybinding,
                                     restore_keyevent)
+from spyder.utils.scrollback import ScrollbackBuffer
 from spyder.widgets.mixins import (GetHelpMixin, SaveHistoryMixin,
                                    TracebackLinksMixin, BrowseHistoryMixin)
+from spyder.widgets.scrollbackviewer import ScrollbackViewer
 from spyder.plugins.console.widgets.console import ConsoleBaseWidget
 
 
 # Maximum number of lines to load
 MAX_LINES = 1000
 
+# Minimum time between two renderings of output, in milliseconds
+FLUSH_INTERVAL = 50
+
 
 class ShellBaseWidget(ConsoleBaseWidget, SaveHistoryMixin,
                       BrowseHistoryMixin):
@@ -85,6 +90,11 @@ def __init__(self, parent, history_filename, profile=False,
         # Simple profiling test
         self.profile = profile
 
+        # All the output, including lines that don't fit in the console
+        self.scrollback = ScrollbackBuffer()
+        self.scrollback_viewer = None
+        self.collapsed_lines = 0
+
         # Buffer to increase performance of write/flush operations
         self.__buffer = []
         if initial_message:
@@ -136,6 +146,12 @@ def setup_context_menu(self):
                                      shortcut=keybinding('Paste'),
                                      icon=ima.icon('editpaste'),
                                      triggered=self.paste)
+        scrollback_action = create_action(
+            self, _("Show output history..."),
+            icon=ima.icon('history'),
+            tip=_("Show all outputs, including the ones that don't fit in "
+                  "the console"),
+            triggered=self.show_scrollback)
         save_action = create_action(self, _("Save history log..."),
                                     icon=ima.icon('filesave'),
                                     tip=_("Save current history log (i.e. all "
@@ -151,7 +167,8 @@ def setup_context_menu(self):
                                     triggered=self.selectAll)
         add_actions(self.menu, (self.cut_action, self.copy_action,
                                 paste_action, self.delete_action, None,
-                                selectall_action, None, save_action) )
+                                selectall_action, None, scrollback_action,
+                                save_action) )
 
     def contextMenuEvent(self, event):
         """Reimplement Qt method"""
@@ -183,6 +200,8 @@ def clear_terminal(self):
         Child classes reimplement this method to write prompt
         """
         self.clear()
+        self.scrollback.clear()
+        self.collapsed_lines = 0
 
     # The buffer being edited
     def _set_input_buffer(self, text):
@@ -541,11 +560,11 @@ def write(self, text, flush=False, error=False, prompt=False):
         ts = time.time()
         if flush or prompt:
             self.flush(error=error, prompt=prompt)
-        elif ts - self.__timestamp > 0.05:
+        elif ts - self.__timestamp > FLUSH_INTERVAL / 1000:
             self.flush(error=error)
             self.__timestamp = ts
             # Timer to flush strings cached by last write() operation in series
-            self.__flushtimer.start(50)
+            self.__flushtimer.start(FLUSH_INTERVAL)
 
     def flush(self, error=False, prompt=False):
         """Flush buffer, write text to console"""
@@ -563,6 +582,9 @@ def flush(self, error=False, prompt=False):
             text = "".join(self.__buffer)
 
         self.__buffer = []
+        self.scrollback.append(text)
+        if not prompt:
+            text = self.collapse_output(text)
         self.insert_text(text, at_end=True, error=error, prompt=prompt)
 
         # The lines below are causing a hard crash when Qt generates
@@ -577,6 +599,30 @@ def flush(self, error=False, prompt=False):
         self.new_input_line = True
 
 
+    def collapse_output(self, text):
+        """
+        Return the last lines of text that fit in the console.
+
+        This avoids rendering lines that would be removed right away when
+        lots of them are printed at once. They are still available in the
+        output history.
+        """
+        max_lines = self.maximumBlockCount()
+        if max_lines <= 0 or text.count('\n') < max_lines:
+            return text
+        collapsed = text.rsplit('\n', max_lines - 1)[0]
+        self.collapsed_lines += collapsed.count('\n') + 1
+        return text[len(collapsed) + 1:]
+
+    def show_scrollback(self):
+        """Show all outputs, including the ones that don't fit."""
+        if self.scrollback_viewer is None:
+            self.scrollback_viewer = ScrollbackViewer(self.scrollback, self)
+            self.scrollback_viewer.set_font(self.font())
+        self.scrollback_viewer.refresh(collapsed=self.collapsed_lines)
+        self.scrollback_viewer.show()
+        self.scrollback_viewer.raise_()
+
     #------ Text Insertion
     def insert_text(self, text, at_end=False, error=False, prompt=False):
         """
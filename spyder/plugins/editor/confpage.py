@@ -225,6 +225,21 @@ def enable_tabwidth_spin(index):
         autosave_layout.addWidget(autosave_spinbox)
         autosave_group.setLayout(autosave_layout)
 
+        # -- Large files
+        large_file_group = QGroupBox(_('Large files'))
+        large_file_spinbox = self.create_spinbox(
+            _('Open files larger than: '),
+            _('MB as read-only'),
+            'large_file_threshold',
+            min_=0, max_=100000,
+            tip=_("These files are shown by parts, without syntax "
+                  "highlighting nor code completion.\n"
+                  "Set it to 0 to always open files fully."))
+
+        large_file_layout = QVBoxLayout()
+        large_file_layout.addWidget(large_file_spinbox)
+        large_file_group.setLayout(large_file_layout)
+
         # -- Docstring
         docstring_group = QGroupBox(_('Docstring type'))
 
@@ -313,8 +328,8 @@ def enable_tabwidth_spin(index):
         tabs.addTab(self.create_tab(sourcecode_widget), _("Source code"))
         tabs.addTab(self.create_tab(run_widget), _('Run code'))
         tabs.addTab(self.create_tab(template_btn, autosave_group,
-                                    docstring_group, annotations_group,
-                                    eol_group),
+                                    large_file_group, docstring_group,
+                                    annotations_group, eol_group),
                     _("Advanced settings"))
 
         vlayout = QVBoxLayout()
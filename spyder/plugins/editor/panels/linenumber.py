@@ -99,7 +99,9 @@ def draw_pixmap(xleft, ytop, pixmap):
                 painter.drawText(0, top, self.width(),
                                  font_height,
                                  int(Qt.AlignRight | Qt.AlignBottom),
-                                 to_text_string(line_number))
+                                 to_text_string(
+                                     line_number +
+                                     self.editor.large_file_first_line))
 
             size = self.get_markers_margin() - 2
             icon_size = QSize(size, size)
@@ -184,6 +186,10 @@ def compute_width(self):
             return 0
         digits = 1
         maxb = max(1, self.editor.blockCount())
+        large_file = self.editor.large_file
+        if large_file is not None:
+            maxb = max(maxb + self.editor.large_file_first_line,
+                       large_file.line_count or 0)
         while maxb >= 10:
             maxb /= 10
             digits += 1
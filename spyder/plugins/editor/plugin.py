@@ -40,6 +40,7 @@
 from spyder.widgets.findreplace import FindReplace
 from spyder.plugins.editor.confpage import EditorConfigPage
 from spyder.plugins.editor.utils.autosave import AutosaveForPlugin
+from spyder.plugins.editor.utils.findtasks import TASKS_PATTERN
 from spyder.plugins.editor.utils.switcher import EditorSwitcherManager
 from spyder.plugins.editor.widgets.editor import (EditorMainWindow, Printer,
                                                   EditorSplitter, EditorStack,)
@@ -64,6 +65,10 @@
 
 WINPDB_PATH = programs.find_program('winpdb')
 
+# Maximum number of tasks of other project files shown in the todo list
+# menu. The rest can be seen by searching them in Find in files.
+MAX_PROJECT_TODO_ENTRIES = 50
+
 
 class Editor(SpyderPluginWidget):
     """
@@ -1650,8 +1655,45 @@ def update_todo_menu(self):
             slot = lambda _checked, _l=line0: self.load(filename, goto=_l)
             action = create_action(self, text=text, icon=icon, triggered=slot)
             self.todo_menu.addAction(action)
+
+        # Tasks of the other files of the project, even if not open
+        project_results = self.get_project_todo_results()
+        project_results.pop(filename, None)
+        if project_results:
+            project_menu = self.todo_menu.addMenu(_("Project"))
+            root_path = self.projects.get_active_project_path()
+            tasks = [(fname, text, line0)
+                     for fname in sorted(project_results)
+                     for text, line0 in project_results[fname]]
+            for fname, text, line0 in tasks[:MAX_PROJECT_TODO_ENTRIES]:
+                relpath = osp.relpath(fname, root_path)
+                slot = (lambda _checked, _f=fname, _l=line0:
+                        self.load(_f, goto=_l))
+                action = create_action(
+                    self, text=u"{}:{}: {}".format(relpath, line0, text),
+                    icon=ima.icon('todo'), triggered=slot)
+                project_menu.addAction(action)
+
+            if (len(tasks) > MAX_PROJECT_TODO_ENTRIES and
+                    self.main.findinfiles is not None):
+                project_menu.addSeparator()
+                action = create_action(
+                    self, text=_("Show all {} tasks").format(len(tasks)),
+                    icon=ima.icon('find'),
+                    triggered=self.find_project_todos)
+                project_menu.addAction(action)
         self.update_todo_actions()
 
+    def find_project_todos(self):
+        """Search the tasks of all the project files in Find in files."""
+        self.main.findinfiles.find_in_project(TASKS_PATTERN, regexp=True)
+
+    def get_project_todo_results(self):
+        """Return the tasks of each file of the active project."""
+        if self.projects is None or not self.get_option('todo_list'):
+            return {}
+        return self.projects.get_todo_results()
+
     def todo_results_changed(self):
         """
         Synchronize todo results between editorstacks
@@ -1730,7 +1772,8 @@ def update_todo_actions(self):
         editorstack = self.get_current_editorstack()
         results = editorstack.get_todo_results()
         state = (self.get_option('todo_list') and
-                 results is not None and len(results))
+                 results is not None and
+                 bool(len(results) or self.get_project_todo_results()))
         if state is not None:
             self.todo_list_action.setEnabled(state)
 
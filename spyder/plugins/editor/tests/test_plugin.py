@@ -16,7 +16,9 @@
 import pytest
 
 # Local imports
+from spyder.plugins.editor import plugin as editor_module
 from spyder.plugins.editor.utils.autosave import AutosaveForPlugin
+from spyder.plugins.editor.utils.findtasks import TASKS_PATTERN
 from spyder.plugins.editor.widgets.codeeditor import CodeEditor
 
 
@@ -328,5 +330,34 @@ def test_open_and_close_lsp_requests(editor_plugin_open_files, mocker):
     assert CodeEditor.notify_close.call_count == 2
 
 
+def test_todo_menu_project_entries(editor_plugin, mocker, monkeypatch):
+    """
+    Test that the tasks of the project shown in the todo list menu are
+    capped and that the rest can be searched.
+    """
+    monkeypatch.setattr(editor_module, 'MAX_PROJECT_TODO_ENTRIES', 3)
+    mocker.patch.object(editor_plugin.get_current_editorstack(),
+                        'get_todo_results', return_value=[])
+    editor_plugin.main.findinfiles = mocker.Mock()
+    editor_plugin.projects = mocker.Mock()
+    editor_plugin.projects.get_active_project_path.return_value = '/project'
+    mocker.patch.object(
+        editor_plugin, 'get_project_todo_results',
+        return_value={'/project/a.py': [('TODO a', 1), ('TODO b', 2)],
+                      '/project/b.py': [('FIXME c', 3), ('FIXME d', 4)]})
+
+    editor_plugin.update_todo_menu()
+    project_menu = editor_plugin.todo_menu.actions()[-1].menu()
+    actions = [action for action in project_menu.actions()
+               if not action.isSeparator()]
+    assert [action.text() for action in actions] == [
+        'a.py:1: TODO a', 'a.py:2: TODO b', 'b.py:3: FIXME c',
+        'Show all 4 tasks']
+
+    actions[-1].trigger()
+    editor_plugin.main.findinfiles.find_in_project.assert_called_once_with(
+        TASKS_PATTERN, regexp=True)
+
+
 if __name__ == "__main__":
     pytest.main(['-x', osp.basename(__file__), '-vv', '-rw'])
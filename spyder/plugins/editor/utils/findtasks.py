@@ -8,10 +8,14 @@
 Source code analysis utilities.
 """
 
+import os
+import os.path as osp
 import re
+import threading
 
 # Local import
 from spyder.config.base import get_debug_level
+from spyder.utils import encoding
 
 DEBUG_EDITOR = get_debug_level() >= 3
 
@@ -21,6 +25,18 @@
 TASKS_PATTERN = r"(^|#)[ ]*(TODO|FIXME|XXX|HINT|TIP|@todo|" \
                 r"HACK|BUG|OPTIMIZE|!!!|\?\?\?)([^#]*)"
 
+# Extensions of the files added to TODO indexes
+PYTHON_EXTENSIONS = ('.py', '.pyw', '.ipy')
+
+
+def find_line_task(text):
+    """Return the task in a line of code, or '' if there's none."""
+    task = ''
+    for todo in re.findall(TASKS_PATTERN, text):
+        task = (todo[-1].strip(' :').capitalize() if todo[-1]
+                else todo[-2])
+    return task
+
 
 def find_tasks(source_code):
     """Find tasks in source code (TODO, FIXME, XXX, ...)."""
@@ -31,3 +47,78 @@ def find_tasks(source_code):
                          else todo[-2])
             results.append((todo_text, line + 1))
     return results
+
+
+class TodoIndex(object):
+    """
+    Index of the tasks found in the Python files of a directory.
+
+    Files are only read again when their modification time or size
+    changed since the last update.
+    """
+
+    def __init__(self, root_path):
+        self.root_path = root_path
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def update(self, filenames=None):
+        """
+        Update the index for the given files or for all of them.
+
+        Return the list of files whose tasks changed.
+        """
+        if filenames is None:
+            filenames = list(self._walk())
+            with self._lock:
+                removed = set(self._files) - set(filenames)
+                for filename in removed:
+                    self._files.pop(filename)
+            changed = list(removed)
+        else:
+            changed = []
+
+        for filename in filenames:
+            if self._update_file(filename):
+                changed.append(filename)
+        return changed
+
+    def get_tasks(self):
+        """Return a dict with the tasks of each file that has any."""
+        with self._lock:
+            return {filename: tasks for filename, (__, tasks)
+                    in self._files.items() if tasks}
+
+    # ---- Private API
+    def _walk(self):
+        for dirpath, dirnames, filenames in os.walk(self.root_path):
+            dirnames[:] = [name for name in dirnames
+                           if not name.startswith('.') and
+                           name != '__pycache__']
+            for name in filenames:
+                if osp.splitext(name)[1] in PYTHON_EXTENSIONS:
+                    yield osp.join(dirpath, name)
+
+    def _update_file(self, filename):
+        """Scan filename if it changed and return if its tasks changed."""
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            with self._lock:
+                return self._files.pop(filename, None) is not None
+
+        key = (stat.st_mtime, stat.st_size)
+        with self._lock:
+            previous = self._files.get(filename)
+        if previous is not None and previous[0] == key:
+            return False
+
+        try:
+            text, __ = encoding.read(filename)
+        except Exception:
+            text = ''
+        tasks = find_tasks(text)
+        with self._lock:
+            self._files[filename] = (key, tasks)
+        old_tasks = previous[1] if previous is not None else []
+        return tasks != old_tasks
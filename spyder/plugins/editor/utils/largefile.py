@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Utilities to show files too large to be loaded in the editor.
+
+These files are memory-mapped and only a window of lines around the visible
+ones is decoded and put in the editor. The offset of each line is computed
+in a background thread to be able to move that window anywhere in the file
+and to search in it without reading it whole.
+
+Lines are found by the bytes of a newline in the file encoding, which is an
+ASCII-compatible one unless the file starts with a UTF-16 or UTF-32 BOM.
+"""
+
+# Standard library imports
+from array import array
+import bisect
+import logging
+import mmap
+import os
+import re
+import threading
+
+# Third party imports
+from qtpy.QtCore import QObject, Signal
+
+# Local imports
+from spyder.utils import encoding
+
+
+logger = logging.getLogger(__name__)
+
+# Number of lines loaded in the editor at the same time
+WINDOW_LINES = 20000
+
+# Size of the chunks used to index and search files backwards
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Size of the sample used to detect the file encoding
+SAMPLE_SIZE = 64 * 1024
+
+
+class LargeFile(QObject):
+    """Memory-mapped file with an index of the position of its lines."""
+
+    sig_index_ready = Signal()
+    """This signal is emitted when the line index is built."""
+
+    def __init__(self, filename, parent=None):
+        QObject.__init__(self, parent)
+        self.filename = filename
+
+        # First line of the window loaded in the editors of the file. It's
+        # kept here because cloned editors share their document.
+        self.first_line = 0
+
+        self._open()
+
+    # ---- Public API
+    @property
+    def size(self):
+        return len(self._mmap)
+
+    @property
+    def is_indexed(self):
+        return self._line_offsets is not None
+
+    @property
+    def line_count(self):
+        """Number of lines, or None if the index is not ready yet."""
+        if self._line_offsets is None:
+            return None
+        return len(self._line_offsets)
+
+    def build_index(self):
+        """Build the line index in a background thread."""
+        thread = threading.Thread(target=self._build_index)
+        thread.daemon = True
+        thread.start()
+
+    def read_lines(self, start, count):
+        """
+        Return `count` lines starting at line `start` (zero-based).
+
+        Before the index is ready only the first lines of the file can be
+        read.
+        """
+        if self._line_offsets is None:
+            if start != 0:
+                return ''
+            begin = self._start
+            end = self._find_nth_newline(count)
+        else:
+            start = max(0, min(start, len(self._line_offsets) - 1))
+            begin = self._line_offsets[start]
+            if start + count < len(self._line_offsets):
+                end = self._line_offsets[start + count]
+            else:
+                end = len(self._mmap)
+
+        text = self._mmap[begin:end].decode(self._codec, 'replace')
+
+        # The last newline would add an empty block to the editor
+        if text.endswith('\r\n'):
+            text = text[:-2]
+        elif text.endswith('\n'):
+            text = text[:-1]
+        return text
+
+    def line_at(self, offset):
+        """Return the line (zero-based) that contains the byte offset."""
+        return bisect.bisect_right(self._line_offsets, offset) - 1
+
+    def search(self, text, start_line, forward=True, case=False,
+               word=False, regexp=False):
+        """
+        Search `text` in the file starting at line `start_line`.
+
+        Backward searches look for matches before `start_line`, which can
+        be the number of lines to search from the end of the file. Return
+        the line (zero-based) of the first match or None if there are no
+        matches or the index is not ready.
+
+        The file is decoded by chunks of lines to search in them, so matches
+        can't span chunks, and `^` and `$` match at the start and end of
+        each line.
+        """
+        if self._line_offsets is None or not text:
+            return None
+
+        if not regexp:
+            text = re.escape(text)
+        if word:
+            text = r'\b{}\b'.format(text)
+        flags = re.MULTILINE | (0 if case else re.IGNORECASE)
+        try:
+            pattern = re.compile(text, flags)
+        except re.error:
+            return None
+
+        line_count = len(self._line_offsets)
+        if start_line < 0 or start_line > line_count:
+            return None
+
+        if forward:
+            begin = start_line
+            while begin < line_count:
+                end = self._chunk_end(begin)
+                chunk = self._read_chunk(begin, end)
+                match = pattern.search(chunk)
+                if match is not None:
+                    return begin + chunk.count('\n', 0, match.start())
+                begin = end
+            return None
+
+        # Search backwards by chunks, keeping the last match of each one
+        end = start_line
+        while end > 0:
+            begin = self._chunk_start(end)
+            chunk = self._read_chunk(begin, end)
+            last = None
+            for match in pattern.finditer(chunk):
+                last = match
+            if last is not None:
+                return begin + chunk.count('\n', 0, last.start())
+            end = begin
+        return None
+
+    def reload(self):
+        """
+        Open the file again if it changed on disk since it was opened.
+
+        Return True if it was reopened, in which case it must be indexed
+        again.
+        """
+        if os.stat(self.filename).st_mtime == self._mtime:
+            return False
+        self.close()
+        self.first_line = 0
+        self._open()
+        return True
+
+    def close(self):
+        """Release the file."""
+        try:
+            self._mmap.close()
+        except AttributeError:
+            pass
+        self._file.close()
+
+    # ---- Private API
+    def _open(self):
+        """Memory-map the file and detect its encoding."""
+        self._file = open(self.filename, 'rb')
+        self._mtime = os.fstat(self._file.fileno()).st_mtime
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be memory-mapped
+            self._mmap = b''
+        self._line_offsets = None
+        self.encoding = self._detect_encoding()
+
+        # Codec used to decode lines, the bytes of a newline and the offset
+        # of the first line. Lines of files with a UTF-16 or UTF-32 BOM
+        # are decoded without it, because they don't start with one.
+        self._codec = self.encoding
+        self._newline = b'\n'
+        self._start = 0
+        for bom, codec in encoding.WIDE_BOMS:
+            if self._mmap[:len(bom)] == bom:
+                self.encoding = codec[:-3]
+                self._codec = codec
+                self._newline = u'\n'.encode(codec)
+                self._start = len(bom)
+                break
+
+    def _detect_encoding(self):
+        """Detect the file encoding from a sample of its beginning."""
+        sample = self._mmap[:SAMPLE_SIZE]
+
+        # Don't split multibyte chars
+        if len(sample) == SAMPLE_SIZE:
+            sample = encoding.truncate_lines(sample, SAMPLE_SIZE)
+
+        __, enc = encoding.decode(sample)
+        enc = enc.replace('-guessed', '')
+        if enc == 'utf-8-bom':
+            enc = 'utf-8-sig'
+        return enc
+
+    def _find_nth_newline(self, count):
+        """Return the offset after the `count`-th newline."""
+        width = len(self._newline)
+        position = self._start
+        for __ in range(count):
+            position = self._mmap.find(self._newline, position)
+            # Skip the matches that are not at the start of a code unit
+            while position > 0 and position % width:
+                position = self._mmap.find(self._newline, position + 1)
+            if position == -1:
+                return len(self._mmap)
+            position += width
+        return position
+
+    def _read_chunk(self, begin, end):
+        """Return the text of lines begin to end, with LF line endings."""
+        if end < len(self._line_offsets):
+            stop = self._line_offsets[end]
+        else:
+            stop = len(self._mmap)
+        text = self._mmap[self._line_offsets[begin]:stop].decode(
+            self._codec, 'replace')
+        return text.replace('\r\n', '\n')
+
+    def _chunk_end(self, begin):
+        """Return the line after a chunk of CHUNK_SIZE bytes from begin."""
+        offset = self._line_offsets[begin] + CHUNK_SIZE
+        if offset >= len(self._mmap):
+            return len(self._line_offsets)
+        return max(begin + 1, self.line_at(offset))
+
+    def _chunk_start(self, end):
+        """Return the first line of a chunk of CHUNK_SIZE bytes to end."""
+        if end < len(self._line_offsets):
+            offset = self._line_offsets[end] - CHUNK_SIZE
+        else:
+            offset = len(self._mmap) - CHUNK_SIZE
+        return max(0, min(end - 1, self.line_at(offset)))
+
+    def _build_index(self):
+        """Compute the offset of the beginning of each line."""
+        data = self._mmap
+        offsets = array('q', [self._start])
+        size = len(data)
+        width = len(self._newline)
+        if width == 1:
+            newline = re.compile(b'\n')
+        else:
+            # Look ahead to not skip newlines that overlap a match that is
+            # not at the start of a code unit
+            newline = re.compile(b'(?=' + re.escape(self._newline) + b')')
+        try:
+            # Chunks start at the start of a code unit, so they don't split
+            # newlines
+            for begin in range(self._start, size, CHUNK_SIZE):
+                end = min(begin + CHUNK_SIZE, size)
+                offsets.extend(match.start() + width for match in
+                               newline.finditer(data, begin, end)
+                               if match.start() % width == 0)
+        except ValueError:
+            # The file was closed or reloaded while indexing it
+            return
+
+        # Don't count the empty line after a trailing newline
+        if len(offsets) > 1 and offsets[-1] == size:
+            offsets.pop()
+
+        if data is not self._mmap:
+            return
+        self._line_offsets = offsets
+        logger.debug("Indexed {} lines of {}".format(len(offsets),
+                                                     self.filename))
+        self.sig_index_ready.emit()
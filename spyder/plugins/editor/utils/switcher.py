@@ -30,6 +30,9 @@ class EditorSwitcherManager(object):
     Symbol mode -> '@'
     Line mode -> ':'
     Files mode -> ''
+
+    In files mode, the files of the active project that match the search
+    text are shown after the open ones.
     """
 
     SYMBOL_MODE = '@'
@@ -50,6 +53,7 @@ def __init__(self, plugin, switcher_instance, get_codeeditor,
         self._editor = get_codeeditor
         self._editorstack = get_editorstack
         self._section = section
+        self._project_section = _("Project")
         self._current_line = None
 
         self.setup_switcher()
@@ -193,6 +197,10 @@ def handle_switcher_selection(self, item, mode, search_text):
             if item.get_section() == self._section:
                 self.editor_switcher_handler(data)
                 self._plugin.switch_to_plugin()
+            elif item.get_section() == self._project_section:
+                self._switcher.hide()
+                self._plugin.load(data)
+                self._plugin.switch_to_plugin()
 
     def handle_switcher_text(self, search_text):
         """Handle switcher search text for line mode."""
@@ -202,9 +210,29 @@ def handle_switcher_text(self, search_text):
             item = self._switcher.current_item()
             self.line_switcher_handler(item.get_data(), search_text,
                                        visible=True)
-        elif self._current_line and mode == '':
-            editorstack.go_to_line(self._current_line)
-            self._current_line = None
+        elif mode == '':
+            if self._current_line:
+                editorstack.go_to_line(self._current_line)
+                self._current_line = None
+            self.create_project_switcher(search_text)
+
+    def create_project_switcher(self, search_text):
+        """Add the files of the active project that match search_text."""
+        items = []
+        projects = getattr(self._plugin, 'projects', None)
+        if search_text and projects is not None:
+            root_path = projects.get_active_project_path()
+            open_files = set(osp.normcase(osp.normpath(data.filename))
+                             for data in self._editorstack().data)
+            for path, score in projects.find_files(search_text):
+                if osp.normcase(osp.normpath(path)) in open_files:
+                    continue
+                items.append((score, dict(
+                    title=osp.basename(path),
+                    description=osp.dirname(osp.relpath(path, root_path)),
+                    icon=get_file_icon(path),
+                    data=path)))
+        self._switcher.set_section_items(self._project_section, items)
 
     def handle_switcher_rejection(self):
         """Do actions when the Switcher is rejected."""
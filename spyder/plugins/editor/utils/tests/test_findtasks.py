@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for findtasks.py"""
+
+# Standard library imports
+import os
+
+# Local imports
+from spyder.plugins.editor.utils.findtasks import find_line_task, TodoIndex
+
+
+def test_find_line_task():
+    """Test finding the task of a single line."""
+    assert find_line_task('# TODO: fix this') == 'Fix this'
+    assert find_line_task('# FIXME') == 'FIXME'
+    assert find_line_task('# nothing to do here') == ''
+
+
+def test_todo_index(tmpdir):
+    """Test that the index only reads again files that changed."""
+    first = tmpdir.join('first.py')
+    first.write('x = 1  # TODO: remove\n')
+    tmpdir.mkdir('.hidden').join('hidden.py').write('# TODO: hidden\n')
+    tmpdir.join('data.txt').write('# TODO: not python\n')
+
+    index = TodoIndex(str(tmpdir))
+    assert index.update() == [str(first)]
+    assert index.get_tasks() == {str(first): [('Remove', 1)]}
+
+    # Nothing changed
+    assert index.update() == []
+
+    second = tmpdir.join('second.py')
+    second.write('# XXX\n')
+    assert index.update([str(second)]) == [str(second)]
+    assert index.get_tasks()[str(second)] == [('XXX', 1)]
+
+    # Removed files are dropped from the index
+    os.remove(str(first))
+    assert index.update() == [str(first)]
+    assert list(index.get_tasks()) == [str(second)]
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for largefile.py"""
+
+# Standard library imports
+import codecs
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.editor.utils import largefile
+from spyder.plugins.editor.utils.largefile import LargeFile
+
+
+@pytest.fixture
+def large_file(tmpdir):
+    """Create an indexed LargeFile with 1000 numbered lines."""
+    path = tmpdir.join('large.txt')
+    path.write_binary(b''.join(b'line %d\n' % i for i in range(1000)))
+    large_file = LargeFile(str(path))
+    large_file._build_index()
+    yield large_file
+    large_file.close()
+
+
+def test_read_lines(large_file):
+    """Test that lines are read using the index."""
+    assert large_file.line_count == 1000
+    assert large_file.read_lines(10, 2) == 'line 10\nline 11'
+    assert large_file.read_lines(998, 10) == 'line 998\nline 999'
+
+
+def test_read_lines_before_index(tmpdir):
+    """Test that the first lines can be read before indexing the file."""
+    path = tmpdir.join('large.txt')
+    path.write_binary(b'a\nb\nc\n')
+    large_file = LargeFile(str(path))
+    assert large_file.line_count is None
+    assert large_file.read_lines(0, 2) == 'a\nb'
+    large_file.close()
+
+
+def test_search(large_file):
+    """Test forward and backward searches."""
+    assert large_file.search('line 5', 0) == 5
+    assert large_file.search('line 5', 6) == 50
+    assert large_file.search('LINE 5', 0, case=True) is None
+    assert large_file.search('line 5', 6, word=True) is None
+    assert large_file.search('line 99', 1000, forward=False) == 999
+    assert large_file.search(r'line \d0$', 0, regexp=True) == 10
+    assert large_file.search('line 12', 12, forward=False) is None
+
+
+def test_search_chunks(large_file, monkeypatch):
+    """Test searches in files bigger than a chunk."""
+    monkeypatch.setattr(largefile, 'CHUNK_SIZE', 64)
+    assert large_file.search('line 5', 6) == 50
+    assert large_file.search('line 99', 1000, forward=False) == 999
+    assert large_file.search('line 5', 500, forward=False) == 59
+    assert large_file.search(r'^line 1$', 500, forward=False,
+                             regexp=True) == 1
+    assert large_file.search('line 1000', 0) is None
+
+
+@pytest.mark.parametrize(
+    'codec, bom',
+    [('utf-8', codecs.BOM_UTF8),
+     ('utf-16-le', codecs.BOM_UTF16_LE),
+     ('utf-16-be', codecs.BOM_UTF16_BE),
+     ('utf-32-le', codecs.BOM_UTF32_LE),
+     ('utf-32-be', codecs.BOM_UTF32_BE),
+     ])
+def test_encodings(tmpdir, codec, bom):
+    """
+    Test that lines are found in files with a BOM, even if the bytes of a
+    newline are part of other chars.
+    """
+    # The bytes of these chars include the one of a newline
+    lines = [u'\u010a\u0a0a \u00c9t\u00e9 {}'.format(i) for i in range(100)]
+    path = tmpdir.join('large.txt')
+    path.write_binary(bom + u'\r\n'.join(lines).encode(codec))
+    large_file = LargeFile(str(path))
+    assert large_file.read_lines(0, 2) == u'\r\n'.join(lines[:2])
+    large_file._build_index()
+    assert large_file.line_count == 100
+    assert large_file.read_lines(98, 5) == u'\r\n'.join(lines[98:])
+    assert large_file.search(u'\u00c9T\u00c9 5', 0) == 5
+    assert large_file.search(u'\u00e9 \\d7$', 100, forward=False,
+                             regexp=True) == 97
+    large_file.close()
+
+
+def test_reload(tmpdir):
+    """Test that files are only reopened after they change."""
+    path = tmpdir.join('large.txt')
+    path.write_binary(b'a\nb\n')
+    large_file = LargeFile(str(path))
+    large_file._build_index()
+    large_file.first_line = 1
+    assert not large_file.reload()
+    assert large_file.line_count == 2
+
+    path.write_binary(b'c\nd\ne\n')
+    path.setmtime(path.mtime() + 10)
+    assert large_file.reload()
+    assert large_file.first_line == 0
+    assert large_file.line_count is None
+    large_file._build_index()
+    assert large_file.read_lines(0, 3) == 'c\nd\ne'
+    large_file.close()
@@ -77,6 +77,7 @@
 # from spyder.plugins.editor.utils.folding import IndentFoldDetector, FoldScope
 from spyder.plugins.editor.utils.kill_ring import QtKillRing
 from spyder.plugins.editor.utils.languages import ALL_LANGUAGES, CELL_LANGUAGES
+from spyder.plugins.editor.utils.largefile import WINDOW_LINES
 from spyder.plugins.completion.manager.decorators import (
     request, handles, class_register)
 from spyder.plugins.editor.widgets.base import TextEditBaseWidget
@@ -137,13 +138,14 @@ def __init__(self, editor):
         label = QLabel(_("Go to line:"))
         self.lineedit = QLineEdit()
         validator = QIntValidator(self.lineedit)
-        validator.setRange(1, editor.get_line_count())
+        validator.setRange(1, editor.get_file_line_count())
         self.lineedit.setValidator(validator)
         self.lineedit.textChanged.connect(self.text_has_changed)
         cl_label = QLabel(_("Current line:"))
-        cl_label_v = QLabel("<b>%d</b>" % editor.get_cursor_line_number())
+        cl_label_v = QLabel("<b>%d</b>" % (editor.get_cursor_line_number() +
+                                           editor.large_file_first_line))
         last_label = QLabel(_("Line count:"))
-        last_label_v = QLabel("%d" % editor.get_line_count())
+        last_label_v = QLabel("%d" % editor.get_file_line_count())
 
         glayout = QGridLayout()
         glayout.addWidget(label, 0, 0, Qt.AlignVCenter | Qt.AlignRight)
@@ -534,6 +536,11 @@ def __init__(self, parent=None):
         self.classfunc_match = None
         self.comment_string = None
         self._kill_ring = QtKillRing(self)
+        self.todo_enabled = True
+
+        # Large files are shown by windows of lines
+        self.large_file = None
+        self._large_file_loading = False
 
         # Block user data
         self.blockCountChanged.connect(self.update_bookmarks)
@@ -1142,6 +1149,9 @@ def log_lsp_handle_errors(self, message):
     # ------------- LSP: Configuration and protocol start/end ----------------
     def start_completion_services(self):
         """Start completion services for this instance."""
+        if self.large_file is not None:
+            # Servers would only get the window of lines in the editor
+            return
         self.completions_available = True
 
         if self.is_cloned:
@@ -1162,6 +1172,8 @@ def register_completion_capabilities(self, capabilities):
         capabilities: dict
             Capabilities supported by a language server.
         """
+        if self.large_file is not None:
+            return
         sync_options = capabilities['textDocumentSync']
         completion_options = capabilities['completionProvider']
         signature_options = capabilities['signatureHelpProvider']
@@ -1835,6 +1847,8 @@ def notify_save(self):
              requires_response=False)
     def notify_close(self):
         """Send close request."""
+        if self.large_file is not None and not self.is_cloned:
+            self.large_file.close()
         if self.completions_available:
             params = {
                 'file': self.filename,
@@ -2646,6 +2660,173 @@ def set_text_from_file(self, filename, language=None):
         self.set_language(language, filename)
         self.set_text(text)
 
+    # ---- Large files
+    def set_large_file(self, large_file):
+        """
+        Show a file too large to be loaded whole.
+
+        Only a window of lines is put in the (read-only) editor and it's
+        moved when scrolling past its start or end.
+        """
+        if self.large_file is None:
+            self.setReadOnly(True)
+            self.verticalScrollBar().valueChanged.connect(
+                self._move_large_file_window)
+            # Don't use the highlighter guessed from the file name
+            self.set_language(None)
+        self.large_file = large_file
+        large_file.sig_index_ready.connect(self._large_file_index_ready)
+        if self.is_cloned:
+            # The window of lines is in the document shared with the
+            # original editor
+            return
+        self._load_large_file_window(0)
+        self.set_eol_chars(self.toPlainText())
+        large_file.build_index()
+
+    def reload_large_file(self):
+        """Show the large file again after it changed on disk."""
+        if self.large_file.reload():
+            self._load_large_file_window(0)
+            self.large_file.build_index()
+
+    @property
+    def large_file_first_line(self):
+        """First line of the large file that is in the editor."""
+        if self.large_file is None:
+            return 0
+        return self.large_file.first_line
+
+    def get_file_line_count(self):
+        """Return the number of lines of the file shown in the editor."""
+        if self.large_file is not None and self.large_file.is_indexed:
+            return self.large_file.line_count
+        return self.get_line_count()
+
+    def go_to_large_file_line(self, line):
+        """
+        Make sure *line* (one-based) of the large file is in the editor
+        and return its number in the current window.
+        """
+        first_line = self.large_file_first_line
+        if not (first_line < line <= first_line + self.blockCount()):
+            self._load_large_file_window(line - 1 - WINDOW_LINES // 2)
+        return line - self.large_file_first_line
+
+    def _load_large_file_window(self, first_line):
+        """Put WINDOW_LINES lines of the large file in the editor."""
+        line_count = self.large_file.line_count
+        if line_count is None:
+            first_line = 0
+        else:
+            first_line = max(0, min(first_line, line_count - WINDOW_LINES))
+
+        self._large_file_loading = True
+        try:
+            self.setPlainText(
+                self.large_file.read_lines(first_line, WINDOW_LINES))
+            self.large_file.first_line = first_line
+            self.document().setModified(False)
+        finally:
+            self._large_file_loading = False
+        self.linenumberarea.update()
+
+    def _move_large_file_window(self, value):
+        """Move the window of lines when scrolling past its limits."""
+        if self._large_file_loading or not self.large_file.is_indexed:
+            return
+
+        scrollbar = self.verticalScrollBar()
+        first_line = self.large_file_first_line
+        window_end = first_line + self.blockCount()
+        if value == scrollbar.maximum() and (
+                window_end < self.large_file.line_count):
+            shift = WINDOW_LINES // 2
+        elif value == scrollbar.minimum() and first_line > 0:
+            shift = -WINDOW_LINES // 2
+        else:
+            return
+
+        top_line = first_line + value
+        self._load_large_file_window(first_line + shift)
+        self._large_file_loading = True
+        try:
+            scrollbar.setValue(top_line - self.large_file_first_line)
+        finally:
+            self._large_file_loading = False
+
+    def find_text(self, text, changed=True, forward=True, case=False,
+                  word=False, regexp=False):
+        """Find text, in the whole file for large files."""
+        if self.large_file is None or not text:
+            return super(CodeEditor, self).find_text(
+                text, changed=changed, forward=forward, case=case,
+                word=word, regexp=regexp)
+        return self._find_in_large_file(text, changed, forward, case, word,
+                                        regexp)
+
+    def _large_file_index_ready(self):
+        """Update the line numbers once the whole file is indexed."""
+        self.linenumberarea.update()
+
+    def _find_in_large_file(self, text, changed, forward, case, word,
+                            regexp):
+        """Find text in the whole large file, not only in its window."""
+        pattern = text if regexp else re.escape(text)
+        if word:
+            pattern = r'\b{}\b'.format(pattern)
+        try:
+            pattern = re.compile(pattern, 0 if case else re.IGNORECASE)
+        except re.error:
+            return False
+
+        # Look first in the rest of the current line
+        cursor = self.textCursor()
+        block = cursor.block()
+        start = cursor.selectionStart() - block.position()
+        end = cursor.selectionEnd() - block.position()
+        position = end if forward and not changed else start
+        match = self._match_in_block(pattern, block.text(), forward,
+                                     position)
+        if match is None and self.large_file.is_indexed:
+            line_count = self.large_file.line_count
+            current = self.large_file_first_line + block.blockNumber()
+            if forward:
+                lines = [current + 1, 0]
+            else:
+                lines = [current, line_count]
+            for start_line in lines:
+                line = self.large_file.search(text, start_line, forward,
+                                              case, word, regexp)
+                if line is not None:
+                    break
+            else:
+                return False
+
+            number = self.go_to_large_file_line(line + 1) - 1
+            block = self.document().findBlockByNumber(number)
+            match = self._match_in_block(
+                pattern, block.text(), forward,
+                0 if forward else len(block.text()))
+
+        if match is None:
+            return False
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + match.start())
+        cursor.setPosition(block.position() + match.end(),
+                           QTextCursor.KeepAnchor)
+        self.setTextCursor(cursor)
+        return True
+
+    def _match_in_block(self, pattern, text, forward, position):
+        """Return the first match after position or the last before it."""
+        if forward:
+            return pattern.search(text, position)
+        match = None
+        for match in pattern.finditer(text, 0, position):
+            pass
+        return match
+
     def append(self, text):
         """Append text to the end of the text widget"""
         cursor = self.textCursor()
@@ -2744,6 +2925,8 @@ def center_cursor_on_next_focus(self):
 
     def go_to_line(self, line, start_column=0, end_column=0, word=''):
         """Go to line number *line* and eventually highlight it"""
+        if self.large_file is not None:
+            line = self.go_to_large_file_line(line)
         self.text_helper.goto_line(line, column=start_column,
                                    end_column=end_column, move=True,
                                    word=word)
@@ -3113,8 +3296,43 @@ def go_to_next_todo(self):
 
         return self.get_position('cursor')
 
+    def highlighter_finds_tasks(self):
+        """Return whether tasks are found by the syntax highlighter."""
+        return (self.highlighter is not None and
+                self.highlighter.TASKS_IN_COMMENTS)
+
+    def set_todo_enabled(self, state):
+        """Enable/disable finding tasks while highlighting."""
+        if state == self.todo_enabled:
+            return
+        self.todo_enabled = state
+        if not state:
+            for data in self.blockuserdata_list():
+                data.todo = ''
+            self.sig_flags_changed.emit()
+        elif self.highlighter_finds_tasks():
+            self.rehighlight()
+
+    def get_todo_results(self):
+        """Return the tasks found by the syntax highlighter."""
+        results = []
+        block = self.document().firstBlock()
+        line_number = 1
+        while block.isValid():
+            data = block.userData()
+            if data and data.todo:
+                results.append((data.todo, line_number))
+            block = block.next()
+            line_number += 1
+        return results
+
     def process_todo(self, todo_results):
         """Process todo finder results"""
+        if self.highlighter_finds_tasks():
+            # Block data is already up to date
+            self.sig_flags_changed.emit()
+            return
+
         for data in self.blockuserdata_list():
             data.todo = ''
 
@@ -16,6 +16,7 @@
 import logging
 import os
 import os.path as osp
+import shutil
 import sys
 import functools
 import unicodedata
@@ -24,7 +25,7 @@
 import qdarkstyle
 from qtpy.compat import getsavefilename
 from qtpy.QtCore import (QByteArray, QFileInfo, QObject, QPoint, QSize, Qt,
-                         QThread, QTimer, Signal, Slot, QCoreApplication)
+                         QTimer, Signal, Slot, QCoreApplication)
 from qtpy.QtGui import QFont
 from qtpy.QtWidgets import (QAction, QApplication, QFileDialog, QHBoxLayout,
                             QLabel, QMainWindow, QMessageBox, QMenu,
@@ -41,6 +42,7 @@
                               MutableSequence)
 from spyder.utils import icon_manager as ima
 from spyder.utils import encoding, sourcecode, syntaxhighlighters
+from spyder.utils.executor import get_executor, PRIORITY_BACKGROUND
 from spyder.utils.qthelpers import (add_actions, create_action,
                                     create_toolbutton, MENU_SEPARATOR,
                                     mimedata2url, set_menu_icons,
@@ -58,6 +60,7 @@
                                                   EncodingStatus, EOLStatus,
                                                   ReadWriteStatus, VCSStatus)
 from spyder.plugins.editor.utils.findtasks import find_tasks
+from spyder.plugins.editor.utils.largefile import LargeFile
 from spyder.widgets.tabs import BaseTabs
 from spyder.config.manager import CONF
 from spyder.plugins.explorer.widgets.explorer import (
@@ -68,99 +71,63 @@
 logger = logging.getLogger(__name__)
 
 
-class AnalysisThread(QThread):
-    """Analysis thread"""
-
-    def __init__(self, parent, checker, source_code):
-
-        super(AnalysisThread, self).__init__(parent)
-        self.checker = checker
-        self.results = None
-        self.source_code = source_code
-
-    def run(self):
-        """Run analysis"""
-        try:
-            self.results = self.checker(self.source_code)
-        except Exception as e:
-            logger.error(e, exc_info=True)
-
-
 class ThreadManager(QObject):
-    """Analysis thread manager"""
-    def __init__(self, parent, max_simultaneous_threads=2):
+    """
+    Analysis task manager.
+
+    Analyses are run in the shared task executor with a background priority.
+    A new analysis of a file supersedes the one that may be queued or
+    running for it.
+    """
+    def __init__(self, parent):
         super(ThreadManager, self).__init__(parent)
-        self.max_simultaneous_threads = max_simultaneous_threads
-        self.started_threads = {}
-        self.pending_threads = []
-        self.end_callbacks = {}
+        self.tasks = {}
 
     def close_threads(self, parent):
-        """Close threads associated to parent_id"""
+        """Cancel the analyses associated to parent."""
         logger.debug("Call ThreadManager's 'close_threads'")
         if parent is None:
-            # Closing all threads
-            self.pending_threads = []
-            threadlist = []
-            for threads in list(self.started_threads.values()):
-                threadlist += threads
+            # Closing all tasks
+            tasks = self.tasks
+            self.tasks = {}
         else:
             parent_id = id(parent)
-            self.pending_threads = [(_th, _id) for (_th, _id)
-                                    in self.pending_threads
-                                    if _id != parent_id]
-            threadlist = self.started_threads.get(parent_id, [])
-        for thread in threadlist:
-            logger.debug("Waiting for thread %r to finish" % thread)
-            while thread.isRunning():
-                # We can't terminate thread safely, so we simply wait...
-                QApplication.processEvents()
+            tasks = {key: task for key, task in self.tasks.items()
+                     if key[0] == parent_id}
+            for key in tasks:
+                self.tasks.pop(key)
+        for task in tasks.values():
+            task.cancel()
 
     def close_all_threads(self):
-        """Close all threads"""
+        """Cancel all analyses"""
         logger.debug("Call ThreadManager's 'close_all_threads'")
         self.close_threads(None)
 
     def add_thread(self, checker, end_callback, source_code, parent):
-        """Add thread to queue"""
-        parent_id = id(parent)
-        thread = AnalysisThread(self, checker, source_code)
-        self.end_callbacks[id(thread)] = end_callback
-        self.pending_threads.append((thread, parent_id))
-        logger.debug("Added thread %r to queue" % thread)
-        QTimer.singleShot(50, self.update_queue)
-
-    def update_queue(self):
-        """Update queue"""
-        started = 0
-        for parent_id, threadlist in list(self.started_threads.items()):
-            still_running = []
-            for thread in threadlist:
-                if thread.isFinished():
-                    end_callback = self.end_callbacks.pop(id(thread))
-                    if thread.results is not None:
-                        #  The thread was executed successfully
-                        end_callback(thread.results)
-                    thread.setParent(None)
-                    thread = None
-                else:
-                    still_running.append(thread)
-                    started += 1
-            threadlist = None
-            if still_running:
-                self.started_threads[parent_id] = still_running
-            else:
-                self.started_threads.pop(parent_id)
-        logger.debug("Updating queue:")
-        logger.debug("    started: %d" % started)
-        logger.debug("    pending: %d" % len(self.pending_threads))
-        if self.pending_threads and started < self.max_simultaneous_threads:
-            thread, parent_id = self.pending_threads.pop(0)
-            thread.finished.connect(self.update_queue)
-            threadlist = self.started_threads.get(parent_id, [])
-            self.started_threads[parent_id] = threadlist+[thread]
-            logger.debug("===>starting: %r" % thread)
-            thread.start()
+        """Run checker on source_code and pass its results to end_callback"""
+        key = (id(parent), checker)
+        executor = get_executor()
+        task = executor.create_task(checker, source_code,
+                                    priority=PRIORITY_BACKGROUND,
+                                    key=(self.__class__.__name__, ) + key)
+        task.sig_finished.connect(
+            lambda task, results, error:
+                self._task_finished(key, task, results, error,
+                                    end_callback))
+        self.tasks[key] = task
+        executor.start(task)
+        logger.debug("Added task %r to queue" % task)
+
+    def _task_finished(self, key, task, results, error, end_callback):
+        """Call end_callback if task is the last one submitted for key."""
+        if self.tasks.get(key) is not task or task.is_cancelled():
+            return
+        self.tasks.pop(key)
+        if error is not None:
+            logger.error(error)
+        elif results is not None:
+            end_callback(results)
 
 
 class FileInfo(QObject):
@@ -216,7 +183,10 @@ def get_source_code(self):
 
     def run_todo_finder(self):
         """Run TODO finder"""
-        if self.editor.is_python_or_ipython():
+        if self.editor.highlighter_finds_tasks():
+            # Tasks were found when highlighting the blocks that changed
+            self.todo_finished(self.editor.get_todo_results())
+        elif self.editor.is_python_or_ipython():
             self.threadmanager.add_thread(find_tasks,
                                           self.todo_finished,
                                           self.get_source_code(), self)
@@ -1002,9 +972,13 @@ def clone_editor_from(self, other_finfo, set_current):
         fname = other_finfo.filename
         enc = other_finfo.encoding
         new = other_finfo.newly_created
+        # Clones of large files must be read-only too, to not save only
+        # the lines in them
+        large_file = other_finfo.editor.large_file
         finfo = self.create_new_editor(fname, enc, "",
                                        set_current=set_current, new=new,
-                                       cloned_from=other_finfo.editor)
+                                       cloned_from=other_finfo.editor,
+                                       large_file=large_file)
         finfo.set_todo_results(other_finfo.todo_results)
         return finfo.editor
 
@@ -1176,6 +1150,7 @@ def set_todolist_enabled(self, state, current_finfo=None):
         if self.data:
             for finfo in self.data:
                 self.__update_editor_margins(finfo.editor)
+                finfo.editor.set_todo_enabled(state)
                 finfo.cleanup_todo_results()
                 if state and current_finfo is not None:
                     if current_finfo is not finfo:
@@ -1535,9 +1510,14 @@ def rename_in_data(self, original_filename, new_filename):
         if index is None:
             return
         finfo = self.data[index]
+        large_file = finfo.editor.large_file
 
         # Send close request to LSP
-        finfo.editor.notify_close()
+        if large_file is None:
+            finfo.editor.notify_close()
+        else:
+            # Large files are not sent to LSP, and they are kept open
+            large_file.filename = new_filename
 
         # Set new filename
         finfo.filename = new_filename
@@ -1546,7 +1526,7 @@ def rename_in_data(self, original_filename, new_filename):
         # File type has changed!
         original_ext = osp.splitext(original_filename)[1]
         new_ext = osp.splitext(new_filename)[1]
-        if original_ext != new_ext:
+        if large_file is None and original_ext != new_ext:
             # Set file language and re-run highlighter
             txt = to_text_string(finfo.editor.get_text_with_eol())
             language = get_file_language(new_filename, txt)
@@ -2036,6 +2016,12 @@ def _write_to_file(self, fileinfo, filename):
         This is a low-level function that only saves the text to file in the
         correct encoding without doing any error handling.
         """
+        large_file = fileinfo.editor.large_file
+        if large_file is not None:
+            # Only a part of large files is in the editor
+            if osp.abspath(filename) != osp.abspath(large_file.filename):
+                shutil.copyfile(large_file.filename, filename)
+            return
         txt = fileinfo.editor.get_text_with_eol()
         fileinfo.encoding = encoding.write(txt, filename, fileinfo.encoding)
 
@@ -2072,18 +2058,20 @@ def save(self, index=None, force=False, save_new_files=True):
                 return self.save_as(index=index)
             # The file doesn't need to be saved
             return True
-        if self.always_remove_trailing_spaces:
-            self.remove_trailing_spaces(index)
-        if self.remove_trailing_newlines:
-            self.trim_trailing_newlines(index)
-        if self.add_newline:
-            self.add_newline_to_file(index)
-        if self.convert_eol_on_save:
-            # hack to account for the fact that the config file saves
-            # CR/LF/CRLF while set_os_eol_chars wants the os.name value.
-            osname_lookup = {'LF': 'posix', 'CRLF': 'nt', 'CR': 'mac'}
-            osname = osname_lookup[self.convert_eol_on_save_to]
-            self.set_os_eol_chars(osname=osname)
+        # Large files are only shown partially and can't be modified
+        if finfo.editor.large_file is None:
+            if self.always_remove_trailing_spaces:
+                self.remove_trailing_spaces(index)
+            if self.remove_trailing_newlines:
+                self.trim_trailing_newlines(index)
+            if self.add_newline:
+                self.add_newline_to_file(index)
+            if self.convert_eol_on_save:
+                # hack to account for the fact that the config file saves
+                # CR/LF/CRLF while set_os_eol_chars wants the os.name value.
+                osname_lookup = {'LF': 'posix', 'CRLF': 'nt', 'CR': 'mac'}
+                osname = osname_lookup[self.convert_eol_on_save_to]
+                self.set_os_eol_chars(osname=osname)
 
         try:
             if self.format_on_save and finfo.editor.formatting_enabled:
@@ -2318,7 +2306,7 @@ def analyze_script(self, index=None):
             index = self.get_stack_index()
         if self.data and len(self.data) > index:
             finfo = self.data[index]
-            if self.todolist_enabled:
+            if self.todolist_enabled and finfo.editor.large_file is None:
                 finfo.run_todo_finder()
         self.is_analysis_done = True
 
@@ -2605,6 +2593,14 @@ def reload(self, index):
         finfo = self.data[index]
         logger.debug("Reloading {}".format(finfo.filename))
 
+        if finfo.editor.large_file is not None:
+            # The file is shared with the clones of the editor, so it's
+            # reloaded only once
+            finfo.editor.reload_large_file()
+            finfo.encoding = finfo.editor.large_file.encoding
+            finfo.lastmodified = QFileInfo(finfo.filename).lastModified()
+            return
+
         txt, finfo.encoding = encoding.read(finfo.filename)
         finfo.lastmodified = QFileInfo(finfo.filename).lastModified()
         position = finfo.editor.get_position('cursor')
@@ -2642,12 +2638,16 @@ def revert(self):
         self.reload(index)
 
     def create_new_editor(self, fname, enc, txt, set_current, new=False,
-                          cloned_from=None, add_where='end'):
+                          cloned_from=None, add_where='end', large_file=None):
         """
         Create a new editor instance
         Returns finfo object (instead of editor as in previous releases)
+
+        If `large_file` is given, its lines are shown by windows in a
+        read-only editor, without syntax highlighting nor code folding.
         """
         editor = codeeditor.CodeEditor(self)
+        editor.set_todo_enabled(self.todolist_enabled)
         editor.go_to_definition.connect(
             lambda fname, line, column: self.sig_go_to_definition.emit(
                 fname, line, column))
@@ -2673,7 +2673,10 @@ def create_new_editor(self, fname, enc, txt, set_current, new=False,
         editor.sig_process_code_analysis.connect(
             lambda: self.update_code_analysis_actions.emit())
         editor.sig_refresh_formatting.connect(self.sig_refresh_formatting)
-        language = get_file_language(fname, txt)
+        if large_file is None:
+            language = get_file_language(fname, txt)
+        else:
+            language = None
         editor.setup_editor(
             linenumbers=self.linenumbers_enabled,
             show_blanks=self.blanks_enabled,
@@ -2710,13 +2713,15 @@ def create_new_editor(self, fname, enc, txt, set_current, new=False,
             filename=fname,
             show_class_func_dropdown=self.show_class_func_dropdown,
             indent_guides=self.indent_guides,
-            folding=self.code_folding_enabled,
+            folding=self.code_folding_enabled and large_file is None,
             remove_trailing_spaces=self.always_remove_trailing_spaces,
             remove_trailing_newlines=self.remove_trailing_newlines,
             add_newline=self.add_newline,
             format_on_save=self.format_on_save
         )
-        if cloned_from is None:
+        if large_file is not None:
+            editor.set_large_file(large_file)
+        elif cloned_from is None:
             editor.set_text(txt)
             editor.document().setModified(False)
         finfo.text_changed_at.connect(
@@ -2750,18 +2755,22 @@ def perform_completion_request(lang, method, params):
 
         # To update the outline explorer.
         editor.oe_proxy = OutlineExplorerProxyEditor(editor, editor.filename)
-        if self.outlineexplorer is not None:
-            self.outlineexplorer.register_editor(editor.oe_proxy)
-
-        # Needs to reset the highlighting on startup in case the PygmentsSH
-        # is in use
-        editor.run_pygments_highlighter()
-        options = {
-            'language': editor.language,
-            'filename': editor.filename,
-            'codeeditor': editor
-        }
-        self.sig_open_file.emit(options)
+        # Large files are not shown in the outline explorer nor sent to
+        # completion services, because only a window of their lines is in
+        # the editor
+        if large_file is None:
+            if self.outlineexplorer is not None:
+                self.outlineexplorer.register_editor(editor.oe_proxy)
+
+            # Needs to reset the highlighting on startup in case the
+            # PygmentsSH is in use
+            editor.run_pygments_highlighter()
+            options = {
+                'language': editor.language,
+                'filename': editor.filename,
+                'codeeditor': editor
+            }
+            self.sig_open_file.emit(options)
         if self.get_stack_index() == 0:
             self.current_changed(0)
 
@@ -2831,6 +2840,12 @@ def load(self, filename, set_current=True, add_where='end',
         filename = osp.abspath(to_text_string(filename))
         if processevents:
             self.starting_long_process.emit(_("Loading %s...") % filename)
+
+        threshold = CONF.get('editor', 'large_file_threshold')
+        if threshold > 0 and osp.getsize(filename) > threshold * 1024 ** 2:
+            return self.load_large_file(filename, set_current, add_where,
+                                        processevents)
+
         text, enc = encoding.read(filename)
         self.autosave.file_hashes[filename] = hash(text)
         finfo = self.create_new_editor(filename, enc, text, set_current,
@@ -2855,6 +2870,22 @@ def load(self, filename, set_current=True, add_where='end',
         self.analyze_script(index)
         return finfo
 
+    def load_large_file(self, filename, set_current=True, add_where='end',
+                        processevents=True):
+        """
+        Load a file bigger than the large file threshold.
+
+        Only a window of its lines is loaded in a read-only editor.
+        """
+        logger.debug("Loading {} as a large file".format(filename))
+        large_file = LargeFile(filename)
+        finfo = self.create_new_editor(filename, large_file.encoding, '',
+                                       set_current, add_where=add_where,
+                                       large_file=large_file)
+        if processevents:
+            self.ending_long_process.emit("")
+        return finfo
+
     def set_os_eol_chars(self, index=None, osname=None):
         """Sets the EOL character(s) based on the operating system.
 
@@ -13,6 +13,7 @@
 from spyder.config.base import _
 from spyder.py3compat import to_text_string
 from spyder.utils import icon_manager as ima
+from spyder.utils.executor import PRIORITY_BACKGROUND
 from spyder.utils.workers import WorkerManager
 from spyder.utils.vcs import get_git_refs
 from spyder.widgets.status import StatusBarWidget
@@ -97,7 +98,7 @@ def update_vcs(self, fname, index, force=False):
         else:
             self._worker_manager.terminate_all()
             worker = self._worker_manager.create_python_worker(
-                self.get_git_refs, fname)
+                self.get_git_refs, fname, priority=PRIORITY_BACKGROUND)
             worker.sig_finished.connect(self.process_git_data)
             self._last_git_job = (fname, index)
             self._git_job_queue = None
@@ -25,6 +25,8 @@
 
 # Local imports
 from spyder.config.base import get_conf_path
+from spyder.plugins.completion.manager.api import LSPRequestTypes
+from spyder.plugins.editor.widgets.codeeditor import CodeEditor
 from spyder.plugins.editor.widgets.editor import EditorStack
 from spyder.widgets.findreplace import FindReplace
 from spyder.py3compat import PY2
@@ -906,5 +908,35 @@ def test_ipython_files(base_editor_bot, qtbot):
     assert blocks_with_data == 1
 
 
+def test_large_file_completions(base_editor_bot, mocker, qtbot, tmpdir):
+    """
+    Test that large files are not sent to completion services nor shown in
+    the outline explorer, because only a window of their lines is in the
+    editor.
+    """
+    editor_stack = base_editor_bot
+    qtbot.addWidget(editor_stack)
+    outlineexplorer = Mock()
+    editor_stack.set_outlineexplorer(outlineexplorer)
+    emit_request = mocker.patch.object(CodeEditor, 'emit_request')
+    path = tmpdir.join('large.py')
+    path.write(''.join('x = {}\n'.format(i) for i in range(30000)))
+
+    with qtbot.assertNotEmitted(editor_stack.sig_open_file):
+        finfo = editor_stack.load_large_file(str(path), processevents=False)
+    editor = finfo.editor
+    assert editor.language == 'Text'
+    assert not outlineexplorer.register_editor.called
+
+    # Servers (or fallback completions) for the language don't open it
+    editor_stack.register_completion_capabilities(
+        Mock(), editor.language.lower())
+    editor_stack.start_completion_services(editor.language.lower())
+    editor.start_completion_services()
+    assert not editor.completions_available
+    assert not any(call[0][0] == LSPRequestTypes.DOCUMENT_DID_OPEN
+                   for call in emit_request.call_args_list)
+
+
 if __name__ == "__main__":
     pytest.main(['test_editor.py'])
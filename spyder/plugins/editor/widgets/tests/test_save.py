@@ -17,6 +17,7 @@
 
 # Third party imports
 import pytest
+from qtpy.QtGui import QFont
 
 # Local imports
 from spyder.plugins.editor.panels import DebuggerPanel
@@ -455,5 +456,39 @@ def test_save_as_change_file_type(editor_bot, mocker, tmpdir):
     assert not debugger_panel.isVisible()
 
 
+def test_save_cloned_large_file(base_editor_bot, tmpdir):
+    """
+    Test that saving a clone of an editor of a large file, which only has a
+    window of its lines, doesn't overwrite the file with those lines.
+    """
+    editorstack, qtbot = base_editor_bot
+    qtbot.addWidget(editorstack)
+    path = tmpdir.join('large.txt')
+    text = b''.join(b'line %d\n' % i for i in range(30000))
+    path.write_binary(text)
+    finfo = editorstack.load_large_file(str(path), processevents=False)
+
+    clone_stack = editor.EditorStack(None, [])
+    clone_stack.set_find_widget(Mock())
+    clone_stack.set_io_actions(Mock(), Mock(), Mock(), Mock())
+    clone_stack.set_default_font(QFont())
+    qtbot.addWidget(clone_stack)
+    clone = clone_stack.clone_editor_from(finfo, set_current=True)
+
+    # The clone shows the same window of lines and is read-only
+    assert clone.large_file is finfo.editor.large_file
+    assert clone.isReadOnly()
+    assert clone.document() is finfo.editor.document()
+    assert clone.blockCount() < 30000
+
+    # Saving it keeps the whole file
+    assert clone_stack.save(index=0, force=True)
+    assert path.read_binary() == text
+
+    # Closing the clone doesn't close the file of the original editor
+    clone_stack.close_file(0, force=True)
+    assert finfo.editor.large_file.read_lines(0, 1) == 'line 0'
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -134,7 +134,7 @@ def icon(self, icontype_or_qfileinfo):
         else:
             qfileinfo = icontype_or_qfileinfo
             fname = osp.normpath(to_text_string(qfileinfo.absoluteFilePath()))
-            if osp.isfile(fname) or osp.isdir(fname):
+            if qfileinfo.isFile() or qfileinfo.isDir():
                 icon = ima.get_icon_by_extension_or_type(fname,
                                                          scale_factor=1.0)
             else:
@@ -149,6 +149,20 @@ def set_max_results(self, value=None):
         """
         self.get_widget().set_max_results(value)
 
+    def find_in_project(self, text, regexp=False):
+        """
+        Search text in the files of the current project.
+
+        Parameters
+        ----------
+        text: str
+            Search string.
+        regexp: bool, optional
+            Whether `text` is a regular expression. Default is False.
+        """
+        self.switch_to_plugin()
+        self.get_widget().find_in_project(text, regexp=regexp)
+
     def unset_project_path(self):
         """
         Unset current project path.
@@ -483,6 +483,26 @@ def test_set_project_path(findinfiles, qtbot):
     assert path_selection_combo.currentIndex() == CWD
 
 
+def test_find_in_project(findinfiles, qtbot):
+    """Test searching in the files of the project."""
+    # Nothing is searched without a project
+    findinfiles.find_in_project("spam")
+    assert not findinfiles.running
+
+    findinfiles.set_project_path(osp.join(LOCATION, "data"))
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find_in_project("sp.m", regexp=True)
+    assert findinfiles.path_selection_combo.currentIndex() == PROJECT
+    assert findinfiles.search_regexp_action.isChecked()
+    matches = process_search_results(findinfiles.result_browser.data)
+    assert expected_results() == matches
+
+    # Restore defaults
+    findinfiles.search_regexp_action.setChecked(False)
+    findinfiles.path_selection_combo.setCurrentIndex(CWD)
+    findinfiles._update_options()
+
+
 @pytest.mark.parametrize('findinfiles',
                          [{'path_history': [
                              LOCATION,
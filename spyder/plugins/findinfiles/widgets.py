@@ -1275,6 +1275,29 @@ def set_search_text(self, text):
 
         self.search_text_edit.setFocus()
 
+    def find_in_project(self, text, regexp=False):
+        """
+        Search text in the files of the current project.
+
+        Parameters
+        ----------
+        text: str
+            Search string.
+        regexp: bool, optional
+            Whether `text` is a regular expression. Default is False.
+
+        Notes
+        -----
+        Nothing is searched if there's no project path.
+        """
+        if self.project_path is None:
+            return
+
+        self.path_selection_combo.setCurrentIndex(PROJECT)
+        self.search_regexp_action.setChecked(regexp)
+        self.set_search_text(text)
+        self.start()
+
     def find(self):
         """
         Start/stop find action.
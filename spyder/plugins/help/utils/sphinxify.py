@@ -21,24 +21,27 @@
 """
 
 # Standard library imports
+import atexit
 import codecs
+from collections import OrderedDict
+import hashlib
+import logging
 import os
 import os.path as osp
 import shutil
 import sys
 from tempfile import mkdtemp
+import threading
+import time
 from xml.sax.saxutils import escape
 
-# Third party imports
-from docutils.utils import SystemMessage as SystemMessage
-from jinja2 import Environment, FileSystemLoader
-import sphinx
-from sphinx.application import Sphinx
+# Sphinx, docutils and Jinja are imported when they are used, because
+# importing them takes a long time and this module is imported at startup.
 
 # Local imports
 from spyder.config.base import (_, get_module_data_path,
                                 get_module_source_path)
-from spyder.py3compat import PY2
+from spyder.py3compat import PY2, to_text_string
 from spyder.utils import encoding
 
 if PY2:
@@ -70,6 +73,17 @@
                                                     JS_PATH),
                                    attr_name='JQUERYPATH')
 
+# Name of the document built by Sphinx
+DOCNAME = 'docstring'
+
+# Number of rendered docstrings to keep
+CACHE_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+# Renderer shared by all calls to sphinxify
+_renderer = None
+
 #-----------------------------------------------------------------------------
 # Utility functions
 #-----------------------------------------------------------------------------
@@ -80,28 +94,31 @@ def is_sphinx_markup(docstring):
     return ("`" in docstring or "::" in docstring)
 
 
-def warning(message, css_path=CSS_PATH):
-    """Print a warning message on the rich text view"""
+def get_template(name):
+    """Return the Jinja template called name of the rich text view."""
+    from jinja2 import Environment, FileSystemLoader
+
     env = Environment()
     env.loader = FileSystemLoader(osp.join(CONFDIR_PATH, 'templates'))
-    warning = env.get_template("warning.html")
+    return env.get_template(name)
+
+
+def warning(message, css_path=CSS_PATH):
+    """Print a warning message on the rich text view"""
+    warning = get_template("warning.html")
     return warning.render(css_path=css_path, text=message)
 
 
 def usage(title, message, tutorial_message, tutorial, css_path=CSS_PATH):
     """Print a usage message on the rich text view"""
-    env = Environment()
-    env.loader = FileSystemLoader(osp.join(CONFDIR_PATH, 'templates'))
-    usage = env.get_template("usage.html")
+    usage = get_template("usage.html")
     return usage.render(css_path=css_path, title=title, intro_message=message,
                         tutorial_message=tutorial_message, tutorial=tutorial)
 
 
 def loading(message, loading_img, css_path=CSS_PATH):
     """Print loading message on the rich text view."""
-    env = Environment()
-    env.loader = FileSystemLoader(osp.join(CONFDIR_PATH, 'templates'))
-    loading = env.get_template("loading.html")
+    loading = get_template("loading.html")
     return loading.render(
         css_path=css_path, loading_img=loading_img, message=message)
 
@@ -136,6 +153,7 @@ def generate_context(name='', argspec='', note='', math=False, collapse=False,
     -------
     A dict of strings to be used by Jinja to generate the webpage
     """
+    import sphinx
 
     if img_path and os.name == 'nt':
         img_path = img_path.replace('\\', '/')
@@ -183,87 +201,227 @@ def sphinxify(docstring, context, buildername='html'):
     -------
     An Sphinx-processed string, in either HTML or plain text format, depending
     on the value of `buildername`
+
+    Notes
+    -----
+    The Sphinx application used to do this is kept alive between calls and
+    the results are cached. See `SphinxRenderer`.
+    """
+    return get_renderer().render(docstring, context, buildername)
+
+
+def get_renderer():
+    """Return the renderer shared by all calls to `sphinxify`."""
+    global _renderer
+    if _renderer is None:
+        _renderer = SphinxRenderer()
+    return _renderer
+
+
+class SphinxRenderer(object):
+    """
+    Render docstrings with a long-lived Sphinx application.
+
+    Creating a Sphinx application (which loads its extensions, theme and
+    templates) takes most of the time needed to render a docstring, so the
+    same one is reused for all renders and only recreated when the builder
+    or the math option change. Rendered docstrings are also kept in an LRU
+    cache, keyed by the docstring, the template context (which includes the
+    theme) and the builder.
     """
 
-    confdir = osp.join(get_module_source_path('spyder.plugins.help.utils'))
-    srcdir = mkdtemp()
-    srcdir = encoding.to_unicode_from_fs(srcdir)
-    destdir = osp.join(srcdir, '_build')
-    temp_confdir_needed = False
-
-    if os.name == 'nt':
-        # Check if confdir and srcdir are in the same drive
-        # See spyder-ide/spyder#11762
-        drive_confdir = pathlib.Path(confdir).parts[0]
-        drive_srcdir = pathlib.Path(srcdir).parts[0]
-        temp_confdir_needed = drive_confdir != drive_srcdir
-
-        if temp_confdir_needed:
-            # TODO: This may be inefficient. Find a faster way to do it.
-            confdir = mkdtemp()
-            confdir = encoding.to_unicode_from_fs(confdir)
-            generate_configuration(confdir)
-
-    rst_name = osp.join(srcdir, 'docstring.rst')
-    if buildername == 'html':
-        suffix = '.html'
-    else:
-        suffix = '.txt'
-    output_name = osp.join(destdir, 'docstring' + suffix)
-
-    # This is needed so users can type \\ on latex eqnarray envs inside raw
-    # docstrings
-    if context['right_sphinx_version'] and context['math_on']:
-        docstring = docstring.replace('\\\\', '\\\\\\\\')
-        # Needed to prevent MathJax render the '\*' red.
-        # Also the '\*' seems to actually by a simple '*'
-        # See spyder-ide/spyder#9785
-        docstring = docstring.replace("\\*", "*")
-
-    # Add a class to several characters on the argspec. This way we can
-    # highlight them using css, in a similar way to what IPython does.
-    # NOTE: Before doing this, we escape common html chars so that they
-    # don't interfere with the rest of html present in the page
-    argspec = escape(context['argspec'])
-    for char in ['=', ',', '(', ')', '*', '**']:
-        argspec = argspec.replace(char,
-                         '<span class="argspec-highlight">' + char + '</span>')
-    context['argspec'] = argspec
-
-    doc_file = codecs.open(rst_name, 'w', encoding='utf-8')
-    doc_file.write(docstring)
-    doc_file.close()
-
-    confoverrides = {'html_context': context}
-
-    doctreedir = osp.join(srcdir, 'doctrees')
-
-    sphinx_app = Sphinx(srcdir, confdir, destdir, doctreedir, buildername,
-                        confoverrides, status=None, warning=None,
-                        freshenv=True, warningiserror=False, tags=None)
-    try:
-        sphinx_app.build(None, [rst_name])
-    except SystemMessage:
-        output = _("It was not possible to generate rich text help for this "
-                    "object.</br>"
-                    "Please see it in plain text.")
-        return warning(output)
-
-    # TODO: Investigate if this is necessary/important for us
-    if osp.exists(output_name):
-        output = codecs.open(output_name, 'r', encoding='utf-8').read()
-        output = output.replace('<pre>', '<pre class="literal-block">')
-    else:
-        output = _("It was not possible to generate rich text help for this "
-                    "object.</br>"
-                    "Please see it in plain text.")
-        return warning(output)
-
-    if temp_confdir_needed:
-        shutil.rmtree(confdir, ignore_errors=True)
-    shutil.rmtree(srcdir, ignore_errors=True)
-
-    return output
+    def __init__(self, cache_size=CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._app = None
+        self._app_key = None
+        self._srcdir = None
+        self._confdir = None
+        self._temp_confdir = False
+        self.hits = 0
+        self.misses = 0
+        self.total_time = 0.
+        self.last_time = 0.
+
+    # ---- Public API
+    def render(self, docstring, context, buildername='html'):
+        """Render docstring, see `sphinxify`."""
+        key = self.cache_key(docstring, context, buildername)
+        with self._lock:
+            output = self._cache.get(key)
+            if output is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return output
+            self.misses += 1
+
+            start = time.time()
+            output = self._render(docstring, dict(context), buildername)
+            self.last_time = time.time() - start
+            self.total_time += self.last_time
+            logger.debug("Docstring rendered in {:.3f}s".format(
+                self.last_time))
+
+            if output is None:
+                output = _("It was not possible to generate rich text help "
+                           "for this object.</br>"
+                           "Please see it in plain text.")
+                return warning(output)
+
+            self._cache[key] = output
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return output
+
+    def cache_key(self, docstring, context, buildername):
+        """Return the cache key of a render."""
+        digest = hashlib.sha1(docstring.encode('utf-8')).hexdigest()
+        context_key = tuple(sorted(
+            (name, to_text_string(value)) for name, value in context.items()))
+        return (digest, context_key, buildername)
+
+    def clear(self):
+        """Remove all cached renders."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self):
+        """Return cache and render time metrics."""
+        return {
+            'cached': len(self._cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'total_time': self.total_time,
+            'last_time': self.last_time,
+            'mean_time': self.total_time / self.misses if self.misses else 0.,
+        }
+
+    def close(self):
+        """Remove the directories used by Sphinx."""
+        self._app = None
+        self._app_key = None
+        if self._srcdir is not None:
+            shutil.rmtree(self._srcdir, ignore_errors=True)
+            self._srcdir = None
+        if self._temp_confdir:
+            shutil.rmtree(self._confdir, ignore_errors=True)
+            self._temp_confdir = False
+        self._confdir = None
+
+    # ---- Private API
+    def _setup_dirs(self):
+        """Create the source dir and, if needed, the conf dir."""
+        if self._srcdir is not None:
+            return
+
+        confdir = osp.join(get_module_source_path('spyder.plugins.help.utils'))
+        srcdir = mkdtemp()
+        srcdir = encoding.to_unicode_from_fs(srcdir)
+
+        if os.name == 'nt':
+            # Check if confdir and srcdir are in the same drive
+            # See spyder-ide/spyder#11762
+            drive_confdir = pathlib.Path(confdir).parts[0]
+            drive_srcdir = pathlib.Path(srcdir).parts[0]
+            self._temp_confdir = drive_confdir != drive_srcdir
+
+            if self._temp_confdir:
+                confdir = mkdtemp()
+                confdir = encoding.to_unicode_from_fs(confdir)
+                generate_configuration(confdir)
+
+        self._srcdir = srcdir
+        self._confdir = confdir
+        atexit.register(self.close)
+
+    def _get_app(self, buildername, math_on):
+        """Return a Sphinx app for buildername, creating it if needed."""
+        from sphinx.application import Sphinx
+
+        # The math option changes the extensions loaded in conf.py
+        app_key = (buildername, math_on)
+        if self._app is None or self._app_key != app_key:
+            self._setup_dirs()
+            srcdir = self._srcdir
+            self._app = Sphinx(srcdir, self._confdir,
+                               osp.join(srcdir, '_build'),
+                               osp.join(srcdir, 'doctrees'), buildername,
+                               {'html_context': {}}, status=None,
+                               warning=None, freshenv=True,
+                               warningiserror=False, tags=None)
+            self._app_key = app_key
+        return self._app
+
+    def _build(self, rst_name, context, buildername, math_on):
+        """Build rst_name with the current Sphinx app."""
+        app = self._get_app(buildername, math_on)
+        app.config.html_context = context
+
+        # Forget the previous docstring so it's read again even if the
+        # file modification time didn't change
+        if DOCNAME in app.env.all_docs:
+            app.env.clear_doc(DOCNAME)
+        app.build(None, [rst_name])
+
+    def _render(self, docstring, context, buildername):
+        """Render docstring and return the output or None on errors."""
+        from docutils.utils import SystemMessage
+
+        self._setup_dirs()
+        rst_name = osp.join(self._srcdir, DOCNAME + '.rst')
+        if buildername == 'html':
+            suffix = '.html'
+        else:
+            suffix = '.txt'
+        output_name = osp.join(self._srcdir, '_build', DOCNAME + suffix)
+
+        # This is needed so users can type \\ on latex eqnarray envs inside
+        # raw docstrings
+        if context['right_sphinx_version'] and context['math_on']:
+            docstring = docstring.replace('\\\\', '\\\\\\\\')
+            # Needed to prevent MathJax render the '\*' red.
+            # Also the '\*' seems to actually by a simple '*'
+            # See spyder-ide/spyder#9785
+            docstring = docstring.replace("\\*", "*")
+
+        # Add a class to several characters on the argspec. This way we can
+        # highlight them using css, in a similar way to what IPython does.
+        # NOTE: Before doing this, we escape common html chars so that they
+        # don't interfere with the rest of html present in the page
+        argspec = escape(context['argspec'])
+        for char in ['=', ',', '(', ')', '*', '**']:
+            argspec = argspec.replace(
+                char, '<span class="argspec-highlight">' + char + '</span>')
+        context['argspec'] = argspec
+
+        doc_file = codecs.open(rst_name, 'w', encoding='utf-8')
+        doc_file.write(docstring)
+        doc_file.close()
+
+        if osp.exists(output_name):
+            os.remove(output_name)
+
+        math_on = context.get('math_on')
+        try:
+            self._build(rst_name, context, buildername, math_on)
+        except SystemMessage:
+            return None
+        except Exception:
+            # The app may be in a bad state after an error, so try again
+            # with a new one
+            logger.debug("Error rendering docstring", exc_info=True)
+            self._app = None
+            try:
+                self._build(rst_name, context, buildername, math_on)
+            except SystemMessage:
+                return None
+
+        # TODO: Investigate if this is necessary/important for us
+        if osp.exists(output_name):
+            output = codecs.open(output_name, 'r', encoding='utf-8').read()
+            return output.replace('<pre>', '<pre class="literal-block">')
+        return None
 
 
 def generate_configuration(directory):
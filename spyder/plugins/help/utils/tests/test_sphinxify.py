@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for sphinxify.py"""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.help.utils.sphinxify import (generate_context,
+                                                 SphinxRenderer)
+
+
+@pytest.fixture
+def renderer():
+    renderer = SphinxRenderer(cache_size=2)
+    yield renderer
+    renderer.close()
+
+
+def test_renderer_reuses_app(renderer):
+    """Test that the same Sphinx app renders different docstrings."""
+    context = generate_context(name='foo')
+    first = renderer.render('First *docstring*', context)
+    app = renderer._app
+    second = renderer.render('Second docstring', context)
+    assert renderer._app is app
+    assert 'First' in first
+    assert 'Second' in second
+    assert 'First' not in second
+
+
+def test_renderer_cache(renderer, mocker):
+    """Test that renders are cached in an LRU cache."""
+    mocker.patch.object(renderer, '_render',
+                        side_effect=lambda doc, context, builder: doc)
+    context = generate_context(name='foo')
+    assert renderer.render('a', context) == 'a'
+    assert renderer.render('a', context) == 'a'
+    assert renderer.get_stats()['hits'] == 1
+
+    # A different theme needs a new render
+    renderer.render('a', generate_context(name='foo', css_path='dark'))
+    assert renderer.get_stats()['misses'] == 2
+
+    # 'a' with the first context was evicted
+    renderer.render('b', context)
+    renderer.render('a', context)
+    stats = renderer.get_stats()
+    assert stats['misses'] == 4
+    assert stats['cached'] == 2
@@ -18,5 +18,6 @@
 FORMAT_EXT  = ".h5"
 FORMAT_LOAD = load_hdf5
 FORMAT_SAVE = save_hdf5
+FORMAT_MMAP = True
 
 PLUGIN_CLASS = True
@@ -16,6 +16,9 @@
 the data on disk.  Nonetheless, this plugin gives quick and dirty but convenient
 access to HDF5 files.
 
+When loading with mmap=True, contiguous and uncompressed datasets are memory-mapped
+instead, so only the slices that are accessed are read from disk.
+
 There is no support for creating files with compression, chunking etc, although
 these can be read without problem.
 
@@ -41,13 +44,32 @@
 import numpy as np
 
 if importlib.util.find_spec('h5py'):
-    def load_hdf5(filename):
+    def memmap_dataset(filename, dataset):
+        """
+        Memory-map dataset if it's stored contiguously and without filters in
+        filename, else read it.
+        """
+        offset = dataset.id.get_offset()
+        if (offset is None or dataset.chunks is not None
+                or dataset.dtype.hasobject or not dataset.shape
+                or dataset.size == 0):
+            return np.array(dataset)
+
+        # Copy-on-write, so users can modify the array without touching
+        # the file.
+        return np.memmap(filename, dtype=dataset.dtype, mode='c',
+                         offset=offset, shape=dataset.shape)
+
+    def load_hdf5(filename, mmap=False):
         import h5py
         def get_group(group):
             contents = {}
             for name, obj in list(group.items()):
                 if isinstance(obj, h5py.Dataset):
-                    contents[name] = np.array(obj)
+                    if mmap:
+                        contents[name] = memmap_dataset(filename, obj)
+                    else:
+                        contents[name] = np.array(obj)
                 elif isinstance(obj, h5py.Group):
                     # it is a group, so call self recursively
                     contents[name] = get_group(obj)
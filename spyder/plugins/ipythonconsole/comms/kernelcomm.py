@@ -25,6 +25,30 @@
 jupyter_client.connect.channel_socket_types['comm'] = zmq.DEALER
 
 
+def is_unknown_call(error):
+    """
+    Return True if error was raised because the kernel doesn't have the
+    call, e.g. because its spyder-kernels is older than ours.
+    """
+    return (error.etype is CommError and
+            str(error).startswith('No such spyder call type'))
+
+
+class ReplyCallback(object):
+    """
+    Callback of a remote call that also receives the error raised by the
+    call in the kernel (if any).
+    """
+
+    def __init__(self, callback, error_callback):
+        self.callback = callback
+        self.error_callback = error_callback
+
+    def __call__(self, value):
+        if self.callback is not None:
+            self.callback(value)
+
+
 class KernelComm(CommBase, QObject):
     """
     Class with the necessary attributes and methods to handle
@@ -113,8 +137,17 @@ def open_comm(self, kernel_client):
                 'pickle_protocol': pickle.HIGHEST_PROTOCOL}))
 
     def remote_call(self, interrupt=False, blocking=False, callback=None,
-                    comm_id=None, timeout=None, display_error=False):
-        """Get a handler for remote calls."""
+                    comm_id=None, timeout=None, display_error=False,
+                    error_callback=None):
+        """
+        Get a handler for remote calls.
+
+        If error_callback is given, it's called with the error raised by
+        non-blocking calls in the kernel. If it returns False, the error
+        is reported as the ones of other calls.
+        """
+        if error_callback is not None and not blocking:
+            callback = ReplyCallback(callback, error_callback)
         return super(KernelComm, self).remote_call(
             interrupt=interrupt, blocking=blocking, callback=callback,
             comm_id=comm_id, timeout=timeout, display_error=display_error)
@@ -233,8 +266,16 @@ def _handle_remote_call_reply(self, msg_dict, buffer):
         """
         A blocking call received a reply.
         """
-        super(KernelComm, self)._handle_remote_call_reply(
-            msg_dict, buffer)
+        content = msg_dict['content']
+        __, callback = self._reply_waitlist.get(content['call_id'],
+                                                (None, None))
+        if content['is_error'] and isinstance(callback, ReplyCallback):
+            del self._reply_waitlist[content['call_id']]
+            if callback.error_callback(buffer) is False:
+                self._async_error(buffer)
+        else:
+            super(KernelComm, self)._handle_remote_call_reply(
+                msg_dict, buffer)
         self._sig_got_reply.emit()
 
     def _async_error(self, error_wrapper):
@@ -19,7 +19,8 @@
 # Local imports
 from spyder_kernels.utils.test_utils import get_kernel
 from spyder_kernels.comms.frontendcomm import FrontendComm
-from spyder.plugins.ipythonconsole.comms.kernelcomm import KernelComm
+from spyder.plugins.ipythonconsole.comms.kernelcomm import (
+    KernelComm, is_unknown_call)
 
 
 # =============================================================================
@@ -181,5 +182,36 @@ def handler(a, b):
     assert res == 'ab'
 
 
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_error_callback(comms):
+    """Test that errors of calls are passed to their error callback."""
+    kernel_comm, frontend_comm = comms
+    kernel_comm.kernel_client.is_alive = lambda: True
+    kernel_comm.comm_channel_connected = lambda: True
+    replies = []
+    errors = []
+
+    def handler(a):
+        return 1 / a
+
+    frontend_comm.register_call_handler('test_request', handler)
+
+    kernel_comm.remote_call(
+        callback=replies.append,
+        error_callback=errors.append).test_request(1)
+    assert replies == [1]
+    assert errors == []
+
+    kernel_comm.remote_call(
+        callback=replies.append,
+        error_callback=errors.append).test_request(0)
+    assert replies == [1]
+    assert errors[0].etype is ZeroDivisionError
+    assert not is_unknown_call(errors[0])
+
+    kernel_comm.remote_call(error_callback=errors.append).unknown_call()
+    assert is_unknown_call(errors[1])
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -410,6 +410,23 @@ def setup_page(self):
         prompts_layout.addLayout(prompts_g_layout)
         prompts_group.setLayout(prompts_layout)
 
+        # Kernel pool group
+        pool_group = QGroupBox(_("Kernel pool"))
+        pool_label = QLabel(_("Keep some kernels started in the background "
+                              "so new consoles and restarts are available "
+                              "immediately. Each of them uses as much memory "
+                              "as an empty console."))
+        pool_label.setWordWrap(True)
+        pool_spin = self.create_spinbox(
+            _("Number of pre-started kernels:"), "", 'kernel_pool_size',
+            min_=0, max_=10, step=1,
+            tip=_("Set to 0 to disable the kernel pool"))
+
+        pool_layout = QVBoxLayout()
+        pool_layout.addWidget(pool_label)
+        pool_layout.addWidget(pool_spin)
+        pool_group.setLayout(pool_layout)
+
         # Windows adjustments
         windows_group = QGroupBox(_("Windows adjustments"))
         hide_cmd_windows = newcb(
@@ -432,7 +449,7 @@ def setup_page(self):
                     _("Debugger"))
         tabs.addTab(self.create_tab(jedi_group, greedy_group, autocall_group,
                                     sympy_group, prompts_group,
-                                    windows_group),
+                                    pool_group, windows_group),
                     _("Advanced settings"))
 
         vlayout = QVBoxLayout()
@@ -39,7 +39,9 @@
 from spyder.config.gui import get_font, is_dark_interface
 from spyder.config.manager import CONF
 from spyder.plugins.ipythonconsole.confpage import IPythonConsoleConfigPage
-from spyder.plugins.ipythonconsole.utils.kernelspec import SpyderKernelSpec
+from spyder.plugins.ipythonconsole.utils.kernelpool import KernelPool
+from spyder.plugins.ipythonconsole.utils.kernelspec import (
+    KERNEL_SPEC_OPTIONS, SpyderKernelSpec)
 from spyder.plugins.ipythonconsole.utils.manager import SpyderKernelManager
 from spyder.plugins.ipythonconsole.utils.ssh import openssh_tunnel
 from spyder.plugins.ipythonconsole.utils.style import create_qss_style
@@ -154,6 +156,19 @@ class IPythonConsole(SpyderPluginWidget):
         The new working directory path.
     """
 
+    sig_profile_data_received = Signal(str, object)
+    """
+    This signal is emitted when code profiled in a console has finished.
+
+    Parameters
+    ----------
+    name: str
+        Name of the profiled code, e.g. its file and cell name.
+    stats: dict
+        Statistics of cProfile, as in the `stats` attribute of
+        pstats.Stats.
+    """
+
     # Error messages
     permission_error_msg = _("The directory {} is not writable and it is "
                              "required to create IPython consoles. Please "
@@ -254,6 +269,13 @@ def __init__(self, parent, testing=False, test_dir=None,
         # See spyder-ide/spyder#11880
         self._init_asyncio_patch()
 
+        # Pool of pre-spawned kernels
+        self.kernel_pool = KernelPool(
+            self,
+            self._new_connection_file,
+            size=self.get_option('kernel_pool_size'),
+            stderr_dir=self.test_dir)
+
     #------ SpyderPluginMixin API ---------------------------------------------
     def update_font(self):
         """Update font from Preferences"""
@@ -460,6 +482,14 @@ def apply_plugin_settings(self, options):
         restart_needed = any([restart_option in options
                               for restart_option in restart_options])
 
+        kernel_pool_size_n = 'kernel_pool_size'
+        if kernel_pool_size_n in options:
+            self.kernel_pool.set_size(self.get_option(kernel_pool_size_n))
+
+        # Pooled kernels were started with the old options
+        if any([option in KERNEL_SPEC_OPTIONS for option in options]):
+            self.renew_kernel_pool()
+
         if (restart_needed or pylab_restart) and not running_under_pytest():
             restart_dialog = ConsoleRestartDialog(self)
             restart_dialog.exec_()
@@ -530,6 +560,7 @@ def get_focus_widget(self):
     def closing_plugin(self, cancelable=False):
         """Perform actions before parent main window is closed"""
         self.mainwindow_close = True
+        self.kernel_pool.clear()
         for client in self.clients:
             client.shutdown()
             client.remove_stderr_file()
@@ -836,6 +867,34 @@ def debug_cell(self, code, cell_name, filename, run_cell_copy):
         """Debug current cell."""
         self.run_cell(code, cell_name, filename, run_cell_copy, 'debugcell')
 
+    def profile_cell(self, cell_name, filename):
+        """Profile a cell of filename in the current client."""
+        if self._check_profiling_client():
+            filename = remove_backslashes(to_text_string(filename))
+            self.run_cell_filename = filename
+            self.execute_code("profilecell({}, '{}')".format(
+                repr(cell_name), filename.replace("'", r"\'")))
+
+    def profile_code(self, code):
+        """Profile code in the namespace of the current client."""
+        if self._check_profiling_client():
+            self.execute_code("profilecode({})".format(repr(code)))
+
+    def _check_profiling_client(self):
+        """Check that the current client can profile code."""
+        client = self.get_current_client()
+        if client is None or not client.shellwidget.is_spyder_kernel():
+            QMessageBox.warning(
+                self, _('Warning'),
+                _("Code can only be profiled in consoles that use "
+                  "spyder-kernels."), QMessageBox.Ok)
+            return False
+        if client.shellwidget._executing:
+            return False
+        self._visibility_changed(True)
+        self.raise_()
+        return True
+
     def set_current_client_working_directory(self, directory):
         """Set current client working directory."""
         shellwidget = self.get_current_shellwidget()
@@ -863,6 +922,9 @@ def update_path(self, path_dict, new_path_dict):
                 self.main.get_spyder_pythonpath()
                 shell.update_syspath(path_dict, new_path_dict)
 
+        # Pooled kernels were started with the old path
+        self.renew_kernel_pool()
+
     def execute_code(self, lines, current_client=True, clear_variables=False):
         """Execute code instructions."""
         sw = self.get_current_shellwidget()
@@ -1054,6 +1116,44 @@ def connect_client_to_kernel(self, client, is_cython=False,
             client.show_kernel_error(km)
             return
 
+        # The kernel was taken from the pool, so it has its own connection
+        # and stderr files.
+        if km.connection_file != connection_file:
+            if stderr_handle is not None:
+                stderr_handle.close()
+            client.remove_stderr_file()
+            client.connection_file = km.connection_file
+
+        self.start_kernel_client(client, kc)
+
+        shellwidget = client.shellwidget
+        shellwidget.set_kernel_client_and_manager(kc, km)
+        shellwidget.sig_exception_occurred.connect(
+            self.main.console.handle_exception)
+
+    def claim_pooled_kernel(self, client):
+        """
+        Return the kernel manager and client of a pooled kernel that can
+        replace the kernel of client on restarts, or None if the pool has
+        no kernels available.
+        """
+        km = client.shellwidget.kernel_manager
+        if km is None or self.get_related_clients(client):
+            return None
+
+        kernel_manager = self.kernel_pool.claim(km._kernel_spec)
+        if kernel_manager is None:
+            return None
+
+        return kernel_manager, self._create_kernel_client(kernel_manager)
+
+    def release_pooled_kernel(self, kernel_manager, kernel_client):
+        """Shutdown a kernel claimed with claim_pooled_kernel."""
+        kernel_client.stop_channels()
+        self.kernel_pool.release(kernel_manager)
+
+    def start_kernel_client(self, client, kc):
+        """Connect kc signals to client and start its channels."""
         # This avoids a recurrent, spurious NameError when running our
         # tests in our CIs
         if not self.testing:
@@ -1063,11 +1163,6 @@ def connect_client_to_kernel(self, client, is_cython=False,
                 lambda c=client: self.process_finished(c))
         kc.start_channels(shell=True, iopub=True)
 
-        shellwidget = client.shellwidget
-        shellwidget.set_kernel_client_and_manager(kc, km)
-        shellwidget.sig_exception_occurred.connect(
-            self.main.console.handle_exception)
-
     @Slot(object, object)
     def edit_file(self, filename, line):
         """Handle %edit magic petitions."""
@@ -1249,6 +1344,10 @@ def register_client(self, client, give_focus=True):
         # Connect to working directory
         shellwidget.sig_change_cwd.connect(self.set_working_directory)
 
+        # Connect to the profiler
+        shellwidget.sig_profile_data_received.connect(
+            self.sig_profile_data_received)
+
     def close_client(self, index=None, client=None, force=False):
         """Close client tab from index or widget (or close current tab)"""
         if not self.tabwidget.count():
@@ -1467,6 +1566,13 @@ def create_kernel_spec(self, is_cython=False,
                                 is_pylab=is_pylab,
                                 is_sympy=is_sympy)
 
+    def renew_kernel_pool(self):
+        """Replace pooled kernels by ones started with current options."""
+        self.kernel_pool.renew(
+            lambda spec: self.create_kernel_spec(is_cython=spec.is_cython,
+                                                 is_pylab=spec.is_pylab,
+                                                 is_sympy=spec.is_sympy))
+
     def create_kernel_manager_and_kernel_client(self, connection_file,
                                                 stderr_handle,
                                                 is_cython=False,
@@ -1478,6 +1584,11 @@ def create_kernel_manager_and_kernel_client(self, connection_file,
                                               is_pylab=is_pylab,
                                               is_sympy=is_sympy)
 
+        # Use an already started kernel if there's one available
+        kernel_manager = self.kernel_pool.claim(kernel_spec)
+        if kernel_manager is not None:
+            return kernel_manager, self._create_kernel_client(kernel_manager)
+
         # Kernel manager
         try:
             kernel_manager = SpyderKernelManager(
@@ -1501,14 +1612,17 @@ def create_kernel_manager_and_kernel_client(self, connection_file,
                           "<tt>{}</tt>").format(traceback.format_exc())
             return (error_msg, None)
 
-        # Kernel client
+        return kernel_manager, self._create_kernel_client(kernel_manager)
+
+    def _create_kernel_client(self, kernel_manager):
+        """Create a kernel client for kernel_manager."""
         kernel_client = kernel_manager.client()
 
         # Increase time (in seconds) to detect if a kernel is alive.
         # See spyder-ide/spyder#3444.
         kernel_client.hb_channel.time_to_dead = 25.0
 
-        return kernel_manager, kernel_client
+        return kernel_client
 
     def restart_kernel(self):
         """Restart kernel of current client."""
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Pool of pre-spawned kernels.
+
+Starting a kernel takes several seconds because of all the imports done by
+spyder-kernels (and its Matplotlib, NumPy, etc customizations). To hide that
+time, this pool keeps a number of already started kernels per kernel spec,
+so new consoles and restarts can claim one immediately.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+import codecs
+import logging
+import os
+import os.path as osp
+
+# Third party imports
+from qtpy.QtCore import QObject, QTimer
+
+# Local imports
+from spyder.plugins.ipythonconsole.utils.manager import SpyderKernelManager
+from spyder.utils.programs import get_temp_dir
+
+
+logger = logging.getLogger(__name__)
+
+# Delay in ms between kernel starts, so filling the pool doesn't block the
+# interface for several kernels in a row
+START_DELAY = 500
+
+# Maximum number of kernel specs to keep kernels for. Kernels for the
+# least recently requested specs, e.g. those of a previous interpreter,
+# are shut down after this.
+MAX_SPECS = 3
+
+
+class PooledKernel(object):
+    """A kernel started by the pool and waiting to be claimed."""
+
+    def __init__(self, kernel_manager, stderr_file, stderr_handle):
+        self.kernel_manager = kernel_manager
+        self.stderr_file = stderr_file
+        self.stderr_handle = stderr_handle
+
+    @property
+    def connection_file(self):
+        return self.kernel_manager.connection_file
+
+    def is_alive(self):
+        try:
+            return self.kernel_manager.is_alive()
+        except Exception:
+            return False
+
+    def shutdown(self):
+        """Shutdown the kernel and remove its stderr file."""
+        try:
+            self.kernel_manager.shutdown_kernel(now=True)
+        except Exception:
+            pass
+        try:
+            self.stderr_handle.close()
+            os.remove(self.stderr_file)
+        except Exception:
+            pass
+
+
+class KernelPool(QObject):
+    """
+    Pool of started kernels, grouped by the command and environment used to
+    start them.
+
+    The pool only learns which kernel specs are needed when they are
+    requested, i.e. it's filled after the first miss for a given spec.
+    Kernels are started one at a time from the event loop, so the
+    interface stays responsive while the pool is filled.
+    """
+
+    def __init__(self, parent, new_connection_file, size=0, stderr_dir=None):
+        """
+        Parameters
+        ----------
+        new_connection_file: callable
+            Function that returns the path of a new connection file.
+        size: int
+            Number of kernels to keep started per kernel spec. A size of 0
+            disables the pool.
+        stderr_dir: str or None
+            Directory where to save the kernels stderr. If None, Spyder's
+            temp dir is used.
+        """
+        super(KernelPool, self).__init__(parent)
+        self._new_connection_file = new_connection_file
+        self._size = size
+        self.stderr_dir = stderr_dir
+        self._kernels = {}
+        self._specs = OrderedDict()
+        self._scheduled = set()
+        self.hits = 0
+        self.misses = 0
+
+    # ---- Public API
+    @property
+    def size(self):
+        return self._size
+
+    def set_size(self, size):
+        """Set the number of kernels to keep started per kernel spec."""
+        self._size = max(size, 0)
+        for key in list(self._kernels):
+            kernels = self._kernels[key]
+            while len(kernels) > self._size:
+                kernels.pop().shutdown()
+        self._replenish_all()
+
+    def kernel_key(self, kernel_spec):
+        """Key that identifies kernels started with the same command/env."""
+        env = tuple(sorted((name, str(value))
+                           for name, value in kernel_spec.env.items()))
+        return (tuple(kernel_spec.argv), env)
+
+    def claim(self, kernel_spec):
+        """
+        Return the kernel manager of a started kernel compatible with
+        kernel_spec, or None if there's none available.
+
+        Claimed kernels are replaced in the background.
+        """
+        if self._size <= 0:
+            return None
+
+        key = self._add_spec(kernel_spec)
+        kernels = self._kernels.setdefault(key, [])
+
+        pooled = None
+        while kernels and pooled is None:
+            candidate = kernels.pop(0)
+            if candidate.is_alive():
+                pooled = candidate
+            else:
+                candidate.shutdown()
+
+        if pooled is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # The client opens its own stderr handle
+            pooled.stderr_handle.close()
+        logger.debug("Kernel pool %s (hits: %s, misses: %s)",
+                     'hit' if pooled is not None else 'miss',
+                     self.hits, self.misses)
+
+        self._schedule_replenish(key)
+
+        if pooled is not None:
+            return pooled.kernel_manager
+
+    def release(self, kernel_manager):
+        """Shutdown a claimed kernel that ended up not being used."""
+        stderr_file = self._stderr_file(kernel_manager.connection_file)
+        try:
+            kernel_manager.shutdown_kernel(now=True)
+        except Exception:
+            pass
+        try:
+            os.remove(stderr_file)
+        except Exception:
+            pass
+
+    def clear(self):
+        """Shutdown all pooled kernels."""
+        for kernels in self._kernels.values():
+            for pooled in kernels:
+                pooled.shutdown()
+        self._kernels = {}
+        self._specs = OrderedDict()
+
+    def renew(self, create_spec):
+        """
+        Replace all pooled kernels by new ones, e.g. because the options
+        used to start them changed.
+
+        Parameters
+        ----------
+        create_spec: callable
+            Function that receives each kernel spec the pool was filled
+            for and returns the one to use from now on.
+        """
+        specs = list(self._specs.values())
+        self.clear()
+        if self._size <= 0:
+            return
+        for kernel_spec in specs:
+            self._schedule_replenish(self._add_spec(create_spec(kernel_spec)))
+
+    def get_stats(self):
+        """Return pool metrics."""
+        return {
+            'size': self._size,
+            'available': sum(len(k) for k in self._kernels.values()),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    # ---- Private API
+    def _stderr_file(self, connection_file):
+        kernel_id = osp.basename(connection_file).split('.json')[0]
+        stderr_dir = self.stderr_dir
+        if stderr_dir is None:
+            stderr_dir = get_temp_dir()
+        return osp.join(stderr_dir, kernel_id + '.stderr')
+
+    def _start_kernel(self, kernel_spec):
+        """Start a kernel for kernel_spec and return it or None on errors."""
+        connection_file = self._new_connection_file()
+        if connection_file is None:
+            return None
+
+        stderr_file = self._stderr_file(connection_file)
+        try:
+            stderr_handle = codecs.open(stderr_file, 'w', encoding='utf-8')
+        except Exception:
+            return None
+
+        try:
+            kernel_manager = SpyderKernelManager(
+                connection_file=connection_file,
+                config=None,
+                autorestart=True,
+            )
+            kernel_manager._kernel_spec = kernel_spec
+            kernel_manager.start_kernel(stderr=stderr_handle,
+                                        env=kernel_spec.env)
+        except Exception:
+            logger.debug("Error starting pooled kernel", exc_info=True)
+            stderr_handle.close()
+            return None
+
+        return PooledKernel(kernel_manager, stderr_file, stderr_handle)
+
+    def _add_spec(self, kernel_spec):
+        """Register kernel_spec as the most recently requested one."""
+        key = self.kernel_key(kernel_spec)
+        self._specs[key] = kernel_spec
+        self._specs.move_to_end(key)
+        while len(self._specs) > MAX_SPECS:
+            old_key, __ = self._specs.popitem(last=False)
+            for pooled in self._kernels.pop(old_key, []):
+                pooled.shutdown()
+        return key
+
+    def _schedule_replenish(self, key, delay=0):
+        """Start a kernel for key later, unless one is already due."""
+        if key in self._scheduled:
+            return
+        self._scheduled.add(key)
+        QTimer.singleShot(delay, lambda: self._replenish(key))
+
+    def _replenish(self, key):
+        """
+        Start a kernel for key and schedule the next one until the pool for
+        key is full.
+        """
+        self._scheduled.discard(key)
+        kernel_spec = self._specs.get(key)
+        if kernel_spec is None:
+            return
+
+        kernels = self._kernels.setdefault(key, [])
+        if len(kernels) >= self._size:
+            return
+
+        pooled = self._start_kernel(kernel_spec)
+        if pooled is None:
+            return
+        kernels.append(pooled)
+
+        if len(kernels) < self._size:
+            self._schedule_replenish(key, delay=START_DELAY)
+
+    def _replenish_all(self):
+        for key in list(self._specs):
+            self._schedule_replenish(key)
@@ -24,6 +24,7 @@
 from spyder.utils.conda import (add_quotes, get_conda_activation_script,
                                 get_conda_env_path, is_conda_env)
 from spyder.utils.environ import clean_env
+from spyder.utils.interpreters import get_cached_interpreter_info
 from spyder.utils.misc import get_python_executable
 from spyder.utils.programs import is_python_interpreter
 
@@ -31,6 +32,17 @@
 HERE = os.path.abspath(os.path.dirname(__file__))
 logger = logging.getLogger(__name__)
 
+# IPython console options passed to kernels through their environment, so
+# kernels started before they change need to be replaced
+KERNEL_SPEC_OPTIONS = (
+    'startup/run_lines', 'startup/use_run_file', 'startup/run_file',
+    'pylab', 'pylab/backend', 'pylab/autoload', 'pylab/inline/figure_format',
+    'pylab/inline/bbox_inches', 'pylab/inline/resolution',
+    'pylab/inline/width', 'pylab/inline/height', 'autocall',
+    'greedy_completer', 'jedi_completer', 'symbolic_math',
+    'hide_cmd_windows',
+)
+
 
 def is_different_interpreter(pyexec):
     """Check that pyexec is a different interpreter from sys.executable."""
@@ -84,7 +96,9 @@ def argv(self):
             pyexec = get_python_executable()
         else:
             pyexec = CONF.get('main_interpreter', 'executable')
-            if not is_python_interpreter(pyexec):
+            # Interpreters with saved metadata were run successfully
+            if (get_cached_interpreter_info(pyexec) is None and
+                    not is_python_interpreter(pyexec)):
                 pyexec = get_python_executable()
                 CONF.set('main_interpreter', 'executable', '')
                 CONF.set('main_interpreter', 'default', True)
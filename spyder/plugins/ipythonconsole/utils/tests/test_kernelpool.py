@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the kernel pool
+"""
+
+import os.path as osp
+
+import pytest
+
+from spyder.plugins.ipythonconsole.utils import kernelpool
+from spyder.plugins.ipythonconsole.utils.kernelpool import KernelPool
+from spyder.plugins.ipythonconsole.utils.kernelspec import SpyderKernelSpec
+
+
+@pytest.fixture
+def kernel_pool(qtbot, tmpdir):
+    """Kernel pool that saves connection and stderr files in tmpdir."""
+    counter = [0]
+
+    def new_connection_file():
+        counter[0] += 1
+        return osp.join(str(tmpdir), 'kernel-%s.json' % counter[0])
+
+    pool = KernelPool(None, new_connection_file, size=1,
+                      stderr_dir=str(tmpdir))
+    yield pool
+    pool.clear()
+
+
+def test_kernel_pool_disabled(kernel_pool):
+    """Test that no kernels are started when the pool size is 0."""
+    kernel_pool.set_size(0)
+    assert kernel_pool.claim(SpyderKernelSpec()) is None
+    assert kernel_pool.get_stats()['misses'] == 0
+
+
+def test_kernel_pool_claim(qtbot, kernel_pool):
+    """Test that kernels are started after a miss and claimed later."""
+    kernel_spec = SpyderKernelSpec()
+
+    # First request is a miss that fills the pool in the background
+    assert kernel_pool.claim(kernel_spec) is None
+    qtbot.waitUntil(lambda: kernel_pool.get_stats()['available'] == 1)
+
+    kernel_manager = kernel_pool.claim(kernel_spec)
+    assert kernel_manager is not None
+    assert kernel_manager.is_alive()
+    assert kernel_pool.get_stats()['hits'] == 1
+    assert kernel_pool.get_stats()['misses'] == 1
+
+    # The claimed kernel is replaced
+    qtbot.waitUntil(lambda: kernel_pool.get_stats()['available'] == 1)
+    kernel_manager.shutdown_kernel(now=True)
+
+
+def test_kernel_pool_renew(qtbot, kernel_pool):
+    """Test that renewing the pool replaces its kernels by new ones."""
+    kernel_pool.claim(SpyderKernelSpec())
+    qtbot.waitUntil(lambda: kernel_pool.get_stats()['available'] == 1)
+    old_kernel = kernel_pool.claim(SpyderKernelSpec())
+    qtbot.waitUntil(lambda: kernel_pool.get_stats()['available'] == 1)
+    kernel_pool.release(old_kernel)
+    assert not old_kernel.is_alive()
+
+    new_specs = []
+
+    def create_spec(kernel_spec):
+        new_spec = SpyderKernelSpec(is_sympy=True)
+        new_specs.append(new_spec)
+        return new_spec
+
+    # Kernels are started later, from the event loop
+    kernel_pool.renew(create_spec)
+    assert kernel_pool.get_stats()['available'] == 0
+    qtbot.waitUntil(lambda: kernel_pool.get_stats()['available'] == 1)
+
+    assert len(new_specs) == 1
+    kernel_manager = kernel_pool.claim(new_specs[0])
+    assert kernel_manager is not None
+    kernel_pool.release(kernel_manager)
+
+
+def test_kernel_pool_max_specs(qtbot, kernel_pool, monkeypatch):
+    """Test that kernels for old specs are shut down."""
+    monkeypatch.setattr(kernelpool, 'MAX_SPECS', 1)
+    kernel_pool.claim(SpyderKernelSpec())
+    qtbot.waitUntil(lambda: kernel_pool.get_stats()['available'] == 1)
+
+    # A new spec replaces the old one
+    kernel_pool.claim(SpyderKernelSpec(is_sympy=True))
+    assert kernel_pool.get_stats()['available'] == 0
+    qtbot.waitUntil(lambda: kernel_pool.get_stats()['available'] == 1)
+    assert kernel_pool.claim(SpyderKernelSpec()) is None
@@ -341,6 +341,9 @@ def _when_prompt_is_ready(self):
         # To show if special console is valid
         self._check_special_console_error()
 
+        # To complete imports without importing modules in the kernel
+        self.shellwidget.send_module_index()
+
         self.shellwidget.sig_prompt_ready.disconnect(
             self._when_prompt_is_ready)
         self.shellwidget.sig_remote_execute.disconnect(
@@ -537,6 +540,12 @@ def add_actions_to_context_menu(self, menu):
             QKeySequence(CONF.get_shortcut('console', 'clear shell')),
             triggered=self.clear_console)
 
+        scrollback_action = create_action(
+            self,
+            _("Show output history..."),
+            icon=ima.icon('history'),
+            triggered=self.shellwidget.show_scrollback)
+
         quit_action = create_action(
             self,
             _("&Quit"),
@@ -545,7 +554,7 @@ def add_actions_to_context_menu(self, menu):
 
         add_actions(menu, (None, inspect_action, clear_line_action,
                            clear_console_action, reset_namespace_action,
-                           None, quit_action))
+                           None, scrollback_action, None, quit_action))
         return menu
 
     def set_font(self, font):
@@ -624,6 +633,8 @@ def restart_kernel(self):
                 self.restart_thread = QThread()
                 self.restart_thread.run = self._restart_thread_main
                 self.restart_thread.error = None
+                self.restart_thread.pooled_kernel = (
+                    self.plugin.claim_pooled_kernel(self))
                 self.restart_thread.finished.connect(
                     lambda: self._finalise_restart(True))
                 self.restart_thread.start()
@@ -638,8 +649,13 @@ def restart_kernel(self):
     def _restart_thread_main(self):
         """Restart the kernel in a thread."""
         try:
-            self.shellwidget.kernel_manager.restart_kernel(
-                stderr=self.stderr_handle)
+            if self.restart_thread.pooled_kernel is not None:
+                # The kernel is replaced by an already started one in
+                # _finalise_restart
+                self.shellwidget.kernel_manager.shutdown_kernel(now=True)
+            else:
+                self.shellwidget.kernel_manager.restart_kernel(
+                    stderr=self.stderr_handle)
         except RuntimeError as e:
             self.restart_thread.error = e
 
@@ -648,15 +664,21 @@ def _finalise_restart(self, reset=False):
         sw = self.shellwidget
 
         if self._abort_kernel_restart():
+            self._release_pooled_kernel()
             sw.spyder_kernel_comm.close()
             return
 
         if self.restart_thread and self.restart_thread.error is not None:
+            self._release_pooled_kernel()
             sw._append_plain_text(
                 _('Error restarting kernel: %s\n') % self.restart_thread.error,
                 before_prompt=True
             )
         else:
+            if (self.restart_thread
+                    and self.restart_thread.pooled_kernel is not None):
+                self._set_pooled_kernel(*self.restart_thread.pooled_kernel)
+
             # Reset Pdb state and reopen comm
             sw._pdb_in_loop = False
             sw.spyder_kernel_comm.close()
@@ -670,6 +692,7 @@ def _finalise_restart(self, reset=False):
             # setting of %colors on windows by assuming it was using a
             # dark background. This corrects it based on the scheme.
             self.set_color_scheme(sw.syntax_style, reset=reset)
+            sw.send_module_index()
             sw._append_html(_("<br>Restarting kernel...\n<hr><br>"),
                             before_prompt=True)
 
@@ -677,6 +700,27 @@ def _finalise_restart(self, reset=False):
         self.stop_button.setDisabled(True)
         self.restart_thread = None
 
+    def _release_pooled_kernel(self):
+        """Shutdown the pooled kernel claimed for a failed restart."""
+        if (self.restart_thread
+                and self.restart_thread.pooled_kernel is not None):
+            self.plugin.release_pooled_kernel(
+                *self.restart_thread.pooled_kernel)
+            self.restart_thread.pooled_kernel = None
+
+    def _set_pooled_kernel(self, kernel_manager, kernel_client):
+        """Replace the kernel of this client by one taken from the pool."""
+        sw = self.shellwidget
+        if sw.kernel_client is not None:
+            sw.kernel_client.stop_channels()
+
+        # Pooled kernels have their own connection and stderr files
+        self.remove_stderr_file()
+        self.connection_file = kernel_manager.connection_file
+
+        self.plugin.start_kernel_client(self, kernel_client)
+        sw.set_kernel_client_and_manager(kernel_client, kernel_manager)
+
     @Slot(str)
     def kernel_restarted_message(self, msg):
         """Show kernel restarted/died messages."""
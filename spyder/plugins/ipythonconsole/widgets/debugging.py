@@ -24,6 +24,7 @@
 
 from spyder.config.base import _, get_conf_path
 from spyder.config.manager import CONF
+from spyder.plugins.ipythonconsole.comms.kernelcomm import is_unknown_call
 
 
 class SpyderIPy3Lexer(IPython3Lexer):
@@ -185,6 +186,9 @@ def __init__(self, *args, **kwargs):
         self._pdb_prompt = (None, None)  # prompt, password
         self._pdb_last_cmd = ''  # last command sent to pdb
         self._pdb_frame_loc = (None, None)  # fname, lineno
+        self._pdb_breakpoints = {}  # Last breakpoints sent to the kernel
+        # False if the kernel is too old to update breakpoints by file
+        self._kernel_updates_breakpoints = True
         # Command queue
         self._pdb_input_queue = []  # List of (code, hidden, echo_stack_entry)
         # Temporary flags
@@ -323,8 +327,9 @@ def pdb_execute(self, line, hidden=False, echo_stack_entry=True,
 
     def get_pdb_settings(self):
         """Get pdb settings"""
+        self._pdb_breakpoints = CONF.get('run', 'breakpoints', {})
         return {
-            "breakpoints": CONF.get('run', 'breakpoints', {}),
+            "breakpoints": self._pdb_breakpoints,
             "pdb_ignore_lib": CONF.get('ipython_console', 'pdb_ignore_lib'),
             "pdb_execute_events": CONF.get(
                 'ipython_console', 'pdb_execute_events'),
@@ -335,9 +340,40 @@ def get_pdb_settings(self):
 
     # --- To Sort --------------------------------------------------
     def set_spyder_breakpoints(self):
-        """Set Spyder breakpoints into a debugging session"""
+        """
+        Set Spyder breakpoints into a debugging session.
+
+        Only the breakpoints of the files that changed are sent, and
+        nothing is sent if we are not debugging, because they are asked
+        for again when a session starts.
+        """
+        breakpoints = CONF.get('run', 'breakpoints', {})
+        if not self.is_debugging():
+            return
+        last_breakpoints = self._pdb_breakpoints
+        changes = {}
+        for fname in set(breakpoints) | set(last_breakpoints):
+            data = breakpoints.get(fname, [])
+            if data != last_breakpoints.get(fname, []):
+                changes[fname] = data
+        self._pdb_breakpoints = breakpoints
+        if not changes:
+            return
+        if self._kernel_updates_breakpoints:
+            self.call_kernel(
+                interrupt=True,
+                error_callback=self._update_breakpoints_failed
+            ).update_breakpoints(changes)
+        else:
+            self.call_kernel(interrupt=True).set_breakpoints(breakpoints)
+
+    def _update_breakpoints_failed(self, error):
+        """Send all breakpoints if the kernel can't update them by file."""
+        if not is_unknown_call(error):
+            return False
+        self._kernel_updates_breakpoints = False
         self.call_kernel(interrupt=True).set_breakpoints(
-            CONF.get('run', 'breakpoints', {}))
+            self._pdb_breakpoints)
 
     def set_pdb_ignore_lib(self, pdb_ignore_lib):
         """Set pdb_ignore_lib into a debugging session"""
@@ -386,6 +422,10 @@ def refresh_from_pdb(self, pdb_state):
 
         if 'var_properties' in pdb_state:
             self.set_var_properties(pdb_state['var_properties'])
+        elif 'namespace_view' not in pdb_state:
+            # The kernel only sends the step, so ask for the namespace
+            # changes if the Variable Explorer is visible
+            self.refresh_namespacebrowser(interrupt=False)
 
     def set_pdb_state(self, pdb_state):
         """Set current pdb state."""
@@ -23,6 +23,8 @@
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
 
 from spyder.config.base import _
+from spyder.config.manager import CONF
+from spyder.plugins.ipythonconsole.comms.kernelcomm import is_unknown_call
 from spyder.py3compat import PY2, to_text_string, TimeoutError
 from spyder_kernels.comms.commbase import CommError
 
@@ -49,16 +51,66 @@ class NamepaceBrowserWidget(RichJupyterWidget):
     # To save values and messages returned by the kernel
     _kernel_is_starting = True
 
+    # To coalesce refreshes of the namespace browser: only one request is
+    # sent to the kernel at a time and the ones made while waiting for its
+    # reply are merged into a single one.
+    _namespacebrowser_request_time = None
+    _namespacebrowser_refresh_pending = False
+
+    # True if a refresh was skipped because the namespace browser was hidden
+    namespacebrowser_outdated = False
+
+    # Last namespace state received from the kernel, so it only needs to
+    # send the variables that changed after it
+    _namespace_state = None
+
+    # Older kernels don't have get_namespace_view_and_properties or its
+    # `since` argument. These are set to False when a call fails because
+    # of that.
+    _kernel_batches_namespace = True
+    _kernel_sends_namespace_deltas = True
+
+    # Older kernels can't memory-map imported data. This is set to False
+    # when load_data fails because of its `mmap` argument.
+    _kernel_maps_data = True
+
     # --- Public API --------------------------------------------------
     def set_namespacebrowser(self, namespacebrowser):
         """Set namespace browser widget"""
         self.namespacebrowser = namespacebrowser
 
-    def refresh_namespacebrowser(self, interrupt=True):
-        """Refresh namespace browser"""
+    def refresh_namespacebrowser(self, interrupt=True, force=False):
+        """
+        Refresh namespace browser
+
+        Parameters
+        ----------
+        interrupt: bool
+            Interrupt the kernel to perform the refresh.
+        force: bool
+            Make the kernel recompute the namespace view even if it
+            didn't execute any code since the last refresh.
+        """
         if self.kernel_client is None:
             return
-        if self.namespacebrowser:
+        if not self.namespacebrowser:
+            return
+
+        # Don't compute the namespace view if nobody is going to see it
+        if not self.namespacebrowser.is_shown():
+            self.namespacebrowser_outdated = True
+            return
+        self.namespacebrowser_outdated = False
+
+        # Wait for the reply to the previous request, unless it was lost
+        request_time = self._namespacebrowser_request_time
+        if (request_time is not None and
+                time.monotonic() - request_time < CALL_KERNEL_TIMEOUT):
+            self._namespacebrowser_refresh_pending = True
+            return
+
+        self._namespacebrowser_refresh_pending = False
+        if not self._kernel_batches_namespace:
             self.call_kernel(
                 interrupt=interrupt,
                 callback=self.set_namespace_view
@@ -67,6 +119,34 @@ def refresh_namespacebrowser(self, interrupt=True):
                 interrupt=interrupt,
                 callback=self.set_var_properties
             ).get_var_properties()
+            return
+
+        self._namespacebrowser_request_time = time.monotonic()
+        args = [force]
+        if self._kernel_sends_namespace_deltas:
+            since = None
+            if not force and self._namespace_state is not None:
+                since = self._namespace_state.get('state_id')
+            args.append(since)
+        self.call_kernel(
+            interrupt=interrupt,
+            callback=self.set_namespace_view_and_properties,
+            error_callback=self._namespace_request_failed
+        ).get_namespace_view_and_properties(*args)
+
+    def set_namespace_view_and_properties(self, state):
+        """Set the current namespace view and var properties."""
+        self._namespacebrowser_request_time = None
+        if state is not None:
+            if state.get('delta'):
+                state = self._apply_namespace_delta(state)
+            self._namespace_state = state
+            self.set_namespace_view(state['namespace_view'])
+            self.set_var_properties(state['var_properties'])
+
+        # Send the refreshes requested while waiting for this reply
+        if self._namespacebrowser_refresh_pending:
+            self.refresh_namespacebrowser(interrupt=False)
 
     def set_namespace_view(self, view):
         """Set the current namespace view."""
@@ -149,12 +229,28 @@ def load_data(self, filename, ext):
             result = QMessageBox.question(
                 self, _('Data loading'), message, buttons)
             overwrite = result == QMessageBox.Yes
+        kwargs = dict(overwrite=overwrite)
+        if (self._kernel_maps_data and
+                CONF.get('variable_explorer', 'import_mmap')):
+            kwargs['mmap'] = True
         try:
-            return self.call_kernel(
-                blocking=True,
-                display_error=True,
-                timeout=CALL_KERNEL_TIMEOUT).load_data(
-                    filename, ext, overwrite=overwrite)
+            try:
+                return self.call_kernel(
+                    blocking=True,
+                    display_error=True,
+                    timeout=CALL_KERNEL_TIMEOUT).load_data(
+                        filename, ext, **kwargs)
+            except TypeError as error:
+                if 'mmap' not in kwargs or 'mmap' not in str(error):
+                    raise
+                # The kernel is too old to memory-map data
+                self._kernel_maps_data = False
+                kwargs.pop('mmap')
+                return self.call_kernel(
+                    blocking=True,
+                    display_error=True,
+                    timeout=CALL_KERNEL_TIMEOUT).load_data(
+                        filename, ext, **kwargs)
         except ImportError as msg:
             module = str(msg).split("'")[1]
             msg = _("Spyder is unable to open the file "
@@ -169,6 +265,20 @@ def load_data(self, filename, ext):
         except (UnpicklingError, RuntimeError, CommError):
             return None
 
+    def load_text_data(self, name, filename, settings, callback=None):
+        """
+        Load a text file in a variable with the settings of the Import
+        Wizard.
+
+        This doesn't block Spyder, because big files can take a while to
+        load. callback gets an error message or None.
+        """
+        self.call_kernel(
+            interrupt=True,
+            callback=callback,
+            display_error=True,
+            ).load_text_data(name, filename, settings)
+
     def save_namespace(self, filename):
         try:
             return self.call_kernel(
@@ -181,6 +291,49 @@ def save_namespace(self, filename):
         except (UnpicklingError, RuntimeError, CommError):
             return None
 
+    # ---- Private API ---------------------------------------------
+    def _namespace_request_failed(self, error):
+        """
+        Refresh the namespace browser again with the calls supported by
+        older kernels if that's why the request failed.
+        """
+        self._namespacebrowser_request_time = None
+        pending = self._namespacebrowser_refresh_pending
+        self._namespacebrowser_refresh_pending = False
+        if is_unknown_call(error):
+            self._kernel_batches_namespace = False
+        elif (error.etype is TypeError and
+                self._kernel_sends_namespace_deltas):
+            self._kernel_sends_namespace_deltas = False
+        else:
+            if pending:
+                self.refresh_namespacebrowser(interrupt=False)
+            return False
+        self.refresh_namespacebrowser(interrupt=False)
+
+    def _reset_namespace_state(self):
+        """
+        Forget the namespace state and what the kernel supports, because
+        it was (re)started and could be a different one.
+        """
+        self._namespacebrowser_request_time = None
+        self._namespace_state = None
+        self._kernel_batches_namespace = True
+        self._kernel_sends_namespace_deltas = True
+        self._kernel_maps_data = True
+
+    def _apply_namespace_delta(self, delta):
+        """Return the namespace state after applying a delta to it."""
+        view = dict(self._namespace_state['namespace_view'])
+        properties = dict(self._namespace_state['var_properties'])
+        view.update(delta['namespace_view'])
+        properties.update(delta['var_properties'])
+        for name in delta['removed']:
+            view.pop(name, None)
+            properties.pop(name, None)
+        return dict(namespace_view=view, var_properties=properties,
+                    state_id=delta['state_id'])
+
     # ---- Private API (overrode by us) ----------------------------
     def _handle_execute_reply(self, msg):
         """
@@ -196,6 +349,7 @@ def _handle_execute_reply(self, msg):
         # Refresh namespacebrowser after the kernel starts running
         exec_count = msg['content'].get('execution_count', '')
         if exec_count == 0 and self._kernel_is_starting:
+            self._reset_namespace_state()
             if self.namespacebrowser is not None:
                 self.set_namespace_view_settings()
                 self.refresh_namespacebrowser(interrupt=False)
@@ -229,6 +383,7 @@ def _handle_status(self, msg):
                 self._kernel_is_starting = True
         elif state == 'idle' and msg_type == 'shutdown_request':
             # This handles restarts asked by the user
+            self._reset_namespace_state()
             if self.namespacebrowser is not None:
                 self.set_namespace_view_settings()
                 self.refresh_namespacebrowser(interrupt=False)
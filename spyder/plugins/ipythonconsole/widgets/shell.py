@@ -24,8 +24,11 @@
 from spyder.py3compat import to_text_string
 from spyder.utils import programs, encoding
 from spyder.utils import syntaxhighlighters as sh
+from spyder.utils.introspection.module_completion import get_module_index
+from spyder.utils.scrollback import ScrollbackBuffer
 from spyder.plugins.ipythonconsole.utils.style import create_qss_style, create_style_class
 from spyder.widgets.helperwidgets import MessageCheckBox
+from spyder.widgets.scrollbackviewer import ScrollbackViewer
 from spyder.plugins.ipythonconsole.comms.kernelcomm import KernelComm
 from spyder.plugins.ipythonconsole.widgets import (
         ControlWidget, DebuggingWidget, FigureBrowserWidget,
@@ -69,6 +72,9 @@ class ShellWidget(NamepaceBrowserWidget, HelpWidget, DebuggingWidget,
     # For printing internal errors
     sig_exception_occurred = Signal(dict)
 
+    # For profiling code in the kernel
+    sig_profile_data_received = Signal(str, object)
+
     def __init__(self, ipyclient, additional_options, interpreter_versions,
                  external_kernel, *args, **kw):
         # To override the Qt widget used by RichJupyterWidget
@@ -86,6 +92,11 @@ def __init__(self, ipyclient, additional_options, interpreter_versions,
         self.external_kernel = external_kernel
         self._cwd = ''
 
+        # All the output, including lines removed from the console because
+        # they don't fit in its buffer
+        self.scrollback = ScrollbackBuffer()
+        self.scrollback_viewer = None
+
         # Keyboard shortcuts
         self.shortcuts = self.create_shortcuts()
 
@@ -111,6 +122,7 @@ def __init__(self, ipyclient, additional_options, interpreter_versions,
             'do_where': self.do_where,
             'pdb_input': self.pdb_input,
             'request_interrupt_eventloop': self.request_interrupt_eventloop,
+            'show_profile_data': self.handle_show_profile_data,
         }
         for request_id in handlers:
             self.spyder_kernel_comm.register_call_handler(
@@ -166,10 +178,11 @@ def will_close(self, externally_managed):
             self.spyder_kernel_comm.close()
             if self.kernel_client is not None:
                 self.kernel_client.stop_channels()
+        self.scrollback.close()
         super(ShellWidget, self).will_close(externally_managed)
 
     def call_kernel(self, interrupt=False, blocking=False, callback=None,
-                    timeout=None, display_error=False):
+                    timeout=None, display_error=False, error_callback=None):
         """
         Send message to Spyder kernel connected to this console.
 
@@ -191,13 +204,18 @@ def call_kernel(self, interrupt=False, blocking=False, callback=None,
             used.
         display_error: bool
             If an error occurs, should it be printed to the console.
+        error_callback: callable
+            Callable to process the error raised by a non-blocking call
+            in the kernel, e.g. because an older kernel doesn't have it.
+            The error is still reported if it returns False.
         """
         return self.spyder_kernel_comm.remote_call(
             interrupt=interrupt,
             blocking=blocking,
             callback=callback,
             timeout=timeout,
-            display_error=display_error
+            display_error=display_error,
+            error_callback=error_callback
         )
 
     def set_kernel_client_and_manager(self, kernel_client, kernel_manager):
@@ -306,6 +324,23 @@ def update_syspath(self, path_dict, new_path_dict):
             interrupt=True,
             blocking=False).update_syspath(path_dict, new_path_dict)
 
+    def send_module_index(self):
+        """
+        Send the modules of the main interpreter to the kernel, to complete
+        imports with them, once they are found in the background.
+        """
+        if self.external_kernel or self.kernel_manager is None:
+            return
+
+        def send(modules):
+            try:
+                self.call_kernel().set_module_index(modules)
+            except RuntimeError:
+                # The console was closed meanwhile
+                pass
+
+        get_module_index(update=True).call_when_ready(send)
+
     def request_syspath(self):
         """Ask the kernel for sys.path contents."""
         self.call_kernel(
@@ -437,6 +472,7 @@ def short_banner(self):
     # --- To define additional shortcuts
     def clear_console(self):
         self.execute("%clear")
+        self.scrollback.clear()
         # Stop reading as any input has been removed.
         self._reading = False
 
@@ -747,11 +783,34 @@ def handle_current_filename(self):
         """Get the current filename."""
         return self.get_editorstack().get_current_finfo().filename
 
+    def handle_show_profile_data(self, name, stats):
+        """Show the statistics of code profiled in the kernel."""
+        self.sig_profile_data_received.emit(name, stats)
+
+    def show_scrollback(self):
+        """Show all outputs, including the ones that don't fit."""
+        if self.scrollback_viewer is None:
+            self.scrollback_viewer = ScrollbackViewer(self.scrollback, self)
+            self.scrollback_viewer.set_font(self.font)
+        self.scrollback_viewer.refresh()
+        self.scrollback_viewer.show()
+        self.scrollback_viewer.raise_()
+
     # ---- Public methods (overrode by us) ------------------------------------
     def request_restart_kernel(self):
         """Reimplemented to call our own restart mechanism."""
         self.ipyclient.restart_kernel()
 
+    def append_stream(self, text):
+        """
+        Reimplemented to keep all outputs in the scrollback buffer.
+
+        Streams are already rendered in batches by qtconsole, which only
+        keeps the last buffer_size lines of each batch.
+        """
+        self.scrollback.append(text)
+        super(ShellWidget, self).append_stream(text)
+
     # ---- Private methods (overrode by us) -----------------------------------
     def _handle_error(self, msg):
         """
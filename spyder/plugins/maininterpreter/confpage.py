@@ -22,6 +22,8 @@
 from spyder.utils import icon_manager as ima
 from spyder.utils import programs
 from spyder.utils.conda import get_list_conda_envs_cache
+from spyder.utils.interpreters import (get_cached_interpreter_info,
+                                       refresh_interpreter_info)
 from spyder.utils.misc import get_python_executable
 from spyder.utils.pyenv import get_list_pyenv_envs_cache
 
@@ -178,10 +180,14 @@ def warn_python_compatibility(self, pyexec):
             return
 
         spyder_version = sys.version_info[0]
+        info = get_cached_interpreter_info(pyexec)
         try:
-            args = ["-c", "import sys; print(sys.version_info[0])"]
-            proc = programs.run_program(pyexec, args, env={})
-            console_version = int(proc.communicate()[0])
+            if info is not None:
+                console_version = int(info['version'].split()[-1].split('.')[0])
+            else:
+                args = ["-c", "import sys; print(sys.version_info[0])"]
+                proc = programs.run_program(pyexec, args, env={})
+                console_version = int(proc.communicate()[0])
         except IOError:
             console_version = spyder_version
         except ValueError:
@@ -296,6 +302,9 @@ def apply_settings(self, options):
 
             # Show warning compatibility message.
             self.warn_python_compatibility(executable)
+
+            # Get the metadata of the interpreter before consoles need it
+            refresh_interpreter_info(executable)
         if not self.pyexec_edit.text():
             self.set_option('custom_interpreter', '')
         else:
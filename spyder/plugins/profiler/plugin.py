@@ -18,6 +18,7 @@
 from spyder.api.plugins import Plugins, SpyderDockablePlugin
 from spyder.api.translations import get_translation
 from spyder.plugins.mainmenu.api import ApplicationMenus
+from spyder.plugins.outlineexplorer.api import cell_name
 from spyder.plugins.profiler.confpage import ProfilerConfigPage
 from spyder.plugins.profiler.widgets.main_widget import (ProfilerWidget,
                                                          ProfilerWidgetActions,
@@ -32,6 +33,8 @@
 # ----------------------------------------------------------------------------
 class ProfilerActions:
     ProfileCurrentFile = 'profile_current_filename_action'
+    ProfileCell = 'profile_cell_action'
+    ProfileSelection = 'profile_selection_action'
 
 
 # --- Plugin
@@ -43,7 +46,7 @@ class Profiler(SpyderDockablePlugin):
 
     NAME = 'profiler'
     REQUIRES = [Plugins.Editor, Plugins.VariableExplorer]
-    OPTIONAL = [Plugins.MainMenu]
+    OPTIONAL = [Plugins.IPythonConsole, Plugins.MainMenu]
     TABIFY = Plugins.Help
     WIDGET_CLASS = ProfilerWidget
     CONF_SECTION = NAME
@@ -73,12 +76,17 @@ def get_icon(self):
     def register(self):
         widget = self.get_widget()
         editor = self.get_plugin(Plugins.Editor)
+        ipyconsole = self.get_plugin(Plugins.IPythonConsole)
         mainmenu = self.get_plugin(Plugins.MainMenu)
 
         widget.sig_edit_goto_requested.connect(editor.load)
         widget.sig_started.connect(self.sig_started)
         widget.sig_finished.connect(self.sig_finished)
 
+        if ipyconsole:
+            ipyconsole.sig_profile_data_received.connect(
+                self.show_console_data)
+
         run_action = self.create_action(
             ProfilerActions.ProfileCurrentFile,
             text=_("Run profiler"),
@@ -89,9 +97,31 @@ def register(self):
         )
         run_action.setEnabled(is_profiler_installed())
 
+        profile_actions = [run_action]
+        if ipyconsole:
+            profile_actions += [
+                self.create_action(
+                    ProfilerActions.ProfileCell,
+                    text=_("Profile cell in console"),
+                    tip=_("Profile the current cell in the namespace of "
+                          "the current console"),
+                    icon=self.create_icon('run_cell'),
+                    triggered=self.profile_cell,
+                ),
+                self.create_action(
+                    ProfilerActions.ProfileSelection,
+                    text=_("Profile selection in console"),
+                    tip=_("Profile the selection or current line in the "
+                          "namespace of the current console"),
+                    icon=self.create_icon('run_selection'),
+                    triggered=self.profile_selection,
+                ),
+            ]
+
         if mainmenu:
             run_menu = mainmenu.get_application_menu(ApplicationMenus.Run)
-            mainmenu.add_item_to_application_menu(run_action, menu=run_menu)
+            for action in profile_actions:
+                mainmenu.add_item_to_application_menu(action, menu=run_menu)
 
         # TODO: On a separate PR when core plugin is merged
         # self.main.editor.pythonfile_dependent_actions += [profiler_act]
@@ -111,6 +141,44 @@ def run_profiler(self):
             self.switch_to_plugin()
             self.analyze(editor.get_current_filename())
 
+    def profile_cell(self):
+        """Profile the current cell of the editor in the current console."""
+        editor = self.get_plugin(Plugins.Editor)
+        codeeditor = editor.get_current_editor()
+        if codeeditor is None or not codeeditor.is_python_or_ipython():
+            return
+        __, block = codeeditor.get_cell_as_executable_code()
+        self.get_plugin(Plugins.IPythonConsole).profile_cell(
+            cell_name(block), editor.get_current_filename())
+
+    def profile_selection(self):
+        """
+        Profile the selection (or current line) of the editor in the
+        current console.
+        """
+        codeeditor = self.get_plugin(Plugins.Editor).get_current_editor()
+        if codeeditor is None:
+            return
+        code = codeeditor.get_selection_as_executable_code()
+        if not code:
+            code = codeeditor.get_current_line().strip()
+        if code:
+            self.get_plugin(Plugins.IPythonConsole).profile_code(code)
+
+    def show_console_data(self, name, stats):
+        """
+        Show the statistics of code profiled in a console.
+
+        Parameters
+        ----------
+        name: str
+            Name of the profiled code.
+        stats: dict
+            Statistics of cProfile.
+        """
+        self.switch_to_plugin(force_focus=False)
+        self.get_widget().show_stats(name, stats)
+
     def stop_profiler(self):
         """
         Stop profiler.
@@ -10,6 +10,8 @@
 
 
 # Standard library imports
+import cProfile
+import os
 try:
     from unittest.mock import Mock
 except ImportError:
@@ -102,5 +104,26 @@ class Stats:
                                   ['2.00 s', ['-400.00 ms', 'green']]]
 
 
+def test_load_data_cache(profiler_datatree_bot, tmpdir):
+    """Test that profiler data is only parsed again when it changes."""
+    tree = profiler_datatree_bot
+    datafile = str(tmpdir.join('profiler.results'))
+    cProfile.run('sum(range(10))', datafile)
+
+    tree.load_data(datafile)
+    stats = tree.profdata
+    tree.load_data(datafile)
+    assert tree.profdata is stats
+
+    cProfile.run('sum(range(20))', datafile)
+    os.utime(datafile, ns=(0, 0))
+    tree.load_data(datafile)
+    assert tree.profdata is not stats
+
+    stats = tree.profdata
+    tree.load_data(datafile, reload=True)
+    assert tree.profdata is not stats
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+History of profiler runs.
+
+Runs are stored as pstats dumps in a folder per script, together with an
+index of their dates and total times, so they can be listed without loading
+them. Loaded runs are kept in a small cache to compare them quickly.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import os.path as osp
+import pstats
+import shutil
+import time
+
+# Local imports
+from spyder.config.base import get_conf_path
+
+
+# Maximum number of runs stored per script
+MAX_RUNS = 20
+
+# Number of loaded runs kept in memory
+CACHE_SIZE = 8
+
+# Name of the index of runs in the folder of each script
+INDEX_FILENAME = 'index.json'
+
+
+def compare_stats(base, new):
+    """
+    Return the changes in cumulative time between two pstats.Stats.
+
+    The result is a list of (function, base time, new time, delta) tuples,
+    sorted by decreasing delta so regressions come first. Functions are
+    (filename, line number, name) tuples, as in pstats.
+    """
+    changes = []
+    for function in set(base.stats) | set(new.stats):
+        base_time = base.stats.get(function, (0, 0, 0, 0.))[3]
+        new_time = new.stats.get(function, (0, 0, 0, 0.))[3]
+        changes.append((function, base_time, new_time, new_time - base_time))
+    changes.sort(key=lambda change: change[3], reverse=True)
+    return changes
+
+
+class ProfileHistory(object):
+    """Store of the profiler runs of each script."""
+
+    def __init__(self, path=None, max_runs=MAX_RUNS):
+        if path is None:
+            path = get_conf_path('profiler_history')
+        self.path = path
+        self.max_runs = max_runs
+        self._cache = OrderedDict()
+
+    def get_runs(self, filename):
+        """
+        Return the runs of filename, from oldest to newest.
+
+        Each run is a dictionary with its id, date (as a timestamp), total
+        time and number of functions.
+        """
+        return self._read_index(filename)['runs']
+
+    def add_run(self, filename, stats):
+        """Store the pstats.Stats of a run of filename and return the run."""
+        os.makedirs(self._get_folder(filename), exist_ok=True)
+        index = self._read_index(filename)
+        runs = index['runs']
+        run = {
+            'id': runs[-1]['id'] + 1 if runs else 1,
+            'date': time.time(),
+            'total_time': stats.total_tt,
+            'functions': len(stats.stats),
+        }
+        path = self.get_run_path(filename, run['id'])
+        stats.dump_stats(path)
+        self._add_to_cache(path, stats)
+        runs.append(run)
+
+        for old_run in runs[:-self.max_runs]:
+            old_path = self.get_run_path(filename, old_run['id'])
+            self._cache.pop(old_path, None)
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+        index['runs'] = runs[-self.max_runs:]
+        self._write_index(filename, index)
+        return run
+
+    def load_stats(self, filename, run_id):
+        """Return the pstats.Stats of a run of filename."""
+        path = self.get_run_path(filename, run_id)
+        stats = self._cache.get(path)
+        if stats is None:
+            stats = pstats.Stats(path)
+        self._add_to_cache(path, stats)
+        return stats
+
+    def compare(self, filename, base_id, new_id):
+        """Return the changes between two runs, see compare_stats."""
+        return compare_stats(self.load_stats(filename, base_id),
+                             self.load_stats(filename, new_id))
+
+    def remove(self, filename):
+        """Remove all the runs of filename."""
+        folder = self._get_folder(filename)
+        for path in list(self._cache):
+            if osp.dirname(path) == folder:
+                del self._cache[path]
+        shutil.rmtree(folder, ignore_errors=True)
+
+    def get_run_path(self, filename, run_id):
+        """Return the path of the pstats dump of a run."""
+        return osp.join(self._get_folder(filename), '{}.prof'.format(run_id))
+
+    def _get_folder(self, filename):
+        key = hashlib.md5(osp.normcase(filename).encode('utf-8')).hexdigest()
+        return osp.join(self.path, key)
+
+    def _add_to_cache(self, path, stats):
+        self._cache.pop(path, None)
+        self._cache[path] = stats
+        while len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _read_index(self, filename):
+        index_path = osp.join(self._get_folder(filename), INDEX_FILENAME)
+        try:
+            with open(index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, IOError, ValueError):
+            return {'filename': filename, 'runs': []}
+
+    def _write_index(self, filename, index):
+        index_path = osp.join(self._get_folder(filename), INDEX_FILENAME)
+        temp_path = index_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(temp_path, index_path)
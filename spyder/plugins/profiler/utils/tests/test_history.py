@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the history of profiler runs.
+"""
+
+# Standard library imports
+import cProfile
+import os.path as osp
+import pstats
+
+# Local imports
+from spyder.plugins.profiler.utils.history import ProfileHistory
+
+
+def slow(n):
+    return sum(i * i for i in range(n))
+
+
+def profile(n):
+    profiler = cProfile.Profile()
+    profiler.runcall(slow, n)
+    return pstats.Stats(profiler)
+
+
+def test_profile_history(tmpdir):
+    """Test storing, pruning and comparing runs."""
+    history = ProfileHistory(str(tmpdir), max_runs=2)
+    filename = osp.join(str(tmpdir), 'script.py')
+    assert history.get_runs(filename) == []
+
+    history.add_run(filename, profile(10))
+    history.add_run(filename, profile(10))
+    history.add_run(filename, profile(100000))
+    runs = history.get_runs(filename)
+    assert [run['id'] for run in runs] == [2, 3]
+    assert not osp.exists(history.get_run_path(filename, 1))
+    assert runs[0]['date'] <= runs[1]['date']
+
+    # Runs are loaded again from their files
+    history = ProfileHistory(str(tmpdir), max_runs=2)
+    changes = history.compare(filename, 2, 3)
+    function, base_time, new_time, delta = changes[0]
+    assert function[2] == 'slow'
+    assert delta == new_time - base_time > 0
+    assert [change[3] for change in changes] == sorted(
+        [change[3] for change in changes], reverse=True)
+
+    history.remove(filename)
+    assert history.get_runs(filename) == []
@@ -15,6 +15,7 @@
 
 # Standard library imports
 import logging
+import marshal
 import os
 import os.path as osp
 import re
@@ -27,14 +28,16 @@
 from qtpy.compat import getopenfilename, getsavefilename
 from qtpy.QtCore import QByteArray, QProcess, QProcessEnvironment, Qt, Signal
 from qtpy.QtGui import QColor
-from qtpy.QtWidgets import (QApplication, QHBoxLayout, QLabel, QMessageBox,
-                            QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+from qtpy.QtWidgets import (QApplication, QComboBox, QDialog, QHBoxLayout,
+                            QLabel, QMessageBox, QPushButton, QTreeWidget,
+                            QTreeWidgetItem, QVBoxLayout, QWidget)
 
 # Local imports
 from spyder.api.translations import get_translation
 from spyder.api.widgets import PluginMainWidget, SpyderWidgetMixin
 from spyder.config.base import get_conf_path
 from spyder.config.gui import is_dark_interface
+from spyder.plugins.profiler.utils.history import ProfileHistory
 from spyder.plugins.variableexplorer.widgets.texteditor import TextEditor
 from spyder.py3compat import to_text_string
 from spyder.utils.misc import add_pathlist_to_PYTHONPATH, getcwd_or_home
@@ -56,6 +59,9 @@
 else:
     MAIN_TEXT_COLOR = '#444444'
 
+# Maximum number of functions shown in the history dialog
+MAX_HISTORY_FUNCTIONS = 500
+
 
 class ProfilerWidgetActions:
     # Triggers
@@ -63,6 +69,7 @@ class ProfilerWidgetActions:
     Clear = 'clear_action'
     Collapse = 'collapse_action'
     Expand = 'expand_action'
+    History = 'history_action'
     LoadData = 'load_data_action'
     Run = 'run_action'
     SaveData = 'save_data_action'
@@ -174,6 +181,8 @@ def __init__(self, name=None, plugin=None, parent=None,
         self.output = None
         self.running = False
         self.text_color = self.get_option('text_color')
+        self.history = ProfileHistory()
+        self.data_name = None
 
         # Widgets
         self.process = None
@@ -260,6 +269,14 @@ def setup(self, options):
             triggered=self.clear,
         )
         self.clear_action.setEnabled(False)
+        self.history_action = self.create_action(
+            ProfilerWidgetActions.History,
+            text=_("History"),
+            icon_text=_("History"),
+            tip=_("Compare previous runs of this script"),
+            icon=self.create_icon('history'),
+            triggered=self.show_history,
+        )
 
         # Main Toolbar
         toolbar = self.get_main_toolbar()
@@ -277,7 +294,8 @@ def setup(self, options):
         for item in [self.collapse_action, self.expand_action,
                      self.create_stretcher(), self.datelabel,
                      self.create_stretcher(), self.log_action,
-                     self.save_action, self.load_action, self.clear_action]:
+                     self.save_action, self.load_action, self.history_action,
+                     self.clear_action]:
             self.add_item_to_toolbar(
                 item,
                 toolbar=secondary_toolbar,
@@ -339,7 +357,9 @@ def _finished(self, exit_code, exit_status):
         self.show_errorlog()  # If errors occurred, show them.
         self.output = self.error_output + self.output
         self.datelabel.setText('')
-        self.show_data(justanalyzed=True)
+        succeeded = (exit_code == 0
+                     and self.process.exitStatus() == QProcess.NormalExit)
+        self.show_data(justanalyzed=True, add_to_history=succeeded)
         self.update_actions()
 
     def _read_output(self, error=False):
@@ -398,6 +418,22 @@ def compare(self):
             self.show_data()
             self.clear_action.setEnabled(True)
 
+    def show_history(self):
+        """Show the runs of the current script or code to compare them."""
+        name = self.data_name or to_text_string(self.filecombo.currentText())
+        if not name:
+            return
+        dialog = ProfilerHistoryDialog(self.history, name, parent=self)
+        dialog.sig_compare_requested.connect(self.compare_run)
+        dialog.sig_edit_goto_requested.connect(self.sig_edit_goto_requested)
+        dialog.show()
+
+    def compare_run(self, path):
+        """Compare the last run with a run stored in the history."""
+        self.datatree.compare(path)
+        self.show_data()
+        self.clear_action.setEnabled(True)
+
     def clear(self):
         """Clear data in tree."""
         self.datatree.compare(None)
@@ -521,6 +557,7 @@ def start(self, wdir=None, args=None, pythonpath=None):
         self._last_wdir = wdir
         self._last_args = args
         self._last_pythonpath = pythonpath
+        self.data_name = filename
 
         self.datelabel.setText(_('Profiling, please wait...'))
 
@@ -592,7 +629,28 @@ def run(self):
         else:
             self.start()
 
-    def show_data(self, justanalyzed=False):
+    def show_stats(self, name, stats):
+        """
+        Show statistics of cProfile, e.g. of code profiled in a console.
+
+        Parameters
+        ----------
+        name: str
+            Name of the profiled code, used to store it in the history.
+        stats: dict
+            Statistics of cProfile, as in the `stats` attribute of
+            pstats.Stats.
+        """
+        self._kill_if_running()
+        # Save them like the ones of scripts, so they can be saved and
+        # compared in the same way
+        with open(self.DATAPATH, 'wb') as f:
+            marshal.dump(stats, f)
+        self.output = ''
+        self.error_output = ''
+        self.show_data(justanalyzed=True, add_to_history=True, name=name)
+
+    def show_data(self, justanalyzed=False, add_to_history=False, name=None):
         """
         Show analyzed data on results tree.
 
@@ -600,6 +658,11 @@ def show_data(self, justanalyzed=False):
         ----------
         justanalyzed: bool, optional
             Default is False.
+        add_to_history: bool, optional
+            Store the data as a new run of the script. Default is False.
+        name: str, optional
+            Name of the profiled script or code. By default, the one of the
+            last data shown.
         """
         if not justanalyzed:
             self.output = None
@@ -607,14 +670,23 @@ def show_data(self, justanalyzed=False):
         self.log_action.setEnabled(self.output is not None
                                    and len(self.output) > 0)
         self._kill_if_running()
-        filename = to_text_string(self.filecombo.currentText())
+        if name is not None:
+            self.data_name = name
+        filename = self.data_name or to_text_string(
+            self.filecombo.currentText())
         if not filename:
             return
 
         self.datelabel.setText(_('Sorting data, please wait...'))
         QApplication.processEvents()
 
-        self.datatree.load_data(self.DATAPATH)
+        self.datatree.load_data(self.DATAPATH, reload=justanalyzed)
+        if add_to_history and self.datatree.profdata is not None:
+            try:
+                self.history.add_run(filename, self.datatree.profdata)
+            except (OSError, IOError):
+                logger.warning("Could not save the profiler run of %s to "
+                               "the history", filename, exc_info=True)
         self.datatree.show_tree()
 
         text_style = "<span style=\'color: %s\'><b>%s </b></span>"
@@ -622,6 +694,7 @@ def show_data(self, justanalyzed=False):
                                   time.strftime("%Y-%m-%d %H:%M:%S",
                                                 time.localtime()))
         self.datelabel.setText(date_text)
+        self.datelabel.setToolTip(filename)
 
 
 class TreeWidgetItem( QTreeWidgetItem ):
@@ -684,6 +757,7 @@ def __init__(self, parent=None):
         self.items_to_be_shown = None
         self.current_view_depth = None
         self.compare_file = None
+        self._stats_cache = {}
         self.setColumnCount(len(self.header_list))
         self.setHeaderLabels(self.header_list)
         self.initialize_view()
@@ -707,12 +781,22 @@ def initialize_view(self):
         self.items_to_be_shown = {}
         self.current_view_depth = 0
 
-    def load_data(self, profdatafile):
-        """Load profiler data saved by profile/cProfile module"""
-        import pstats
+    def load_data(self, profdatafile, reload=False):
+        """
+        Load profiler data saved by profile/cProfile module.
+
+        Files are only parsed again if they changed or `reload` is True.
+        """
+        if reload:
+            self._stats_cache.pop(profdatafile, None)
+        self._stats_cache = {
+            path: self._stats_cache[path]
+            for path in (profdatafile, self.compare_file)
+            if path in self._stats_cache}
+
         # Fixes spyder-ide/spyder#6220.
         try:
-            stats_indi = [pstats.Stats(profdatafile), ]
+            stats_indi = [self._load_stats(profdatafile), ]
         except (OSError, IOError):
             self.profdata = None
             return
@@ -721,7 +805,7 @@ def load_data(self, profdatafile):
         if self.compare_file is not None:
             # Fixes spyder-ide/spyder#5587.
             try:
-                stats_indi.append(pstats.Stats(self.compare_file))
+                stats_indi.append(self._load_stats(self.compare_file))
             except (OSError, IOError) as e:
                 QMessageBox.critical(
                     self, _("Error"),
@@ -729,11 +813,22 @@ def load_data(self, profdatafile):
                       "The error was<br><br>"
                       "<tt>{0}</tt>").format(e))
                 self.compare_file = None
-        map(lambda x: x.calc_callees(), stats_indi)
-        self.profdata.calc_callees()
         self.stats1 = stats_indi
         self.stats = stats_indi[0].stats
 
+    def _load_stats(self, filename):
+        """Return the pstats.Stats of filename, parsing it if it changed."""
+        import pstats
+        stat = os.stat(filename)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._stats_cache.get(filename)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        stats = pstats.Stats(filename)
+        stats.calc_callees()
+        self._stats_cache[filename] = (key, stats)
+        return stats
+
     def compare(self,filename):
         self.hide_diff_cols(False)
         self.compare_file = filename
@@ -985,6 +1080,115 @@ def change_view(self, change_in_depth):
                 item.setExpanded(True)
 
 
+class ProfilerHistoryDialog(QDialog):
+    """
+    Dialog to compare the runs of a script stored in the profiler history.
+
+    Functions are sorted by their change in cumulative time between a base
+    run and a newer one, so regressions come first.
+    """
+
+    sig_compare_requested = Signal(str)
+    """
+    This signal is emitted to compare the last run with a stored one.
+
+    Parameters
+    ----------
+    path: str
+        Path to the pstats file of the stored run.
+    """
+
+    sig_edit_goto_requested = Signal(str, int, str)
+
+    def __init__(self, history, filename, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.filename = filename
+        self.runs = history.get_runs(filename)
+        self.setWindowTitle(_("Profiler history of {}").format(
+            osp.basename(filename)))
+
+        self.base_combo = QComboBox(self)
+        self.new_combo = QComboBox(self)
+        for run in self.runs:
+            text = '{} ({})'.format(
+                time.strftime("%Y-%m-%d %H:%M:%S",
+                              time.localtime(run['date'])),
+                ProfilerDataTree.format_measure(run['total_time']))
+            self.base_combo.addItem(text)
+            self.new_combo.addItem(text)
+        self.base_combo.setCurrentIndex(max(len(self.runs) - 2, 0))
+        self.new_combo.setCurrentIndex(len(self.runs) - 1)
+
+        self.tree = QTreeWidget(self)
+        self.tree.setRootIsDecorated(False)
+        self.tree.setHeaderLabels([_('Function/Module'), _('Base run'),
+                                   _('Run'), _('Diff'), _('File:line')])
+        self.tree.itemActivated.connect(self.item_activated)
+
+        compare_button = QPushButton(_("Compare last run with base run"))
+        compare_button.clicked.connect(self.compare)
+        compare_button.setEnabled(bool(self.runs))
+
+        runs_layout = QHBoxLayout()
+        runs_layout.addWidget(QLabel(_("Base run")))
+        runs_layout.addWidget(self.base_combo)
+        runs_layout.addWidget(QLabel(_("Run")))
+        runs_layout.addWidget(self.new_combo)
+        runs_layout.addStretch()
+        runs_layout.addWidget(compare_button)
+        layout = QVBoxLayout()
+        layout.addLayout(runs_layout)
+        layout.addWidget(self.tree)
+        self.setLayout(layout)
+        self.resize(800, 500)
+
+        self.base_combo.currentIndexChanged.connect(self.refresh)
+        self.new_combo.currentIndexChanged.connect(self.refresh)
+        self.refresh()
+
+    def refresh(self):
+        """Show the changes between the selected runs."""
+        self.tree.clear()
+        if not self.runs:
+            return
+        base_id = self.runs[self.base_combo.currentIndex()]['id']
+        new_id = self.runs[self.new_combo.currentIndex()]['id']
+        try:
+            changes = self.history.compare(self.filename, base_id, new_id)
+        except (OSError, IOError, ValueError):
+            return
+
+        format_measure = ProfilerDataTree.format_measure
+        items = []
+        for function, base_time, new_time, delta in changes:
+            if len(items) == MAX_HISTORY_FUNCTIONS:
+                break
+            filename, line_number, name = function
+            sign, color = ('+', 'red') if delta > 0 else ('-', 'green')
+            item = QTreeWidgetItem([
+                name, format_measure(base_time), format_measure(new_time),
+                sign + format_measure(delta) if delta else '',
+                '%s : %d' % (filename, line_number)])
+            item.setForeground(3, QColor(color))
+            item.setData(0, Qt.UserRole, (filename, line_number))
+            items.append(item)
+        self.tree.addTopLevelItems(items)
+        self.tree.resizeColumnToContents(0)
+
+    def compare(self):
+        """Compare the last run with the base run in the profiler tree."""
+        run = self.runs[self.base_combo.currentIndex()]
+        self.sig_compare_requested.emit(
+            self.history.get_run_path(self.filename, run['id']))
+        self.accept()
+
+    def item_activated(self, item):
+        filename, line_number = item.data(0, Qt.UserRole)
+        if osp.isfile(filename):
+            self.sig_edit_goto_requested.emit(filename, line_number, '')
+
+
 # =============================================================================
 # Tests
 # =============================================================================
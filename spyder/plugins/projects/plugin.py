@@ -34,10 +34,15 @@
 from spyder.utils import encoding
 from spyder.utils import icon_manager as ima
 from spyder.utils.qthelpers import add_actions, create_action, MENU_SEPARATOR
+from spyder.utils.executor import get_executor, PRIORITY_BACKGROUND
 from spyder.utils.misc import getcwd_or_home
+from spyder.plugins.editor.utils.findtasks import TodoIndex
 from spyder.plugins.projects.api import (BaseProjectType, EmptyProject,
                                          WORKSPACE)
-from spyder.plugins.projects.utils.watcher import WorkspaceWatcher
+from spyder.plugins.projects.utils.fileindex import (MAX_RESULTS,
+                                                    ProjectFileIndex)
+from spyder.plugins.projects.utils.watcher import (CREATED, DELETED, MODIFIED,
+                                                   WorkspaceWatcher)
 from spyder.plugins.projects.widgets.explorer import ProjectExplorerWidget
 from spyder.plugins.projects.widgets.projectdialog import ProjectDialog
 from spyder.plugins.completion.manager.api import (
@@ -49,6 +54,13 @@
 # Localization
 _ = get_translation("spyder")
 
+# LSP kinds of the changes notified by the project watcher
+FILE_CHANGE_KINDS = {
+    CREATED: FileChangeType.CREATED,
+    MODIFIED: FileChangeType.CHANGED,
+    DELETED: FileChangeType.DELETED
+}
+
 
 @class_register
 class Projects(SpyderPluginWidget):
@@ -97,6 +109,8 @@ def __init__(self, parent=None):
         self.current_active_project = None
         self.latest_project = None
         self.watcher = WorkspaceWatcher(self)
+        self.todo_index = None
+        self.file_index = None
         self.completions_available = False
         self.explorer.setup_project(self.get_active_project_path())
         self.watcher.connect_signals(self)
@@ -419,7 +433,13 @@ def open_project(self, path=None, project=None, restart_consoles=True,
         else:
             self.sig_project_loaded.emit(path)
         self.sig_pythonpath_changed.emit()
-        self.watcher.start(path)
+        self.watcher.start(
+            path, excludes=self.get_option('watcher_excludes'))
+        self.todo_index = TodoIndex(path)
+        self.update_todo_index()
+        self.file_index = ProjectFileIndex(
+            path, excludes=self.get_option('watcher_excludes'))
+        self.update_file_index()
 
         if restart_consoles:
             self.restart_consoles()
@@ -459,6 +479,10 @@ def close_project(self):
             self.explorer.clear()
             self.restart_consoles()
             self.watcher.stop()
+            get_executor().cancel('project_todo_index')
+            get_executor().cancel('project_file_index')
+            self.todo_index = None
+            self.file_index = None
 
     def delete_project(self):
         """
@@ -631,6 +655,51 @@ def add_to_recent(self, project):
         if len(self.recent_projects) > self.get_option('max_recent_projects'):
             self.recent_projects.pop(-1)
 
+    def update_todo_index(self, filenames=None):
+        """
+        Update the tasks index of the project in the background.
+
+        If filenames is None, all the project is scanned, but only files
+        that changed since the last update are read.
+        """
+        if self.todo_index is None:
+            return
+        # Only full updates supersede each other
+        key = 'project_todo_index' if filenames is None else None
+        get_executor().submit(self.todo_index.update, filenames,
+                              priority=PRIORITY_BACKGROUND, key=key)
+
+    def get_todo_results(self):
+        """
+        Return a dict with the tasks (TODO, FIXME, ...) found in each file
+        of the active project.
+        """
+        if self.todo_index is None:
+            return {}
+        return self.todo_index.get_tasks()
+
+    def update_file_index(self, changes=None):
+        """
+        Update the files index of the project in the background.
+
+        changes is a list of (kind, path, is_dir) tuples emitted by the
+        project watcher. If it's None, all the project is walked again.
+        """
+        if self.file_index is None:
+            return
+        key = 'project_file_index' if changes is None else None
+        get_executor().submit(self.file_index.update, changes,
+                              priority=PRIORITY_BACKGROUND, key=key)
+
+    def find_files(self, query, limit=MAX_RESULTS):
+        """
+        Return the (path, score) of the files of the active project that
+        match query, from the best match to the worst.
+        """
+        if self.file_index is None:
+            return []
+        return self.file_index.find(query, limit)
+
     def start_workspace_services(self):
         """Enable LSP workspace functionality."""
         self.completions_available = True
@@ -656,79 +725,46 @@ def handle_response(self, method, params):
             handler = getattr(self, handler_name)
             handler(params)
 
-    @Slot(str, str, bool)
+    @Slot(object)
     @request(method=LSPRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
              requires_response=False)
-    def file_moved(self, src_file, dest_file, is_dir):
-        """Notify LSP server about a file that is moved."""
-        # LSP specification only considers file updates
-        if is_dir:
-            return
-
-        deletion_entry = {
-            'file': src_file,
-            'kind': FileChangeType.DELETED
-        }
+    def files_changed(self, changes):
+        """
+        Notify LSP server about a batch of filesystem changes.
 
-        addition_entry = {
-            'file': dest_file,
-            'kind': FileChangeType.CREATED
-        }
+        `changes` is a list of (kind, path, is_dir) tuples emitted by the
+        project watcher.
+        """
+        self.update_file_index(changes)
+
+        entries = []
+        filenames = []
+        update_all = False
+        for kind, path, is_dir in changes:
+            # LSP specification only considers file updates
+            if is_dir:
+                if kind != MODIFIED:
+                    update_all = True
+                continue
+            filenames.append(path)
+            entries.append({
+                'file': path,
+                'kind': FILE_CHANGE_KINDS[kind]
+            })
+
+        if update_all:
+            self.update_todo_index()
+        elif filenames:
+            self.update_todo_index(filenames)
+
+        if not entries:
+            return None
 
-        entries = [addition_entry, deletion_entry]
         params = {
             'params': entries
         }
         return params
 
-    @request(method=LSPRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
-             requires_response=False)
-    @Slot(str, bool)
-    def file_created(self, src_file, is_dir):
-        """Notify LSP server about file creation."""
-        if is_dir:
-            return
-
-        params = {
-            'params': [{
-                'file': src_file,
-                'kind': FileChangeType.CREATED
-            }]
-        }
-        return params
-
-    @request(method=LSPRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
-             requires_response=False)
-    @Slot(str, bool)
-    def file_deleted(self, src_file, is_dir):
-        """Notify LSP server about file deletion."""
-        if is_dir:
-            return
-
-        params = {
-            'params': [{
-                'file': src_file,
-                'kind': FileChangeType.DELETED
-            }]
-        }
-        return params
-
-    @request(method=LSPRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
-             requires_response=False)
-    @Slot(str, bool)
-    def file_modified(self, src_file, is_dir):
-        """Notify LSP server about file modification."""
-        if is_dir:
-            return
-
-        params = {
-            'params': [{
-                'file': src_file,
-                'kind': FileChangeType.CHANGED
-            }]
-        }
-        return params
-
     @request(method=LSPRequestTypes.WORKSPACE_FOLDERS_CHANGE,
              requires_response=False)
     def notify_project_open(self, path):
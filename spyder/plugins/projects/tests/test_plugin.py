@@ -366,73 +366,50 @@ def test_filesystem_notifications(qtbot, projects, tmpdir):
     # Get a reference to the filesystem event handler
     fs_handler = projects.watcher.event_handler
 
+    def wait_changes(*expected, timeout=3000):
+        """Wait for a batch of changes that includes the expected ones."""
+        return qtbot.waitSignal(
+            fs_handler.sig_files_changed, timeout=timeout,
+            check_params_cb=lambda changes: all(
+                change in changes for change in expected))
+
     # Test file creation
-    with qtbot.waitSignal(fs_handler.sig_file_created,
-                          timeout=30000) as blocker:
+    with wait_changes(('created', to_text_string(file2), False),
+                      timeout=30000):
         file2.write('')
 
-    file_created, is_dir = blocker.args
-    assert file_created == to_text_string(file2)
-    assert not is_dir
-
     # Test folder creation
-    with qtbot.waitSignal(fs_handler.sig_file_created,
-                          timeout=3000) as blocker:
-        folder2 = project_root.mkdir('folder2')
-
-    folder_created, is_dir = blocker.args
-    assert folder_created == osp.join(to_text_string(project_root), 'folder2')
+    folder2 = osp.join(to_text_string(project_root), 'folder2')
+    with wait_changes(('created', folder2, True)):
+        os.mkdir(folder2)
 
     # Test file move/renaming
     new_file = osp.join(to_text_string(folder0), 'new_file')
-    with qtbot.waitSignal(fs_handler.sig_file_moved,
-                          timeout=3000) as blocker:
+    with wait_changes(('deleted', to_text_string(file1), False),
+                      ('created', new_file, False)):
         shutil.move(to_text_string(file1), new_file)
 
-    original_file, file_moved, is_dir = blocker.args
-    assert original_file == to_text_string(file1)
-    assert file_moved == new_file
-    assert not is_dir
-
     # Test folder move/renaming
     new_folder = osp.join(to_text_string(project_root), 'new_folder')
-    with qtbot.waitSignal(fs_handler.sig_file_moved,
-                          timeout=3000) as blocker:
-        shutil.move(to_text_string(folder2), new_folder)
-
-    original_folder, folder_moved, is_dir = blocker.args
-    assert original_folder == to_text_string(folder2)
-    assert folder_moved == new_folder
-    assert is_dir
+    with wait_changes(('deleted', folder2, True),
+                      ('created', new_folder, True)):
+        shutil.move(folder2, new_folder)
 
     # Test file deletion
-    with qtbot.waitSignal(fs_handler.sig_file_deleted,
-                          timeout=3000) as blocker:
+    with wait_changes(('deleted', to_text_string(file0), False)):
         os.remove(to_text_string(file0))
-
-    deleted_file, is_dir = blocker.args
-    assert deleted_file == to_text_string(file0)
-    assert not is_dir
     assert not osp.exists(to_text_string(file0))
 
     # Test folder deletion
-    with qtbot.waitSignal(fs_handler.sig_file_deleted,
-                          timeout=3000) as blocker:
+    with wait_changes(('deleted', to_text_string(folder0), True)):
         shutil.rmtree(to_text_string(folder0))
 
-    deleted_folder, is_dir = blocker.args
-    assert to_text_string(folder0) in deleted_folder
-
     # For some reason this fails in macOS
     if not sys.platform == 'darwin':
         # Test file/folder modification
-        with qtbot.waitSignal(fs_handler.sig_file_modified,
-                              timeout=3000) as blocker:
+        with wait_changes(('modified', to_text_string(file3), False)):
             file3.write('abc')
 
-        modified_file, is_dir = blocker.args
-        assert modified_file in to_text_string(file3)
-
 
 def test_loaded_and_closed_signals(create_projects, tmpdir, mocker, qtbot):
     """
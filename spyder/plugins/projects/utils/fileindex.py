@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the files of a project, to find them by name.
+"""
+
+# Standard library imports
+import fnmatch
+import os
+import os.path as osp
+import threading
+
+# Local imports
+from spyder.plugins.projects.utils.watcher import CREATED, DELETED
+from spyder.utils.stringmatching import FuzzyFilter, get_fuzzy_score
+
+
+# Maximum number of files returned by searches
+MAX_RESULTS = 50
+
+# Score added to files that only match in their folder
+PATH_SCORE = 10000
+
+
+class PathFilter(FuzzyFilter):
+    """Filter of relative paths that prefers matches in their file name."""
+
+    def __init__(self, paths):
+        super(PathFilter, self).__init__(paths)
+        self._names = [osp.basename(path) for path in self._lower]
+        self._keys = self._names
+
+    def get_score(self, query, index):
+        """Return the score of the path at index for a lowercase query."""
+        score = get_fuzzy_score(query, self._names[index])
+        if score is None:
+            score = get_fuzzy_score(query, self._lower[index])
+            if score is not None:
+                score += PATH_SCORE
+        return score
+
+
+class ProjectFileIndex(object):
+    """
+    List of the files of a project.
+
+    It's filled by walking the project and kept up to date with the changes
+    found by the project watcher, which should be done in the background,
+    so searches don't need to touch the filesystem.
+    """
+
+    def __init__(self, root_path, excludes=None):
+        self.root_path = root_path
+        self.excludes = list(excludes or [])
+        self._files = set()
+        self._lock = threading.Lock()
+        self._filter = PathFilter([])
+
+    def update(self, changes=None):
+        """
+        Walk the project again, or apply a batch of changes, i.e. a list of
+        (kind, path, is_dir) tuples as emitted by the project watcher.
+        """
+        if changes is None:
+            files = set(self._walk(self.root_path))
+            with self._lock:
+                self._files = files
+            self._update_filter()
+            return
+
+        added = set()
+        removed = set()
+        removed_folders = []
+        for kind, path, is_dir in changes:
+            relpath = osp.relpath(path, self.root_path)
+            if is_dir:
+                if kind == DELETED:
+                    removed_folders.append(relpath + os.sep)
+                elif kind == CREATED:
+                    # Files of moved folders are not notified
+                    added.update(self._walk(path))
+            elif kind == DELETED:
+                removed.add(relpath)
+            elif not self._is_excluded(relpath):
+                added.add(relpath)
+
+        with self._lock:
+            files = self._files
+            if removed_folders:
+                prefixes = tuple(removed_folders)
+                files.difference_update(
+                    [relpath for relpath in files
+                     if relpath.startswith(prefixes)])
+            files.difference_update(removed)
+            files.update(added)
+        self._update_filter()
+
+    def get_files(self):
+        """Return the sorted relative paths of the files of the project."""
+        with self._lock:
+            return sorted(self._files)
+
+    def find(self, query, limit=MAX_RESULTS):
+        """
+        Return the (path, score) of the files whose relative path contains
+        the letters of query in order, from the best match to the worst.
+        """
+        path_filter = self._filter
+        choices = path_filter.choices
+        return [(osp.join(self.root_path, choices[index]), score)
+                for index, score in path_filter.filter(query, limit)]
+
+    # ---- Private API
+    def _update_filter(self):
+        """Replace the filter used by searches with one of current files."""
+        self._filter = PathFilter(self.get_files())
+
+    def _is_excluded(self, relpath):
+        """Return True if a part of relpath matches an exclude pattern."""
+        parts = relpath.replace('\\', '/').split('/')
+        return any(fnmatch.fnmatch(part, pattern)
+                   for part in parts for pattern in self.excludes)
+
+    def _walk(self, path):
+        """Yield the relative paths of the files under path."""
+        if self._is_excluded(osp.relpath(path, self.root_path)):
+            return
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = [
+                name for name in dirnames
+                if not any(fnmatch.fnmatch(name, pattern)
+                           for pattern in self.excludes)]
+            relpath = osp.relpath(dirpath, self.root_path)
+            for name in filenames:
+                if not any(fnmatch.fnmatch(name, pattern)
+                           for pattern in self.excludes):
+                    yield osp.normpath(osp.join(relpath, name))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the project's file index.
+"""
+
+# Standard library imports
+import os.path as osp
+
+# Local imports
+from spyder.plugins.projects.utils.fileindex import ProjectFileIndex
+from spyder.plugins.projects.utils.watcher import CREATED, DELETED, MODIFIED
+
+
+def test_file_index(tmpdir):
+    """Test that the index is filled and kept up to date with changes."""
+    tmpdir.join('setup.py').write('')
+    tmpdir.join('pkg', 'module.py').write('', ensure=True)
+    tmpdir.join('pkg', 'module.pyc').write('', ensure=True)
+    tmpdir.join('.git', 'config').write('', ensure=True)
+    root = str(tmpdir)
+    path = lambda *names: osp.join(root, *names)
+
+    index = ProjectFileIndex(root, excludes=['.git', '*.pyc'])
+    index.update()
+    assert index.get_files() == [osp.join('pkg', 'module.py'), 'setup.py']
+
+    tmpdir.join('docs', 'index.md').write('', ensure=True)
+    index.update([
+        (CREATED, path('docs'), True),
+        (CREATED, path('README.md'), False),
+        (MODIFIED, path('setup.py'), False),
+        (CREATED, path('pkg', 'other.pyc'), False),
+        (DELETED, path('pkg'), True),
+    ])
+    assert index.get_files() == ['README.md', osp.join('docs', 'index.md'),
+                                 'setup.py']
+
+
+def test_find(tmpdir):
+    """Test that files are found by their name before their folder."""
+    for relpath in [('setup.py',), ('spyder', 'app.py'),
+                    ('spyder', 'utils', 'misc.py'), ('tests', 'test_sp.py')]:
+        tmpdir.join(*relpath).write('', ensure=True)
+    root = str(tmpdir)
+    index = ProjectFileIndex(root)
+    index.update()
+
+    assert [osp.relpath(path, root) for path, __ in index.find('sp')] == [
+        osp.join('tests', 'test_sp.py'),
+        osp.join('spyder', 'utils', 'misc.py'), 'setup.py',
+        osp.join('spyder', 'app.py')]
+    assert [osp.relpath(path, root) for path, __ in index.find('sp', 1)] == [
+        osp.join('tests', 'test_sp.py')]
+    assert index.find('xyz') == []
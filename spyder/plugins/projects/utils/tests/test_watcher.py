@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the project's filesystem watcher.
+"""
+
+# Standard library imports
+import os.path as osp
+
+# Third party imports
+from watchdog.events import (DirModifiedEvent, FileCreatedEvent,
+                             FileDeletedEvent, FileModifiedEvent,
+                             FileMovedEvent)
+
+# Local imports
+from spyder.plugins.projects.utils.watcher import (CREATED, DELETED, MODIFIED,
+                                                   WorkspaceEventHandler)
+
+
+def test_event_batches(qtbot, tmpdir):
+    """Test that events are merged by path and emitted together."""
+    root = str(tmpdir)
+    path = lambda *names: osp.join(root, *names)
+    handler = WorkspaceEventHandler()
+    handler.root_path = root
+    handler.excludes = ['.git', '*.pyc']
+
+    with qtbot.waitSignal(handler.sig_files_changed) as blocker:
+        # Saved through a temporary file
+        handler.dispatch(FileCreatedEvent(path('a.py~')))
+        handler.dispatch(FileModifiedEvent(path('a.py~')))
+        handler.dispatch(FileMovedEvent(path('a.py~'), path('a.py')))
+
+        # Replaced
+        handler.dispatch(FileDeletedEvent(path('b.py')))
+        handler.dispatch(FileCreatedEvent(path('b.py')))
+
+        handler.dispatch(FileModifiedEvent(path('c.py')))
+        handler.dispatch(FileDeletedEvent(path('c.py')))
+
+        # Ignored events
+        handler.dispatch(DirModifiedEvent(path('pkg')))
+        handler.dispatch(FileModifiedEvent(path('.git', 'index')))
+        handler.dispatch(FileCreatedEvent(path('pkg', 'mod.pyc')))
+
+    assert blocker.args[0] == [
+        (CREATED, path('a.py'), False),
+        (MODIFIED, path('b.py'), False),
+        (DELETED, path('c.py'), False)
+    ]
@@ -7,22 +7,50 @@
 """Watcher to detect filesystem changes in the project's directory."""
 
 # Standard lib imports
+from collections import OrderedDict
+import fnmatch
 import logging
+import os.path as osp
+import threading
 
 # Third-party imports
 from qtpy.QtCore import QObject, Signal
-from qtpy.QtWidgets import QMessageBox
 
 import watchdog
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 # Local imports
-from spyder.config.base import _
 from spyder.py3compat import to_text_string
 
 logger = logging.getLogger(__name__)
 
+# Time to collect events before notifying them together, in seconds
+BATCH_DELAY = 0.3
+
+# Interval between scans of the project when inotify can't be used
+POLLING_INTERVAL = 5
+
+# Kinds of changes
+CREATED = 'created'
+MODIFIED = 'modified'
+DELETED = 'deleted'
+
+
+def merge_changes(previous, current):
+    """
+    Return the change equivalent to two consecutive changes of a path, or
+    None if they cancel each other.
+    """
+    if previous == CREATED:
+        return None if current == DELETED else CREATED
+    elif previous == DELETED:
+        # The file was replaced, e.g. by git or an editor
+        return MODIFIED if current == CREATED else DELETED
+    else:
+        return DELETED if current == DELETED else MODIFIED
+
 
 class BaseThreadWrapper(watchdog.utils.BaseThread):
     """
@@ -55,49 +83,96 @@ class WorkspaceEventHandler(QObject, FileSystemEventHandler):
     Event handler for watchdog notifications.
 
     This class receives notifications about file/folder moving, modification,
-    creation and deletion and emits a corresponding signal about it.
+    creation and deletion. They are collected during BATCH_DELAY seconds,
+    merged by path and emitted together, so operations that touch many
+    files (e.g. a git checkout) don't flood the interface and the
+    completion servers.
     """
 
-    sig_file_moved = Signal(str, str, bool)
-    sig_file_created = Signal(str, bool)
-    sig_file_deleted = Signal(str, bool)
-    sig_file_modified = Signal(str, bool)
+    sig_files_changed = Signal(object)
+    """
+    This signal is emitted with a batch of changes.
+
+    Parameters
+    ----------
+    changes: list
+        List of (kind, path, is_dir) tuples, where kind is CREATED,
+        MODIFIED or DELETED. Moves are reported as a deletion and a
+        creation.
+    """
 
     def __init__(self, parent=None):
         super(QObject, self).__init__(parent)
         super(FileSystemEventHandler, self).__init__()
+        self.root_path = None
+        self.excludes = []
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._timer = None
 
     def fmt_is_dir(self, is_dir):
         return 'directory' if is_dir else 'file'
 
+    def is_excluded(self, path):
+        """Return True if a part of path matches an exclude pattern."""
+        if self.root_path is not None:
+            path = osp.relpath(path, self.root_path)
+        parts = path.replace('\\', '/').split('/')
+        return any(fnmatch.fnmatch(part, pattern)
+                   for part in parts for pattern in self.excludes)
+
     def on_moved(self, event):
-        src_path = event.src_path
-        dest_path = event.dest_path
-        is_dir = event.is_directory
-        logger.info("Moved {0}: {1} to {2}".format(
-            self.fmt_is_dir(is_dir), src_path, dest_path))
-        self.sig_file_moved.emit(src_path, dest_path, is_dir)
+        self.add_change(DELETED, event.src_path, event.is_directory)
+        self.add_change(CREATED, event.dest_path, event.is_directory)
 
     def on_created(self, event):
-        src_path = event.src_path
-        is_dir = event.is_directory
-        logger.info("Created {0}: {1}".format(
-            self.fmt_is_dir(is_dir), src_path))
-        self.sig_file_created.emit(src_path, is_dir)
+        self.add_change(CREATED, event.src_path, event.is_directory)
 
     def on_deleted(self, event):
-        src_path = event.src_path
-        is_dir = event.is_directory
-        logger.info("Deleted {0}: {1}".format(
-            self.fmt_is_dir(is_dir), src_path))
-        self.sig_file_deleted.emit(src_path, is_dir)
+        self.add_change(DELETED, event.src_path, event.is_directory)
 
     def on_modified(self, event):
-        src_path = event.src_path
-        is_dir = event.is_directory
-        logger.info("Modified {0}: {1}".format(
-            self.fmt_is_dir(is_dir), src_path))
-        self.sig_file_modified.emit(src_path, is_dir)
+        # Directories are modified each time one of their files changes
+        if not event.is_directory:
+            self.add_change(MODIFIED, event.src_path, False)
+
+    def add_change(self, kind, path, is_dir):
+        """Add a change to the next batch."""
+        if self.is_excluded(path):
+            return
+        logger.debug("{0} {1}: {2}".format(
+            kind.capitalize(), self.fmt_is_dir(is_dir), path))
+        with self._lock:
+            previous = self._pending.pop(path, None)
+            if previous is not None:
+                kind = merge_changes(previous[0], kind)
+            if kind is not None:
+                self._pending[path] = (kind, is_dir)
+            if self._timer is None:
+                self._timer = threading.Timer(BATCH_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Emit pending changes."""
+        with self._lock:
+            pending = self._pending
+            self._pending = OrderedDict()
+            self._timer = None
+        if pending:
+            changes = [(kind, path, is_dir)
+                       for path, (kind, is_dir) in pending.items()]
+            logger.info("Notifying {} filesystem changes".format(
+                len(changes)))
+            self.sig_files_changed.emit(changes)
+
+    def clear(self):
+        """Discard pending changes."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = OrderedDict()
 
 
 class WorkspaceWatcher(QObject):
@@ -113,46 +188,33 @@ def __init__(self, parent=None):
         self.event_handler = WorkspaceEventHandler(self)
 
     def connect_signals(self, project):
-        self.event_handler.sig_file_created.connect(project.file_created)
-        self.event_handler.sig_file_moved.connect(project.file_moved)
-        self.event_handler.sig_file_deleted.connect(project.file_deleted)
-        self.event_handler.sig_file_modified.connect(project.file_modified)
+        self.event_handler.sig_files_changed.connect(project.files_changed)
 
-    def start(self, workspace_folder):
-        # Needed to handle an error caused by the inotify limit reached.
+    def start(self, workspace_folder, excludes=None):
+        """
+        Start watching workspace_folder, ignoring paths with a part that
+        matches one of the `excludes` glob patterns.
+        """
+        self.event_handler.root_path = workspace_folder
+        self.event_handler.excludes = list(excludes or [])
+
+        # Poll for changes when the inotify limit is reached.
         # See spyder-ide/spyder#10478
         try:
-            self.observer = Observer()
-            self.observer.schedule(
-                self.event_handler, workspace_folder, recursive=True)
-            self.observer.start()
+            self.observer = self._start_observer(Observer(), workspace_folder)
         except OSError as e:
             if u'inotify' in to_text_string(e):
-                QMessageBox.warning(
-                    self.parent(),
-                    "Spyder",
-                    _("File system changes for this project can't be tracked "
-                      "because it contains too many files. To fix this you "
-                      "need to increase the inotify limit in your system, "
-                      "with the following command:"
-                      "<br><br>"
-                      "<code>"
-                      "sudo sysctl -n -w fs.inotify.max_user_watches=524288"
-                      "</code>"
-                      "<br><br>For a permanent solution you need to add to"
-                      "<code>/etc/sysctl.conf</code>"
-                      "the following line:<br><br>"
-                      "<code>"
-                      "fs.inotify.max_user_watches=524288"
-                      "</code>"
-                      "<br><br>"
-                      "After doing that, you need to close and start Spyder "
-                      "again so those changes can take effect."))
-                self.observer = None
+                logger.warning(
+                    "The inotify limit was reached, so changes in {} are "
+                    "detected by polling".format(workspace_folder))
+                self.observer = self._start_observer(
+                    PollingObserver(timeout=POLLING_INTERVAL),
+                    workspace_folder)
             else:
                 raise e
 
     def stop(self):
+        self.event_handler.clear()
         if self.observer is not None:
             # This is required to avoid showing an error when closing
             # projects.
@@ -163,3 +225,17 @@ def stop(self):
                 del self.observer
             except RuntimeError:
                 pass
+
+    def _start_observer(self, observer, workspace_folder):
+        """Start observer and return it, stopping it on errors."""
+        observer.schedule(self.event_handler, workspace_folder,
+                          recursive=True)
+        try:
+            observer.start()
+        except OSError:
+            try:
+                observer.stop()
+            except Exception:
+                pass
+            raise
+        return observer
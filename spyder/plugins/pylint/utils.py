@@ -12,11 +12,12 @@
 import os
 import os.path as osp
 
-# Third party imports
-import pylint.config
-
 
 def _find_pylintrc_path(path):
+    # Importing pylint.config imports astroid, which is slow, so it's only
+    # done when needed
+    import pylint.config
+
     os.chdir(path)
     return pylint.config.find_pylintrc()
 
@@ -33,6 +33,14 @@ def setup_page(self):
         display_boxes = [self.create_checkbox(text, option, tip=tip)
                          for option, text, tip in display_data]
 
+        import_group = QGroupBox(_("Import"))
+        import_box = self.create_checkbox(
+            _("Memory-map arrays when importing NumPy and HDF5 files"),
+            'import_mmap',
+            tip=_("Arrays are read from disk only when they are accessed,\n"
+                  "which makes importing large files much faster.\n"
+                  "Changes to them are not saved to the file."))
+
         filter_layout = QVBoxLayout()
         for box in filter_boxes:
             filter_layout.addWidget(box)
@@ -43,8 +51,13 @@ def setup_page(self):
             display_layout.addWidget(box)
         display_group.setLayout(display_layout)
 
+        import_layout = QVBoxLayout()
+        import_layout.addWidget(import_box)
+        import_group.setLayout(import_layout)
+
         vlayout = QVBoxLayout()
         vlayout.addWidget(filter_group)
         vlayout.addWidget(display_group)
+        vlayout.addWidget(import_group)
         vlayout.addStretch(1)
         self.setLayout(vlayout)
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Multi-resolution reductions of 2D arrays.
+
+The minimum, maximum and mean of square tiles of an array are computed with
+vectorized NumPy operations. Each level of the pyramid reduces tiles twice
+as large as the ones of the previous level, so large arrays can be drawn at
+any scale and their range of values is known without reading them again.
+"""
+
+# Third party imports
+import numpy as np
+
+
+# Maximum number of tiles of the first level
+MAX_BASE_TILES = 512 * 512
+
+# Number of rows of the array converted to floats at the same time
+BAND_ROWS = 1024
+
+
+def get_base_tile_size(shape):
+    """Return the tile size of the first level for an array shape."""
+    cells = shape[0] * shape[1]
+    size = 1
+    while cells > MAX_BASE_TILES * size * size:
+        size *= 2
+    return size
+
+
+def reduce_tiles(values, ufunc, size):
+    """Reduce tiles of size x size values with a NumPy ufunc."""
+    values = ufunc.reduceat(values, np.arange(0, values.shape[0], size),
+                            axis=0)
+    return ufunc.reduceat(values, np.arange(0, values.shape[1], size),
+                          axis=1)
+
+
+class PyramidLevel(object):
+    """Minimum, maximum, sum and number of valid values of tiles."""
+
+    def __init__(self, tile_size, mins, maxs, sums, counts):
+        self.tile_size = tile_size
+        self.mins = mins
+        self.maxs = maxs
+        self.sums = sums
+        self.counts = counts
+
+    @classmethod
+    def from_values(cls, values, tile_size):
+        """Create a level from an array of floats."""
+        valid = ~np.isnan(values)
+        return cls(tile_size,
+                   reduce_tiles(values, np.fmin, tile_size),
+                   reduce_tiles(values, np.fmax, tile_size),
+                   reduce_tiles(np.where(valid, values, 0.), np.add,
+                                tile_size),
+                   reduce_tiles(valid.astype(np.int64), np.add, tile_size))
+
+    @property
+    def shape(self):
+        return self.mins.shape
+
+    @property
+    def means(self):
+        """Mean of each tile, NaN for tiles without valid values."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.sums / self.counts
+
+    def reduce(self):
+        """Return the next level, with tiles twice as large."""
+        return PyramidLevel(self.tile_size * 2,
+                            reduce_tiles(self.mins, np.fmin, 2),
+                            reduce_tiles(self.maxs, np.fmax, 2),
+                            reduce_tiles(self.sums, np.add, 2),
+                            reduce_tiles(self.counts, np.add, 2))
+
+    @staticmethod
+    def concatenate(levels):
+        """Join levels computed for consecutive bands of rows."""
+        return PyramidLevel(
+            levels[0].tile_size,
+            np.concatenate([level.mins for level in levels]),
+            np.concatenate([level.maxs for level in levels]),
+            np.concatenate([level.sums for level in levels]),
+            np.concatenate([level.counts for level in levels]))
+
+
+class ArrayPyramid(object):
+    """Reductions of a 2D array at several resolutions."""
+
+    def __init__(self, data, color_func=np.real):
+        """
+        Parameters
+        ----------
+        data: numpy.ndarray
+            2D array of numbers, which can be masked.
+        color_func: callable
+            Function to convert values to real numbers, e.g. np.abs for
+            complex numbers.
+        """
+        self.data = data
+        self.color_func = color_func
+        self.base_tile_size = get_base_tile_size(data.shape)
+        self.levels = []
+
+    @property
+    def vmin(self):
+        """Minimum of the array, or None if the pyramid is not built."""
+        if not self.levels:
+            return None
+        return float(np.nanmin(self.levels[-1].mins))
+
+    @property
+    def vmax(self):
+        """Maximum of the array, or None if the pyramid is not built."""
+        if not self.levels:
+            return None
+        return float(np.nanmax(self.levels[-1].maxs))
+
+    def build(self, token=None):
+        """
+        Compute all the levels, reading the array by bands of rows.
+
+        Return False if it was cancelled through the CancellationToken
+        `token`.
+        """
+        rows, cols = self.data.shape
+        if rows == 0 or cols == 0:
+            return True
+
+        size = self.base_tile_size
+        band_rows = size * max(1, BAND_ROWS // size)
+        bands = []
+        with np.errstate(invalid='ignore', over='ignore'):
+            for start in range(0, rows, band_rows):
+                if token is not None and token.is_cancelled:
+                    return False
+                values = self._get_values(self.data[start:start + band_rows])
+                bands.append(PyramidLevel.from_values(values, size))
+
+            levels = [PyramidLevel.concatenate(bands)]
+            while levels[-1].shape != (1, 1):
+                levels.append(levels[-1].reduce())
+        self.levels = levels
+        return True
+
+    def get_level(self, cells_per_pixel):
+        """Return the coarsest level with tiles not larger than a pixel."""
+        level = self.levels[0]
+        for candidate in self.levels[1:]:
+            if candidate.tile_size > cells_per_pixel:
+                break
+            level = candidate
+        return level
+
+    def _get_values(self, block):
+        """Return values of block as floats, with NaNs for masked ones."""
+        values = self.color_func(block)
+        if isinstance(values, np.ma.MaskedArray):
+            return values.astype(float).filled(np.nan)
+        return np.asarray(values, dtype=float)
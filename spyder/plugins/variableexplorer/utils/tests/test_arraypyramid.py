@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for arraypyramid.py"""
+
+# Third party imports
+import numpy as np
+from numpy.testing import assert_array_equal
+
+# Local imports
+from spyder.plugins.variableexplorer.utils import arraypyramid
+from spyder.plugins.variableexplorer.utils.arraypyramid import ArrayPyramid
+
+
+def test_pyramid_levels(monkeypatch):
+    """Test the reductions of each level, with tiles not filling the array."""
+    monkeypatch.setattr(arraypyramid, 'MAX_BASE_TILES', 4)
+    monkeypatch.setattr(arraypyramid, 'BAND_ROWS', 2)
+    data = np.arange(15, dtype=float).reshape(5, 3)
+    data[0, 0] = np.nan
+
+    pyramid = ArrayPyramid(data)
+    assert pyramid.build()
+    assert [level.tile_size for level in pyramid.levels] == [2, 4, 8]
+
+    base = pyramid.levels[0]
+    assert_array_equal(base.mins, [[1, 2], [6, 8], [12, 14]])
+    assert_array_equal(base.maxs, [[4, 5], [10, 11], [13, 14]])
+    assert_array_equal(base.means, [[8 / 3., 3.5], [8, 9.5], [12.5, 14]])
+    assert pyramid.vmin == 1
+    assert pyramid.vmax == 14
+
+
+def test_pyramid_masked_and_complex_arrays():
+    """Test that masked values are ignored and complex ones converted."""
+    data = np.ma.masked_array([[1, -100], [3, 4]],
+                              mask=[[False, True], [False, False]])
+    pyramid = ArrayPyramid(data)
+    pyramid.build()
+    assert (pyramid.vmin, pyramid.vmax) == (1, 4)
+
+    pyramid = ArrayPyramid(np.array([[3 + 4j, 1]]), color_func=np.abs)
+    pyramid.build()
+    assert (pyramid.vmin, pyramid.vmax) == (1, 5)
+
+
+def test_pyramid_level_selection():
+    """Test choosing levels by the number of array cells per pixel."""
+    pyramid = ArrayPyramid(np.zeros((2000, 2000)))
+    assert not pyramid.build(token=type('Token', (), {'is_cancelled': True}))
+    assert pyramid.vmin is None
+
+    pyramid.build()
+    assert pyramid.base_tile_size == 4
+    assert pyramid.get_level(1).tile_size == 4
+    assert pyramid.get_level(10).tile_size == 8
+    assert pyramid.levels[-1].shape == (1, 1)
@@ -15,17 +15,22 @@
 
 # Standard library imports
 from __future__ import print_function
+from collections import OrderedDict
+import logging
 
 # Third party imports
 import numpy as np
 from qtpy.compat import from_qvariant, to_qvariant
 from qtpy.QtCore import (QAbstractTableModel, QItemSelection, QLocale,
-                         QItemSelectionRange, QModelIndex, Qt, Slot)
-from qtpy.QtGui import QColor, QCursor, QDoubleValidator, QKeySequence
-from qtpy.QtWidgets import (QAbstractItemDelegate, QApplication, QCheckBox,
-                            QComboBox, QDialog, QGridLayout, QHBoxLayout,
-                            QInputDialog, QItemDelegate, QLabel, QLineEdit,
-                            QMenu, QMessageBox, QPushButton, QSpinBox,
+                         QItemSelectionRange, QModelIndex, QRectF, Qt,
+                         Signal, Slot)
+from qtpy.QtGui import (QColor, QCursor, QDoubleValidator, QImage,
+                        QKeySequence, QPainter)
+from qtpy.QtWidgets import (QAbstractItemDelegate, QAbstractItemView,
+                            QApplication, QCheckBox, QComboBox, QDialog,
+                            QGridLayout, QHBoxLayout, QInputDialog,
+                            QItemDelegate, QLabel, QLineEdit, QMenu,
+                            QMessageBox, QPushButton, QSpinBox,
                             QStackedWidget, QTableView, QVBoxLayout,
                             QWidget)
 from spyder_kernels.utils.nsview import value_to_display
@@ -39,9 +44,14 @@
                               is_text_string, PY3, to_binary_string,
                               to_text_string)
 from spyder.utils import icon_manager as ima
+from spyder.utils.executor import get_executor, PRIORITY_BACKGROUND
 from spyder.utils.qthelpers import add_actions, create_action, keybinding
+from spyder.plugins.variableexplorer.utils.arraypyramid import ArrayPyramid
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
 
+
+logger = logging.getLogger(__name__)
+
 # Note: string and unicode data types will be formatted with '%s' (see below)
 SUPPORTED_FORMATS = {
                      'single': '%.6g',
@@ -91,6 +101,14 @@
 LARGE_NROWS = 1e5
 LARGE_COLS = 60
 
+# Size and maximum number of the tiles of formatted values kept in memory
+TEXT_TILE_ROWS = 64
+TEXT_TILE_COLS = 16
+MAX_TEXT_TILES = 64
+
+# Smallest number of rows or columns shown by the overview when zooming
+OVERVIEW_MIN_CELLS = 8
+
 
 #==============================================================================
 # Utility functions
@@ -112,6 +130,30 @@ def get_idx_rect(index_list):
     return ( min(rows), max(rows), min(cols), max(cols) )
 
 
+def hsv_to_argb(hue, saturation, value, alpha):
+    """
+    Convert an array of hues to 32-bit ARGB colors, like QColor.fromHsvF.
+
+    NaN hues are converted to transparent colors.
+    """
+    invalid = np.isnan(hue)
+    hue = np.where(invalid, 0., hue) % 1. * 6
+    sector = hue.astype(int) % 6
+    fraction = hue - np.floor(hue)
+    full = np.full(hue.shape, value)
+    low = np.full(hue.shape, value * (1 - saturation))
+    falling = value * (1 - saturation * fraction)
+    rising = value * (1 - saturation * (1 - fraction))
+    red = np.choose(sector, [full, falling, low, low, rising, full])
+    green = np.choose(sector, [rising, full, full, falling, low, low])
+    blue = np.choose(sector, [low, low, rising, full, full, falling])
+
+    argb = np.uint32(int(round(alpha * 255)) << 24)
+    for shift, channel in ((16, red), (8, green), (0, blue)):
+        argb = argb | (np.round(channel * 255).astype(np.uint32) << shift)
+    return np.where(invalid, np.uint32(0), argb).astype(np.uint32)
+
+
 #==============================================================================
 # Main classes
 #==============================================================================
@@ -121,6 +163,12 @@ class ArrayModel(QAbstractTableModel):
     ROWS_TO_LOAD = 500
     COLS_TO_LOAD = 40
 
+    sig_colors_ready = Signal()
+    """
+    This signal is emitted when the range of values used for background
+    colors has been computed in the background.
+    """
+
     def __init__(self, data, format="%.6g", xlabels=None, ylabels=None,
                  readonly=False, parent=None):
         QAbstractTableModel.__init__(self)
@@ -152,30 +200,40 @@ def __init__(self, data, format="%.6g", xlabels=None, ylabels=None,
         self.total_cols = self._data.shape[1]
         size = self.total_rows * self.total_cols
 
-        try:
-            self.vmin = np.nanmin(self.color_func(data))
-            self.vmax = np.nanmax(self.color_func(data))
-            if self.vmax == self.vmin:
-                self.vmin -= 1
-            self.hue0 = huerange[0]
-            self.dhue = huerange[1]-huerange[0]
-            self.bgcolor_enabled = True
-        except (AttributeError, TypeError, ValueError):
-            self.vmin = None
-            self.vmax = None
-            self.hue0 = None
-            self.dhue = None
-            self.bgcolor_enabled = False
-
-        # Array with infinite values cannot display background colors and
-        # crashes. See: spyder-ide/spyder#8093
+        # Formatted values are computed by tiles, see get_text
+        self._text_tiles = OrderedDict()
+        self._text_tiles_enabled = (
+            data.dtype.kind in ['i', 'u', 'f'] and
+            not isinstance(data, np.ma.MaskedArray))
+
+        # The range of values for background colors is taken from a
+        # reduction pyramid of the array, which is also used by the
+        # overview. It's computed in the background for large arrays.
+        self.vmin = None
+        self.vmax = None
+        self.hue0 = huerange[0]
+        self.dhue = huerange[1]-huerange[0]
         self.has_inf = False
-        if data.dtype.kind in ['f', 'c']:
-            self.has_inf = np.any(np.isinf(data))
-
-        # Deactivate coloring for object arrays or arrays with inf values
-        if self._data.dtype.name == 'object' or self.has_inf:
-            self.bgcolor_enabled = False
+        self.bgcolor_enabled = False
+        self.pyramid = None
+        self._pyramid_task = None
+        if data.dtype.kind in ['b', 'i', 'u', 'f', 'c']:
+            self.pyramid = ArrayPyramid(data, self.color_func)
+            self.bgcolor_enabled = True
+            if size > LARGE_SIZE:
+                executor = get_executor()
+                self._pyramid_task = executor.create_task(
+                    self.pyramid.build, priority=PRIORITY_BACKGROUND,
+                    pass_token=True)
+                self._pyramid_task.sig_finished.connect(self._pyramid_built)
+                executor.start(self._pyramid_task)
+            else:
+                try:
+                    self.pyramid.build()
+                    self._set_color_range()
+                except (TypeError, ValueError):
+                    self.pyramid = None
+                    self.bgcolor_enabled = False
 
         # Use paging when the total size, number of rows or number of
         # columns is too large
@@ -192,6 +250,39 @@ def __init__(self, data, format="%.6g", xlabels=None, ylabels=None,
             else:
                 self.cols_loaded = self.total_cols
 
+    def _set_color_range(self):
+        """Set the range of values for background colors from the pyramid."""
+        self.vmin = self.pyramid.vmin
+        self.vmax = self.pyramid.vmax
+        if self.vmin is None or np.isnan(self.vmin):
+            self.bgcolor_enabled = False
+            return
+        if self.vmax == self.vmin:
+            self.vmin -= 1
+
+        # Array with infinite values cannot display background colors and
+        # crashes. See: spyder-ide/spyder#8093
+        self.has_inf = bool(np.isinf(self.vmin) or np.isinf(self.vmax))
+        if self.has_inf:
+            self.bgcolor_enabled = False
+
+    def _pyramid_built(self, task, output, error):
+        """Handle the end of the background computation of the pyramid."""
+        self._pyramid_task = None
+        if error is not None:
+            logger.debug("Error computing the array pyramid: %s", error)
+            self.pyramid = None
+            self.bgcolor_enabled = False
+        else:
+            self._set_color_range()
+        self.sig_colors_ready.emit()
+
+    def cancel_pyramid(self):
+        """Stop computing the pyramid, e.g. when closing the editor."""
+        if self._pyramid_task is not None:
+            self._pyramid_task.cancel()
+            self._pyramid_task = None
+
     def get_format(self):
         """Return current format"""
         # Avoid accessing the private attribute _format from outside
@@ -204,6 +295,7 @@ def get_data(self):
     def set_format(self, format):
         """Change display format"""
         self._format = format
+        self._text_tiles.clear()
         self.reset()
 
     def columnCount(self, qindex=QModelIndex()):
@@ -262,10 +354,44 @@ def get_value(self, index):
             value = self._data[i, j]
         return self.changes.get((i, j), value)
 
+    def get_text(self, i, j):
+        """
+        Return the formatted value of a cell, or None if not available.
+
+        Values are formatted with vectorized NumPy operations for a tile of
+        cells around the requested one, so scrolling doesn't format them
+        one by one.
+        """
+        if not self._text_tiles_enabled or (i, j) in self.changes:
+            return None
+        key = (i // TEXT_TILE_ROWS, j // TEXT_TILE_COLS)
+        tile = self._text_tiles.get(key)
+        if tile is None:
+            row = key[0] * TEXT_TILE_ROWS
+            column = key[1] * TEXT_TILE_COLS
+            values = self._data[row:row + TEXT_TILE_ROWS,
+                                column:column + TEXT_TILE_COLS]
+            try:
+                tile = np.char.mod(self._format, values)
+            except (TypeError, ValueError):
+                # Let data format values one by one
+                self._text_tiles_enabled = False
+                return None
+            self._text_tiles[key] = tile
+            if len(self._text_tiles) > MAX_TEXT_TILES:
+                self._text_tiles.popitem(last=False)
+        else:
+            self._text_tiles.move_to_end(key)
+        return str(tile[i % TEXT_TILE_ROWS, j % TEXT_TILE_COLS])
+
     def data(self, index, role=Qt.DisplayRole):
         """Cell content."""
         if not index.isValid():
             return to_qvariant()
+        if role == Qt.DisplayRole:
+            text = self.get_text(index.row(), index.column())
+            if text is not None:
+                return to_qvariant(text)
         value = self.get_value(index)
         dtn = self._data.dtype.name
 
@@ -295,7 +421,8 @@ def data(self, index, role=Qt.DisplayRole):
         elif role == Qt.TextAlignmentRole:
             return to_qvariant(int(Qt.AlignCenter|Qt.AlignVCenter))
         elif (role == Qt.BackgroundColorRole and self.bgcolor_enabled
-                and value is not np.ma.masked and not self.has_inf):
+                and self.vmax is not None and value is not np.ma.masked
+                and not self.has_inf):
             try:
                 hue = (self.hue0 +
                        self.dhue * (float(self.vmax) - self.color_func(value))
@@ -349,7 +476,7 @@ def setData(self, index, value, role=Qt.EditRole):
         self.changes[(i, j)] = val
         self.dataChanged.emit(index, index)
 
-        if not is_string(val):
+        if not is_string(val) and self.vmax is not None:
             val = self.color_func(val)
 
             if val > self.vmax:
@@ -511,6 +638,18 @@ def load_more_data(self, value, rows=False, columns=False):
             # See isue 7880
             pass
 
+    def go_to_cell(self, row, column):
+        """Load the rows and columns up to a cell and select it."""
+        model = self.model()
+        while row >= model.rows_loaded and model.can_fetch_more(rows=True):
+            model.fetch_more(rows=True)
+        while (column >= model.cols_loaded and
+                model.can_fetch_more(columns=True)):
+            model.fetch_more(columns=True)
+        index = model.index(row, column)
+        self.setCurrentIndex(index)
+        self.scrollTo(index, QAbstractItemView.PositionAtCenter)
+
     def resize_to_contents(self):
         """Resize cells to contents"""
         QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
@@ -580,6 +719,111 @@ def copy(self):
         clipboard.setText(cliptxt)
 
 
+class ArrayOverview(QWidget):
+    """
+    Zoomable heatmap of the mean values of an array.
+
+    It's drawn from the reduction pyramid of the array model, using the
+    level that matches the number of array cells per pixel.
+    """
+
+    sig_cell_clicked = Signal(int, int)
+    """
+    This signal is emitted when a cell of the array is clicked.
+
+    Parameters
+    ----------
+    row: int
+        Row of the cell.
+    column: int
+        Column of the cell.
+    """
+
+    def __init__(self, parent, model):
+        QWidget.__init__(self, parent)
+        self.model = model
+        self._images = {}
+        self._region = QRectF(0, 0, model.total_cols, model.total_rows)
+        self.setMinimumWidth(150)
+        self.setToolTip(_("Mean values of the array. Use the mouse wheel "
+                          "to zoom and click to go to a cell."))
+        model.sig_colors_ready.connect(self.update_colors)
+
+    def update_colors(self):
+        """Draw the overview again, e.g. when colors are ready."""
+        self._images = {}
+        self.update()
+
+    def paintEvent(self, event):
+        """Reimplement Qt method"""
+        painter = QPainter(self)
+        pyramid = self.model.pyramid
+        if (pyramid is None or not pyramid.levels or
+                self.model.vmax is None):
+            painter.drawText(self.rect(), Qt.AlignCenter, _("Computing..."))
+            return
+
+        region = self._region
+        cells_per_pixel = max(region.width() / max(1, self.width()),
+                              region.height() / max(1, self.height()))
+        level = pyramid.get_level(cells_per_pixel)
+        size = float(level.tile_size)
+        source = QRectF(region.x() / size, region.y() / size,
+                        region.width() / size, region.height() / size)
+        painter.drawImage(QRectF(self.rect()), self._get_image(level),
+                          source)
+
+    def wheelEvent(self, event):
+        """Reimplement Qt method to zoom around the cursor."""
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        region = self._region
+        x = event.pos().x() / max(1., self.width())
+        y = event.pos().y() / max(1., self.height())
+        column = region.x() + x * region.width()
+        row = region.y() + y * region.height()
+
+        total_cols = self.model.total_cols
+        total_rows = self.model.total_rows
+        width = min(max(region.width() * factor,
+                        min(OVERVIEW_MIN_CELLS, total_cols)), total_cols)
+        height = min(max(region.height() * factor,
+                         min(OVERVIEW_MIN_CELLS, total_rows)), total_rows)
+        left = min(max(column - x * width, 0), total_cols - width)
+        top = min(max(row - y * height, 0), total_rows - height)
+        self._region = QRectF(left, top, width, height)
+        self.update()
+        event.accept()
+
+    def mousePressEvent(self, event):
+        """Reimplement Qt method to go to the clicked cell."""
+        if event.button() != Qt.LeftButton:
+            return QWidget.mousePressEvent(self, event)
+        region = self._region
+        column = region.x() + (event.pos().x() / max(1., self.width()) *
+                               region.width())
+        row = region.y() + (event.pos().y() / max(1., self.height()) *
+                            region.height())
+        self.sig_cell_clicked.emit(
+            min(int(row), self.model.total_rows - 1),
+            min(int(column), self.model.total_cols - 1))
+
+    def _get_image(self, level):
+        """Return the image of a pyramid level, with the table colors."""
+        image = self._images.get(level.tile_size)
+        if image is None:
+            model = self.model
+            with np.errstate(invalid='ignore'):
+                hue = model.hue0 + (model.dhue * (model.vmax - level.means)
+                                    / (model.vmax - model.vmin))
+            colors = np.ascontiguousarray(
+                hsv_to_argb(np.abs(hue), model.sat, model.val, model.alp))
+            rows, cols = colors.shape
+            image = QImage(colors.tobytes(), cols, rows, cols * 4,
+                           QImage.Format_ARGB32).copy()
+            self._images[level.tile_size] = image
+        return image
+
+
 class ArrayEditorWidget(QWidget):
 
     def __init__(self, parent, data, readonly=False,
@@ -609,19 +853,41 @@ def __init__(self, parent, data, readonly=False,
         btn = QPushButton(_( "Resize"))
         btn_layout.addWidget(btn)
         btn.clicked.connect(self.view.resize_to_contents)
-        bgcolor = QCheckBox(_( 'Background color'))
-        bgcolor.setChecked(self.model.bgcolor_enabled)
-        bgcolor.setEnabled(self.model.bgcolor_enabled)
-        bgcolor.stateChanged.connect(self.model.bgcolor)
-        btn_layout.addWidget(bgcolor)
+        self.bgcolor = QCheckBox(_( 'Background color'))
+        self.bgcolor.setChecked(self.model.bgcolor_enabled)
+        self.bgcolor.setEnabled(self.model.bgcolor_enabled)
+        self.bgcolor.stateChanged.connect(self.model.bgcolor)
+        btn_layout.addWidget(self.bgcolor)
+
+        self.overview = ArrayOverview(self, self.model)
+        self.overview.sig_cell_clicked.connect(self.view.go_to_cell)
+        self.overview.hide()
+        overview = QCheckBox(_('Overview'))
+        overview.setEnabled(self.model.pyramid is not None and
+                            self.data.size > 0)
+        overview.toggled.connect(self.overview.setVisible)
+        btn_layout.addWidget(overview)
+        self.model.sig_colors_ready.connect(self.colors_ready)
+
+        table_layout = QHBoxLayout()
+        table_layout.addWidget(self.view, stretch=3)
+        table_layout.addWidget(self.overview, stretch=1)
 
         layout = QVBoxLayout()
-        layout.addWidget(self.view)
+        layout.addLayout(table_layout)
         layout.addLayout(btn_layout)
         self.setLayout(layout)
 
+    def colors_ready(self):
+        """Update the widget once the background colors can be shown."""
+        if not self.model.bgcolor_enabled:
+            self.bgcolor.setChecked(False)
+        self.bgcolor.setEnabled(self.model.bgcolor_enabled)
+        self.view.viewport().update()
+
     def accept_changes(self):
         """Accept changes"""
+        self.model.cancel_pyramid()
         for (i, j), value in list(self.model.changes.items()):
             self.data[i, j] = value
         if self.old_data_shape is not None:
@@ -629,6 +895,7 @@ def accept_changes(self):
 
     def reject_changes(self):
         """Reject changes"""
+        self.model.cancel_pyramid()
         if self.old_data_shape is not None:
             self.data.shape = self.old_data_shape
 
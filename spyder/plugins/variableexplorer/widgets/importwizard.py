@@ -10,6 +10,7 @@
 
 # Standard library imports
 from __future__ import print_function
+import csv
 from functools import partial as ft_partial
 
 # Third party imports
@@ -33,12 +34,48 @@
 from spyder.config.base import _
 from spyder.py3compat import (INT_TYPES, io, TEXT_TYPES, to_text_string,
                               zip_longest)
-from spyder.utils import programs
+from spyder.utils import encoding, programs
 from spyder.utils import icon_manager as ima
 from spyder.utils.qthelpers import add_actions, create_action
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
 
 
+# Maximum size (in bytes) of the part of files shown by the wizard. The
+# whole file is only loaded in the kernel.
+SAMPLE_SIZE = 2**20
+
+# Column separators that are detected in files, from their first lines
+SNIFFED_SEPARATORS = u",;\t|"
+SNIFFED_LINES = 100
+
+
+def read_text_sample(filename, size=SAMPLE_SIZE):
+    """
+    Read the first complete lines of a file, up to size bytes.
+
+    Return their text, the encoding of the file (as accepted by Python)
+    and if the file has more lines.
+    """
+    with open(filename, 'rb') as fid:
+        data = fid.read(size + 1)
+    truncated = len(data) > size
+    if truncated:
+        data = encoding.truncate_lines(data, size)
+    text, coding = encoding.decode(data)
+    coding = coding.replace('-guessed', '').replace('-bom', '-sig')
+    return text, coding, truncated
+
+
+def sniff_col_sep(text):
+    """Return the column separator of text, or None if it's not clear."""
+    sample = u"\n".join(text.splitlines()[:SNIFFED_LINES])
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=SNIFFED_SEPARATORS)
+    except csv.Error:
+        return None
+    return dialect.delimiter
+
+
 def try_to_parse(value):
     _types = ('int', 'float')
     for _t in _types:
@@ -111,7 +148,7 @@ class ContentsWidget(QWidget):
     """Import wizard contents widget"""
     asDataChanged = Signal(bool)
 
-    def __init__(self, parent, text):
+    def __init__(self, parent, text, col_sep=None):
         QWidget.__init__(self, parent)
 
         self.text_editor = QTextEdit(self)
@@ -162,6 +199,10 @@ def __init__(self, parent, text):
         self.line_edt.setEnabled(True)
         other_btn_col.toggled.connect(self.line_edt.setEnabled)
         grid_layout.addWidget(self.line_edt, 0, 2)
+        if col_sep == u"\t":
+            self.tab_btn.setChecked(True)
+        elif col_sep:
+            self.line_edt.setText(col_sep)
 
         row_label = QLabel(_("Row separator:"))
         grid_layout.addWidget(row_label, 1, 0)
@@ -490,9 +531,16 @@ def get_data(self):
 
 
 class ImportWizard(BaseDialog):
-    """Text data import wizard"""
+    """
+    Text data import wizard
+
+    If filename is given, only the first lines of the file are shown and
+    previewed, and data is meant to be loaded in the kernel from the file
+    with the settings returned by get_load_settings.
+    """
     def __init__(self, parent, text,
-                 title=None, icon=None, contents_title=None, varname=None):
+                 title=None, icon=None, contents_title=None, varname=None,
+                 filename=None):
         QDialog.__init__(self, parent)
 
         # Destroying the C++ object right after closing the dialog box,
@@ -506,17 +554,30 @@ def __init__(self, parent, text,
         self.setWindowTitle(title)
         if icon is None:
             self.setWindowIcon(ima.icon('fileimport'))
+        col_sep = None
+        truncated = False
+        self.filename = filename
+        self.text_encoding = None
+        if filename is not None:
+            text, self.text_encoding, truncated = read_text_sample(
+                filename, SAMPLE_SIZE)
+            col_sep = sniff_col_sep(text)
+
         if contents_title is None:
-            contents_title = _("Raw text")
+            if truncated:
+                contents_title = _("Raw text (first lines)")
+            else:
+                contents_title = _("Raw text")
 
         if varname is None:
             varname = _("variable_name")
 
         self.var_name, self.clip_data = None, None
+        self.load_settings = None
 
         # Setting GUI
         self.tab_widget = QTabWidget(self)
-        self.text_widget = ContentsWidget(self, text)
+        self.text_widget = ContentsWidget(self, text, col_sep)
         self.table_widget = PreviewWidget(self)
 
         self.tab_widget.addTab(self.text_widget, _("text"))
@@ -603,6 +664,14 @@ def get_data(self):
         # already been destroyed, due to the Qt.WA_DeleteOnClose attribute
         return self.var_name, self.clip_data
 
+    def get_load_settings(self):
+        """
+        Return the settings to load data from the file in the kernel (see
+        load_text in spyder_kernels.utils.iofuncs), or None if data is
+        returned by get_data.
+        """
+        return self.load_settings
+
     def _simplify_shape(self, alist, rec=0):
         """Reduce the alist dimension if needed"""
         if rec != 0:
@@ -629,6 +698,29 @@ def _get_plain_text(self):
         """Return clipboard as text"""
         return self.text_widget.text_editor.toPlainText()
 
+    def _get_full_text(self):
+        """Return the whole text, which is only shown partially for files"""
+        if self.filename is None:
+            return self._get_plain_text()
+        text, _encoding = encoding.read(self.filename)
+        return text
+
+    def _get_load_settings(self):
+        """Return the settings to load the whole file in the kernel"""
+        if self.table_widget.array_btn.isChecked():
+            kind = 'array'
+        elif pd and self.table_widget.df_btn.isChecked():
+            kind = 'dataframe'
+        else:
+            kind = 'list'
+        return dict(kind=kind,
+                    sep=self.text_widget.get_col_sep(),
+                    lineterminator=self.text_widget.get_row_sep(),
+                    skiprows=self.text_widget.get_skiprows(),
+                    comment=self.text_widget.get_comments(),
+                    transpose=self.text_widget.trnsp_box.isChecked(),
+                    encoding=self.text_encoding)
+
     @Slot()
     def process(self):
         """Process the data from clipboard"""
@@ -638,12 +730,15 @@ def process(self):
         except UnicodeEncodeError:
             self.var_name = to_text_string(var_name)
         if self.text_widget.get_as_data():
-            self.clip_data = self._get_table_data()
+            if self.filename is None:
+                self.clip_data = self._get_table_data()
+            else:
+                self.load_settings = self._get_load_settings()
         elif self.text_widget.get_as_code():
             self.clip_data = try_to_eval(
-                to_text_string(self._get_plain_text()))
+                to_text_string(self._get_full_text()))
         else:
-            self.clip_data = to_text_string(self._get_plain_text())
+            self.clip_data = to_text_string(self._get_full_text())
         self.accept()
 
 
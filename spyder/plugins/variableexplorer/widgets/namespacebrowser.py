@@ -11,6 +11,7 @@
 """
 
 # Standard library imports
+from functools import partial
 import os
 import os.path as osp
 
@@ -29,7 +30,6 @@
 from spyder.config.base import _
 from spyder.config.manager import CONF
 from spyder.py3compat import PY2, is_text_string, to_text_string
-from spyder.utils import encoding
 from spyder.utils import icon_manager as ima
 from spyder.utils.misc import getcwd_or_home, remove_backslashes
 from spyder.utils.programs import is_module_installed
@@ -379,15 +379,26 @@ def show_finder(self, set_visible=False):
         else:
             self.editor.setFocus()
 
+    def is_shown(self):
+        """Return True if the variable table can be seen by users."""
+        return self.is_visible and self.isVisible()
+
     def refresh_table(self):
         """Refresh variable table"""
-        if self.is_visible and self.isVisible():
-            self.shellwidget.refresh_namespacebrowser()
+        if self.is_shown():
+            self.shellwidget.refresh_namespacebrowser(force=True)
             try:
                 self.editor.resizeRowToContents()
             except TypeError:
                 pass
 
+    def showEvent(self, event):
+        """Refresh the table if executions happened while hidden."""
+        super(NamespaceBrowser, self).showEvent(event)
+        if (self.shellwidget is not None and
+                self.shellwidget.namespacebrowser_outdated):
+            self.shellwidget.refresh_namespacebrowser()
+
     def process_remote_view(self, remote_view):
         """Process remote view"""
         # To load all variables when a new filtering search is
@@ -460,13 +471,22 @@ def import_data(self, filenames=None):
                 # Import data with import wizard
                 error_message = None
                 try:
-                    text, _encoding = encoding.read(self.filename)
                     base_name = osp.basename(self.filename)
-                    editor = ImportWizard(self, text, title=base_name,
-                                  varname=fix_reference_name(base_name))
+                    editor = ImportWizard(self, None, title=base_name,
+                                  varname=fix_reference_name(base_name),
+                                  filename=self.filename)
                     if editor.exec_():
                         var_name, clip_data = editor.get_data()
-                        self.editor.new_value(var_name, clip_data)
+                        settings = editor.get_load_settings()
+                        if settings is None:
+                            self.editor.new_value(var_name, clip_data)
+                        else:
+                            # Big files can take a while to load, so
+                            # don't wait for the kernel
+                            self.shellwidget.load_text_data(
+                                var_name, self.filename, settings,
+                                callback=partial(self._text_data_loaded,
+                                                 self.filename))
                 except Exception as error:
                     error_message = str(error)
             else:
@@ -484,6 +504,16 @@ def import_data(self, filenames=None):
                                        ) % (self.filename, error_message))
             self.refresh_table()
 
+    def _text_data_loaded(self, filename, error_message):
+        """Show the result of loading a text file in the kernel."""
+        if error_message is not None:
+            QMessageBox.critical(self, _("Import data"),
+                                 _("<b>Unable to load '%s'</b>"
+                                   "<br><br>"
+                                   "The error message was:<br>%s"
+                                   ) % (filename, error_message))
+        self.refresh_table()
+
     @Slot()
     def reset_namespace(self):
         warning = CONF.get('ipython_console', 'show_reset_namespace_warning')
@@ -26,6 +26,7 @@
 from flaky import flaky
 
 # Local imports
+from spyder.plugins.variableexplorer.widgets import arrayeditor
 from spyder.plugins.variableexplorer.widgets.arrayeditor import ArrayEditor, ArrayModel
 
 
@@ -341,5 +342,30 @@ def test_arrayeditor_edit_overflow(qtbot, monkeypatch):
                       dialog.get_value()) == len(expected_array)
 
 
+def test_arraymodel_text_tiles(qtbot):
+    """Test that values are formatted by tiles and edits are shown."""
+    arr = np.arange(200 * 40, dtype=float).reshape(200, 40)
+    model = ArrayModel(arr, format='%.1f')
+    assert model.data(model.index(70, 20)) == '2820.0'
+    assert len(model._text_tiles) == 1
+
+    assert model.setData(model.index(70, 20), '5')
+    assert model.data(model.index(70, 20)) == '5.0'
+    model.set_format('%.2f')
+    assert model.data(model.index(0, 1)) == '1.00'
+
+
+def test_arraymodel_colors_of_large_arrays(qtbot, monkeypatch):
+    """Test that the color range of large arrays is computed in background."""
+    monkeypatch.setattr(arrayeditor, 'LARGE_SIZE', 10)
+    model = ArrayModel(np.arange(100.).reshape(10, 10))
+    assert model.vmax is None
+    with qtbot.waitSignal(model.sig_colors_ready):
+        pass
+    assert (model.vmin, model.vmax) == (0, 99)
+    assert model.bgcolor_enabled
+    assert model.pyramid.levels
+
+
 if __name__ == "__main__":
     pytest.main()
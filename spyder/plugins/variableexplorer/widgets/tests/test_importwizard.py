@@ -8,11 +8,15 @@
 Tests for importwizard.py
 """
 
+# Standard library imports
+import codecs
+
 # Test library imports
 import pytest
 
 # Local imports
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
+from spyder.plugins.variableexplorer.widgets import importwizard as iw
 
 
 @pytest.fixture
@@ -30,5 +34,30 @@ def test_importwizard(importwizard):
     assert importwizard
 
 
+def test_importwizard_file(qtbot, tmpdir, monkeypatch):
+    """
+    Test that only the first lines of files are shown and that their data
+    is loaded in the kernel.
+    """
+    monkeypatch.setattr(iw, 'SAMPLE_SIZE', 100)
+    path = tmpdir.join('data.csv')
+    path.write(u''.join(u'{};{}\n'.format(i, i / 2.) for i in range(100)))
+    importwizard = ImportWizard(None, None, filename=str(path))
+    qtbot.addWidget(importwizard)
+
+    text = importwizard._get_plain_text()
+    assert len(text) <= 100 and text.endswith(u'\n')
+    assert importwizard.text_widget.get_col_sep() == u';'
+
+    importwizard._set_step(1)
+    importwizard.process()
+    var_name, data = importwizard.get_data()
+    assert data is None
+    settings = importwizard.get_load_settings()
+    assert settings['sep'] == u';'
+    assert settings['skiprows'] == 0
+    assert codecs.lookup(settings['encoding'])
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -14,8 +14,10 @@
 import sys
 
 from spyder.config.base import running_in_mac_app, get_home_dir
-from spyder.utils.programs import (find_program, run_program,
-                                   run_shell_command)
+from spyder.utils.interpreters import (get_cached_interpreter_info,
+                                       load_env_list, save_env_list,
+                                       update_interpreter_info)
+from spyder.utils.programs import find_program, run_shell_command
 
 
 WINDOWS = os.name == 'nt'
@@ -134,11 +136,14 @@ def get_list_conda_envs():
         path = osp.join(env, 'python.exe') if WINDOWS else osp.join(
             env, 'bin', 'python')
 
-        try:
-            version, __ = run_program(path, ['--version']).communicate()
-            version = version.decode()
-        except Exception:
-            version = ''
+        # Only run the interpreters that changed since they were probed
+        info = get_cached_interpreter_info(path)
+        if info is None:
+            try:
+                info = update_interpreter_info(path)['info']
+            except Exception:
+                info = {'version': ''}
+        version = info['version']
 
         name = ('base' if name.lower().startswith('anaconda') or
                 name.lower().startswith('miniconda') else name)
@@ -146,9 +151,19 @@ def get_list_conda_envs():
         env_list[name] = (path, version.strip())
 
     CONDA_ENV_LIST_CACHE = env_list
+    save_env_list('conda', env_list)
     return env_list
 
 
 def get_list_conda_envs_cache():
-    """Return a cache of envs to avoid computing them again."""
+    """
+    Return a cache of envs to avoid computing them again.
+
+    Before they are computed, the ones found by the last session are
+    returned.
+    """
+    global CONDA_ENV_LIST_CACHE
+
+    if not CONDA_ENV_LIST_CACHE:
+        CONDA_ENV_LIST_CACHE = load_env_list('conda')
     return CONDA_ENV_LIST_CACHE
@@ -12,7 +12,8 @@
 """
 
 # Standard library imports
-from codecs import BOM_UTF8, BOM_UTF16, BOM_UTF32
+from codecs import (BOM_UTF8, BOM_UTF16, BOM_UTF16_BE, BOM_UTF16_LE,
+                    BOM_UTF32, BOM_UTF32_BE, BOM_UTF32_LE)
 import tempfile
 import locale
 import re
@@ -39,6 +40,13 @@
 
 PREFERRED_ENCODING = locale.getpreferredencoding()
 
+# Byte order marks of the encodings with code units wider than a byte, and
+# the codecs that decode the text after them
+WIDE_BOMS = [(BOM_UTF32_LE, 'utf-32-le'),
+             (BOM_UTF32_BE, 'utf-32-be'),
+             (BOM_UTF16_LE, 'utf-16-le'),
+             (BOM_UTF16_BE, 'utf-16-be')]
+
 def transcode(text, input=PREFERRED_ENCODING, output=PREFERRED_ENCODING):
     """Transcode a text string"""
     try:
@@ -158,12 +166,13 @@ def decode(text):
         if text.startswith(BOM_UTF8):
             # UTF-8 with BOM
             return to_text_string(text[len(BOM_UTF8):], 'utf-8'), 'utf-8-bom'
+        elif text.startswith(BOM_UTF32):
+            # UTF-32 with BOM (checked first because the little-endian one
+            # starts with the UTF-16 one)
+            return to_text_string(text[len(BOM_UTF32):], 'utf-32'), 'utf-32'
         elif text.startswith(BOM_UTF16):
             # UTF-16 with BOM
             return to_text_string(text[len(BOM_UTF16):], 'utf-16'), 'utf-16'
-        elif text.startswith(BOM_UTF32):
-            # UTF-32 with BOM
-            return to_text_string(text[len(BOM_UTF32):], 'utf-32'), 'utf-32'
         coding = get_coding(text)
         if coding:
             return to_text_string(text, coding), coding
@@ -177,6 +186,30 @@ def decode(text):
     # Assume Latin-1 (behaviour before 3.7.1)
     return to_text_string(text, "latin-1"), 'latin-1-guessed'
 
+
+def truncate_lines(data, size):
+    """
+    Return the complete lines at the beginning of the bytes data, up to
+    size bytes, or its first size bytes if it has no newline before that.
+
+    Lines are cut after a newline encoded as in the BOM of data, if any, so
+    UTF-16 and UTF-32 characters are not split.
+    """
+    newline = b'\n'
+    for bom, codec in WIDE_BOMS:
+        if data.startswith(bom):
+            newline = u'\n'.encode(codec)
+            break
+    width = len(newline)
+
+    # Skip the matches that are not at the start of a code unit
+    end = data.rfind(newline, 0, size)
+    while end > 0 and end % width:
+        end = data.rfind(newline, 0, end + width - 1)
+    if end == -1:
+        return data[:size - size % width]
+    return data[:end + width]
+
 def encode(text, orig_coding):
     """
     Function to encode a text.
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+"""
+Shared executor to run Python functions in background threads or processes.
+
+Tasks are run by a fixed pool of threads (and a process pool created on
+demand) in order of priority, so interactive requests aren't delayed by
+background work. A task submitted with a key supersedes the queued or
+running task with the same key, e.g. to not scan an old version of a file.
+"""
+
+# Standard library imports
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+
+# Third party imports
+from qtpy.QtCore import QObject, Signal
+
+
+logger = logging.getLogger(__name__)
+
+# Task priorities, lower values run first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 5
+PRIORITY_BACKGROUND = 10
+
+# Number of task latencies used to compute metrics
+LATENCY_SAMPLES = 200
+
+
+class CancellationToken(object):
+    """Token that tells a running function it should stop."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def is_cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+
+
+class Task(QObject):
+    """A function submitted to the executor."""
+
+    sig_finished = Signal(object, object, object)
+    """
+    This signal is emitted when the task finishes without being cancelled.
+
+    Parameters
+    ----------
+    task: Task
+        This task.
+    output: object
+        Value returned by the function.
+    error: Exception or None
+        Exception raised by the function.
+    """
+
+    def __init__(self, func, args, kwargs, priority=PRIORITY_NORMAL,
+                 key=None, process=False):
+        super(Task, self).__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.key = key
+        self.process = process
+        self.token = CancellationToken()
+        self.submit_time = time.time()
+        self.start_time = None
+        self.end_time = None
+
+    @property
+    def wait_time(self):
+        """Time spent in the queue."""
+        if self.start_time is None:
+            return None
+        return self.start_time - self.submit_time
+
+    @property
+    def run_time(self):
+        """Time spent running."""
+        if self.end_time is None or self.start_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def cancel(self):
+        """Cancel the task, its result (if any) won't be emitted."""
+        self.token.cancel()
+
+    def is_cancelled(self):
+        return self.token.is_cancelled
+
+    def is_finished(self):
+        return self.end_time is not None
+
+
+class TaskExecutor(QObject):
+    """Prioritized pool of threads (and processes) to run tasks."""
+
+    def __init__(self, max_threads=None, max_processes=None):
+        """
+        Parameters
+        ----------
+        max_threads: int or None
+            Number of threads to run tasks. By default, it depends on the
+            number of CPUs.
+        max_processes: int or None
+            Number of processes of the process pool. By default, it's the
+            number of CPUs.
+        """
+        super(TaskExecutor, self).__init__()
+        if max_threads is None:
+            max_threads = min(8, (os.cpu_count() or 1) + 2)
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._threads = []
+        self._idle_threads = 0
+        self._process_pool = None
+        self._keys = {}
+        self._running = set()
+        self._shutdown = False
+
+        # Metrics
+        self.completed = 0
+        self.cancelled = 0
+        self.failed = 0
+        self._wait_times = deque(maxlen=LATENCY_SAMPLES)
+        self._run_times = deque(maxlen=LATENCY_SAMPLES)
+
+    # ---- Public API
+    def submit(self, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) in the executor and return its Task.
+
+        The following keyword arguments are used by the executor and not
+        passed to func:
+
+        priority: int
+            One of the PRIORITY_* constants. PRIORITY_NORMAL by default.
+        key: hashable or None
+            Tasks with the same key supersede each other: the previous one
+            is cancelled when a new one is submitted.
+        process: bool
+            Run func in the process pool. It and its arguments must be
+            picklable. False by default.
+        pass_token: bool
+            Pass the CancellationToken of the task to func as the `token`
+            keyword argument, so it can stop early. False by default.
+
+        Notes
+        -----
+        The task can finish before its signals are connected. To avoid
+        that, use `create_task` and then `start`.
+        """
+        task = self.create_task(func, *args, **kwargs)
+        self.start(task)
+        return task
+
+    def create_task(self, func, *args, **kwargs):
+        """Create a task to be run later with `start`, see `submit`."""
+        priority = kwargs.pop('priority', PRIORITY_NORMAL)
+        key = kwargs.pop('key', None)
+        process = kwargs.pop('process', False)
+        pass_token = kwargs.pop('pass_token', False)
+
+        task = Task(func, args, kwargs, priority=priority, key=key,
+                    process=process)
+        if pass_token:
+            kwargs['token'] = task.token
+        return task
+
+    def start(self, task):
+        """Queue a task created with `create_task`."""
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('The executor has been shut down')
+            task.submit_time = time.time()
+            if task.key is not None:
+                previous = self._keys.get(task.key)
+                if previous is not None:
+                    previous.cancel()
+                self._keys[task.key] = task
+            heapq.heappush(self._queue,
+                           (task.priority, next(self._counter), task))
+            if self._idle_threads == 0 and (
+                    len(self._threads) < self.max_threads):
+                self._start_thread()
+            self._condition.notify()
+
+    def cancel(self, key):
+        """Cancel the task with the given key, if any."""
+        with self._condition:
+            task = self._keys.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def get_stats(self):
+        """Return queue depth and task latency metrics."""
+        with self._condition:
+            queued = len([item for item in self._queue
+                          if not item[-1].is_cancelled()])
+            running = len(self._running)
+
+        def mean(values):
+            return sum(values) / len(values) if values else 0.
+
+        return {
+            'queued': queued,
+            'running': running,
+            'threads': len(self._threads),
+            'completed': self.completed,
+            'cancelled': self.cancelled,
+            'failed': self.failed,
+            'mean_wait_time': mean(self._wait_times),
+            'max_wait_time': max(self._wait_times, default=0.),
+            'mean_run_time': mean(self._run_times),
+        }
+
+    def shutdown(self):
+        """Cancel all tasks and stop the threads and processes."""
+        with self._condition:
+            self._shutdown = True
+            for __, __, task in self._queue:
+                task.cancel()
+            for task in self._running:
+                task.cancel()
+            self._queue = []
+            self._keys = {}
+            self._condition.notify_all()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+
+    # ---- Private API
+    def _start_thread(self):
+        thread = threading.Thread(target=self._work,
+                                  name='TaskExecutor-{}'.format(
+                                      len(self._threads)))
+        thread.daemon = True
+        self._threads.append(thread)
+        thread.start()
+
+    def _next_task(self):
+        """Wait for the next task to run, or return None on shutdown."""
+        with self._condition:
+            while True:
+                while self._queue:
+                    __, __, task = heapq.heappop(self._queue)
+                    if task.is_cancelled():
+                        self._task_done(task)
+                        continue
+                    self._running.add(task)
+                    return task
+                if self._shutdown:
+                    return None
+                self._idle_threads += 1
+                self._condition.wait()
+                self._idle_threads -= 1
+
+    def _task_done(self, task):
+        """Update metrics and keys after task ended. Needs the lock."""
+        self._running.discard(task)
+        if task.key is not None and self._keys.get(task.key) is task:
+            del self._keys[task.key]
+        if task.is_cancelled():
+            self.cancelled += 1
+
+    def _work(self):
+        """Run tasks until shutdown."""
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+
+            task.start_time = time.time()
+            output = None
+            error = None
+            try:
+                if task.process:
+                    output = self._get_process_pool().submit(
+                        task.func, *task.args, **task.kwargs).result()
+                else:
+                    output = task.func(*task.args, **task.kwargs)
+            except Exception as err:
+                error = err
+                logger.debug("Task %r failed", task.func, exc_info=True)
+            task.end_time = time.time()
+
+            with self._condition:
+                self._task_done(task)
+                if not task.is_cancelled():
+                    self.completed += 1
+                    if error is not None:
+                        self.failed += 1
+                    self._wait_times.append(task.wait_time)
+                    self._run_times.append(task.run_time)
+
+            if not task.is_cancelled():
+                task.sig_finished.emit(task, output, error)
+
+    def _get_process_pool(self):
+        with self._condition:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(self.max_processes)
+            return self._process_pool
+
+
+_executor = None
+
+
+def get_executor():
+    """Return the executor shared by all Spyder components."""
+    global _executor
+    if _executor is None:
+        _executor = TaskExecutor()
+    return _executor
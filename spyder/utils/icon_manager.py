@@ -9,6 +9,7 @@
 import os.path as osp
 import mimetypes as mime
 import sys
+import time
 
 # Third party imports
 from qtpy.QtCore import QBuffer, QByteArray, Qt
@@ -47,6 +48,8 @@
 
 ICONS_BY_EXTENSION = {}
 
+APPLICATION_ICONS = dict(BIN_FILES, **DOCUMENT_FILES)
+
 # Magnification factors for attribute icons
 # per platform
 if sys.platform.startswith('linux'):
@@ -105,6 +108,15 @@
     'loaded': False,
 }
 
+# Icons created by `icon`, by name, theme, scale factor and colors
+_icon_cache = {}
+
+# Current icon theme, read once from the config until the cache is cleared
+_icon_theme = {'name': None}
+
+# Number of icons created, cache hits and time spent creating icons
+_icon_stats = {'created': 0, 'hits': 0, 'time': 0.}
+
 _qtaargs = {
     'environment':             [('mdi.cube-outline',), {'color': MAIN_FG_COLOR}],
     'drag-horizontal':         [('mdi.drag-horizontal',), {'color': MAIN_FG_COLOR}],
@@ -409,7 +421,36 @@ def get_icon(name, default=None, resample=False, adjust_for_interface=False):
 
 
 def icon(name, scale_factor=None, resample=False, icon_path=None):
-    theme = CONF.get('appearance', 'icon_theme')
+    """
+    Return the icon called `name` in the current icon theme.
+
+    Icons are created once and then taken from a cache, so menus, toolbars
+    and trees showing the same icons don't render them again.
+    """
+    if _icon_theme['name'] is None:
+        _icon_theme['name'] = CONF.get('appearance', 'icon_theme')
+    theme = _icon_theme['name']
+
+    key = (name, theme, scale_factor, MAIN_FG_COLOR, resample, icon_path)
+    cached_icon = _icon_cache.get(key)
+    if cached_icon is not None:
+        _icon_stats['hits'] += 1
+        # Return a copy, which shares its pixmaps with the cached icon, so
+        # callers can't modify the cached one
+        return QIcon(cached_icon)
+
+    start = time.perf_counter()
+    new_icon = _create_icon(name, theme, scale_factor, resample, icon_path)
+    _icon_stats['time'] += time.perf_counter() - start
+    _icon_stats['created'] += 1
+    if new_icon is not None:
+        _icon_cache[key] = new_icon
+        new_icon = QIcon(new_icon)
+    return new_icon
+
+
+def _create_icon(name, theme, scale_factor, resample, icon_path):
+    """Create an icon of the given theme."""
     if theme == 'spyder 3':
         if not _resource['loaded']:
             qta.load_font('spyder', 'spyder.ttf', 'spyder-charmap.json',
@@ -417,7 +458,7 @@ def icon(name, scale_factor=None, resample=False, icon_path=None):
             _resource['loaded'] = True
         args, kwargs = _qtaargs[name]
         if scale_factor is not None:
-            kwargs['scale_factor'] = scale_factor
+            kwargs = dict(kwargs, scale_factor=scale_factor)
         return qta.icon(*args, **kwargs)
     elif theme == 'spyder 2':
         icon = get_icon(name + '.png', resample=resample)
@@ -428,23 +469,37 @@ def icon(name, scale_factor=None, resample=False, icon_path=None):
         return icon if icon is not None else QIcon()
 
 
+def clear_icon_cache():
+    """Clear cached icons, e.g. after changing the icon theme."""
+    _icon_theme['name'] = None
+    _icon_cache.clear()
+    ICONS_BY_EXTENSION.clear()
+
+
+def get_icon_stats():
+    """
+    Return the number of icons created, the number of cache hits and the
+    time spent creating icons, in seconds.
+    """
+    return dict(_icon_stats)
+
+
 def get_icon_by_extension_or_type(fname, scale_factor):
     """Return the icon depending on the file extension"""
-    application_icons = {}
-    application_icons.update(BIN_FILES)
-    application_icons.update(DOCUMENT_FILES)
-
     basename = osp.basename(fname)
     __, extension = osp.splitext(basename.lower())
-    mime_type, __ = mime.guess_type(basename)
 
-    if osp.isdir(fname):
+    is_dir = osp.isdir(fname)
+    if is_dir:
         extension = "Folder"
 
     if (extension, scale_factor) in ICONS_BY_EXTENSION:
         return ICONS_BY_EXTENSION[(extension, scale_factor)]
 
-    if osp.isdir(fname):
+    # Only guess the mime type of extensions not seen before
+    mime_type, __ = mime.guess_type(basename)
+
+    if is_dir:
         icon_by_extension = icon('DirOpenIcon', scale_factor)
     else:
         icon_by_extension = get_icon('binary', adjust_for_interface=True)
@@ -485,9 +540,9 @@ def get_icon_by_extension_or_type(fname, scale_factor):
                 elif file_type == 'image':
                     icon_by_extension = icon('ImageFileIcon', scale_factor)
                 elif file_type == 'application':
-                    if bin_name in application_icons:
+                    if bin_name in APPLICATION_ICONS:
                         icon_by_extension = icon(
-                            application_icons[bin_name], scale_factor)
+                            APPLICATION_ICONS[bin_name], scale_factor)
 
     ICONS_BY_EXTENSION[(extension, scale_factor)] = icon_by_extension
     return icon_by_extension
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Cache of the metadata of Python interpreters.
+
+Knowing the version of an interpreter or of the modules installed in it
+requires running it, which is slow when there are many environments. That
+metadata is saved in the modules database with the mtimes of the interpreter
+and of its site-packages, so it's only probed again after they change.
+"""
+
+# Standard library imports
+from functools import partial
+import hashlib
+import json
+import logging
+import os
+import os.path as osp
+
+# Third party imports
+from pickleshare import PickleShareDB
+
+# Local imports
+from spyder.config.base import get_conf_path
+
+
+logger = logging.getLogger(__name__)
+
+# Modules whose versions are saved, with the name of their distribution
+KEY_MODULES = {
+    'spyder_kernels': 'spyder-kernels',
+    'ipykernel': 'ipykernel',
+    'IPython': 'ipython',
+    'jedi': 'jedi',
+    'matplotlib': 'matplotlib',
+    'numpy': 'numpy',
+    'pandas': 'pandas',
+    'sympy': 'sympy',
+    'Cython': 'Cython',
+}
+
+# Code run by interpreters to get their metadata. Versions are read from
+# the distributions metadata to not import modules, if possible. The user
+# site-packages is included in the paths checked for changes, if enabled.
+# Their sys.path and builtin modules are used to index their modules.
+INTERPRETER_INFO_CODE = """
+import json, site, sys, sysconfig
+try:
+    from importlib.metadata import version as get_version
+except ImportError:
+    get_version = None
+modules = {{}}
+for module, dist in {modules!r}.items():
+    try:
+        modules[module] = get_version(dist)
+        continue
+    except Exception:
+        pass
+    try:
+        mod = __import__(module)
+    except Exception:
+        continue
+    version = getattr(mod, '__version__', getattr(mod, 'VERSION', None))
+    modules[module] = None if version is None else str(version)
+paths = set(sysconfig.get_paths()[key] for key in ('purelib', 'platlib'))
+if site.ENABLE_USER_SITE:
+    paths.add(site.getusersitepackages())
+paths = sorted(paths)
+print(json.dumps({{'version': 'Python ' + sys.version.split()[0],
+                  'modules': modules, 'paths': paths, 'sys_path': sys.path,
+                  'builtin_modules': list(sys.builtin_module_names)}}))
+""".format(modules=KEY_MODULES)
+
+# Cache entries read in this session, by executable
+_cache = {}
+
+
+def _get_key(executable):
+    """Return the key of the metadata of an interpreter in the database."""
+    digest = hashlib.md5(executable.encode('utf-8')).hexdigest()
+    return 'interpreter_info/' + digest
+
+
+def get_mtimes(paths):
+    """Return the mtimes of paths (None for the missing ones)."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def probe_interpreter(executable):
+    """
+    Run an interpreter to get its version, the versions of KEY_MODULES
+    installed in it (None if they don't have one), its site-packages, its
+    sys.path and its builtin modules.
+    """
+    from spyder.utils.programs import run_program
+
+    # Use a clean environment
+    process = run_program(executable, ['-c', INTERPRETER_INFO_CODE], env={})
+    output, __ = process.communicate()
+    return json.loads(output.decode('utf-8'))
+
+
+def update_interpreter_info(executable, db_path=None):
+    """
+    Probe an interpreter, save its metadata in the modules database at
+    db_path and return the saved entry.
+
+    This blocks until the interpreter exits, so it should run in a worker
+    thread or process.
+    """
+    info = probe_interpreter(executable)
+    entry = {
+        'mtimes': get_mtimes([executable] + info['paths']),
+        'info': info,
+    }
+    modules_db = PickleShareDB(db_path or get_conf_path('db'))
+    modules_db[_get_key(executable)] = entry
+    _cache[executable] = entry
+    return entry
+
+
+def get_cached_interpreter_info(executable, db_path=None):
+    """
+    Return the saved metadata of an interpreter, or None if it was never
+    probed or it (or its site-packages) changed since then.
+
+    This only reads the cache, so it can be used at startup.
+    """
+    entry = _cache.get(executable)
+    if entry is None:
+        modules_db = PickleShareDB(db_path or get_conf_path('db'))
+        entry = modules_db.get(_get_key(executable))
+        if entry is None:
+            return None
+        _cache[executable] = entry
+
+    if get_mtimes(entry['mtimes']) != entry['mtimes']:
+        return None
+    return entry['info']
+
+
+def refresh_interpreter_info(executable, callback=None):
+    """
+    Probe an interpreter in a background process if its saved metadata is
+    missing or outdated.
+
+    callback is called with the metadata once it's available. This must be
+    called from the main thread.
+    """
+    from spyder.utils.executor import PRIORITY_BACKGROUND, get_executor
+
+    info = get_cached_interpreter_info(executable)
+    if info is not None or not osp.isfile(executable):
+        if info is not None and callback is not None:
+            callback(info)
+        return
+
+    executor = get_executor()
+    task = executor.create_task(
+        update_interpreter_info, executable, get_conf_path('db'),
+        priority=PRIORITY_BACKGROUND, key=('interpreter_info', executable),
+        process=True)
+    task.sig_finished.connect(partial(_interpreter_info_updated, executable,
+                                      callback))
+    executor.start(task)
+
+
+def _interpreter_info_updated(executable, callback, task, entry, error):
+    """Save the metadata probed by refresh_interpreter_info."""
+    if error is not None:
+        logger.debug("Metadata of %s not updated: %s", executable, error)
+        return
+    _cache[executable] = entry
+    if callback is not None:
+        callback(entry['info'])
+
+
+def load_env_list(kind):
+    """
+    Return the environments of kind (e.g. 'conda') saved by save_env_list,
+    without the ones that were removed since then.
+    """
+    modules_db = PickleShareDB(get_conf_path('db'))
+    env_list = modules_db.get('env_list/' + kind, {})
+    return {name: (path, version)
+            for name, (path, version) in env_list.items()
+            if osp.isfile(path)}
+
+
+def save_env_list(kind, env_list):
+    """Save the environments of kind, to know them at startup."""
+    modules_db = PickleShareDB(get_conf_path('db'))
+    if modules_db.get('env_list/' + kind) != env_list:
+        modules_db['env_list/' + kind] = env_list
@@ -11,13 +11,23 @@
 Module completion auxiliary functions.
 """
 
+import bisect
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import os.path as osp
 import pkgutil
+import re
 
 from pickleshare import PickleShareDB
 
 from spyder.config.base import get_conf_path
 
 
+logger = logging.getLogger(__name__)
+
 # List of preferred modules
 PREFERRED_MODULES = ['numpy', 'scipy', 'sympy', 'pandas', 'networkx',
                      'statsmodels', 'matplotlib', 'sklearn', 'skimage',
@@ -30,24 +40,46 @@
                      'zlib', 'pytest', 'PyQt4', 'PyQt5', 'PySide',
                      'PySide2', 'os.path']
 
+# Code run by interpreters to know where their modules are
+INTERPRETER_INFO_CODE = ("import json, sys; "
+                         "print(json.dumps([sys.path, "
+                         "list(sys.builtin_module_names)]))")
+
+MODULE_NAME_REGEX = re.compile(r'^[^\W\d]\w*$', re.UNICODE)
+
+# Module indexes by interpreter
+_module_indexes = {}
+
+
+def find_modules(path, prefix=''):
+    """
+    Return the names of the modules in path and in its packages, without
+    importing them.
+    """
+    names = []
+    for __, name, ispkg in pkgutil.iter_modules([path]):
+        if not MODULE_NAME_REGEX.match(name):
+            continue
+        names.append(prefix + name)
+        if ispkg:
+            names.extend(find_modules(osp.join(path, name),
+                                      prefix + name + '.'))
+    return names
+
 
 def get_submodules(mod):
     """Get all submodules of a given module"""
-    def catch_exceptions(module):
-        pass
     try:
-        m = __import__(mod)
-        submodules = [mod]
-        submods = pkgutil.walk_packages(m.__path__, m.__name__ + '.',
-                                        catch_exceptions)
-        for sm in submods:
-            sm_name = sm[1]
-            submodules.append(sm_name)
-    except ImportError:
+        # This only imports the parent packages of mod
+        spec = importlib.util.find_spec(mod)
+    except Exception:
+        return []
+    if spec is None:
         return []
-    except:
-        return [mod]
 
+    submodules = [mod]
+    for path in spec.submodule_search_locations or []:
+        submodules.extend(find_modules(path, mod + '.'))
     return submodules
 
 
@@ -73,3 +105,169 @@ def get_preferred_submodules():
 
     modules_db['submodules'] = submodules
     return submodules
+
+
+def get_interpreter_sys_path(executable, db_path=None):
+    """
+    Return the sys.path and the builtin modules of an interpreter.
+
+    They're taken from its saved metadata if it's up to date, to not run
+    it again.
+    """
+    from spyder.utils.interpreters import get_cached_interpreter_info
+    from spyder.utils.programs import run_program
+
+    info = get_cached_interpreter_info(executable, db_path)
+    if info is not None and 'sys_path' in info:
+        return [info['sys_path'], info['builtin_modules']]
+
+    process = run_program(executable, ['-c', INTERPRETER_INFO_CODE])
+    output, __ = process.communicate()
+    return json.loads(output.decode('utf-8'))
+
+
+def update_module_index(executable, db_path):
+    """
+    Update the index of the modules of an interpreter saved in the modules
+    database at db_path, and return their sorted names.
+
+    Only the directories of its sys.path that changed (i.e. whose mtime
+    changed) since the last update are scanned. No module is imported,
+    so this can be run in a background process.
+    """
+    modules_db = PickleShareDB(db_path)
+    key = get_module_index_key(executable)
+    index = modules_db.get(key, {})
+    sys_path, builtin_modules = get_interpreter_sys_path(executable,
+                                                         db_path)
+
+    new_index = {}
+    for path in sys_path:
+        # The working directory changes, so it's not indexed
+        if not path or path in new_index:
+            continue
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        entry = index.get(path)
+        if entry is None or entry[0] != mtime:
+            entry = (mtime, find_modules(path))
+        new_index[path] = entry
+
+    if new_index != index:
+        modules_db[key] = new_index
+
+    names = set(builtin_modules)
+    for __, modules in new_index.values():
+        names.update(modules)
+    return sorted(names)
+
+
+def get_module_index_key(executable):
+    """Return the key of the index of an interpreter in the modules db."""
+    digest = hashlib.md5(executable.encode('utf-8')).hexdigest()
+    return 'module_index/' + digest
+
+
+def get_main_interpreter():
+    """Return the interpreter used by the consoles and the editor."""
+    from spyder.config.manager import CONF
+    from spyder.utils.misc import get_python_executable
+
+    if CONF.get('main_interpreter', 'default'):
+        return get_python_executable()
+    return (CONF.get('main_interpreter', 'executable') or
+            get_python_executable())
+
+
+def get_module_index(executable=None, update=False):
+    """
+    Return the module index of an interpreter (the main one by default).
+
+    It's updated when it's created or if update is True, e.g. because
+    packages could have been installed since then.
+    """
+    if executable is None:
+        executable = get_main_interpreter()
+    index = _module_indexes.get(executable)
+    if index is None:
+        index = _module_indexes[executable] = ModuleIndex(executable)
+        update = True
+    if update:
+        index.update()
+    return index
+
+
+class ModuleIndex(object):
+    """
+    Names of the modules that can be imported by an interpreter, to
+    complete imports without looking for or importing them.
+
+    It's saved in the modules database and updated in a background
+    process, which only scans the directories that changed.
+    """
+
+    def __init__(self, executable):
+        self.executable = executable
+        self.modules = []
+        self.ready = False
+        self._updating = False
+        self._callbacks = []
+
+    def update(self):
+        """Update the index in the background."""
+        from spyder.utils.executor import PRIORITY_BACKGROUND, get_executor
+
+        executor = get_executor()
+        task = executor.create_task(
+            update_module_index, self.executable, get_conf_path('db'),
+            priority=PRIORITY_BACKGROUND,
+            key=('module_index', self.executable), process=True)
+        task.sig_finished.connect(self._updated)
+        self._updating = True
+        executor.start(task)
+
+    def call_when_ready(self, callback):
+        """
+        Call callback with the module names once the index is up to date,
+        i.e. now or after the update in progress (if any).
+
+        The names are an empty list if the update failed.
+        """
+        if self.ready and not self._updating:
+            callback(self.modules)
+        else:
+            self._callbacks.append(callback)
+
+    def get_completions(self, name):
+        """
+        Return the names of the modules that complete a (dotted) module
+        name, i.e. the ones in its package that start with its last part.
+        """
+        modules = self.modules
+        depth = name.count('.')
+        completions = []
+        for position in range(bisect.bisect_left(modules, name),
+                              len(modules)):
+            module = modules[position]
+            if not module.startswith(name):
+                break
+            if module.count('.') == depth:
+                completions.append(module)
+        return completions
+
+    # ---- Private API
+    def _updated(self, task, modules, error):
+        """Use the modules found by update."""
+        self._updating = False
+        if error is None:
+            self.modules = modules
+            self.ready = True
+        else:
+            logger.debug("Module index of %s not updated: %s",
+                         self.executable, error)
+            modules = []
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(modules)
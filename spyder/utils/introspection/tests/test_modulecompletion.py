@@ -9,6 +9,7 @@
 """
 
 # Stdlib imports
+import os
 import sys
 
 # Test library imports
@@ -16,7 +17,11 @@
 
 # Local imports
 from spyder.py3compat import PY3
-from spyder.utils.introspection.module_completion import get_preferred_submodules
+from spyder.utils import interpreters, programs
+from spyder.utils.introspection import module_completion
+from spyder.utils.introspection.module_completion import (
+    ModuleIndex, find_modules, get_interpreter_sys_path,
+    get_preferred_submodules, update_module_index)
 
 
 @pytest.mark.skipif(sys.platform == 'darwin' and PY3,
@@ -26,5 +31,97 @@ def test_module_completion():
     assert 'numpy.linalg' in get_preferred_submodules()
 
 
+def test_update_module_index(tmpdir, monkeypatch):
+    """Test that only the directories that changed are scanned again."""
+    site = tmpdir.mkdir('site')
+    site.join('mod.py').write('raise ImportError')
+    package = site.mkdir('pkg')
+    package.join('__init__.py').write('raise ImportError')
+    package.join('sub.py').write('')
+    monkeypatch.setattr(module_completion, 'get_interpreter_sys_path',
+                        lambda executable, db_path: [['', str(site)],
+                                                     ['sys']])
+    db_path = str(tmpdir.join('db'))
+
+    assert find_modules(str(site)) == ['mod', 'pkg', 'pkg.sub']
+    assert update_module_index('python', db_path) == [
+        'mod', 'pkg', 'pkg.sub', 'sys']
+
+    scanned = []
+
+    def find_modules_spy(path, prefix=''):
+        scanned.append(path)
+        return find_modules(path, prefix)
+
+    monkeypatch.setattr(module_completion, 'find_modules', find_modules_spy)
+    update_module_index('python', db_path)
+    assert scanned == []
+
+    site.join('new.py').write('')
+    os.utime(str(site), (0, 0))
+    assert 'new' in update_module_index('python', db_path)
+    assert scanned[0] == str(site)
+
+
+def test_module_index_completions():
+    """Test the completions of the module index."""
+    index = ModuleIndex('python')
+    index.modules = ['numpy', 'numpy.linalg', 'numpy.linalg.linalg',
+                     'numpy.lib', 'os', 'os.path']
+    index.modules.sort()
+    assert index.get_completions('') == ['numpy', 'os']
+    assert index.get_completions('nu') == ['numpy']
+    assert index.get_completions('numpy.li') == ['numpy.lib', 'numpy.linalg']
+    assert index.get_completions('numpy.linalg.') == ['numpy.linalg.linalg']
+    assert index.get_completions('sys') == []
+
+
+def test_module_index_call_when_ready(mocker):
+    """
+    Test that callbacks wait for the update in progress and are called
+    even if it fails.
+    """
+    mocker.patch('spyder.utils.executor.get_executor')
+    index = ModuleIndex('python')
+    calls = []
+
+    index.update()
+    index.call_when_ready(calls.append)
+    assert calls == []
+    index._updated(None, ['os', 'sys'], None)
+    assert calls == [['os', 'sys']]
+
+    # The old modules are not used while a rescan is running
+    index.update()
+    index.call_when_ready(calls.append)
+    assert len(calls) == 1
+    index._updated(None, None, OSError())
+    assert calls[1] == []
+    assert index.modules == ['os', 'sys']
+
+    index.call_when_ready(calls.append)
+    assert calls[2] == ['os', 'sys']
+
+
+def test_interpreter_sys_path(tmpdir, monkeypatch):
+    """Test that the saved metadata of interpreters is used if possible."""
+    db_path = str(tmpdir.join('db'))
+    monkeypatch.setattr(interpreters, '_cache', {})
+    sys_path, builtin_modules = get_interpreter_sys_path(sys.executable,
+                                                         db_path)
+    assert 'sys' in builtin_modules
+
+    info = interpreters.update_interpreter_info(sys.executable,
+                                                db_path)['info']
+    monkeypatch.setattr(interpreters, '_cache', {})
+
+    def run_program(*args, **kwargs):
+        raise AssertionError("The interpreter was run")
+
+    monkeypatch.setattr(programs, 'run_program', run_program)
+    assert get_interpreter_sys_path(sys.executable, db_path) == [
+        info['sys_path'], info['builtin_modules']]
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -26,7 +26,6 @@
 import time
 
 # Third party imports
-import pkg_resources
 import psutil
 
 # Local imports
@@ -868,9 +867,18 @@ def get_package_version(package_name):
     # When support for Python 3.7 and below is dropped, this can be replaced
     # with the built-in importlib.metadata.version
     try:
-        ver = pkg_resources.get_distribution(package_name).version
-        return ver
-    except pkg_resources.DistributionNotFound:
+        from importlib import metadata
+    except ImportError:
+        # Importing pkg_resources is slow, so it's only done if needed
+        import pkg_resources
+        try:
+            return pkg_resources.get_distribution(package_name).version
+        except pkg_resources.DistributionNotFound:
+            return None
+
+    try:
+        return metadata.version(package_name)
+    except metadata.PackageNotFoundError:
         return None
 
 
@@ -889,7 +897,26 @@ def is_module_installed(module_name, version=None, interpreter=None):
     given ``version`` in the ``interpreter``'s environment. Otherwise checks
     in Spyder's environment.
     """
-    if interpreter is not None:
+    from spyder.utils import interpreters
+
+    if (interpreter is not None and
+            module_name in interpreters.KEY_MODULES):
+        # The versions of these modules are saved by interpreter, so it's
+        # only run if it changed since they were saved.
+        info = interpreters.get_cached_interpreter_info(interpreter)
+        if info is None and is_python_interpreter(interpreter):
+            try:
+                entry = interpreters.update_interpreter_info(interpreter)
+                info = entry['info']
+            except Exception:
+                return False
+        if info is None:
+            # Try to not take a wrong decision if interpreter check fails
+            return True
+        if module_name not in info['modules']:
+            return False
+        module_version = info['modules'][module_name]
+    elif interpreter is not None:
         if is_python_interpreter(interpreter):
             cmd = dedent("""
                 try:
@@ -936,23 +963,33 @@ def is_module_installed(module_name, version=None, interpreter=None):
     if version is None:
         return True
     else:
-        if ';' in version:
-            versions = version.split(';')
-        else:
-            versions = [version]
-
-        output = True
-        for _ver in versions:
-            match = re.search(r'[0-9]', _ver)
-            assert match is not None, "Invalid version number"
-            symb = _ver[:match.start()]
-            if not symb:
-                symb = '='
-            assert symb in ('>=', '>', '=', '<', '<='),\
-                "Invalid version condition '%s'" % symb
-            ver = _ver[match.start():]
-            output = output and check_version(module_version, ver, symb)
-        return output
+        return check_version_requirements(module_version, version)
+
+
+def check_version_requirements(actver, version):
+    """
+    Check that the version of a module satisfies a requirement.
+
+    version may start with =, >=, > or < to specify the exact requirement ;
+    multiple conditions may be separated by ';' (e.g. '>=0.13;<1.0')
+    """
+    if ';' in version:
+        versions = version.split(';')
+    else:
+        versions = [version]
+
+    output = True
+    for _ver in versions:
+        match = re.search(r'[0-9]', _ver)
+        assert match is not None, "Invalid version number"
+        symb = _ver[:match.start()]
+        if not symb:
+            symb = '='
+        assert symb in ('>=', '>', '=', '<', '<='),\
+            "Invalid version condition '%s'" % symb
+        ver = _ver[match.start():]
+        output = output and check_version(actver, ver, symb)
+    return output
 
 
 def is_python_interpreter_valid_name(filename):
@@ -1051,8 +1088,13 @@ def is_spyder_process(pid):
         return False
 
 
-def get_interpreter_info(path):
+def get_interpreter_version(path):
     """Return version information of the selected Python interpreter."""
+    from spyder.utils import interpreters
+
+    info = interpreters.get_cached_interpreter_info(path)
+    if info is not None:
+        return info['version']
     try:
         out, __ = run_program(path, ['-V']).communicate()
         out = out.decode()
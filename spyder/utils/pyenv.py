@@ -12,6 +12,7 @@
 import os.path as osp
 
 from spyder.config.base import get_home_dir, running_in_mac_app
+from spyder.utils.interpreters import load_env_list, save_env_list
 from spyder.utils.programs import find_program, run_shell_command
 
 
@@ -57,9 +58,19 @@ def get_list_pyenv_envs():
         env_list[name] = (path, version)
 
     PYENV_ENV_LIST_CACHE = env_list
+    save_env_list('pyenv', env_list)
     return env_list
 
 
 def get_list_pyenv_envs_cache():
-    """Return a cache of envs to avoid computing them again."""
+    """
+    Return a cache of envs to avoid computing them again.
+
+    Before they are computed, the ones found by the last session are
+    returned.
+    """
+    global PYENV_ENV_LIST_CACHE
+
+    if not PYENV_ENV_LIST_CACHE:
+        PYENV_ENV_LIST_CACHE = load_env_list('pyenv')
     return PYENV_ENV_LIST_CACHE
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Disk-backed ring buffer for console output.
+
+Consoles only keep a bounded number of lines in their widgets, so printing
+lots of lines doesn't make them unresponsive. All their output is also
+appended to this buffer, which stores lines in a temporary file and only
+their offsets in memory, so it can be scrolled and searched on demand.
+"""
+
+# Standard library imports
+from array import array
+import re
+import shutil
+import tempfile
+
+
+# Maximum number of lines kept in the buffer
+MAX_LINES = 1000000
+
+# Minimum size of dropped lines at the start of the file to compact it
+COMPACT_MIN_BYTES = 1024 * 1024
+
+# Number of lines read at once when searching
+SEARCH_CHUNK_LINES = 4096
+
+
+class ScrollbackBuffer(object):
+    """Ring buffer of text lines stored in a temporary file."""
+
+    def __init__(self, max_lines=MAX_LINES):
+        self.max_lines = max_lines
+        self.dropped = 0
+        self._file = None
+        # Offsets of lines, counted from the start of the output, not of
+        # the file, which drops lines when it's compacted.
+        self._offsets = array('q')
+        self._first = 0
+        self._base = 0
+        self._end = 0
+        self._partial = ''
+
+    def __len__(self):
+        """Number of lines, including the last one if it's not finished."""
+        return len(self._offsets) - self._first + (1 if self._partial else 0)
+
+    def append(self, text):
+        """Append text, dropping the oldest lines if needed."""
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        if not lines:
+            return
+
+        excess = len(lines) - self.max_lines
+        if excess > 0:
+            self.dropped += excess
+            lines = lines[excess:]
+
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix='spyder-scrollback-')
+        data = []
+        offset = self._end
+        for line in lines:
+            encoded = line.encode('utf-8', 'replace') + b'\n'
+            self._offsets.append(offset)
+            offset += len(encoded)
+            data.append(encoded)
+        self._file.seek(self._end - self._base)
+        self._file.write(b''.join(data))
+        self._end = offset
+
+        excess = len(self._offsets) - self._first - self.max_lines
+        if excess > 0:
+            self.dropped += excess
+            self._first += excess
+            self._compact()
+
+    def get_lines(self, start, stop):
+        """Return the lines from start to stop (not included)."""
+        complete = len(self._offsets) - self._first
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+
+        lines = []
+        if start < complete:
+            begin = self._offsets[self._first + start]
+            if stop < complete:
+                end = self._offsets[self._first + stop]
+            else:
+                end = self._end
+            self._file.seek(begin - self._base)
+            data = self._file.read(end - begin)
+            lines = data.decode('utf-8', 'replace').split('\n')[:-1]
+        if stop > complete:
+            lines.append(self._partial)
+        return lines
+
+    def find(self, text, start=0, case=False, regexp=False):
+        """
+        Return the index of the first line from start that contains text,
+        or -1 if no line does.
+        """
+        if not regexp:
+            text = re.escape(text)
+        pattern = re.compile(text, 0 if case else re.IGNORECASE)
+        count = len(self)
+        for chunk_start in range(max(start, 0), count, SEARCH_CHUNK_LINES):
+            lines = self.get_lines(chunk_start,
+                                   chunk_start + SEARCH_CHUNK_LINES)
+            for index, line in enumerate(lines):
+                if pattern.search(line):
+                    return chunk_start + index
+        return -1
+
+    def clear(self):
+        """Remove all lines and the temporary file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.dropped = 0
+        self._offsets = array('q')
+        self._first = 0
+        self._base = 0
+        self._end = 0
+        self._partial = ''
+
+    def close(self):
+        """
+        Close and remove the temporary file.
+
+        Its lines are removed too, so the buffer can still be used after
+        closing it.
+        """
+        self.clear()
+
+    def _compact(self):
+        """Remove dropped lines from the file and the offsets."""
+        if self._first > len(self._offsets) // 2:
+            del self._offsets[:self._first]
+            self._first = 0
+
+        start = self._offsets[self._first] if self._offsets else self._end
+        dead = start - self._base
+        if dead > COMPACT_MIN_BYTES and dead > (self._end - self._base) // 2:
+            new_file = tempfile.TemporaryFile(prefix='spyder-scrollback-')
+            self._file.seek(dead)
+            shutil.copyfileobj(self._file, new_file)
+            self._file.close()
+            self._file = new_file
+            self._base = start
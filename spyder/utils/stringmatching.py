@@ -8,6 +8,7 @@
 String search and match utilities usefull when filtering a list of texts.
 """
 
+import heapq
 import re
 
 from spyder.py3compat import to_text_string
@@ -15,6 +16,11 @@
 NOT_FOUND_SCORE = -1
 NO_SCORE = 0
 
+# Scores of fuzzy matches (lower scores imply a better match)
+INSIDE_WORD_SCORE = 100
+SCATTERED_SCORE = 1000
+GROUP_SCORE = 100
+
 
 def get_search_regex(query, ignore_case=True):
     """Returns a compiled regex pattern to search for query letters in order.
@@ -235,6 +241,164 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     return results
 
 
+def get_fuzzy_score(query, text):
+    """
+    Return the score of the letters of query found in order in text, or None
+    if they aren't found. Lower scores imply a better match.
+
+    Both query and text must be lowercase, and query must not be empty.
+
+    Notes
+    -----
+    The score is given according the following precedence (high to low):
+
+    - Query found at the start of a word. Example: 'up' in 'up stroke'
+    - Query found inside a word. Example: 'st' in 'upstream'
+    - Letters found in less groups and closer to each other.
+      Example: 'cls' in 'close' before 'cls' in 'car lost'
+    """
+    pos = text.find(query)
+    if pos != -1:
+        if pos and text[pos - 1].isalnum():
+            return INSIDE_WORD_SCORE + pos
+        return pos
+
+    find = text.find
+    first = last = find(query[0])
+    if first == -1:
+        return None
+    groups = 1
+    for char in query[1:]:
+        pos = find(char, last + 1)
+        if pos == -1:
+            return None
+        if pos != last + 1:
+            groups += 1
+        last = pos
+    return SCATTERED_SCORE + GROUP_SCORE * groups + last - first
+
+
+def get_fuzzy_positions(query, text):
+    """
+    Return the positions of the letters of query found by get_fuzzy_score
+    in text, or None if they aren't found.
+
+    The search is case insensitive.
+    """
+    query = query.lower()
+    text = text.lower()
+    if not query:
+        return []
+    pos = text.find(query)
+    if pos != -1:
+        return list(range(pos, pos + len(query)))
+    positions = []
+    pos = -1
+    for char in query:
+        pos = text.find(char, pos + 1)
+        if pos == -1:
+            return None
+        positions.append(pos)
+    return positions
+
+
+def get_fuzzy_rich_text(query, text, template='<b>{}</b>'):
+    """Return text with the letters of query found in it in template."""
+    positions = get_fuzzy_positions(query, text)
+    if not positions:
+        return text
+    # Consecutive letters are highlighted together
+    groups = []
+    for pos in positions:
+        if groups and groups[-1][1] == pos:
+            groups[-1][1] = pos + 1
+        else:
+            groups.append([pos, pos + 1])
+    parts = []
+    last = 0
+    for start, end in groups:
+        parts.append(text[last:start])
+        parts.append(template.format(text[start:end]))
+        last = end
+    parts.append(text[last:])
+    return u''.join(parts)
+
+
+class FuzzyFilter(object):
+    """
+    Filter a list of choices with queries whose letters must be found in
+    order in them.
+
+    When a query extends the previous one, only the choices that matched
+    the previous one are scored, since the others can't match. When only
+    the best matches are needed, choices are only scored if there aren't
+    enough of them that start with or contain the query.
+    """
+
+    def __init__(self, choices):
+        self.choices = choices
+        self._lower = [to_text_string(choice).lower() for choice in choices]
+        # Strings where the query is first looked for
+        self._keys = self._lower
+        self._query = None
+        self._candidates = None
+
+    def filter(self, query, limit=None):
+        """
+        Return the (index, score) of the choices that match query, sorted
+        from the best to the worst match.
+
+        Spaces in query are ignored and, if limit is given, only the best
+        limit matches are returned.
+        """
+        query = to_text_string(query).replace(' ', '').lower()
+        if not query:
+            matches = [(index, NO_SCORE) for index in range(len(self.choices))]
+            return matches[:limit] if limit is not None else matches
+
+        if self._query is not None and query.startswith(self._query):
+            candidates = self._candidates
+        else:
+            candidates = range(len(self.choices))
+
+        score = self.get_score
+        key = lambda match: (match[1], match[0])
+        if limit is not None:
+            # The candidates are kept as they are, since they are still
+            # valid for queries that extend this one
+            keys = self._keys
+            matches = [(index, NO_SCORE) for index in candidates
+                       if keys[index].startswith(query)]
+            if len(matches) >= limit:
+                return matches[:limit]
+            contained = [index for index in candidates
+                         if query in keys[index]]
+            if len(contained) >= limit:
+                return heapq.nsmallest(
+                    limit, [(index, score(query, index))
+                            for index in contained], key=key)
+
+        # Skipping the letters different from the next one is faster than
+        # a lazy match of any letter
+        pattern = re.escape(query[0]) + u''.join(
+            u'[^{0}]*{1}'.format(re.escape(previous), re.escape(char))
+            for previous, char in zip(query, query[1:]))
+        search = re.compile(pattern).search
+        lower = self._lower
+        candidates = [index for index in candidates if search(lower[index])]
+        self._query = query
+        self._candidates = candidates
+
+        matches = [(index, score(query, index)) for index in candidates]
+        if limit is not None:
+            return heapq.nsmallest(limit, matches, key=key)
+        return sorted(matches, key=key)
+
+    def get_score(self, query, index):
+        """Return the score of the choice at index for a lowercase query."""
+        return get_fuzzy_score(query, self._lower[index])
+
+
 def test():
     template = '<b>{0}</b>'
     names = ['close pane', 'debug continue', 'debug exit', 'debug step into',
@@ -14,11 +14,11 @@
 import keyword
 import os
 import re
+import time
 import weakref
 
 # Third party imports
 from pygments.lexer import RegexLexer, bygroups
-from pygments.lexers import get_lexer_by_name
 from pygments.token import (Text, Other, Keyword, Name, String, Number,
                             Comment, Generic, Token)
 from qtpy.QtCore import Qt, QTimer, Signal
@@ -34,9 +34,12 @@
 from spyder.plugins.editor.utils.languages import CELL_LANGUAGES
 from spyder.plugins.editor.utils.editor import TextBlockHelper as tbh
 from spyder.plugins.editor.utils.editor import BlockUserData
+from spyder.plugins.editor.utils.findtasks import find_line_task
+from spyder.utils.executor import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
 from spyder.utils.workers import WorkerManager
 from spyder.plugins.outlineexplorer.api import OutlineExplorerData
 from spyder.utils.qstringhelpers import qstring_length
+from spyder.utils.tokenspans import TokenSpans
 
 
 
@@ -174,6 +177,29 @@ def create_patterns(patterns, compile=False):
                                                        compile=True))
 
 
+class LazyPattern(object):
+    """
+    Regular expression compiled the first time it's used.
+
+    Compiling the patterns of all the syntax highlighters when this module
+    is imported slows down Spyder's startup. `make_pattern(*args, **kwargs)`
+    returns the pattern and `flags` are the flags to compile it.
+    """
+
+    def __init__(self, make_pattern, *args, **kwargs):
+        self.flags = kwargs.pop('flags', 0)
+        self._make_pattern = make_pattern
+        self._args = args
+        self._kwargs = kwargs
+        self._regex = None
+
+    def __get__(self, instance, owner):
+        if self._regex is None:
+            self._regex = re.compile(
+                self._make_pattern(*self._args, **self._kwargs), self.flags)
+        return self._regex
+
+
 #==============================================================================
 # Syntax highlighting color schemes
 #==============================================================================
@@ -186,6 +212,9 @@ class BaseSH(QSyntaxHighlighter):
     NORMAL = 0
     # Syntax highlighting parameters.
     BLANK_ALPHA_FACTOR = 0.31
+    # Whether tasks (TODO, FIXME, ...) in comments are found while
+    # highlighting
+    TASKS_IN_COMMENTS = False
 
     sig_outline_explorer_data_changed = Signal()
     # Signal to advertise a new cell
@@ -216,6 +245,10 @@ def __init__(self, parent, font=None, color_scheme='Spyder'):
         self.editor = None
         self.patterns = DEFAULT_COMPILED_PATTERNS
 
+        # Time spent highlighting each block, by block number, if enabled
+        # with set_block_timing
+        self.block_timings = None
+
     def get_background_color(self):
         return QColor(self.background_color)
 
@@ -317,7 +350,13 @@ def highlightBlock(self, text):
 
         :param text: text to highlight.
         """
-        self.highlight_block(text)
+        if self.block_timings is None:
+            self.highlight_block(text)
+        else:
+            start = time.perf_counter()
+            self.highlight_block(text)
+            self.block_timings[self.currentBlock().blockNumber()] = (
+                time.perf_counter() - start)
 
     def highlight_block(self, text):
         """
@@ -386,6 +425,21 @@ def rehighlight(self):
         QSyntaxHighlighter.rehighlight(self)
         QApplication.restoreOverrideCursor()
 
+    def set_block_timing(self, enabled):
+        """
+        Enable or disable recording the time spent highlighting each block.
+
+        This is a debugging aid to find lines that are slow to highlight.
+        """
+        self.block_timings = {} if enabled else None
+
+    def get_slowest_blocks(self, count=10):
+        """Return the (block number, seconds) of the slowest blocks."""
+        if not self.block_timings:
+            return []
+        return sorted(self.block_timings.items(), key=lambda item: item[1],
+                      reverse=True)[:count]
+
 
 class TextSH(BaseSH):
     """Simple Text Syntax Highlighter Class (only highlight spaces)."""
@@ -513,7 +567,8 @@ class PythonSH(BaseSH):
     """Python Syntax Highlighter"""
     # Syntax highlighting rules:
     add_kw = ['async', 'await']
-    PROG = re.compile(make_python_patterns(additional_keywords=add_kw), re.S)
+    PROG = LazyPattern(make_python_patterns, additional_keywords=add_kw,
+                       flags=re.S)
     IDPROG = re.compile(r"\s+(\w+)", re.S)
     ASPROG = re.compile(r"\b(as)\b")
     # Syntax highlighting states (from one text block to another):
@@ -522,6 +577,7 @@ class PythonSH(BaseSH):
      INSIDE_NON_MULTILINE_STRING) = list(range(6))
     DEF_TYPES = {"def": OutlineExplorerData.FUNCTION,
                  "class": OutlineExplorerData.CLASS}
+    TASKS_IN_COMMENTS = True
     # Comments suitable for Outline Explorer
     OECOMMENT = re.compile(r'^(# ?--[-]+|##[#]+ )[ -]*[^- ]+')
 
@@ -642,6 +698,7 @@ def highlight_block(self, text):
 
         oedata = None
         import_stmt = None
+        comment = None
 
         self.setFormat(0, qstring_length(text), self.formats["normal"])
 
@@ -650,6 +707,8 @@ def highlight_block(self, text):
         while match:
             for key, value in list(match.groupdict().items()):
                 if value:
+                    if key == "comment":
+                        comment = value
                     state, import_stmt, oedata = self.highlight_match(
                         text, match, key, value, offset,
                         state, import_stmt, oedata)
@@ -676,7 +735,13 @@ def highlight_block(self, text):
         block = self.currentBlock()
         data = block.userData()
 
-        need_data = (oedata or import_stmt)
+        # Only the blocks that change are highlighted again, so this keeps
+        # tasks up to date without scanning the whole file
+        todo = ''
+        if comment and (self.editor is None or self.editor.todo_enabled):
+            todo = find_line_task(comment)
+
+        need_data = (oedata or import_stmt or todo)
 
         if need_data and not data:
             data = BlockUserData(self.editor)
@@ -693,6 +758,9 @@ def highlight_block(self, text):
         if (import_stmt) or (data and data.import_statement):
             data.import_statement = import_stmt
 
+        if data:
+            data.todo = todo
+
         block.setUserData(data)
 
     def get_import_statements(self):
@@ -716,7 +784,8 @@ def rehighlight(self):
 class IPythonSH(PythonSH):
     """IPython Syntax Highlighter"""
     add_kw = ['async', 'await']
-    PROG = re.compile(make_ipython_patterns(additional_keywords=add_kw), re.S)
+    PROG = LazyPattern(make_ipython_patterns, additional_keywords=add_kw,
+                       flags=re.S)
 
 
 #==============================================================================
@@ -733,8 +802,8 @@ class CythonSH(PythonSH):
 
     ADDITIONAL_BUILTINS = C_TYPES.split() + [
         "array", "bint", "Py_ssize_t", "intern", "reload", "sizeof", "NULL"]
-    PROG = re.compile(make_python_patterns(ADDITIONAL_KEYWORDS,
-                                           ADDITIONAL_BUILTINS), re.S)
+    PROG = LazyPattern(make_python_patterns, ADDITIONAL_KEYWORDS,
+                       ADDITIONAL_BUILTINS, flags=re.S)
     IDPROG = re.compile(r"\s+([\w\.]+)", re.S)
 
 
@@ -746,8 +815,8 @@ class EnamlSH(PythonSH):
     ADDITIONAL_KEYWORDS = ["enamldef", "template", "attr", "event", "const", "alias",
                            "func"]
     ADDITIONAL_BUILTINS = []
-    PROG = re.compile(make_python_patterns(ADDITIONAL_KEYWORDS,
-                                           ADDITIONAL_BUILTINS), re.S)
+    PROG = LazyPattern(make_python_patterns, ADDITIONAL_KEYWORDS,
+                       ADDITIONAL_BUILTINS, flags=re.S)
     IDPROG = re.compile(r"\s+([\w\.]+)", re.S)
 
 
@@ -788,7 +857,7 @@ def make_cpp_patterns():
 class CppSH(BaseSH):
     """C/C++ Syntax Highlighter"""
     # Syntax highlighting rules:
-    PROG = re.compile(make_cpp_patterns(), re.S)
+    PROG = LazyPattern(make_cpp_patterns, flags=re.S)
     # Syntax highlighting states (from one text block to another):
     NORMAL = 0
     INSIDE_COMMENT = 1
@@ -849,7 +918,7 @@ def make_opencl_patterns():
 
 class OpenCLSH(CppSH):
     """OpenCL Syntax Highlighter"""
-    PROG = re.compile(make_opencl_patterns(), re.S)
+    PROG = LazyPattern(make_opencl_patterns, flags=re.S)
 
 
 #==============================================================================
@@ -876,7 +945,7 @@ def make_fortran_patterns():
 class FortranSH(BaseSH):
     """Fortran Syntax Highlighter"""
     # Syntax highlighting rules:
-    PROG = re.compile(make_fortran_patterns(), re.S|re.I)
+    PROG = LazyPattern(make_fortran_patterns, flags=re.S|re.I)
     IDPROG = re.compile(r"\s+(\w+)", re.S)
     # Syntax highlighting states (from one text block to another):
     NORMAL = 0
@@ -949,7 +1018,7 @@ def make_idl_patterns():
 
 class IdlSH(GenericSH):
     """IDL Syntax Highlighter"""
-    PROG = re.compile(make_idl_patterns(), re.S|re.I)
+    PROG = LazyPattern(make_idl_patterns, flags=re.S|re.I)
 
 
 #==============================================================================
@@ -992,7 +1061,7 @@ def make_nsis_patterns():
 class NsisSH(CppSH):
     """NSIS Syntax Highlighter"""
     # Syntax highlighting rules:
-    PROG = re.compile(make_nsis_patterns(), re.S)
+    PROG = LazyPattern(make_nsis_patterns, flags=re.S)
 
 
 #==============================================================================
@@ -1018,7 +1087,7 @@ def make_gettext_patterns():
 class GetTextSH(GenericSH):
     """gettext Syntax Highlighter"""
     # Syntax highlighting rules:
-    PROG = re.compile(make_gettext_patterns(), re.S)
+    PROG = LazyPattern(make_gettext_patterns, flags=re.S)
 
 #==============================================================================
 # yaml highlighter
@@ -1041,7 +1110,7 @@ def make_yaml_patterns():
 class YamlSH(GenericSH):
     """yaml Syntax Highlighter"""
     # Syntax highlighting rules:
-    PROG = re.compile(make_yaml_patterns(), re.S)
+    PROG = LazyPattern(make_yaml_patterns, flags=re.S)
 
 
 #==============================================================================
@@ -1119,7 +1188,7 @@ def make_html_patterns():
 
 class HtmlSH(BaseWebSH):
     """HTML Syntax Highlighter"""
-    PROG = re.compile(make_html_patterns(), re.S)
+    PROG = LazyPattern(make_html_patterns, flags=re.S)
 
 
 # =============================================================================
@@ -1175,11 +1244,11 @@ def make_md_patterns():
 class MarkdownSH(BaseSH):
     """Markdown Syntax Highlighter"""
     # Syntax highlighting rules:
-    PROG = re.compile(make_md_patterns(), re.S)
+    PROG = LazyPattern(make_md_patterns, flags=re.S)
     NORMAL = 0
     CODE = 1
 
-    def highlightBlock(self, text):
+    def highlight_block(self, text):
         text = to_text_string(text)
         previous_state = self.previousBlockState()
 
@@ -1262,6 +1331,11 @@ def setup_formats(self, font=None):
 # highlighter based on PygmentsSH would be 2 to 3 times slower than the
 # current native PythonSH syntax highlighter.
 
+# Time (in ms) without changes after which the format spans found by parsing
+# only the blocks around changes are checked by parsing the whole text
+PYGMENTS_CHECK_DELAY = 2000
+
+
 class PygmentsSH(BaseSH):
     """Generic Pygments syntax highlighter."""
     # Store the language name and a ref to the lexer
@@ -1284,6 +1358,8 @@ def __init__(self, parent, font=None, color_scheme=None):
                         Number: "number"}
         # Load Pygments' Lexer
         if self._lang_name is not None:
+            # Leave this import here to keep startup process fast
+            from pygments.lexers import get_lexer_by_name
             self._lexer = get_lexer_by_name(self._lang_name)
 
         BaseSH.__init__(self, parent, font, color_scheme)
@@ -1292,82 +1368,108 @@ def __init__(self, parent, font=None, color_scheme=None):
         # parsing
         self._worker_manager = WorkerManager()
 
-        # Store the format for all the tokens after Pygments parsing
-        self._charlist = []
+        # Store the format spans of each block after Pygments parsing
+        self._spans = TokenSpans(self._lexer, self._tokmap)
 
         # Flag variable to avoid unnecessary highlights if the worker has not
         # yet finished processing
         self._allow_highlight = True
 
-    def make_charlist(self):
-        """Parses the complete text and stores format for each character."""
+        # Check the spans when the text doesn't change for a while
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(PYGMENTS_CHECK_DELAY)
+        self._check_timer.timeout.connect(self._check_spans)
+
+    def make_charlist(self, blocking=False):
+        """
+        Parse the text and store the format spans of each block.
+
+        Only the blocks around the ones that changed since the last call are
+        parsed again if the lexer allows it, and only the blocks whose
+        formats changed are highlighted again. Parsing is done in a thread
+        unless `blocking` is True.
+        """
 
         def worker_output(worker, output, error):
             """Worker finished callback."""
-            self._charlist = output
             if error is None and output:
-                self._allow_highlight = True
-                self.rehighlight()
-            self._allow_highlight = False
+                self._set_spans(*output)
+                self._start_check()
 
+        self._check_timer.stop()
         text = to_text_string(self.document().toPlainText())
-        tokens = self._lexer.get_tokens(text)
+        if blocking:
+            self._set_spans(*self._spans.lex(text))
+            self._start_check()
+            return
 
         # Before starting a new worker process make sure to end previous
         # incarnations
         self._worker_manager.terminate_all()
 
         worker = self._worker_manager.create_python_worker(
-            self._make_charlist,
-            tokens,
-            self._tokmap,
-            self.formats,
+            self._spans.lex,
+            text,
+            priority=PRIORITY_INTERACTIVE,
         )
         worker.sig_finished.connect(worker_output)
         worker.start()
 
-    def _make_charlist(self, tokens, tokmap, formats):
-        """
-        Parses the complete text and stores format for each character.
-
-        Uses the attached lexer to parse into a list of tokens and Pygments
-        token types.  Then breaks tokens into individual letters, each with a
-        Spyder token type attached.  Stores this list as self._charlist.
+    def _start_check(self):
+        """Check the spans later if they were found incrementally."""
+        if self._spans.partial:
+            self._check_timer.start()
 
-        It's attached to the contentsChange signal of the parent QTextDocument
-        so that the charlist is updated whenever the document changes.
+    def _check_spans(self):
         """
+        Parse the whole text in a thread and highlight again the blocks
+        whose formats were wrong.
+        """
+        spans = self._spans
 
-        def _get_fmt(typ):
-            """Get the Spyder format code for the given Pygments token type."""
-            # Exact matches first
-            if typ in tokmap:
-                return tokmap[typ]
-            # Partial (parent-> child) matches
-            for key, val in tokmap.items():
-                if typ in key: # Checks if typ is a subtype of key.
-                    return val
-
-            return 'normal'
+        def worker_output(worker, output, error):
+            """Worker finished callback."""
+            # Ignore the result if the text changed in the meantime
+            if error is None and output and self._spans is spans:
+                self._set_spans(*output)
 
-        charlist = []
-        for typ, token in tokens:
-            fmt = formats[_get_fmt(typ)]
-            for letter in token:
-                charlist.append((fmt, letter))
+        worker = self._worker_manager.create_python_worker(
+            spans.relex,
+            priority=PRIORITY_BACKGROUND,
+        )
+        worker.sig_finished.connect(worker_output)
+        worker.start()
 
-        return charlist
+    def _set_spans(self, spans, lines):
+        """Set the format spans and highlight the lines that changed."""
+        self._spans = spans
+        first, stop = lines
+        self._allow_highlight = True
+        if first == 0 and stop >= self.document().blockCount():
+            self.rehighlight()
+        else:
+            block = self.document().findBlockByNumber(first)
+            for __ in range(first, stop):
+                if not block.isValid():
+                    break
+                self.rehighlightBlock(block)
+                block = block.next()
+        self._allow_highlight = False
 
-    def highlightBlock(self, text):
+    def highlight_block(self, text):
         """ Actually highlight the block"""
-        # Note that an undefined blockstate is equal to -1, so the first block
-        # will have the correct behaviour of starting at 0.
         if self._allow_highlight:
-            start = self.previousBlockState() + 1
-            end = start + qstring_length(text)
-            for i, (fmt, letter) in enumerate(self._charlist[start:end]):
-                self.setFormat(i, 1, fmt)
-            self.setCurrentBlockState(end)
+            block = self.currentBlock()
+            spans = self._spans.get_spans(block.blockNumber())
+            if spans and qstring_length(text) != len(text):
+                # Qt positions count characters outside the BMP twice
+                spans = [(qstring_length(text[:start]),
+                          qstring_length(text[start:start + length]), kind)
+                         for start, length, kind in spans]
+            for start, length, kind in spans:
+                self.setFormat(start, length, self.formats[kind])
+            tbh.set_state(block, self.NORMAL)
             self.highlight_extras(text)
 
 
@@ -5,13 +5,15 @@
 
 """Tests for encodings.py"""
 
+import codecs
 import os
 import stat
 
 from flaky import flaky
 import pytest
 
-from spyder.utils.encoding import is_text_file, get_coding, write
+from spyder.utils.encoding import (is_text_file, get_coding, write, decode,
+                                   truncate_lines)
 from spyder.py3compat import to_text_string, PY2
 
 if PY2:
@@ -111,5 +113,31 @@ def test_files_encodings(expected_encoding, text_file):
         assert get_coding(text).lower() == expected_encoding.lower()
 
 
+def test_decode_utf32():
+    """Test that UTF-32 files are not decoded as UTF-16 ones."""
+    assert decode(u'abc\n'.encode('utf-32')) == (u'abc\n', 'utf-32')
+
+
+@pytest.mark.parametrize(
+    'codec, bom',
+    [('utf-8', b''),
+     ('utf-16-le', codecs.BOM_UTF16_LE),
+     ('utf-16-be', codecs.BOM_UTF16_BE),
+     ('utf-32-le', codecs.BOM_UTF32_LE),
+     ('utf-32-be', codecs.BOM_UTF32_BE),
+     ])
+def test_truncate_lines(codec, bom):
+    """Test that files are cut after a newline without splitting chars."""
+    # The bytes of these chars include the one of a newline
+    line = u'\u010a\u0a0a\n'
+    text = line * 10
+    data = bom + text.encode(codec)
+    line_size = len(line.encode(codec))
+    for size in range(len(bom) + line_size, len(data)):
+        sample = truncate_lines(data, size)
+        lines = (size - len(bom)) // line_size
+        assert sample[len(bom):].decode(codec) == line * lines
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for executor.py"""
+
+# Standard library imports
+import threading
+import time
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.utils.executor import (PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE,
+                                   TaskExecutor)
+
+
+@pytest.fixture
+def executor():
+    executor = TaskExecutor(max_threads=1)
+    yield executor
+    executor.shutdown()
+
+
+def test_priorities(executor, qtbot):
+    """Test that interactive tasks run before background ones."""
+    event = threading.Event()
+    order = []
+    executor.submit(event.wait)
+    executor.submit(order.append, 'background', priority=PRIORITY_BACKGROUND)
+    last = executor.submit(order.append, 'interactive',
+                           priority=PRIORITY_INTERACTIVE)
+    event.set()
+    qtbot.waitUntil(lambda: len(order) == 2)
+    assert order == ['interactive', 'background']
+    assert last.wait_time is not None
+
+
+def test_superseded_tasks(executor, qtbot):
+    """Test that a task cancels the previous one with the same key."""
+    event = threading.Event()
+    executor.submit(event.wait)
+    first = executor.submit(lambda: 'first', key='scan')
+    second = executor.submit(lambda: 'second', key='scan')
+    assert first.is_cancelled()
+
+    with qtbot.waitSignal(second.sig_finished) as blocker:
+        event.set()
+    assert blocker.args[1] == 'second'
+    stats = executor.get_stats()
+    assert stats['cancelled'] == 1
+    assert stats['queued'] == 0
+
+
+def test_cancellation_token(executor, qtbot):
+    """Test that running tasks can be stopped with their token."""
+    def loop(token=None):
+        while not token.is_cancelled:
+            time.sleep(0.01)
+
+    task = executor.submit(loop, pass_token=True)
+    qtbot.waitUntil(lambda: executor.get_stats()['running'] == 1)
+    task.cancel()
+    qtbot.waitUntil(lambda: executor.get_stats()['running'] == 0)
+    assert task.is_cancelled()
+    assert task.is_finished()
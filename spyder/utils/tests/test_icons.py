@@ -29,5 +29,22 @@ def test_icon_mapping():
             raise e
 
 
+def test_icon_cache():
+    """Test that icons are created once for each name and scale factor."""
+    qapp = qapplication()
+    ima.clear_icon_cache()
+    stats = ima.get_icon_stats()
+
+    ima.icon('edit')
+    ima.icon('edit')
+    ima.icon('edit', scale_factor=0.8)
+    new_stats = ima.get_icon_stats()
+    assert new_stats['created'] - stats['created'] == 2
+    assert new_stats['hits'] - stats['hits'] == 1
+
+    # Scale factors are not kept for later calls
+    assert 'scale_factor' not in ima._qtaargs['edit'][1]
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for interpreters.py"""
+
+# Standard library imports
+import site
+import sys
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.utils import interpreters
+from spyder.utils.interpreters import (
+    get_cached_interpreter_info, load_env_list, save_env_list,
+    update_interpreter_info)
+
+
+@pytest.fixture
+def modules_db(tmpdir, monkeypatch):
+    """Use a temporary modules database and an empty cache."""
+    db_path = str(tmpdir.join('db'))
+    monkeypatch.setattr(interpreters, 'get_conf_path', lambda name: db_path)
+    monkeypatch.setattr(interpreters, '_cache', {})
+    return db_path
+
+
+def test_interpreter_info(modules_db, monkeypatch):
+    """Test that the metadata of interpreters is saved until they change."""
+    assert get_cached_interpreter_info(sys.executable) is None
+
+    entry = update_interpreter_info(sys.executable)
+    info = entry['info']
+    assert info['version'] == 'Python ' + sys.version.split()[0]
+    assert 'pytest' not in info['modules']
+    assert set(info['modules']) <= set(interpreters.KEY_MODULES)
+    if site.ENABLE_USER_SITE:
+        assert site.getusersitepackages() in info['paths']
+    assert info['sys_path']
+    assert 'sys' in info['builtin_modules']
+
+    # The metadata is read from the database in new sessions
+    monkeypatch.setattr(interpreters, '_cache', {})
+    assert get_cached_interpreter_info(sys.executable) == info
+
+    # and it's outdated when a path changes
+    mtimes = interpreters._cache[sys.executable]['mtimes']
+    mtimes[sorted(mtimes)[0]] = 0
+    assert get_cached_interpreter_info(sys.executable) is None
+
+
+def test_env_list(modules_db, tmpdir):
+    """Test that removed environments are not loaded."""
+    python = tmpdir.join('python')
+    python.write('')
+    save_env_list('conda', {'conda: a': (str(python), 'Python 3.8.0'),
+                            'conda: b': (str(tmpdir.join('b')), '')})
+    assert load_env_list('conda') == {
+        'conda: a': (str(python), 'Python 3.8.0')}
+    assert load_env_list('pyenv') == {}
+
+
+if __name__ == "__main__":
+    pytest.main()
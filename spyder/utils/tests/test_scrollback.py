@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for scrollback.py"""
+
+# Local imports
+from spyder.utils import scrollback
+from spyder.utils.scrollback import ScrollbackBuffer
+
+
+def test_scrollback_lines():
+    """Test appending partial lines and reading them back."""
+    buffer = ScrollbackBuffer()
+    buffer.append('first\nsec')
+    assert len(buffer) == 2
+    assert buffer.get_lines(0, 10) == ['first', 'sec']
+
+    buffer.append('ond\r\nthird α\nfour')
+    assert buffer.get_lines(1, 3) == ['second', 'third α']
+    assert buffer.get_lines(3, 4) == ['four']
+    assert buffer.find('THIRD') == 2
+    assert buffer.find('third', case=True, start=3) == -1
+    assert buffer.find(r'^f\w+r$', regexp=True) == 3
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.get_lines(0, 10) == []
+
+
+def test_scrollback_ring(monkeypatch):
+    """Test that the oldest lines are dropped and the file compacted."""
+    monkeypatch.setattr(scrollback, 'COMPACT_MIN_BYTES', 10)
+    buffer = ScrollbackBuffer(max_lines=5)
+    for i in range(4):
+        buffer.append('line {}\n'.format(i))
+    buffer.append(''.join('line {}\n'.format(i) for i in range(4, 20)))
+
+    assert buffer.dropped == 15
+    assert len(buffer) == 5
+    assert buffer.get_lines(0, 5) == ['line {}'.format(i)
+                                      for i in range(15, 20)]
+    assert buffer.find('line 15') == 0
+    assert buffer.find('line 3') == -1
+
+    # Compacting keeps the remaining lines
+    buffer.append('line 20\nline 21\n')
+    assert buffer.get_lines(0, 5) == ['line {}'.format(i)
+                                      for i in range(17, 22)]
+    assert buffer._base > 0
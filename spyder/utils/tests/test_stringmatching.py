@@ -15,7 +15,8 @@
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import (FuzzyFilter, get_fuzzy_rich_text,
+                                         get_fuzzy_score, get_search_scores)
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +217,38 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+def test_fuzzy_score():
+    """Test the precedence of fuzzy scores."""
+    assert get_fuzzy_score('up', 'up stroke') == 0
+    assert get_fuzzy_score('st', 'up stroke') == 3
+    assert get_fuzzy_score('st', 'upstream') == 102
+    assert (get_fuzzy_score('cls', 'close') <
+            get_fuzzy_score('cls', 'car lost'))
+    assert get_fuzzy_score('sc', 'close') is None
+
+
+def test_fuzzy_rich_text():
+    """Test that the letters found are highlighted."""
+    assert get_fuzzy_rich_text('lay', 'Use Layout') == 'Use <b>Lay</b>out'
+    assert get_fuzzy_rich_text('cls', 'close') == '<b>cl</b>o<b>s</b>e'
+    assert get_fuzzy_rich_text('x', 'close') == 'close'
+
+
+@pytest.mark.parametrize('limit', [None, 1, 3])
+def test_fuzzy_filter(limit):
+    """Test that filtering gives the same results as scoring every choice."""
+    choices = ['layout preferences', 'use next layout', 'close all', 'copy',
+               'copy line', 'play', 'Clear Line', 'run selection']
+    fuzzy_filter = FuzzyFilter(choices)
+    for query in ['c', 'cl', 'cli', 'clin', 'l', 'la', 'lay', 'lay o', 'x']:
+        expected = sorted(
+            [(index, get_fuzzy_score(query.replace(' ', ''), choice.lower()))
+             for index, choice in enumerate(choices)
+             if get_fuzzy_score(query.replace(' ', ''),
+                                choice.lower()) is not None],
+            key=lambda match: (match[1], match[0]))
+        assert fuzzy_filter.filter(query, limit) == expected[:limit]
+
+
 if __name__ == "__main__":
     pytest.main()
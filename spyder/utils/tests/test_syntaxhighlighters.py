@@ -7,9 +7,10 @@
 
 import pytest
 from qtpy.QtWidgets import QApplication
-from qtpy.QtGui import QTextDocument
+from qtpy.QtGui import QTextCursor, QTextDocument
 
-from spyder.utils.syntaxhighlighters import HtmlSH, PythonSH, MarkdownSH
+from spyder.utils.syntaxhighlighters import (HtmlSH, PythonSH, MarkdownSH,
+                                             guess_pygments_highlighter)
 from spyder.py3compat import PY3
 
 def compare_formats(actualFormats, expectedFormats, sh):
@@ -107,5 +108,65 @@ def test_python_not_an_outline_explorer_comment(line):
     assert not PythonSH.OECOMMENT.match(line)
 
 
+def test_block_timing():
+    txt = "x = 1\n" * 5 + "y = '" + "a" * 10000 + "'\n"
+    doc = QTextDocument(txt)
+    sh = PythonSH(doc, color_scheme='Spyder')
+    sh.set_block_timing(True)
+    sh.rehighlight()
+    assert sorted(sh.block_timings) == list(range(doc.blockCount()))
+    assert sh.get_slowest_blocks(1)[0][0] == 5
+
+    sh.set_block_timing(False)
+    assert sh.get_slowest_blocks() == []
+
+
+def test_pygments_spans():
+    txt = "/* comment\ncomment */ var x = 'a';"
+    doc = QTextDocument(txt)
+    sh = guess_pygments_highlighter('test.js')(doc, color_scheme='Spyder')
+    sh.make_charlist(blocking=True)
+    compare_formats(doc.lastBlock().layout().additionalFormats(),
+                    [(0, 10, 'comment'), (10, 1, 'normal'),
+                     (11, 3, 'keyword'), (14, 5, 'normal'),
+                     (19, 3, 'string'), (22, 1, 'normal')], sh)
+
+    # Only the changed block is highlighted again
+    sh.set_block_timing(True)
+    cursor = QTextCursor(doc.lastBlock())
+    cursor.insertText('x')
+    sh.make_charlist(blocking=True)
+    assert sorted(sh.block_timings) == [1]
+
+
+def test_pygments_check_spans(qtbot):
+    """
+    Test that the spans found incrementally are checked by parsing the
+    whole text when idle.
+    """
+    txt = "```python\n" + "x = 1\n" * 20
+    doc = QTextDocument(txt)
+    sh = guess_pygments_highlighter('test.md')(doc, color_scheme='Spyder')
+    sh.make_charlist(blocking=True)
+    assert not sh._check_timer.isActive()
+    formats = doc.findBlockByNumber(5).layout().additionalFormats()
+
+    # Closing the code block changes the formats of all its lines
+    cursor = QTextCursor(doc)
+    cursor.movePosition(QTextCursor.End)
+    cursor.insertText("```\n")
+    sh.make_charlist(blocking=True)
+    assert sh._check_timer.isActive()
+    sh._check_timer.stop()
+
+    sh.set_block_timing(True)
+    sh._check_spans()
+    qtbot.waitUntil(lambda: not sh._spans.partial)
+    assert 5 in sh.block_timings
+    new_formats = doc.findBlockByNumber(5).layout().additionalFormats()
+    assert len(new_formats) != len(formats) or any(
+        new.format != old.format for new, old in zip(new_formats, formats))
+
+
 if __name__ == '__main__':
     pytest.main()
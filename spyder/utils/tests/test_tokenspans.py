@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for tokenspans.py"""
+
+# Third party imports
+from pygments.lexers import get_lexer_by_name
+from pygments.token import Comment, Keyword, Name, String, Text
+import pytest
+
+# Local imports
+from spyder.utils.tokenspans import TokenSpans
+
+
+TOKMAP = {Text: 'normal', Keyword: 'keyword', Name.Builtin: 'builtin',
+          Name: 'normal', Comment: 'comment', String: 'string'}
+
+TEXTS = {
+    'javascript': ("var a = 1; /* start\n"
+                   "comment */\n"
+                   "function f(x) {\n"
+                   "  return \"text\";\n"
+                   "}\n") * 10,
+    'c': ("/* start\n"
+          "comment */\n"
+          "int f(int x) {\n"
+          "  return \"text\";\n"
+          "}\n") * 10,
+}
+
+
+def lex(language, text):
+    return TokenSpans(get_lexer_by_name(language), TOKMAP).lex(text)
+
+
+def test_spans():
+    """Test the spans of lines."""
+    spans, lines = lex('javascript', "var a = 'b'; /* c\nd */ a")
+    assert spans.incremental
+    assert lines == (0, 2)
+    assert spans.get_spans(0) == ((0, 3, 'keyword'), (3, 5, 'normal'),
+                                  (8, 3, 'string'), (11, 2, 'normal'),
+                                  (13, 4, 'comment'))
+    assert spans.get_spans(1) == ((0, 4, 'comment'), (4, 2, 'normal'))
+    assert spans.get_spans(2) == ()
+    assert spans.states[0] == ('root',)
+    assert spans.states[1] is None
+
+
+@pytest.mark.parametrize('language', ['javascript', 'c'])
+@pytest.mark.parametrize('edit', [
+    ('comment */', 'comment'),
+    ('start\n', 'start */\n'),
+    ('"text"', '"te\nxt"'),
+    ('{\n', '{\n\n\n'),
+    ('return', ''),
+])
+def test_incremental_lex(language, edit):
+    """Test that lexing edits gives the same spans as lexing from scratch."""
+    text = TEXTS[language]
+    spans, __ = lex(language, text)
+    position = text.index(edit[0], len(text) // 2)
+    new_text = (text[:position] + edit[1] +
+                text[position + len(edit[0]):])
+
+    new_spans, (first, stop) = spans.lex(new_text)
+    expected, __ = lex(language, new_text)
+    assert new_spans.spans == expected.spans
+    if spans.incremental:
+        assert new_spans.states == expected.states
+
+    # Only lines with changes must be highlighted again
+    for number in set(range(len(expected))) - set(range(first, stop)):
+        old_number = number if number < first else number - (
+            len(new_spans) - len(spans))
+        assert expected.spans[number] == spans.spans[old_number]
+
+    # Nothing changes if the text doesn't change
+    assert new_spans.lex(new_text) == (new_spans, (len(new_spans),
+                                                   len(new_spans)))
+
+
+def test_relex():
+    """
+    Test that lexing the whole text again fixes the spans of matches that
+    depend on text far after the lines lexed incrementally.
+    """
+    # Closing a long fenced code block changes the spans of all its lines
+    text = "```python\n" + "x = 1\n" * 20
+    spans, __ = lex('markdown', text)
+    new_text = text + "```\n"
+    new_spans, __ = spans.lex(new_text)
+    expected, __ = lex('markdown', new_text)
+    assert new_spans.partial
+    assert not expected.partial
+
+    fixed, (first, stop) = new_spans.relex()
+    assert fixed.spans == expected.spans
+    assert fixed.states == expected.states
+    assert not fixed.partial
+    assert first <= 1 and stop >= 20
+    for number in set(range(len(expected))) - set(range(first, stop)):
+        assert expected.spans[number] == new_spans.spans[number]
+
+    # Nothing is highlighted again if the spans were right
+    assert fixed.relex()[1] == (len(fixed), len(fixed))
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Run-length spans of the tokens found by Pygments lexers.
+
+The kinds of tokens of each line are stored as (start, length, kind) spans
+instead of one format per character. For lexers based on regular
+expressions, the state of the lexer at the start of lines is stored too, so
+after an edit the text is only lexed again from the last line before it with
+a known state, until the lexer reaches a line with the same state it had
+before the edit.
+
+That can give wrong spans when a match depends on text far after the line
+where it starts, e.g. a fenced code block in Markdown that gets closed, so
+`relex` lexes the whole text again to fix them (it's run when idle).
+"""
+
+# Third party imports
+from pygments.lexer import RegexLexer
+from pygments.token import Error, Text, _TokenType
+
+
+# Minimum number of lines lexed again before a change, because matches
+# that start before a line can depend on the text after it
+RESTART_LINES = 10
+
+
+def get_token_kind(ttype, tokmap):
+    """Return the Spyder kind (format name) of a Pygments token type."""
+    # Exact matches first
+    if ttype in tokmap:
+        return tokmap[ttype]
+    # Partial (parent -> child) matches
+    for key, kind in tokmap.items():
+        if ttype in key:
+            return kind
+    return 'normal'
+
+
+class TokenSpans(object):
+    """
+    Spans of the kinds of tokens of each line of a text.
+
+    Instances are not modified after lexing; `lex` returns a new instance,
+    so they can be created in a thread while another one is used.
+    """
+
+    def __init__(self, lexer, tokmap):
+        self.lexer = lexer
+        self.tokmap = tokmap
+        self.lines = []
+        # Tuple of (start, length, kind) spans for each line
+        self.spans = []
+        # State stack of the lexer at the start of each line, or None if
+        # it can't be restarted there
+        self.states = []
+        self.incremental = (
+            isinstance(lexer, RegexLexer) and
+            type(lexer).get_tokens_unprocessed is
+            RegexLexer.get_tokens_unprocessed)
+        # If some spans were found by lexing only a part of the text
+        self.partial = False
+        self._kinds = {}
+
+    def __len__(self):
+        return len(self.spans)
+
+    def get_spans(self, line):
+        """Return the spans of line, or an empty tuple if it's unknown."""
+        try:
+            return self.spans[line]
+        except IndexError:
+            return ()
+
+    def lex(self, text):
+        """
+        Return the TokenSpans of text, and the range of lines to highlight
+        again as a (first, stop) tuple.
+
+        Only the lines that changed since the text of this instance are
+        lexed, with the lines around them until the lexer re-synchronizes.
+        """
+        lines = text.split('\n')
+        old_lines = self.lines
+        count = len(lines)
+        delta = count - len(old_lines)
+
+        # Lines that didn't change at the start and the end of the text
+        limit = min(count, len(old_lines))
+        first = 0
+        while first < limit and lines[first] == old_lines[first]:
+            first += 1
+        last = 0
+        while (last < limit - first and
+                lines[count - 1 - last] == old_lines[-1 - last]):
+            last += 1
+        resync = count - last
+        if first == count and delta == 0:
+            return self, (count, count)
+
+        # Find the nearest line before the change where the lexer can be
+        # restarted
+        start = 0
+        state = ('root',)
+        if self.incremental and old_lines:
+            start = max(min(first, len(old_lines) - 1) - RESTART_LINES, 0)
+            while self.states[start] is None:
+                start -= 1
+            state = self.states[start]
+        offset = sum(map(len, lines[:start])) + start
+
+        new = TokenSpans(self.lexer, self.tokmap)
+        new._kinds = self._kinds
+        new.lines = lines
+        spans, states, stop = self._lex_lines(lines, text + '\n', start,
+                                              offset, state, resync, delta)
+        new.spans = self.spans[:start] + spans + self.spans[stop - delta:]
+        new.states = self.states[:start] + states + self.states[stop - delta:]
+        new.partial = start > 0 or stop < count
+
+        # Lines without changes in their text or spans don't need to be
+        # highlighted again
+        old_spans = self.spans
+        while (start < first and start < stop and
+                new.spans[start] == old_spans[start]):
+            start += 1
+        while (stop > max(start, resync) and stop - 1 - delta < len(old_spans)
+                and new.spans[stop - 1] == old_spans[stop - 1 - delta]):
+            stop -= 1
+        return new, (start, stop)
+
+    def relex(self):
+        """
+        Return the TokenSpans of the text of this instance lexed from its
+        start, and the range of lines whose spans differ from the ones of
+        this instance as a (first, stop) tuple.
+        """
+        new = TokenSpans(self.lexer, self.tokmap)
+        new._kinds = self._kinds
+        new, __ = new.lex('\n'.join(self.lines))
+        first = 0
+        stop = len(new.spans)
+        while first < stop and new.spans[first] == self.get_spans(first):
+            first += 1
+        while (stop > first and
+                new.spans[stop - 1] == self.get_spans(stop - 1)):
+            stop -= 1
+        return new, (first, stop)
+
+    def _lex_lines(self, lines, text, line, offset, state, resync, delta):
+        """
+        Lex lines of text from line (at offset) with the lexer in state.
+
+        Lexing stops at the first line from resync where the lexer state is
+        the same as before the change, since the following lines can't
+        change. Return the spans and states of the lexed lines, and the line
+        where lexing stopped.
+        """
+        old_states = self.states
+        count = len(lines)
+        spans = []
+        states = [state]
+        current = []
+        line_start = offset
+        line_end = offset + len(lines[line])
+
+        if self.incremental:
+            tokens = self._get_tokens(text, offset, state)
+        else:
+            tokens = self.lexer.get_tokens_unprocessed(text)
+
+        for pos, ttype, value in tokens:
+            end = pos + len(value) if ttype is not None else pos
+            # Move to the line where the token ends, splitting it if it
+            # spans several lines
+            while end > line_end:
+                if ttype is not None:
+                    kind = self._get_kind(ttype)
+                    span_start = max(pos, line_start)
+                    if line_end > span_start:
+                        self._add_span(current, span_start - line_start,
+                                       line_end - span_start, kind)
+                spans.append(tuple(current))
+                current = []
+                line += 1
+                if line == count:
+                    return spans, states, line
+                line_start = line_end + 1
+                line_end = line_start + len(lines[line])
+                states.append(None)
+
+            if ttype is None:
+                # Start of a line where the lexer can be restarted
+                states[-1] = value
+                old_line = line - delta
+                if (line >= resync and old_line < len(old_states) and
+                        old_states[old_line] == value):
+                    states.pop()
+                    return spans, states, line
+            else:
+                span_start = max(pos, line_start)
+                if end > span_start:
+                    self._add_span(current, span_start - line_start,
+                                   end - span_start, self._get_kind(ttype))
+
+        # The lexer stopped before the end of the text
+        spans.append(tuple(current))
+        spans.extend(() for __ in range(count - line - 1))
+        states.extend(None for __ in range(count - line - 1))
+        return spans, states, count
+
+    def _get_kind(self, ttype):
+        kind = self._kinds.get(ttype)
+        if kind is None:
+            kind = self._kinds[ttype] = get_token_kind(ttype, self.tokmap)
+        return kind
+
+    def _add_span(self, spans, start, length, kind):
+        """Add a span to the spans of a line, merging it with the last."""
+        if spans:
+            last_start, last_length, last_kind = spans[-1]
+            if last_kind == kind and last_start + last_length == start:
+                spans[-1] = (last_start, last_length + length, kind)
+                return
+        spans.append((start, length, kind))
+
+    def _get_tokens(self, text, pos, state):
+        """
+        Yield (position, token type, value) tuples of text from pos, like
+        RegexLexer.get_tokens_unprocessed does, together with (position,
+        None, state) tuples at the start of lines where a match starts.
+        """
+        lexer = self.lexer
+        tokendefs = lexer._tokens
+        statestack = list(state)
+        statetokens = tokendefs[statestack[-1]]
+        start = pos
+        end = len(text)
+        while True:
+            if pos < end and (pos == start or text[pos - 1] == '\n'):
+                yield pos, None, tuple(statestack)
+            for rexmatch, action, new_state in statetokens:
+                m = rexmatch(text, pos)
+                if m:
+                    if action is not None:
+                        if type(action) is _TokenType:
+                            yield pos, action, m.group()
+                        else:
+                            for token in action(lexer, m):
+                                yield token
+                    pos = m.end()
+                    if new_state is not None:
+                        # State transition
+                        if isinstance(new_state, tuple):
+                            for name in new_state:
+                                if name == '#pop':
+                                    if len(statestack) > 1:
+                                        statestack.pop()
+                                elif name == '#push':
+                                    statestack.append(statestack[-1])
+                                else:
+                                    statestack.append(name)
+                        elif isinstance(new_state, int):
+                            # Pop, but keep at least one state on the stack
+                            if abs(new_state) >= len(statestack):
+                                del statestack[1:]
+                            else:
+                                del statestack[new_state:]
+                        elif new_state == '#push':
+                            statestack.append(statestack[-1])
+                        statetokens = tokendefs[statestack[-1]]
+                    break
+            else:
+                # No rule matched
+                if pos >= end:
+                    break
+                if text[pos] == '\n':
+                    # At the end of lines, the state is reset to root
+                    statestack = ['root']
+                    statetokens = tokendefs['root']
+                    yield pos, Text, '\n'
+                else:
+                    yield pos, Error, text[pos]
+                pos += 1
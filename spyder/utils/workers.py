@@ -8,6 +8,9 @@
 """
 Worker manager and workers for running files long processes in non GUI
 blocking threads.
+
+Python workers are run by the shared task executor (see
+spyder.utils.executor) instead of each one in its own thread.
 """
 
 # Standard library imports
@@ -21,6 +24,7 @@
 
 # Local imports
 from spyder.py3compat import PY2, to_text_string
+from spyder.utils.executor import get_executor, PRIORITY_NORMAL
 
 
 WIN = os.name == 'nt'
@@ -43,12 +47,13 @@ class PythonWorker(QObject):
     sig_started = Signal(object)
     sig_finished = Signal(object, object, object)  # worker, stdout, stderr
 
-    def __init__(self, func, args, kwargs):
+    def __init__(self, func, args, kwargs, priority=PRIORITY_NORMAL):
         """Generic python worker for running python code on threads."""
         super(PythonWorker, self).__init__()
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.priority = priority
         self._is_finished = False
         self._started = False
 
@@ -226,6 +231,7 @@ def __init__(self, max_threads=10):
         self._queue_workers = deque()
         self._threads = []
         self._workers = []
+        self._running_workers = []
         self._timer = QTimer()
         self._timer_worker_delete = QTimer()
         self._running_threads = 0
@@ -259,16 +265,15 @@ def _start(self, worker=None):
             #                                 len(self._threads)))
             self._running_threads += 1
             worker = self._queue_workers.popleft()
-            thread = QThread()
             if isinstance(worker, PythonWorker):
-                worker.moveToThread(thread)
-                worker.sig_finished.connect(thread.quit)
-                thread.started.connect(worker._start)
-                thread.start()
+                get_executor().submit(worker._start,
+                                      priority=worker.priority)
+                self._running_workers.append(worker)
             elif isinstance(worker, ProcessWorker):
+                thread = QThread()
                 thread.quit()
                 worker._start()
-            self._threads.append(thread)
+                self._threads.append(thread)
         else:
             self._timer.start()
 
@@ -284,13 +289,25 @@ def _start(self, worker=None):
                     self._threads.remove(t)
                     self._running_threads -= 1
 
-        if len(self._threads) == 0 and len(self._workers) == 0:
+        for w in list(self._running_workers):
+            if w.is_finished():
+                self._running_workers.remove(w)
+                self._running_threads -= 1
+
+        if (len(self._threads) == 0 and len(self._workers) == 0 and
+                len(self._running_workers) == 0):
             self._timer.stop()
             self._timer_worker_delete.start()
 
     def create_python_worker(self, func, *args, **kwargs):
-        """Create a new python worker instance."""
-        worker = PythonWorker(func, args, kwargs)
+        """
+        Create a new python worker instance.
+
+        The `priority` keyword argument, if given, is the executor priority
+        of the worker and it's not passed to func.
+        """
+        priority = kwargs.pop('priority', PRIORITY_NORMAL)
+        worker = PythonWorker(func, args, kwargs, priority=priority)
         self._create_worker(worker)
         return worker
 
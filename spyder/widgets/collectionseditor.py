@@ -21,6 +21,7 @@
 # Standard library imports
 from __future__ import print_function
 import datetime
+import heapq
 import re
 import sys
 import warnings
@@ -48,12 +49,14 @@
 from spyder.config.fonts import DEFAULT_SMALL_DELTA
 from spyder.config.gui import get_font
 from spyder.py3compat import (io, is_binary_string, PY3, to_text_string,
-                              is_type_text_string, NUMERIC_TYPES)
+                              is_type_text_string, MutableMapping,
+                              MutableSequence, NUMERIC_TYPES)
 from spyder.utils import icon_manager as ima
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.qthelpers import (add_actions, create_action,
                                     mimedata2url)
-from spyder.utils.stringmatching import get_search_scores, get_search_regex
+from spyder.utils.stringmatching import (get_search_scores, get_search_regex,
+                                         NO_SCORE)
 from spyder.plugins.variableexplorer.widgets.collectionsdelegate import (
     CollectionsDelegate)
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
@@ -66,6 +69,9 @@
 LARGE_NROWS = 100
 ROWS_TO_LOAD = 50
 
+# Only the keys to show are sorted if there are this many times more keys
+PARTIAL_SORT_RATIO = 8
+
 
 def natsort(s):
     """
@@ -120,6 +126,144 @@ def __setitem__(self, key, value):
                 raise
 
 
+class CopyOnWriteDict(MutableMapping):
+    """
+    Dictionary proxy that records changes instead of copying the dictionary.
+
+    Use apply to get a copy of the dictionary with the changes.
+    """
+
+    def __init__(self, data):
+        self._data = data
+        self._changes = {}
+        self._deleted = set()
+
+    def __getitem__(self, key):
+        if key in self._changes:
+            return self._changes[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._deleted.discard(key)
+        self._changes[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._changes.pop(key, None)
+        if key in self._data:
+            self._deleted.add(key)
+
+    def __contains__(self, key):
+        if key in self._changes:
+            return True
+        return key not in self._deleted and key in self._data
+
+    def __iter__(self):
+        if not self.is_modified():
+            return iter(self._data)
+        return self._iter_modified()
+
+    def __len__(self):
+        added = [key for key in self._changes if key not in self._data]
+        return len(self._data) - len(self._deleted) + len(added)
+
+    def is_modified(self):
+        """Return True if there are changes to apply."""
+        return bool(self._changes or self._deleted)
+
+    def apply(self):
+        """Return a copy of the dictionary with the changes applied."""
+        if not self.is_modified():
+            return self._data
+        result = self._data.copy()
+        for key in self._deleted:
+            del result[key]
+        result.update(self._changes)
+        return result
+
+    def _iter_modified(self):
+        for key in self._data:
+            if key not in self._deleted:
+                yield key
+        for key in self._changes:
+            if key not in self._data:
+                yield key
+
+
+class CopyOnWriteList(MutableSequence):
+    """
+    List proxy that records changed items instead of copying the list.
+
+    The list is only copied when items are inserted or removed. Use apply to
+    get a copy of the list with the changes.
+    """
+
+    def __init__(self, data):
+        self._data = data
+        self._changes = {}
+        self._copy = None
+
+    def __getitem__(self, index):
+        if self._copy is not None:
+            return self._copy[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = self._check_index(index)
+        if index in self._changes:
+            return self._changes[index]
+        return self._data[index]
+
+    def __setitem__(self, index, value):
+        if self._copy is None and not isinstance(index, slice):
+            self._changes[self._check_index(index)] = value
+        else:
+            self._get_copy()[index] = value
+
+    def __delitem__(self, index):
+        del self._get_copy()[index]
+
+    def __len__(self):
+        if self._copy is not None:
+            return len(self._copy)
+        return len(self._data)
+
+    def insert(self, index, value):
+        self._get_copy().insert(index, value)
+
+    def is_modified(self):
+        """Return True if there are changes to apply."""
+        return self._copy is not None or bool(self._changes)
+
+    def apply(self):
+        """Return a copy of the list with the changes applied."""
+        if self._copy is not None:
+            return self._copy
+        if not self._changes:
+            return self._data
+        return self._get_copy()
+
+    def _check_index(self, index):
+        """Return index as a positive integer or raise IndexError."""
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('list index out of range')
+        return index
+
+    def _get_copy(self):
+        """Copy the list to insert or remove items in it."""
+        if self._copy is None:
+            self._copy = self._data[:]
+            for index, value in self._changes.items():
+                self._copy[index] = value
+            self._changes = {}
+        return self._copy
+
+
 class ReadOnlyCollectionsModel(QAbstractTableModel):
     """CollectionsEditor Read-Only Table Model"""
 
@@ -151,6 +295,9 @@ def __init__(self, parent, data, title="", names=False,
             self.title = self.title + ' - '
         self.sizes = []
         self.types = []
+        self._sorted_rows = 0
+        self._sorted_by_key = True
+        self._keys_reverse = False
         self.set_data(data)
 
     def get_data(self):
@@ -163,31 +310,29 @@ def set_data(self, data, coll_filter=None):
         data_type = get_type_string(data)
 
         if (coll_filter is not None and not self.remote and
-                isinstance(data, (tuple, list, dict, set))):
+                isinstance(data, (tuple, list, dict, set, CopyOnWriteDict,
+                                  CopyOnWriteList))):
             data = coll_filter(data)
         self.showndata = data
 
         self.header0 = _("Index")
         if self.names:
             self.header0 = _("Name")
+        sort_keys = False
         if isinstance(data, tuple):
             self.keys = list(range(len(data)))
             self.title += _("Tuple")
-        elif isinstance(data, list):
+        elif isinstance(data, (list, CopyOnWriteList)):
             self.keys = list(range(len(data)))
             self.title += _("List")
         elif isinstance(data, set):
             self.keys = list(range(len(data)))
             self.title += _("Set")
             self._data = list(data)
-        elif isinstance(data, dict):
-            try:
-                self.keys = sorted(list(data.keys()), key=natsort)
-            except TypeError:
-                # This is necessary to display dictionaries with mixed
-                # types as keys.
-                # Fixes spyder-ide/spyder#13481
-                self.keys = list(data.keys())
+        elif isinstance(data, (dict, CopyOnWriteDict)):
+            # Keys are sorted as they are shown, see _sort_keys
+            self.keys = list(data.keys())
+            sort_keys = True
             self.title += _("Dictionary")
             if not self.names:
                 self.header0 = _("Key")
@@ -209,6 +354,10 @@ def set_data(self, data, coll_filter=None):
             self.rows_loaded = ROWS_TO_LOAD
         else:
             self.rows_loaded = self.total_rows
+        self._sorted_rows = 0 if sort_keys else self.total_rows
+        self._sorted_by_key = True
+        self._keys_reverse = False
+        self._sort_keys(self.rows_loaded)
         self.sig_setting_data.emit()
         self.set_size_and_type()
         if len(self.keys):
@@ -218,8 +367,12 @@ def set_data(self, data, coll_filter=None):
         self.reset()
 
     def set_size_and_type(self, start=None, stop=None):
-        data = self._data
+        """
+        Reset the size and type of rows from start to stop.
 
+        They are computed when they are first needed, i.e. when their rows
+        are shown or sorted, by get_size_and_type.
+        """
         if start is None and stop is None:
             start = 0
             stop = self.rows_loaded
@@ -227,29 +380,77 @@ def set_size_and_type(self, start=None, stop=None):
         else:
             fetch_more = True
 
+        pending = [None] * (stop - start)
+        if fetch_more:
+            self.sizes = self.sizes + pending
+            self.types = self.types + pending
+        else:
+            self.sizes = pending
+            self.types = list(pending)
+
+    def get_size_and_type(self, row):
+        """Return the size and type of row, computing them if needed."""
+        if self.types[row] is None:
+            self._update_size_and_type(row, row + 1)
+        return self.sizes[row], self.types[row]
+
+    def _update_size_and_type(self, start, stop):
+        """Compute the size and type of rows from start to stop if needed."""
+        data = self._data
+
         # Ignore pandas warnings that certain attributes are deprecated
         # and will be removed, since they will only be accessed if they exist.
         with warnings.catch_warnings():
             warnings.filterwarnings(
                 "ignore", message=(r"^\w+\.\w+ is deprecated and "
                                    "will be removed in a future version"))
-            if self.remote:
-                sizes = [data[self.keys[index]]['size']
-                         for index in range(start, stop)]
-                types = [data[self.keys[index]]['type']
-                         for index in range(start, stop)]
-            else:
-                sizes = [get_size(data[self.keys[index]])
-                         for index in range(start, stop)]
-                types = [get_human_readable_type(data[self.keys[index]])
-                         for index in range(start, stop)]
+            for row in range(start, stop):
+                if self.types[row] is not None:
+                    continue
+                value = data[self.keys[row]]
+                if self.remote:
+                    self.sizes[row] = value['size']
+                    self.types[row] = value['type']
+                else:
+                    self.sizes[row] = get_size(value)
+                    self.types[row] = get_human_readable_type(value)
 
-        if fetch_more:
-            self.sizes = self.sizes + sizes
-            self.types = self.types + types
-        else:
-            self.sizes = sizes
-            self.types = types
+    def _sort_keys(self, rows):
+        """
+        Naturally sort the keys needed to show the first rows.
+
+        Keys before the ones already sorted are left untouched. If there are
+        many more keys than rows to show, the smallest keys are selected
+        instead of sorting all of them.
+        """
+        start = self._sorted_rows
+        if rows <= start:
+            return
+
+        pending = self.keys[start:]
+        count = rows - start
+        for sort_key in (natsort, None):
+            try:
+                if count * PARTIAL_SORT_RATIO < len(pending):
+                    if self._keys_reverse:
+                        selected = heapq.nlargest(count, pending, sort_key)
+                    else:
+                        selected = heapq.nsmallest(count, pending, sort_key)
+                    selected_keys = set(selected)
+                    self.keys[start:] = selected + [
+                        key for key in pending if key not in selected_keys]
+                    self._sorted_rows = rows
+                else:
+                    pending.sort(key=sort_key, reverse=self._keys_reverse)
+                    self.keys[start:] = pending
+                    self._sorted_rows = len(self.keys)
+                return
+            except TypeError:
+                pass
+
+        # This is necessary to display dictionaries with mixed types as keys.
+        # Fixes spyder-ide/spyder#13481
+        self._sorted_rows = len(self.keys)
 
     def load_all(self):
         """Load all the data."""
@@ -257,25 +458,22 @@ def load_all(self):
 
     def sort(self, column, order=Qt.AscendingOrder):
         """Overriding sort method"""
-
-        def all_string(listlike):
-            return all([isinstance(x, str) for x in listlike])
-
         reverse = (order == Qt.DescendingOrder)
-        sort_key = natsort if all_string(self.keys) else None
 
         if column == 0:
-            self.sizes = sort_against(self.sizes, self.keys,
-                                      reverse=reverse,
-                                      sort_key=natsort)
-            self.types = sort_against(self.types, self.keys,
-                                      reverse=reverse,
-                                      sort_key=natsort)
-            try:
-                self.keys.sort(reverse=reverse, key=sort_key)
-            except:
-                pass
-        elif column == 1:
+            if not self._sorted_by_key or reverse != self._keys_reverse:
+                self._sorted_rows = 0
+                self._sorted_by_key = True
+                self._keys_reverse = reverse
+                self._sort_keys(self.rows_loaded)
+                self.set_size_and_type()
+        elif column in [1, 2]:
+            # Only loaded rows are sorted, so keys still to be loaded keep
+            # their order
+            self._sorted_by_key = False
+            self._update_size_and_type(0, self.rows_loaded)
+
+        if column == 1:
             self.keys[:self.rows_loaded] = sort_against(self.keys,
                                                         self.types,
                                                         reverse=reverse)
@@ -296,8 +494,10 @@ def all_string(listlike):
         elif column in [3, 4]:
             values = [self._data[key] for key in self.keys]
             self.keys = sort_against(self.keys, values, reverse=reverse)
-            self.sizes = sort_against(self.sizes, values, reverse=reverse)
-            self.types = sort_against(self.types, values, reverse=reverse)
+            self._sorted_rows = len(self.keys)
+            self._sorted_by_key = False
+            self.set_size_and_type()
+        self._update_size_and_type(0, self.rows_loaded)
         self.beginResetModel()
         self.endResetModel()
 
@@ -327,6 +527,7 @@ def fetchMore(self, index=QModelIndex(), number_to_fetch=None):
             items_to_fetch = min(reminder, number_to_fetch)
         else:
             items_to_fetch = min(reminder, ROWS_TO_LOAD)
+        self._sort_keys(self.rows_loaded + items_to_fetch)
         self.set_size_and_type(self.rows_loaded,
                                self.rows_loaded + items_to_fetch)
         self.beginInsertRows(QModelIndex(), self.rows_loaded,
@@ -349,9 +550,9 @@ def get_value(self, index):
         if index.column() == 0:
             return self.keys[ index.row() ]
         elif index.column() == 1:
-            return self.types[ index.row() ]
+            return self.get_size_and_type(index.row())[1]
         elif index.column() == 2:
-            return self.sizes[ index.row() ]
+            return self.get_size_and_type(index.row())[0]
         else:
             return self._data[ self.keys[index.row()] ]
 
@@ -371,6 +572,11 @@ def get_bgcolor(self, index):
     def update_search_letters(self, text=""):
         """Update search letters with text input in search box."""
         self.letters = text
+        if not text:
+            # All keys have the same score, so there's no need to match them
+            self.scores = [NO_SCORE] * len(self.keys)
+            self.reset()
+            return
         names = [str(key) for key in self.keys]
         results = get_search_scores(text, names, template='<b>{0}</b>')
         if results:
@@ -389,7 +595,7 @@ def row_type(self, row_num):
         Get row type based on model index.
         Needed for the custom proxy model.
         """
-        return self.types[row_num]
+        return self.get_size_and_type(row_num)[1]
 
     def data(self, index, role=Qt.DisplayRole):
         """Cell content"""
@@ -747,7 +953,8 @@ def refresh_plot_entries(self, index):
         else:
             is_array = condition_plot = condition_imshow = is_list \
                      = condition_hist = False
-        is_list_instance = isinstance(self.source_model.get_data(), list)
+        is_list_instance = isinstance(self.source_model.get_data(),
+                                      (list, CopyOnWriteList))
         self.plot_action.setVisible(condition_plot or is_list)
         self.hist_action.setVisible(condition_hist or is_list)
         self.insert_action.setVisible(not is_list_instance)
@@ -936,7 +1143,7 @@ def copy_item(self, erase_original=False, new_name=None):
             title = _('Duplicate')
             field_text = _('Variable name:')
         data = self.source_model.get_data()
-        if isinstance(data, (list, set)):
+        if isinstance(data, (list, set, CopyOnWriteList)):
             new_key, valid = len(data), True
         elif new_name is not None:
             new_key, valid = new_name, True
@@ -979,10 +1186,10 @@ def insert_item(self, below=True):
                 else:
                     row = index.row()
         data = self.source_model.get_data()
-        if isinstance(data, list):
+        if isinstance(data, (list, CopyOnWriteList)):
             key = row
             data.insert(row, '')
-        elif isinstance(data, dict):
+        elif isinstance(data, (dict, CopyOnWriteDict)):
             key, valid = QInputDialog.getText(self, _( 'Insert'), _( 'Key:'),
                                               QLineEdit.Normal)
             if valid and to_text_string(key):
@@ -1191,7 +1398,7 @@ def remove_values(self, keys):
     def copy_value(self, orig_key, new_key):
         """Copy value"""
         data = self.source_model.get_data()
-        if isinstance(data, list):
+        if isinstance(data, (list, CopyOnWriteList)):
             data.append(data[orig_key])
         if isinstance(data, set):
             data.add(data[orig_key])
@@ -1286,7 +1493,8 @@ def refresh_menu(self):
         self.insert_action_above.setEnabled(not self.readonly)
         self.insert_action_below.setEnabled(not self.readonly)
         self.duplicate_action.setEnabled(condition)
-        condition_rename = not isinstance(data, (tuple, list, set))
+        condition_rename = not isinstance(data, (tuple, list, set,
+                                                 CopyOnWriteList))
         self.rename_action.setEnabled(condition_rename)
         self.refresh_plot_entries(index)
 
@@ -1336,7 +1544,14 @@ def __init__(self, parent=None):
     def setup(self, data, title='', readonly=False, remote=False,
               icon=None, parent=None):
         """Setup editor."""
-        if isinstance(data, (dict, set)):
+        if type(data) is dict:
+            # Changes are applied to a copy of the dictionary on save
+            self.data_copy = CopyOnWriteDict(data)
+            datalen = len(data)
+        elif type(data) is list:
+            self.data_copy = CopyOnWriteList(data)
+            datalen = len(data)
+        elif isinstance(data, (dict, set)):
             # dictionnary, set
             self.data_copy = data.copy()
             datalen = len(data)
@@ -1358,7 +1573,8 @@ def setup(self, data, title='', readonly=False, remote=False,
 
         # If the copy has a different type, then do not allow editing, because
         # this would change the type after saving; cf. spyder-ide/spyder#6936.
-        if type(self.data_copy) != type(data):
+        if (not isinstance(self.data_copy, (CopyOnWriteDict, CopyOnWriteList))
+                and type(self.data_copy) != type(data)):
             readonly = True
 
         self.widget = CollectionsEditorWidget(self, self.data_copy,
@@ -1411,6 +1627,8 @@ def get_value(self):
         """Return modified copy of dictionary or list"""
         # It is import to avoid accessing Qt C++ object as it has probably
         # already been destroyed, due to the Qt.WA_DeleteOnClose attribute
+        if isinstance(self.data_copy, (CopyOnWriteDict, CopyOnWriteList)):
+            return self.data_copy.apply()
         return self.data_copy
 
 
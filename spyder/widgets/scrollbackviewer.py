@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Viewer of the output stored in the scrollback buffer of consoles."""
+
+# Third party imports
+from qtpy.QtCore import QAbstractListModel, QModelIndex, Qt
+from qtpy.QtWidgets import (QAbstractItemView, QApplication, QDialog,
+                            QHBoxLayout, QLabel, QLineEdit, QListView,
+                            QVBoxLayout)
+
+# Local imports
+from spyder.config.base import _
+from spyder.utils import icon_manager as ima
+from spyder.utils.qthelpers import create_toolbutton
+
+
+# Number of lines read at once from the buffer
+CACHE_LINES = 512
+
+
+class ScrollbackModel(QAbstractListModel):
+    """Model that reads lines of a ScrollbackBuffer on demand."""
+
+    def __init__(self, buffer, parent=None):
+        QAbstractListModel.__init__(self, parent)
+        self.buffer = buffer
+        self._rows = len(buffer)
+        self._cache_start = 0
+        self._cache = []
+
+    def refresh(self):
+        """Show the current lines of the buffer."""
+        self.beginResetModel()
+        self._rows = len(self.buffer)
+        self._cache_start = 0
+        self._cache = []
+        self.endResetModel()
+
+    def rowCount(self, index=QModelIndex()):
+        """Qt Override."""
+        return self._rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Qt Override."""
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = index.row()
+        if not (self._cache_start <= row
+                < self._cache_start + len(self._cache)):
+            self._cache_start = max(0, row - CACHE_LINES // 2)
+            self._cache = self.buffer.get_lines(
+                self._cache_start, self._cache_start + CACHE_LINES)
+        try:
+            return self._cache[row - self._cache_start]
+        except IndexError:
+            # The buffer changed since the last refresh
+            return ''
+
+
+class ScrollbackViewer(QDialog):
+    """Dialog to scroll and search all the output of a console."""
+
+    def __init__(self, buffer, parent=None):
+        QDialog.__init__(self, parent)
+        self.setWindowTitle(_("Output history"))
+        self.setWindowFlags(self.windowFlags() |
+                            Qt.WindowMaximizeButtonHint)
+        self.buffer = buffer
+
+        self.model = ScrollbackModel(buffer, self)
+        self.view = QListView(self)
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+
+        self.search_edit = QLineEdit(self)
+        self.search_edit.setPlaceholderText(_("Search"))
+        self.search_edit.returnPressed.connect(self.find_next)
+        find_button = create_toolbutton(self, icon=ima.icon('findnext'),
+                                        tip=_("Find next"),
+                                        triggered=self.find_next)
+        self.stats_label = QLabel(self)
+
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(self.search_edit)
+        search_layout.addWidget(find_button)
+        layout = QVBoxLayout()
+        layout.addLayout(search_layout)
+        layout.addWidget(self.view)
+        layout.addWidget(self.stats_label)
+        self.setLayout(layout)
+        self.resize(800, 500)
+
+    def set_font(self, font):
+        """Set font of the lines."""
+        self.view.setFont(font)
+
+    def refresh(self, collapsed=None):
+        """
+        Show the current lines of the buffer.
+
+        `collapsed` is the number of lines that weren't shown by the
+        console because too many were printed at once, if it's known.
+        """
+        self.model.refresh()
+        stats = _("{} lines, {} oldest lines dropped").format(
+            len(self.buffer), self.buffer.dropped)
+        if collapsed is not None:
+            stats += _(", {} lines collapsed by the console").format(
+                collapsed)
+        self.stats_label.setText(stats)
+        self.view.scrollToBottom()
+
+    def find_next(self):
+        """Select the next line that contains the search text."""
+        text = self.search_edit.text()
+        if not text:
+            return
+        current = self.view.currentIndex().row()
+        row = self.buffer.find(text, start=current + 1)
+        if row == -1 and current > 0:
+            row = self.buffer.find(text)
+        if row == -1 or row >= self.model.rowCount():
+            QApplication.beep()
+            return
+        index = self.model.index(row)
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index, QAbstractItemView.PositionAtCenter)
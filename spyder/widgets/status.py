@@ -21,11 +21,13 @@
 # Local imports
 from spyder.config.base import _
 from spyder.config.manager import CONF
-from spyder.utils.conda import get_list_conda_envs
-from spyder.utils.programs import get_interpreter_info
-from spyder.utils.pyenv import get_list_pyenv_envs
+from spyder.utils import interpreters
+from spyder.utils.conda import get_list_conda_envs, get_list_conda_envs_cache
+from spyder.utils.programs import get_interpreter_version
+from spyder.utils.pyenv import get_list_pyenv_envs, get_list_pyenv_envs_cache
 from spyder.utils.qthelpers import (add_actions, create_action,
                                     create_waitspinner)
+from spyder.utils.executor import PRIORITY_BACKGROUND
 from spyder.utils.workers import WorkerManager
 
 
@@ -255,6 +257,13 @@ def __init__(self, parent, statusbar, icon=None, interpreter=None):
         self._get_envs_timer.timeout.connect(self.get_envs)
         self._get_envs_timer.start()
 
+        # Show the envs found by the last session until they are updated,
+        # if that doesn't require to run the interpreter
+        if (interpreter is not None and
+                interpreters.get_cached_interpreter_info(interpreter) is not None):
+            self.update_envs(None, {**get_list_conda_envs_cache(),
+                                    **get_list_pyenv_envs_cache()}, None)
+
         # Update the list of envs at startup
         self.get_envs()
 
@@ -302,11 +311,12 @@ def _get_env_dir(self, interpreter):
 
     def _get_envs(self):
         """Get the list of environments in the system."""
-        # Compute info of default interpreter to have it available in
-        # case we need to switch to it. This will avoid lags when
-        # doing that in get_value.
-        if sys.executable not in self.path_to_env:
-            self._get_env_info(sys.executable)
+        # Compute info of default and current interpreters to have it
+        # available in case we need to switch to them. This will avoid lags
+        # when doing that in get_value.
+        for interpreter in {sys.executable, self._interpreter}:
+            if interpreter and interpreter not in self.path_to_env:
+                self._get_env_info(interpreter)
 
         # Get envs
         conda_env = get_list_conda_envs()
@@ -319,7 +329,8 @@ def get_envs(self):
         date.
         """
         self._worker_manager.terminate_all()
-        worker = self._worker_manager.create_python_worker(self._get_envs)
+        worker = self._worker_manager.create_python_worker(
+            self._get_envs, priority=PRIORITY_BACKGROUND)
         worker.sig_finished.connect(self.update_envs)
         worker.start()
 
@@ -375,7 +386,7 @@ def _get_env_info(self, path):
                 name = 'pyenv'
             else:
                 name = 'custom'
-            version = get_interpreter_info(path)
+            version = get_interpreter_version(path)
             self.path_to_env[path] = name
             self.envs[name] = (path, version)
         __, version = self.envs[name]
@@ -26,7 +26,8 @@
 from spyder.config.utils import is_ubuntu
 from spyder.py3compat import TEXT_TYPES, to_text_string
 from spyder.utils import icon_manager as ima
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import (FuzzyFilter, get_fuzzy_rich_text,
+                                         NOT_FOUND_SCORE)
 from spyder.widgets.helperwidgets import HTMLDelegate
 
 # Style dict constants
@@ -47,13 +48,6 @@
     }
 
 
-def clean_string(text):
-    """Remove regex special characters from string."""
-    for ch in ('(', ')', '.', '\\', '?', '*', '[', ']', '&', '|', '^', '+'):
-        text = text.replace(ch, '')
-    return text
-
-
 class KeyPressFilter(QObject):
     """Use with `installEventFilter` to get up/down arrow key press signal."""
 
@@ -108,6 +102,8 @@ def __init__(self, parent=None, styles=_STYLES):
         self._styles = styles if styles else {}
         self._action_item = False
         self._score = -1
+        # Items with a higher rank are sorted after the others
+        self._rank = 0
         self._height = self._get_height()
 
         # Setup
@@ -512,8 +508,9 @@ def lessThan(self, left, right):
 
         # Check for attribute, otherwise, check for data
         if hasattr(left_item, self.__sort_by):
-            left_data = getattr(left_item, self.__sort_by)
-            right_data = getattr(right_item, self.__sort_by)
+            left_data = (left_item._rank, getattr(left_item, self.__sort_by))
+            right_data = (right_item._rank,
+                          getattr(right_item, self.__sort_by))
             return left_data < right_data
 
 
@@ -543,6 +540,8 @@ class Switcher(QDialog):
     sig_mode_selected = Signal(TEXT_TYPES[-1])
 
     _MAX_NUM_ITEMS = 15
+    # Maximum number of items with the matched letters highlighted
+    _MAX_RICH_ITEMS = 30
     _MIN_WIDTH = 580
     _MIN_HEIGHT = 200
     _MAX_HEIGHT = 390
@@ -556,6 +555,10 @@ def __init__(self, parent, help_text=None, item_styles=ITEM_STYLES,
         self._mode_on = ''
         self._item_styles = item_styles
         self._item_separator_styles = item_separator_styles
+        self._filter = None
+        self._filter_rows = []
+        # Sections whose items are scored by whoever adds them, by rank
+        self._scored_sections = {}
 
         # Widgets
         self.edit = QLineEdit(self)
@@ -604,6 +607,7 @@ def _add_item(self, item, last_item=True):
         """Perform common actions when adding items."""
         item.set_width(self._ITEM_WIDTH)
         self.model.appendRow(item)
+        self._filter = None
         if last_item:
             # Only set the current row to the first item when the added item is
             # the last one in order to prevent performance issues when
@@ -619,6 +623,8 @@ def clear(self):
         self.model.beginResetModel()
         self.model.clear()
         self.model.endResetModel()
+        self._filter = None
+        self._filter_rows = []
         self.setMinimumHeight(self._MIN_HEIGHT)
 
     def set_placeholder_text(self, text):
@@ -664,6 +670,46 @@ def add_item(self, icon=None, title=None, description=None, shortcut=None,
         )
         self._add_item(item, last_item=last_item)
 
+    def set_section_items(self, section, items):
+        """
+        Replace the items of section with the matches of the current search
+        text found elsewhere, e.g. in an index.
+
+        items is a list of (score, kwargs) tuples, where kwargs are the
+        arguments of add_item. These items are not filtered again by the
+        switcher and are shown after the other ones.
+        """
+        rank = self._scored_sections.setdefault(
+            section, len(self._scored_sections) + 1)
+
+        # Their rows are after the other items, unless those were added
+        # later, so the filter of the other items is usually still valid
+        last_filter_row = self._filter_rows[-1] if self._filter_rows else -1
+        for row in reversed(range(self.model.rowCount())):
+            item = self.model.item(row)
+            if (isinstance(item, SwitcherItem) and
+                    item.get_section() == section):
+                self.model.removeRow(row)
+                if row < last_filter_row:
+                    self._filter = None
+
+        search_text = self._get_search_text()
+        for index, (score, kwargs) in enumerate(items):
+            item = SwitcherItem(parent=self.list, styles=self._item_styles,
+                                section=section, **kwargs)
+            item._rank = rank
+            if index < self._MAX_RICH_ITEMS:
+                item.set_rich_title(self._get_rich_title(
+                    search_text, item.get_title()))
+            item.set_score(score)
+            item.set_width(self._ITEM_WIDTH)
+            self.model.appendRow(item)
+
+        self.setup_sections()
+        if self.count():
+            self.set_current_row(0)
+        self.set_height()
+
     def add_separator(self):
         """Add separator item."""
         item = SwitcherSeparatorItem(parent=self.list,
@@ -674,10 +720,7 @@ def setup(self):
         """Set-up list widget content based on the filtering."""
         # Check exited mode
         mode = self._mode_on
-        if mode:
-            search_text = self.search_text()[len(mode):]
-        else:
-            search_text = self.search_text()
+        search_text = self._get_search_text()
 
         # Check exited mode
         if self.search_text() == '':
@@ -695,25 +738,45 @@ def setup(self):
                 return
 
         # Filter by text
-        titles = []
-        for row in range(self.model.rowCount()):
+        if self._filter is None:
+            rows = []
+            titles = []
+            for row in range(self.model.rowCount()):
+                item = self.model.item(row)
+                if isinstance(item, SwitcherItem):
+                    if item.get_section() in self._scored_sections:
+                        continue
+                    title = item.get_title()
+                else:
+                    title = ''
+                rows.append(row)
+                titles.append(title)
+            self._filter = FuzzyFilter(titles)
+            self._filter_rows = rows
+
+        scores = [NOT_FOUND_SCORE] * len(self._filter_rows)
+        matches = self._filter.filter(search_text)
+        for index, score in matches:
+            scores[index] = score
+
+        # Only the best matches are highlighted, since rendering the rich
+        # titles of many items is slow
+        highlighted = set(index for index, __ in
+                          matches[:self._MAX_RICH_ITEMS])
+        for index, score in enumerate(scores):
+            row = self._filter_rows[index]
             item = self.model.item(row)
-            if isinstance(item, SwitcherItem):
-                title = item.get_title()
-            else:
-                title = ''
-            titles.append(title)
-
-        search_text = clean_string(search_text)
-        scores = get_search_scores(to_text_string(search_text),
-                                   titles, template=u"<b>{0}</b>")
-
-        for idx, (title, rich_title, score_value) in enumerate(scores):
-            item = self.model.item(idx)
-            if not self._is_separator(item) and not item.is_action_item():
-                rich_title = rich_title.replace(" ", "&nbsp;")
-                item.set_rich_title(rich_title)
-            item.set_score(score_value)
+            if (score != NOT_FOUND_SCORE and not self._is_separator(item)
+                    and not item.is_action_item()):
+                if index in highlighted:
+                    rich_title = self._get_rich_title(search_text,
+                                                      item.get_title())
+                else:
+                    rich_title = item.get_title().replace(" ", "&nbsp;")
+                if rich_title != item.get_rich_title():
+                    item.set_rich_title(rich_title)
+            if score != item.get_score():
+                item.set_score(score)
         self.proxy.set_filter_by_score(True)
 
         self.setup_sections()
@@ -725,11 +788,7 @@ def setup(self):
 
     def setup_sections(self):
         """Set-up which sections appear on the item list."""
-        mode = self._mode_on
-        if mode:
-            search_text = self.search_text()[len(mode):]
-        else:
-            search_text = self.search_text()
+        search_text = self._get_search_text()
 
         if search_text:
             for row in range(self.model.rowCount()):
@@ -831,6 +890,17 @@ def set_search_text(self, string):
         self.edit.setText(string)
 
     # --- Helper methods: List widget
+    def _get_search_text(self):
+        """Return the search text without the mode token."""
+        return self.search_text()[len(self._mode_on):]
+
+    def _get_rich_title(self, search_text, title):
+        """Return title with the letters of search_text highlighted."""
+        search_text = to_text_string(search_text).replace(' ', '')
+        rich_title = get_fuzzy_rich_text(search_text, title,
+                                         template=u"<b>{}</b>")
+        return rich_title.replace(" ", "&nbsp;")
+
     def _is_separator(self, item):
         """Check if item is an separator item (SwitcherSeparatorItem)."""
         return isinstance(item, SwitcherSeparatorItem)
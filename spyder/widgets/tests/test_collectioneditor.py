@@ -32,7 +32,8 @@
 # Local imports
 from spyder.widgets.collectionseditor import (
     RemoteCollectionsEditorTableView, CollectionsEditorTableView,
-    CollectionsModel, CollectionsEditor, LARGE_NROWS, ROWS_TO_LOAD, natsort)
+    CollectionsModel, CollectionsEditor, CopyOnWriteDict, CopyOnWriteList,
+    LARGE_NROWS, ROWS_TO_LOAD, natsort)
 from spyder.plugins.variableexplorer.widgets.namespacebrowser import (
     NamespacesBrowserFinder)
 from spyder.plugins.variableexplorer.widgets.tests.test_dataframeeditor import \
@@ -920,5 +921,59 @@ def test_dicts_natural_sorting_mixed_types():
                                     ['(0,)', 2, 3, str_size]]
 
 
+def test_copy_on_write_collections():
+    """Test that edits are applied to a copy of the original collection."""
+    original_dict = {'a': 1, 'b': 2}
+    data = CopyOnWriteDict(original_dict)
+    assert data.apply() is original_dict
+    data['a'] = 3
+    data['c'] = 4
+    del data['b']
+    assert dict(data) == {'a': 3, 'c': 4}
+    assert data.apply() == {'a': 3, 'c': 4}
+    assert original_dict == {'a': 1, 'b': 2}
+
+    original_list = [1, 2, 3]
+    data = CopyOnWriteList(original_list)
+    assert data.apply() is original_list
+    data[-1] = 4
+    assert list(data) == [1, 2, 4]
+    data.insert(0, 0)
+    assert data.apply() == [0, 1, 2, 4]
+    assert original_list == [1, 2, 3]
+
+
+def test_collectionseditor_doesnt_copy_data(qtbot):
+    """Test that the editor only copies data with changes when saving."""
+    dictionary = {'a': 1, 'b': 2}
+    editor = CollectionsEditor()
+    editor.setup(dictionary)
+    assert editor.get_value() is dictionary
+
+    cm = editor.widget.editor.source_model
+    cm.set_value(cm.index(0, 3), 3)
+    assert editor.get_value() == {'a': 3, 'b': 2}
+    assert dictionary == {'a': 1, 'b': 2}
+
+
+def test_dicts_partial_sorting(qtbot):
+    """Test that large dicts are sorted as their rows are loaded."""
+    numbers = list(range(10 * LARGE_NROWS))
+    dictionary = {'test{}'.format(i): i for i in reversed(numbers)}
+    cm = CollectionsModel(MockParent(), dictionary)
+    expected = ['test{}'.format(i) for i in numbers]
+    assert cm.keys[:ROWS_TO_LOAD] == expected[:ROWS_TO_LOAD]
+    assert cm.types == [None] * ROWS_TO_LOAD
+
+    cm.fetchMore()
+    assert cm.keys[:2 * ROWS_TO_LOAD] == expected[:2 * ROWS_TO_LOAD]
+    assert data(cm, ROWS_TO_LOAD, 2) == 1
+
+    cm.sort(0, order=Qt.DescendingOrder)
+    assert cm.keys[:2 * ROWS_TO_LOAD] == expected[::-1][:2 * ROWS_TO_LOAD]
+    cm.load_all()
+    assert cm.keys == expected[::-1]
+
+
 if __name__ == "__main__":
     pytest.main()
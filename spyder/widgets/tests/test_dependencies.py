@@ -36,5 +36,45 @@ def test_dependencies(dependencies_dialog):
     assert dependencies_dialog
 
 
+def test_update_installed_versions(qtbot, tmpdir, monkeypatch):
+    """Test that installed versions are found without importing modules."""
+    monkeypatch.setattr(dependencies, 'get_conf_path',
+                        lambda name: str(tmpdir.join('db')))
+    deps = [dependencies.Dependency("pytest", "pytest", "Testing", ">=1.0"),
+            dependencies.Dependency("foo", "foo", "Non-existent", ">=1.0")]
+    with qtbot.waitCallback() as callback:
+        dependencies.update_installed_versions(callback, deps=deps)
+    assert deps[0].installed_version == pytest.__version__
+    assert deps[0].check()
+    assert deps[1].installed_version is None
+    assert not deps[1].check()
+
+    # Versions are read from the cache if packages didn't change
+    monkeypatch.setattr(dependencies, 'save_installed_versions', None)
+    deps = [dependencies.Dependency("pytest", "pytest", "Testing", ">=1.0")]
+    with qtbot.waitCallback() as callback:
+        dependencies.update_installed_versions(callback, deps=deps)
+    assert deps[0].installed_version == pytest.__version__
+
+
+def test_save_installed_versions(tmpdir, monkeypatch):
+    """
+    Test that modules that can't be imported are saved as not installed and
+    that the user site-packages is checked for changes.
+    """
+    monkeypatch.setattr(dependencies.programs, 'get_package_version',
+                        lambda package_name: '1.0')
+    tmpdir.join('broken_dep.py').write('raise ValueError')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    versions = dependencies.save_installed_versions(
+        [('pytest', 'pytest'), ('broken_dep', 'broken_dep')],
+        str(tmpdir.join('db')))
+    assert versions == {'pytest': '1.0', 'broken_dep': None}
+
+    monkeypatch.setattr(dependencies.site, 'ENABLE_USER_SITE', True)
+    assert (dependencies.site.getusersitepackages() in
+            dependencies.get_site_packages())
+
+
 if __name__ == "__main__":
     pytest.main()
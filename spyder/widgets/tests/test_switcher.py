@@ -105,6 +105,38 @@ def test_switcher_filter_and_mode(dlg_switcher, qtbot):
     assert dlg_switcher.count() == 1
 
 
+def test_switcher_section_items(dlg_switcher, qtbot, mocker):
+    """
+    Test that items scored elsewhere are added with a single sort, after
+    the other matches and without discarding the filter of the others.
+    """
+    edit = dlg_switcher.edit
+    edit.setText("master")
+    switcher_filter = dlg_switcher._filter
+    count = dlg_switcher.count()
+
+    sort_by = mocker.spy(dlg_switcher.proxy, 'sortBy')
+    items = [(0, dict(title='master.py', data='master.py')),
+             (5, dict(title='my_aster.py', data='my_aster.py'))]
+    dlg_switcher.set_section_items('Project', items)
+    assert sort_by.call_count == 1
+    assert dlg_switcher._filter is switcher_filter
+    assert dlg_switcher.count() == count + 2
+
+    # They're shown last, even if they match better
+    titles = []
+    for row in range(dlg_switcher.count()):
+        index = dlg_switcher.proxy.mapToSource(dlg_switcher.proxy.index(row, 0))
+        titles.append(dlg_switcher.model.item(index.row()).get_title())
+    assert titles[-2:] == ['master.py', 'my_aster.py']
+
+    # Replacing them or typing more keeps the filter of the other items
+    dlg_switcher.set_section_items('Project', items[:1])
+    assert dlg_switcher.count() == count + 1
+    edit.setText("maste")
+    assert dlg_switcher._filter is switcher_filter
+
+
 def test_switcher_filter_unicode(dlg_switcher, qtbot):
     """Test filter with unicode."""
     edit = dlg_switcher.edit
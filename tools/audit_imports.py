@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Audit the time taken to import the modules of the Spyder startup path.
+
+Usage: python tools/audit_imports.py [--top N] [--repeat N] [--budget SECONDS]
+                                     [MODULE]
+
+MODULE (spyder.app.mainwindow by default) is imported in a new interpreter
+with `-X importtime` and the packages that take longest to import are shown,
+with the module that imported them first. Then it's imported again (without
+`-X importtime`, which adds overhead) to measure the total time. With
+--budget, the exit status is 1 if that time is over the budget, so this can
+be used as a regression benchmark.
+"""
+
+# Standard library imports
+import argparse
+from collections import namedtuple
+import os
+import os.path as osp
+import re
+import subprocess
+import sys
+
+# Use this Spyder and the spyder-kernels of this repo
+ROOT = osp.dirname(osp.dirname(osp.abspath(__file__)))
+PYTHONPATH = [ROOT, osp.join(ROOT, 'external-deps', 'spyder-kernels')]
+
+# Line of the output of -X importtime, e.g.
+# "import time:       481 |     479493 |   IPython"
+IMPORTTIME_REGEX = re.compile(
+    r'^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$')
+
+# Code to measure the time of importing a module
+TIMING_CODE = ("import time; start = time.perf_counter(); import {}; "
+               "print(time.perf_counter() - start)")
+
+Import = namedtuple('Import', ['name', 'self_time', 'cumulative', 'depth',
+                               'parent'])
+
+
+def run_python(args):
+    """Run Python with args, without a display and using this Spyder."""
+    env = os.environ.copy()
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    env['PYTHONPATH'] = os.pathsep.join(
+        PYTHONPATH + [env['PYTHONPATH']] if env.get('PYTHONPATH')
+        else PYTHONPATH)
+    return subprocess.run([sys.executable] + args, env=env, cwd=ROOT,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True)
+
+
+def parse_importtime(output):
+    """
+    Return the imports found in the output of -X importtime, in the order
+    they finished, with the name of the module that imported them.
+    """
+    imports = []
+    for line in output.splitlines():
+        match = IMPORTTIME_REGEX.match(line)
+        if match is None:
+            continue
+        self_time, cumulative, indent, name = match.groups()
+        imports.append([name, int(self_time) / 1e6, int(cumulative) / 1e6,
+                        len(indent) // 2, None])
+
+    # Modules are listed after the ones they import, so the importer of a
+    # module is the next one that is less nested
+    parents = []
+    for item in reversed(imports):
+        depth = item[3]
+        del parents[depth:]
+        if parents:
+            item[4] = parents[-1]
+        parents.append(item[0])
+    return [Import(*item) for item in imports]
+
+
+def get_package_times(imports):
+    """
+    Return the (package, seconds, importer) of the top level packages, by
+    the sum of the self time of their modules, from the slowest.
+
+    The importer is the first module of another package that imported one
+    of its modules.
+    """
+    times = {}
+    importers = {}
+    for item in imports:
+        package = item.name.split('.')[0]
+        times[package] = times.get(package, 0) + item.self_time
+        if (package not in importers and item.parent is not None and
+                item.parent.split('.')[0] != package):
+            importers[package] = item.parent
+    return sorted(((package, seconds, importers.get(package, ''))
+                   for package, seconds in times.items()),
+                  key=lambda item: item[1], reverse=True)
+
+
+def measure(module, repeat):
+    """Return the best time of importing module in a new interpreter."""
+    best = None
+    for __ in range(repeat):
+        process = run_python(['-c', TIMING_CODE.format(module)])
+        if process.returncode != 0:
+            raise RuntimeError(process.stderr.strip())
+        seconds = float(process.stdout.strip().splitlines()[-1])
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--top', type=int, default=20,
+                        help='number of packages and modules to show')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='times the total import time is measured')
+    parser.add_argument('--budget', type=float, default=None,
+                        metavar='SECONDS',
+                        help='fail if importing takes longer than this')
+    parser.add_argument('module', nargs='?', default='spyder.app.mainwindow')
+    args = parser.parse_args()
+
+    process = run_python(['-X', 'importtime', '-c',
+                          'import {}'.format(args.module)])
+    imports = parse_importtime(process.stderr)
+    if process.returncode != 0 or not imports:
+        print(process.stderr.strip(), file=sys.stderr)
+        sys.exit(2)
+
+    print('{:<24}{:>10}  {}'.format('Package', 'Self (ms)', 'Imported by'))
+    for package, seconds, importer in get_package_times(imports)[:args.top]:
+        print('{:<24}{:>10.1f}  {}'.format(package[:23], seconds * 1000,
+                                           importer))
+
+    print('\n{:<48}{:>16}'.format('Module', 'Cumulative (ms)'))
+    slowest = sorted(imports, key=lambda item: item.cumulative, reverse=True)
+    for item in slowest[:args.top]:
+        print('{:<48}{:>16.1f}'.format(item.name[:47], item.cumulative * 1000))
+
+    seconds = measure(args.module, args.repeat)
+    print('\nImporting {} takes {:.3f} s ({} modules)'.format(
+        args.module, seconds, len(imports)))
+    if args.budget is not None and seconds > args.budget:
+        print('Over the budget of {:.3f} s'.format(args.budget))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Measure the overhead of continuing in the Spyder debugger.
+
+Usage: python tools/benchmark_debugger.py [--repeat N]
+
+A workload with many Python calls is run without the debugger and after a
+`continue` in the debugger of spyder-kernels, with a breakpoint in another
+file (so tracing can't be turned off), in another function of the file of
+the workload and in the workload itself (so its frame must be traced). This
+runs outside of a kernel, so the debugger doesn't stop at breakpoints and
+doesn't talk to the frontend.
+"""
+
+# Standard library imports
+import argparse
+import bdb
+import dis
+import os.path as osp
+import sys
+import time
+
+# Use the spyder-kernels of this repo
+ROOT = osp.dirname(osp.dirname(osp.abspath(__file__)))
+sys.path.insert(0, osp.join(ROOT, 'external-deps', 'spyder-kernels'))
+
+# Local imports
+from spyder_kernels.customize.spyderpdb import SpyderPdb  # noqa
+
+
+class BenchmarkPdb(SpyderPdb):
+    """Debugger that continues instead of waiting for commands."""
+
+    def reset(self):
+        # Don't register the session in the kernel
+        bdb.Bdb.reset(self)
+        self.curframe = None
+
+    def interaction(self, frame, traceback):
+        self.set_continue()
+
+
+def fibonacci(n):
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+def workload():
+    """Run many short Python calls, and some long loops."""
+    total = fibonacci(22)
+    for i in range(100000):
+        total += i % 7
+    return total
+
+
+def measure(function, repeat):
+    """Return the best time of calling function repeat times."""
+    best = None
+    for __ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def debug(filename, lineno, ignore_lib=False):
+    """Return a function to run workload in the debugger."""
+    def run():
+        debugger = BenchmarkPdb()
+        debugger.pdb_ignore_lib = ignore_lib
+        debugger.set_break(debugger.canonic(filename), lineno)
+        try:
+            bdb.Bdb.runcall(debugger, workload)
+        finally:
+            sys.settrace(None)
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # Last line of the workload
+    workload_line = max(lineno for __, lineno in
+                        dis.findlinestarts(workload.__code__) if lineno)
+
+    plain = measure(workload, args.repeat)
+    cases = [
+        ('No debugger', plain),
+        ('Breakpoint in another file',
+         measure(debug(bdb.__file__, 1), args.repeat)),
+        ('Breakpoint in another file, ignoring libraries',
+         measure(debug(bdb.__file__, 1, ignore_lib=True), args.repeat)),
+        ('Breakpoint in another function',
+         measure(debug(__file__, main.__code__.co_firstlineno),
+                 args.repeat)),
+        ('Breakpoint in the workload',
+         measure(debug(__file__, workload_line), args.repeat)),
+    ]
+    print('{:<48}{:>10}{:>10}'.format('Case', 'Time (s)', 'Overhead'))
+    for name, seconds in cases:
+        print('{:<48}{:>10.3f}{:>9.1f}x'.format(name, seconds,
+                                                 seconds / plain))
+
+
+if __name__ == '__main__':
+    main()
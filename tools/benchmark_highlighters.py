@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Measure the performance of the syntax highlighters of the editor.
+
+Usage: python tools/benchmark_highlighters.py [--slowest N] [PATH ...]
+
+Files are highlighted by their native highlighter (if any) and by the
+Pygments one, in a QTextDocument and without showing any widget, so this
+can run headless. For each one, the time to highlight the whole file, to
+highlight it again after typing a character and to highlight a page of lines
+(as done when scrolling through a large file) is shown.
+
+Paths can be Python, C++ or Markdown files or folders with them. By default,
+some big files of Spyder are used, together with a generated C++ file.
+"""
+
+# Standard library imports
+import argparse
+import os
+import os.path as osp
+import random
+import sys
+import time
+
+# Run without a display and use this Spyder
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+ROOT = osp.dirname(osp.dirname(osp.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Third party imports
+from qtpy.QtGui import QTextCursor, QTextDocument  # noqa
+from qtpy.QtWidgets import QApplication  # noqa
+
+# Local imports
+from spyder.utils import syntaxhighlighters as sh  # noqa
+
+
+# Native highlighters by file extension
+HIGHLIGHTERS = {
+    '.py': sh.PythonSH,
+    '.cpp': sh.CppSH,
+    '.h': sh.CppSH,
+    '.md': sh.MarkdownSH,
+}
+
+DEFAULT_CORPUS = [
+    osp.join(ROOT, 'spyder', 'plugins', 'editor', 'widgets', 'codeeditor.py'),
+    osp.join(ROOT, 'spyder', 'utils', 'syntaxhighlighters.py'),
+    osp.join(ROOT, 'CHANGELOG.md'),
+]
+
+CPP_SAMPLE = """\
+/* Generated sample
+ * of C++ code */
+#include <vector>
+
+template <typename T>
+class Buffer {
+public:
+    explicit Buffer(int size) : data_(size, T()) {}
+    T sum() const {
+        T total = 0;  // Accumulator
+        for (auto value : data_) {
+            total += value * 2.5;
+        }
+        return total;
+    }
+private:
+    std::vector<T> data_;
+};
+"""
+
+# Number of characters typed for the keystroke measurement
+KEYSTROKES = 20
+
+# Number of lines of a page for the scroll measurement
+PAGE_LINES = 60
+PAGES = 20
+
+
+def get_corpus(paths):
+    """Return the (name, text) of the files in paths."""
+    filenames = []
+    for path in paths or DEFAULT_CORPUS:
+        if osp.isdir(path):
+            for dirpath, __, names in os.walk(path):
+                filenames.extend(
+                    osp.join(dirpath, name) for name in sorted(names)
+                    if osp.splitext(name)[1] in HIGHLIGHTERS)
+        else:
+            filenames.append(path)
+
+    corpus = []
+    for filename in filenames:
+        with open(filename, encoding='utf-8', errors='replace') as f:
+            corpus.append((filename, f.read()))
+    if not paths:
+        corpus.append(('generated.cpp', CPP_SAMPLE * 300))
+    return corpus
+
+
+def highlight(highlighter):
+    """Highlight the whole document."""
+    if isinstance(highlighter, sh.PygmentsSH):
+        highlighter.make_charlist(blocking=True)
+    else:
+        highlighter.rehighlight()
+
+
+def measure(highlighter_class, text):
+    """
+    Return the highlighter and the seconds taken to highlight text, to type
+    a character and to highlight a page.
+    """
+    doc = QTextDocument(text)
+    highlighter = highlighter_class(doc, color_scheme='Spyder')
+    highlighter.set_block_timing(True)
+    start = time.perf_counter()
+    highlight(highlighter)
+    full = time.perf_counter() - start
+    timings = highlighter.block_timings
+    highlighter.set_block_timing(False)
+
+    cursor = QTextCursor(doc.findBlockByNumber(doc.blockCount() // 2))
+    start = time.perf_counter()
+    for __ in range(KEYSTROKES):
+        cursor.insertText('x')
+        if isinstance(highlighter, sh.PygmentsSH):
+            highlighter.make_charlist(blocking=True)
+    keystroke = (time.perf_counter() - start) / KEYSTROKES
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for __ in range(PAGES):
+        first = rng.randrange(max(doc.blockCount() - PAGE_LINES, 1))
+        block = doc.findBlockByNumber(first)
+        for __ in range(PAGE_LINES):
+            if not block.isValid():
+                break
+            highlighter.rehighlightBlock(block)
+            block = block.next()
+    page = (time.perf_counter() - start) / PAGES
+
+    highlighter.block_timings = timings
+    return highlighter, full, keystroke, page
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--slowest', type=int, default=0, metavar='N',
+                        help='show the N slowest lines of each file')
+    parser.add_argument('paths', nargs='*')
+    args = parser.parse_args()
+    app = QApplication.instance() or QApplication([])  # noqa
+
+    print('{:<32}{:<20}{:>8}{:>12}{:>15}{:>11}'.format(
+        'File', 'Highlighter', 'Lines', 'Full (ms)', 'Keystroke (ms)',
+        'Page (ms)'))
+    for filename, text in get_corpus(args.paths):
+        extension = osp.splitext(filename)[1]
+        classes = [sh.guess_pygments_highlighter(filename)]
+        if extension in HIGHLIGHTERS:
+            classes.insert(0, HIGHLIGHTERS[extension])
+        lines = text.splitlines()
+        for highlighter_class in classes:
+            highlighter, full, keystroke, page = measure(highlighter_class,
+                                                         text)
+            name = highlighter_class.__name__
+            if isinstance(highlighter, sh.PygmentsSH):
+                name = 'Pygments ({})'.format(highlighter._lexer.name)
+            print('{:<32}{:<20}{:>8}{:>12.1f}{:>15.2f}{:>11.2f}'.format(
+                osp.basename(filename)[:31], name[:19], len(lines),
+                full * 1000, keystroke * 1000, page * 1000))
+            for number, seconds in highlighter.get_slowest_blocks(
+                    args.slowest):
+                line = lines[number] if number < len(lines) else ''
+                print('    line {:<6} {:>8.3f} ms  {}'.format(
+                    number + 1, seconds * 1000, line.strip()[:60]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Compare full and incremental lexing of the Pygments syntax highlighter.
+
+Usage: python tools/benchmark_tokenspans.py [--lines N] [FILE ...]
+
+Without files, generated texts of common languages are used.
+"""
+
+# Standard library imports
+import argparse
+import os.path as osp
+import sys
+import time
+
+# Third party imports
+from pygments.lexers import get_lexer_by_name, get_lexer_for_filename
+from pygments.token import Comment, Keyword, Name, Number, String, Text
+
+# Local imports
+sys.path.insert(0, osp.dirname(osp.dirname(osp.abspath(__file__))))
+from spyder.utils.tokenspans import TokenSpans  # noqa
+
+
+# Same kinds of tokens as PygmentsSH
+TOKMAP = {Text: 'normal', Keyword: 'keyword', Name.Builtin: 'builtin',
+          Name: 'normal', Comment: 'comment', String: 'string',
+          Number: 'number'}
+
+SAMPLES = {
+    'markdown': ("# Title\n\nSome *text* with `code` and a [link](url).\n\n"
+                 "```python\nx = 1\n```\n\n- item **bold**\n> quote\n"),
+    'json': '{"name": "value", "list": [1, 2.5, true, null],\n "a": {}}\n',
+    'yaml': "key: value\nlist:\n  - 1\n  - 'text'\n# comment\n",
+    'c': ("/* comment\n * block */\nint f(int x) {\n"
+          "    return x + 1; // comment\n}\n"),
+    'html': ('<div class="x">\n  <!-- comment -->\n  <p>text</p>\n'
+             '</div>\n'),
+    'javascript': ("/* comment\n */\nfunction f(x) {\n"
+                   "    return `text ${x}`;\n}\n"),
+}
+
+
+def measure(lexer, text):
+    """Return the time of a full lex and of lexing a keystroke."""
+    start = time.perf_counter()
+    spans, __ = TokenSpans(lexer, TOKMAP).lex(text)
+    full = time.perf_counter() - start
+
+    position = text.find('\n', len(text) // 2) + 1
+    text = text[:position] + 'x' + text[position:]
+    start = time.perf_counter()
+    spans.lex(text)
+    incremental = time.perf_counter() - start
+    return spans, full, incremental
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--lines', type=int, default=50000,
+                        help='lines of the generated texts')
+    parser.add_argument('files', nargs='*')
+    args = parser.parse_args()
+
+    cases = []
+    for filename in args.files:
+        with open(filename, encoding='utf-8', errors='replace') as f:
+            cases.append((osp.basename(filename),
+                          get_lexer_for_filename(filename), f.read()))
+    if not cases:
+        for language, sample in SAMPLES.items():
+            repeat = args.lines // sample.count('\n')
+            cases.append((language, get_lexer_by_name(language),
+                          sample * repeat))
+
+    print('{:<24}{:>10}{:>12}{:>12}{:>14}'.format(
+        'Text', 'Lines', 'Full (s)', 'Edit (ms)', 'Incremental'))
+    for name, lexer, text in cases:
+        spans, full, incremental = measure(lexer, text)
+        print('{:<24}{:>10}{:>12.3f}{:>12.1f}{:>14}'.format(
+            name, len(spans), full, incremental * 1000,
+            'yes' if spans.incremental else 'no'))
+
+
+if __name__ == '__main__':
+    main()